@@ -7,8 +7,11 @@ API metadata is hardcoded, while environment-specific settings load from .env fi
 
 from pathlib import Path
 
+from pydantic import model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from api.utils.session_encryption import validate_server_session_key
+
 
 # Get the project root directory (one level up from api/)
 PROJECT_ROOT = Path(__file__).parent.parent
@@ -48,10 +51,131 @@ class Settings(BaseSettings):
 
     admin_api_key: str  # Admin API key for tenant management (required)
 
+    # ============================================================================
+    # Contract Compilation
+    # ============================================================================
+
+    # Directory for persisted unapplied OpShin templates (empty = memory only)
+    contract_template_cache_dir: str = str(PROJECT_ROOT / ".cache" / "contract_templates")
+
+    # Parsed scripts and addresses of compiled contracts, keyed by (tenant, policy_id)
+    contract_artifact_cache_max_entries: int = 5000
+    contract_artifact_cache_warm_on_startup: bool = True
+
+    # Process pool running OpShin compiles off the event loop
+    compile_max_workers: int = 2
+    compile_max_queue_depth: int = 16  # distinct jobs waiting for a worker
+    compile_job_timeout_seconds: float = 120.0
+
+    # ============================================================================
+    # Chain Queries
+    # ============================================================================
+
+    # "blockfrost", or "emulator" for an in-memory ledger (offline tests and load runs)
+    chain_backend: str = "blockfrost"
+
+    # Address-level UTxO cache (invalidated on submit)
+    utxo_cache_enabled: bool = True
+    utxo_cache_ttl_seconds: float = 10.0
+    utxo_cache_tenant_max_bytes: int = 0  # per-tenant memory limit, 0 = unlimited
+
+    # On-chain status enrichment for contract listings (?enrich=true)
+    contract_enrich_max_concurrency: int = 8
+    contract_enrich_deadline_seconds: float = 10.0  # partial results are returned past this
+
+    # Per-item chain enrichment (address history, policy asset details)
+    chain_enrich_max_concurrency: int = 10  # provider calls in flight across all requests
+    chain_enrich_item_timeout_seconds: float = 15.0
+    chain_enrich_max_retries: int = 3  # retries on HTTP 429
+    chain_enrich_memo_max_entries: int = 5000
+    asset_memo_ttl_seconds: float = 300.0  # asset details change on mint/burn
+
+    # Confirmed transaction payload cache (shared collection in the admin database)
+    confirmed_tx_cache_memory_entries: int = 2000  # in-process LRU size
+    confirmed_tx_cache_max_documents: int = 200_000  # oldest are evicted past this
+
+    # Background tracker advancing SUBMITTED transactions to CONFIRMED
+    confirmation_tracker_enabled: bool = True
+    confirmation_poll_interval_seconds: float = 20.0
+    confirmation_batch_size: int = 100  # transactions per tenant per cycle
+    confirmation_backoff_base_seconds: float = 20.0  # doubles on each still-pending check
+    confirmation_backoff_max_seconds: float = 600.0
+    confirmation_give_up_seconds: float = 86400.0  # mark FAILED if never seen on-chain
+
+    # ============================================================================
+    # Transaction Building
+    # ============================================================================
+
+    # Input selection for built transactions: "largest_first", "random_improve"
+    # or "exact_match" (largest-first is the fallback for the other two)
+    coin_selection_strategy: str = "random_improve"
+
+    # Leases on the inputs of built transactions (per tenant) so concurrent
+    # builds pick different UTxOs. Submitted transactions keep theirs until
+    # confirmed or failed (at most confirmation_give_up_seconds).
+    utxo_lease_ttl_seconds: float = 900.0
+    utxo_chaining_enabled: bool = True  # spend outputs of our own unconfirmed submitted txs
+
+    # Batch payouts pack recipient outputs up to max_tx_size minus this much,
+    # left for inputs, change, fee and witnesses (halved further if a build overflows)
+    payout_tx_reserved_bytes: int = 2048
+
+    # ============================================================================
+    # Wallets
+    # ============================================================================
+
+    # Derived addresses persisted per wallet on create/import (indices
+    # 0..gap_limit-1) so address -> wallet lookups need no key material
+    wallet_address_gap_limit: int = 20
+
+    # ============================================================================
+    # Authentication
+    # ============================================================================
+
+    # Unlocked wallet sessions: "memory" (this process only, single worker) or
+    # "mongo" (encrypted under session_encryption_key, shared by all workers).
+    # The key must be a Fernet key (Fernet.generate_key()); it is checked at startup.
+    session_backend: str = "memory"
+    session_encryption_key: str = ""
+
+    # In-memory store of unlocked wallet sessions (L1 cache for "mongo")
+    session_max_sessions: int = 20000  # LRU-evicted beyond this
+    session_manager_shards: int = 16  # independently locked slices
+
+    # Thread pool for Argon2 / PBKDF2 / BIP32 work (unlock, import, signing).
+    # Each Argon2 call holds 64 MiB, so peak memory ~ concurrency x 64 MiB.
+    crypto_max_concurrency: int = 4
+    crypto_max_queue_depth: int = 32  # jobs waiting for a slot before 503s
+
+    # Sessions validated against MongoDB are trusted for this long. Revocations
+    # bump a per-tenant revision in the admin database that every worker re-reads
+    # at most every session_revocation_poll_seconds: a revocation applies at once
+    # on the worker that made it and within the poll interval on the others.
+    session_validation_ttl_seconds: float = 30.0
+    session_revocation_poll_seconds: float = 1.0
+    session_last_used_flush_seconds: float = 15.0  # write-behind interval for last_used_at
+
+    # Tenant API-key resolutions are cached for this long. Revoking a key bumps
+    # a per-tenant revision in the admin database that every worker re-reads at
+    # most every api_key_revocation_poll_seconds: a revocation applies at once on
+    # the worker that made it and within the poll interval on the others.
+    # Unknown keys are rejected from a shorter-lived negative cache.
+    api_key_cache_ttl_seconds: float = 60.0
+    api_key_revocation_poll_seconds: float = 1.0
+    api_key_negative_cache_ttl_seconds: float = 10.0
+    api_key_last_used_flush_seconds: float = 30.0  # write-behind interval for last_used_at
+
     model_config = SettingsConfigDict(
         env_file=str(PROJECT_ROOT / ".env"), env_file_encoding="utf-8", case_sensitive=False, extra="ignore"
     )
 
+    @model_validator(mode="after")
+    def _check_session_encryption_key(self) -> "Settings":
+        # Fail at startup rather than on the first wallet unlock
+        if self.session_backend == "mongo":
+            validate_server_session_key(self.session_encryption_key)
+        return self
+
     @property
     def contact(self) -> dict[str, str]:
         """FastAPI contact information"""
@@ -165,6 +165,31 @@ class WalletMongo(Document):
         name = "wallets"
 
 
+class WalletAddressMongo(Document):
+    """
+    Derived address registry - MongoDB/Beanie version
+
+    Public derived addresses of each wallet (enterprise and staking variants
+    per derivation index), written when the wallet is created or imported.
+    Resolves "which wallet and index owns address X" with an indexed query
+    instead of re-deriving keys from the mnemonic.
+    """
+
+    id: str  # Bech32 address - will be MongoDB _id
+    wallet_id: str  # References WalletMongo.id
+    derivation_index: int  # m/1852'/1815'/0'/0/{derivation_index}
+    address_type: str  # "enterprise" or "staking"
+    network: str  # NetworkType as string
+
+    created_at: datetime = BeanieField(default_factory=lambda: datetime.now(timezone.utc).replace(tzinfo=None))
+
+    class Settings:
+        name = "wallet_addresses"
+        indexes = [
+            IndexModel([("wallet_id", ASCENDING), ("derivation_index", ASCENDING)]),
+        ]
+
+
 class WalletSessionMongo(Document):
     """
     Wallet session management - MongoDB/Beanie version
@@ -303,14 +328,23 @@ class TransactionMongo(Document):
     tx_metadata: dict = {}
 
     # Confirmation tracking
+    network: str | None = None  # Network the tx was submitted to
     submitted_at: datetime | None = None
     confirmed_at: datetime | None = None
     block_height: int | None = None
+    confirmations: int | None = None  # As of confirmation (see ConfirmationTracker)
+    confirmation_checks: int = 0  # On-chain lookups while SUBMITTED
+    next_check_at: datetime | None = None  # Backoff for the confirmation tracker
 
     # Native token/asset tracking
     assets_sent: list[dict] | None = None  # Original asset request for audit trail
     assets_hash: str | None = None  # Deterministic hash for duplicate detection
 
+    # Batch payouts: transactions built together, submitted in batch_index order
+    batch_id: str | None = None
+    batch_index: int | None = None
+    batch_recipient_indexes: list[int] | None = None  # request recipients paid by this transaction
+
     # Error tracking
     error_message: str | None = None
 
@@ -324,10 +358,36 @@ class TransactionMongo(Document):
             IndexModel([("tx_hash", ASCENDING)], unique=True),
             IndexModel([("wallet_id", ASCENDING), ("created_at", DESCENDING)]),
             IndexModel([("status", ASCENDING)]),
+            IndexModel([("status", ASCENDING), ("next_check_at", ASCENDING)]),
+            IndexModel([("outputs.address", ASCENDING), ("status", ASCENDING)]),  # pending outputs for chaining
             IndexModel([("created_at", DESCENDING)]),
         ]
 
 
+class UtxoReservationMongo(Document):
+    """
+    UTxO reservation ledger - MongoDB/Beanie version (multi-tenant)
+
+    A lease on a UTxO spent by a transaction this tenant built, so concurrent
+    builds don't select the same inputs. Leases expire (TTL index), are
+    extended on submission and released when the transaction is confirmed
+    or fails.
+    """
+
+    id: str  # "tx_hash:index" of the reserved UTxO - will be MongoDB _id
+    tx_hash: str  # Transaction holding the lease
+    wallet_id: str | None = None
+
+    expires_at: Annotated[datetime, Indexed(expireAfterSeconds=0)]  # TTL index - expired leases auto-deleted
+    created_at: datetime = BeanieField(default_factory=lambda: datetime.now(timezone.utc).replace(tzinfo=None))
+
+    class Settings:
+        name = "utxo_reservations"
+        indexes = [
+            IndexModel([("tx_hash", ASCENDING)]),
+        ]
+
+
 class ContractMongo(Document):
     """
     Smart Contract records - MongoDB/Beanie version (multi-tenant)
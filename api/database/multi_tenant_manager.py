@@ -104,9 +104,11 @@ class MultiTenantDatabaseManager:
             try:
                 from api.database.models import (
                     WalletMongo,
+                    WalletAddressMongo,
                     WalletSessionMongo,
                     UserSessionMongo,
                     TransactionMongo,
+                    UtxoReservationMongo,
                     ContractMongo,
                 )
 
@@ -115,9 +117,11 @@ class MultiTenantDatabaseManager:
                     database=tenant_db,
                     document_models=[
                         WalletMongo,
+                        WalletAddressMongo,
                         WalletSessionMongo,
                         UserSessionMongo,
                         TransactionMongo,
+                        UtxoReservationMongo,
                         ContractMongo,
                     ]
                 )
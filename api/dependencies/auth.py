@@ -8,12 +8,20 @@ Provides middleware to protect endpoints and retrieve unlocked wallets.
 from datetime import datetime, timezone
 from typing import Annotated
 
+from beanie.operators import Set
 from fastapi import Depends, HTTPException
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 
 from api.database.models import WalletSessionMongo
+from api.database.tenant_context import get_current_tenant
 from api.enums import WalletRole
-from api.services.session_manager import get_session_manager
+from api.services.crypto_executor import CryptoQueueFullError
+from api.services.session_store import get_session_store
+from api.services.session_validation_cache import (
+    get_last_used_buffer,
+    get_session_revocations,
+    get_session_validation_cache,
+)
 from api.services.token_service import InvalidTokenError, TokenService
 from cardano_offchain.wallet import CardanoWallet
 
@@ -127,8 +135,12 @@ async def get_wallet_from_token(
         )
 
     # Check if session exists in memory
-    session_manager = get_session_manager()
-    cardano_wallet = session_manager.get_session(jti)
+    session_store = get_session_store()
+    try:
+        cardano_wallet = await session_store.get(jti)
+    except CryptoQueueFullError as e:
+        # Restoring a shared session derives keys in the crypto executor
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": str(e.retry_after)}) from e
 
     if not cardano_wallet:
         raise HTTPException(
@@ -136,41 +148,54 @@ async def get_wallet_from_token(
             detail="Session expired or wallet locked. Please unlock the wallet again."
         )
 
-    # Verify session in MongoDB database (for audit trail)
-    db_session = await WalletSessionMongo.find_one(
-        WalletSessionMongo.jti == jti,
-        WalletSessionMongo.wallet_id == wallet_id,
-        WalletSessionMongo.revoked == False  # noqa: E712
-    )
+    # Verify session in MongoDB database (for audit trail). Recently validated
+    # sessions are served from cache until it expires or the tenant's shared
+    # revocation revision moves (at most session_revocation_poll_seconds after
+    # a revocation on another worker; immediately on this one).
+    validation_cache = get_session_validation_cache()
+    tenant_id = get_current_tenant()
+    revision = await get_session_revocations().current(tenant_id)
+    validated = validation_cache.get(jti, wallet_id, tenant_id, revision)
+
+    if validated is None:
+        db_session = await WalletSessionMongo.find_one(
+            WalletSessionMongo.jti == jti,
+            WalletSessionMongo.wallet_id == wallet_id,
+            WalletSessionMongo.revoked == False  # noqa: E712
+        )
 
-    session_id = None
-    if db_session:
-        # Check if session expired in database
-        if db_session.expires_at < datetime.now(timezone.utc).replace(tzinfo=None):
-            # Clean up expired session
-            session_manager.remove_session(jti)
-            db_session.revoked = True
-            await db_session.save()
+        if not db_session:
+            # Session not in database - might have been revoked
+            # Remove from memory as well
+            await session_store.remove(jti)
 
             raise HTTPException(
                 status_code=401,
-                detail="Session expired. Please unlock the wallet again."
+                detail="Session not found or has been revoked. Please unlock the wallet again."
             )
 
-        # Update last used timestamp
-        db_session.last_used_at = datetime.now(timezone.utc).replace(tzinfo=None)
-        await db_session.save()
-        session_id = str(db_session.id)  # MongoDB ObjectId to string
-    else:
-        # Session not in database - might have been revoked
-        # Remove from memory as well
-        session_manager.remove_session(jti)
+        validated = validation_cache.put(
+            jti, wallet_id, tenant_id, str(db_session.id), db_session.expires_at, revision  # ObjectId to string
+        )
+
+    # Check if session expired in database
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    if validated.expires_at < now:
+        # Clean up expired session
+        await session_store.remove(jti)
+        await WalletSessionMongo.find(WalletSessionMongo.jti == jti).update_many(
+            Set({WalletSessionMongo.revoked: True})
+        )
 
         raise HTTPException(
             status_code=401,
-            detail="Session not found or has been revoked. Please unlock the wallet again."
+            detail="Session expired. Please unlock the wallet again."
         )
 
+    # Update last used timestamp (written behind in batches)
+    get_last_used_buffer().touch(jti, tenant_id, now)
+    session_id = validated.session_id
+
     # Return auth context
     return WalletAuthContext(
         wallet_id=wallet_id,
@@ -2,29 +2,28 @@
 Chain Context Dependency
 
 FastAPI dependency for accessing CardanoChainContext with BlockFrost API.
-"""
 
-import logging
-import os
+The shared contexts live in api.services.chain_contexts; the service-level
+helpers are re-exported here for existing router imports.
+"""
 
 from fastapi import HTTPException
 
+from api.services.chain_contexts import (
+    ChainContextConfigError,
+    close_chain_contexts,
+    get_chain_context_for_network,
+    get_default_chain_context,
+)
 from cardano_offchain.chain_context import CardanoChainContext
 
-logger = logging.getLogger(__name__)
 
-# Global state for chain context
-_chain_context: CardanoChainContext | None = None
+__all__ = ["close_chain_contexts", "get_chain_context", "get_chain_context_for_network"]
 
 
 def get_chain_context() -> CardanoChainContext:
     """
-    Get or initialize the chain context.
-
-    Supported networks:
-    - "testnet" or "preview": Cardano Preview testnet
-    - "preprod": Cardano Pre-production testnet
-    - "mainnet": Cardano Mainnet
+    Get or initialize the chain context for the configured network.
 
     Returns:
         CardanoChainContext: Initialized chain context with BlockFrost API
@@ -32,15 +31,7 @@ def get_chain_context() -> CardanoChainContext:
     Raises:
         HTTPException: If blockfrost_api_key is missing from environment
     """
-    global _chain_context
-    if _chain_context is None:
-        network = os.getenv("network", "testnet")
-        blockfrost_api_key = os.getenv("blockfrost_api_key")
-        if not blockfrost_api_key:
-            raise HTTPException(
-                status_code=500,
-                detail="Missing blockfrost_api_key environment variable"
-            )
-        _chain_context = CardanoChainContext(network, blockfrost_api_key)
-        logger.info(f"Chain context initialized: network={network}, base_url={_chain_context.base_url}")
-    return _chain_context
+    try:
+        return get_default_chain_context()
+    except ChainContextConfigError as e:
+        raise HTTPException(status_code=500, detail=str(e)) from e
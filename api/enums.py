@@ -80,6 +80,7 @@ class TransactionType(str, Enum):
     UPDATE_PROTOCOL = "update_protocol"
     MINT_PROJECT = "mint_project"
     UPDATE_PROJECT = "update_project"
+    BATCH_PAYOUT = "batch_payout"
 
 
 # ============================================================================
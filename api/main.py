@@ -47,11 +47,39 @@ async def lifespan(app: FastAPI):
         print(f"✅ MongoDB multi-tenant database initialized")
         print(f"   Admin database: terrasacha_admin")
         print(f"   Architecture: MongoDB-only (PostgreSQL removed)")
+
+        # Shared caches and session state live in the admin database
+        assert db_manager.client is not None, "MongoDB client not connected after initialize()"
+        admin_db = db_manager.client["terrasacha_admin"]
+
+        from api.services.confirmed_tx_cache import get_confirmed_tx_cache
+        await get_confirmed_tx_cache().initialize(admin_db)
+
+        from api.services.session_validation_cache import get_session_revocations
+        await get_session_revocations().initialize(admin_db)
+
+        from api.services.api_key_cache import get_api_key_revocations
+        await get_api_key_revocations().initialize(admin_db)
+
+        from api.services.session_store import MongoSessionStore, get_session_store
+        session_store = get_session_store()
+        if isinstance(session_store, MongoSessionStore):
+            await session_store.initialize(admin_db)
+            print("✅ Shared session store initialized")
     except Exception as e:
         print(f"❌ MongoDB initialization failed: {str(e)}")
         print("   MONGODB_ADMIN_URI environment variable must be set")
         raise  # Fail fast if MongoDB is not available
 
+    # Parse compiled contract scripts and addresses of every tenant once
+    if settings.contract_artifact_cache_warm_on_startup:
+        from api.services.contract_artifact_cache import warm_contract_artifact_cache
+        try:
+            warmed = await warm_contract_artifact_cache()
+            print(f"✅ Contract artifact cache warmed ({warmed} contracts)")
+        except Exception as e:
+            print(f"⚠️  Contract artifact cache warm-up failed: {str(e)}")
+
     # Check for wallet mnemonics
     wallet_mnemonics = [k for k in os.environ.keys() if "wallet_mnemonic" in k]
     print(f"Wallet mnemonics found: {len(wallet_mnemonics)}")
@@ -60,6 +88,18 @@ async def lifespan(app: FastAPI):
             f"  Wallets: {', '.join([k.replace('wallet_mnemonic_', '') for k in wallet_mnemonics if k != 'wallet_mnemonic'])}"
         )
 
+    # Start background confirmation tracking for submitted transactions
+    if settings.confirmation_tracker_enabled:
+        from api.services.confirmation_tracker import get_confirmation_tracker
+        get_confirmation_tracker().start()
+        print("✅ Confirmation tracker started")
+
+    # Start write-behind flushing of session and API key last_used_at timestamps
+    from api.services.session_validation_cache import get_last_used_buffer
+    get_last_used_buffer().start()
+    from api.services.api_key_cache import get_api_key_last_used_buffer
+    get_api_key_last_used_buffer().start()
+
     print(f"\n📚 API Documentation: http://127.0.0.1:8000/docs")
     print("=" * 60 + "\n")
 
@@ -70,6 +110,29 @@ async def lifespan(app: FastAPI):
     print("🛑 Shutting down API")
     print("=" * 60)
 
+    # Stop confirmation tracking before closing its connections
+    from api.services.confirmation_tracker import get_confirmation_tracker
+    await get_confirmation_tracker().stop()
+
+    # Flush buffered session and API key timestamps while MongoDB is still connected
+    from api.services.session_validation_cache import get_last_used_buffer
+    await get_last_used_buffer().stop()
+    from api.services.api_key_cache import get_api_key_last_used_buffer
+    await get_api_key_last_used_buffer().stop()
+
+    # Close pooled chain provider connections
+    from api.services.chain_contexts import close_chain_contexts
+    await close_chain_contexts()
+
+    # Stop compile worker processes
+    from api.services.compile_executor import get_compile_executor
+    get_compile_executor().shutdown()
+    print("✅ Compile workers stopped")
+
+    # Stop wallet crypto threads
+    from api.services.crypto_executor import get_crypto_executor
+    get_crypto_executor().shutdown()
+
     # Close MongoDB connections
     try:
         from api.database.multi_tenant_manager import get_multi_tenant_db_manager
@@ -125,9 +188,29 @@ async def health_check():
     Returns:
         - status: "healthy" if MongoDB is accessible
         - database: MongoDB connection status
+        - compile_executor: Compile queue depth and metrics
+        - crypto_executor: Wallet crypto queue depth and queue-wait metrics
+        - utxo_cache: UTxO cache hit/miss counters per network
+        - chain_enrichment: Enrichment call, retry and memo counters
+        - confirmed_tx_cache: Confirmed transaction cache hit/write counters
+        - contract_artifact_cache: Compiled contract artifact cache counters
+        - confirmation_tracker: Confirmation tracker cycle counters
+        - session_validation: Session validation cache counters and pending timestamp writes
+        - api_key_cache: API key cache counters and pending timestamp writes
         - api_version: API version
         - environment: Current environment
     """
+    from api.services.api_key_cache import get_api_key_cache, get_api_key_last_used_buffer
+    from api.services.chain_enrichment import get_enrichment_engine
+    from api.services.compile_executor import get_compile_executor
+    from api.services.confirmation_tracker import get_confirmation_tracker
+    from api.services.confirmed_tx_cache import get_confirmed_tx_cache
+    from api.services.contract_artifact_cache import get_contract_artifact_cache
+    from api.services.crypto_executor import get_crypto_executor
+    from api.services.session_validation_cache import get_last_used_buffer, get_session_validation_cache
+    from api.services.utxo_cache import get_utxo_cache_stats
+
+    compile_executor = get_compile_executor()
     health_status = {
         "status": "healthy",
         "api_version": settings.api_version,
@@ -135,7 +218,28 @@ async def health_check():
         "database": {
             "type": "MongoDB",
             "connected": False,
-        }
+        },
+        "compile_executor": {
+            "pending_jobs": compile_executor.pending_jobs,
+            **compile_executor.metrics.snapshot(),
+        },
+        "crypto_executor": {
+            "pending_jobs": get_crypto_executor().pending_jobs,
+            **get_crypto_executor().metrics.snapshot(),
+        },
+        "utxo_cache": get_utxo_cache_stats(),
+        "chain_enrichment": get_enrichment_engine().stats.snapshot(),
+        "confirmed_tx_cache": get_confirmed_tx_cache().stats.snapshot(),
+        "contract_artifact_cache": get_contract_artifact_cache().stats.snapshot(),
+        "confirmation_tracker": get_confirmation_tracker().stats.snapshot(),
+        "session_validation": {
+            **get_session_validation_cache().stats.snapshot(),
+            "pending_last_used_writes": get_last_used_buffer().pending,
+        },
+        "api_key_cache": {
+            **get_api_key_cache().stats.snapshot(),
+            "pending_last_used_writes": get_api_key_last_used_buffer().pending,
+        },
     }
 
     try:
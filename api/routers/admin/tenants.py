@@ -10,6 +10,7 @@ from pydantic import BaseModel, EmailStr
 from datetime import datetime, timedelta
 
 from api.dependencies.admin import require_admin_key
+from api.services.api_key_cache import invalidate_api_key
 
 router = APIRouter(prefix="/admin", tags=["admin"])
 
@@ -310,6 +311,7 @@ async def revoke_api_key(
     api_key.is_active = False
     api_key.revoked_at = datetime.utcnow()
     await api_key.save()
+    await invalidate_api_key(tenant_id, api_key_prefix)
 
     return {
         "message": "API key revoked successfully",
@@ -362,6 +364,7 @@ async def delete_api_key(
 
     # Permanently delete from database
     await api_key.delete()
+    await invalidate_api_key(tenant_id, api_key_prefix)
 
     return {
         "message": "API key permanently deleted from database",
@@ -30,6 +30,7 @@ from api.schemas.wallet import (
 )
 from api.services.session_manager import get_session_manager
 from api.database.models import ApiKey
+from api.services.api_key_cache import invalidate_api_key
 from api.utils.security import generate_api_key, hash_api_key
 
 
@@ -651,5 +652,6 @@ async def revoke_tenant_api_key(
     # Soft delete: mark as inactive
     api_key.is_active = False
     await api_key.save()
+    await invalidate_api_key(tenant_id, api_key_prefix)
 
     return {"message": f"API key {api_key_prefix} revoked successfully"}
@@ -12,6 +12,7 @@ from datetime import datetime, timedelta
 from api.dependencies.auth import require_core_wallet, WalletAuthContext
 from api.dependencies.tenant import require_tenant_context
 from api.database.models import ApiKey
+from api.services.api_key_cache import invalidate_api_key
 from api.utils.security import generate_api_key, hash_api_key
 
 router = APIRouter()
@@ -179,5 +180,6 @@ async def revoke_tenant_api_key(
     # Soft delete: mark as inactive
     api_key.is_active = False
     await api_key.save()
+    await invalidate_api_key(tenant_id, api_key_prefix)
 
     return {"message": f"API key {api_key_prefix} revoked successfully"}
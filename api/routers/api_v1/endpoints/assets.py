@@ -7,9 +7,9 @@ Provides asset details and policy-based asset queries via Blockfrost API.
 
 import logging
 
-from blockfrost import ApiError
 from fastapi import APIRouter, Depends, HTTPException, Path, Query
 
+from api.config import settings
 from api.dependencies.auth import WalletAuthContext, get_wallet_from_token
 from api.dependencies.chain_context import get_chain_context
 from api.schemas.asset import (
@@ -21,7 +21,9 @@ from api.schemas.asset import (
     PolicyAssetsDetailResponse,
     PolicyAssetsResponse,
 )
+from api.services.chain_enrichment import EnrichmentTimeoutError, get_enrichment_engine
 from cardano_offchain.chain_context import CardanoChainContext
+from cardano_offchain.chain_provider import ChainProviderError
 
 
 logger = logging.getLogger(__name__)
@@ -90,11 +92,11 @@ async def get_asset_detail(
     **Authentication required:** Bearer token from wallet unlock.
     """
     try:
-        api = chain_context.get_api()
+        provider = chain_context.get_provider()
 
         try:
-            asset_info = api.asset(asset_id, return_type="json")
-        except ApiError as e:
+            asset_info = await provider.asset(asset_id)
+        except ChainProviderError as e:
             if "404" in str(e) or "not found" in str(e).lower():
                 raise HTTPException(
                     status_code=404, detail=f"Asset not found: {asset_id}"
@@ -178,13 +180,13 @@ async def list_policy_assets(
     **Authentication required:** Bearer token from wallet unlock.
     """
     try:
-        api = chain_context.get_api()
+        provider = chain_context.get_provider()
 
         try:
-            assets_list = api.assets_policy(
-                policy_id, return_type="json", count=limit, page=page, order="asc"
+            assets_list = await provider.assets_policy(
+                policy_id, count=limit, page=page, order="asc"
             )
-        except ApiError as e:
+        except ChainProviderError as e:
             if "404" in str(e) or "not found" in str(e).lower():
                 return PolicyAssetsResponse(
                     policy_id=policy_id,
@@ -256,12 +258,8 @@ async def list_policy_assets_with_details(
         min_length=56,
         max_length=56,
     ),
-    page: int = Query(
-        1, ge=1, le=100, description="Page number (1-100, lower max due to detail queries)"
-    ),
-    limit: int = Query(
-        10, ge=1, le=20, description="Results per page (1-20, limited for performance)"
-    ),
+    page: int = Query(1, ge=1, le=1000, description="Page number (1-1000)"),
+    limit: int = Query(10, ge=1, le=100, description="Results per page (1-100)"),
     wallet: WalletAuthContext = Depends(get_wallet_from_token),
     chain_context: CardanoChainContext = Depends(get_chain_context),
 ) -> PolicyAssetsDetailResponse:
@@ -271,24 +269,25 @@ async def list_policy_assets_with_details(
     This endpoint replicates the behavior from the reference code that calls
     `assets_policy()` then fetches `asset()` details for each result.
 
-    **Warning:** This endpoint makes N+1 API calls (1 for the list + 1 for each asset detail).
-    For large policies, use the basic `/policy/{policy_id}` endpoint and fetch details
-    individually.
+    Asset details are fetched concurrently through the shared enrichment engine
+    (bounded concurrency, per-asset timeout, rate-limit backoff) and memoized for
+    a short TTL, so repeated pages are served without new detail queries.
+    Assets whose details cannot be fetched are omitted from the page.
 
     **Pagination:**
-    - `page`: Page number (max 100 due to performance)
-    - `limit`: Results per page (max 20 due to multiple API calls)
+    - `page`: Page number to fetch (1-based)
+    - `limit`: Results per page (max 100)
 
     **Authentication required:** Bearer token from wallet unlock.
     """
     try:
-        api = chain_context.get_api()
+        provider = chain_context.get_provider()
 
         try:
-            assets_list = api.assets_policy(
-                policy_id, return_type="json", count=limit, page=page, order="asc"
+            assets_list = await provider.assets_policy(
+                policy_id, count=limit, page=page, order="asc"
             )
-        except ApiError as e:
+        except ChainProviderError as e:
             if "404" in str(e) or "not found" in str(e).lower():
                 return PolicyAssetsDetailResponse(
                     policy_id=policy_id,
@@ -302,33 +301,42 @@ async def list_policy_assets_with_details(
                 status_code=500, detail=f"Blockfrost API error: {str(e)}"
             )
 
-        detailed_assets = []
-        for asset_summary in assets_list:
+        engine = get_enrichment_engine()
+
+        async def enrich(asset_summary: dict) -> PolicyAssetDetailItem:
             asset_id = asset_summary.get("asset", "")
+            asset_detail = await engine.memoized(
+                f"{chain_context.network}:asset",
+                asset_id,
+                lambda: engine.call(provider.asset, asset_id),
+                ttl=settings.asset_memo_ttl_seconds,
+            )
 
-            try:
-                asset_detail = api.asset(asset_id, return_type="json")
-
-                asset_name_hex = asset_detail.get("asset_name", "")
-                onchain_metadata = asset_detail.get("onchain_metadata")
-
-                detailed_assets.append(
-                    PolicyAssetDetailItem(
-                        asset=asset_detail.get("asset", asset_id),
-                        policy_id=asset_detail.get("policy_id", policy_id),
-                        asset_name=asset_name_hex,
-                        asset_name_decoded=_decode_asset_name(asset_name_hex),
-                        fingerprint=asset_detail.get("fingerprint", ""),
-                        quantity=asset_detail.get("quantity", "0"),
-                        initial_mint_tx_hash=asset_detail.get("initial_mint_tx_hash"),
-                        mint_or_burn_count=asset_detail.get("mint_or_burn_count"),
-                        onchain_metadata=onchain_metadata,
-                        metadata=_parse_asset_metadata(onchain_metadata),
-                    )
-                )
-            except ApiError as e:
-                logger.warning(f"Failed to get details for asset {asset_id}: {str(e)}")
+            asset_name_hex = asset_detail.get("asset_name", "")
+            onchain_metadata = asset_detail.get("onchain_metadata")
+
+            return PolicyAssetDetailItem(
+                asset=asset_detail.get("asset", asset_id),
+                policy_id=asset_detail.get("policy_id", policy_id),
+                asset_name=asset_name_hex,
+                asset_name_decoded=_decode_asset_name(asset_name_hex),
+                fingerprint=asset_detail.get("fingerprint", ""),
+                quantity=asset_detail.get("quantity", "0"),
+                initial_mint_tx_hash=asset_detail.get("initial_mint_tx_hash"),
+                mint_or_burn_count=asset_detail.get("mint_or_burn_count"),
+                onchain_metadata=onchain_metadata,
+                metadata=_parse_asset_metadata(onchain_metadata),
+            )
+
+        detailed_assets = []
+        results = await engine.map(assets_list, enrich)
+        for asset_summary, result in zip(assets_list, results, strict=True):
+            if isinstance(result, (ChainProviderError, EnrichmentTimeoutError)):
+                logger.warning(f"Failed to get details for asset {asset_summary.get('asset', '')}: {str(result)}")
                 continue
+            if isinstance(result, Exception):
+                raise result
+            detailed_assets.append(result)
 
         has_more = len(assets_list) == limit
 
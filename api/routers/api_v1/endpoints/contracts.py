@@ -58,6 +58,7 @@ from api.schemas.contract import (
     UpdateProtocolRequest,
     UpdateProtocolResponse,
 )
+from api.services.compile_executor import CompileExecutorError, CompileTimeoutError
 from api.services.contract_service_mongo import (
     MongoContractService,
     ContractAlreadyExistsError,
@@ -67,6 +68,7 @@ from api.services.contract_service_mongo import (
     ContractNotFoundError,
     InvalidContractParametersError,
 )
+from api.services.utxo_reservations import UtxoReservationConflictError
 from api.dependencies.chain_context import get_chain_context
 from cardano_offchain.chain_context import CardanoChainContext
 
@@ -344,6 +346,10 @@ async def compile_contract(
             is_custom_contract=contract.is_custom_contract
         )
 
+    except CompileTimeoutError as e:
+        raise HTTPException(status_code=504, detail=str(e)) from e
+    except CompileExecutorError as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": str(e.retry_after)}) from e
     except ContractCompilationError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except HTTPException:
@@ -494,6 +500,10 @@ async def compile_custom_contract(
             is_custom_contract=contract.is_custom_contract
         )
 
+    except CompileTimeoutError as e:
+        raise HTTPException(status_code=504, detail=str(e)) from e
+    except CompileExecutorError as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": str(e.retry_after)}) from e
     except ContractCompilationError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except HTTPException:
@@ -674,6 +684,10 @@ async def compile_protocol_contracts(
         raise HTTPException(status_code=409, detail=str(e))
     except InvalidContractParametersError as e:
         raise HTTPException(status_code=400, detail=str(e))
+    except CompileTimeoutError as e:
+        raise HTTPException(status_code=504, detail=str(e)) from e
+    except CompileExecutorError as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": str(e.retry_after)}) from e
     except ContractCompilationError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except HTTPException:
@@ -786,6 +800,8 @@ async def mint_protocol_nfts(
         raise HTTPException(status_code=404, detail=str(e))
     except InvalidContractParametersError as e:
         raise HTTPException(status_code=400, detail=str(e))
+    except UtxoReservationConflictError as e:
+        raise HTTPException(status_code=409, detail=str(e)) from e
     except ContractCompilationError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except HTTPException:
@@ -885,6 +901,8 @@ async def burn_protocol_nfts(
         raise HTTPException(status_code=404, detail=str(e))
     except InvalidContractParametersError as e:
         raise HTTPException(status_code=400, detail=str(e))
+    except UtxoReservationConflictError as e:
+        raise HTTPException(status_code=409, detail=str(e)) from e
     except ContractCompilationError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except HTTPException:
@@ -1017,6 +1035,10 @@ async def compile_project_contracts(
         raise HTTPException(status_code=404, detail=str(e))
     except InvalidContractParametersError as e:
         raise HTTPException(status_code=400, detail=str(e))
+    except CompileTimeoutError as e:
+        raise HTTPException(status_code=504, detail=str(e)) from e
+    except CompileExecutorError as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": str(e.retry_after)}) from e
     except ContractCompilationError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except HTTPException:
@@ -1136,6 +1158,8 @@ async def mint_project_nfts(
         raise HTTPException(status_code=404, detail=str(e))
     except InvalidContractParametersError as e:
         raise HTTPException(status_code=400, detail=str(e))
+    except UtxoReservationConflictError as e:
+        raise HTTPException(status_code=409, detail=str(e)) from e
     except ContractCompilationError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except HTTPException:
@@ -1226,6 +1250,8 @@ async def burn_project_nfts(
         raise HTTPException(status_code=404, detail=str(e))
     except InvalidContractParametersError as e:
         raise HTTPException(status_code=400, detail=str(e))
+    except UtxoReservationConflictError as e:
+        raise HTTPException(status_code=409, detail=str(e)) from e
     except ContractCompilationError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except HTTPException:
@@ -1290,6 +1316,10 @@ async def compile_grey_contract(
         raise HTTPException(status_code=409, detail=str(e))
     except InvalidContractParametersError as e:
         raise HTTPException(status_code=400, detail=str(e))
+    except CompileTimeoutError as e:
+        raise HTTPException(status_code=504, detail=str(e)) from e
+    except CompileExecutorError as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": str(e.retry_after)}) from e
     except ContractCompilationError as e:
         raise HTTPException(status_code=500, detail=str(e))
     except HTTPException:
@@ -1387,6 +1417,8 @@ async def mint_grey_tokens(
         raise HTTPException(status_code=404, detail=str(e))
     except InvalidContractParametersError as e:
         raise HTTPException(status_code=400, detail=str(e))
+    except UtxoReservationConflictError as e:
+        raise HTTPException(status_code=409, detail=str(e)) from e
     except ContractCompilationError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except HTTPException:
@@ -1470,6 +1502,8 @@ async def burn_grey_tokens(
         raise HTTPException(status_code=404, detail=str(e))
     except InvalidContractParametersError as e:
         raise HTTPException(status_code=400, detail=str(e))
+    except UtxoReservationConflictError as e:
+        raise HTTPException(status_code=409, detail=str(e)) from e
     except ContractCompilationError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except HTTPException:
@@ -1625,6 +1659,8 @@ async def deploy_reference_script(
         raise HTTPException(status_code=404, detail=str(e))
     except InvalidContractParametersError as e:
         raise HTTPException(status_code=400, detail=str(e))
+    except UtxoReservationConflictError as e:
+        raise HTTPException(status_code=409, detail=str(e)) from e
     except ContractCompilationError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except HTTPException:
@@ -1788,6 +1824,8 @@ async def update_protocol(
         raise HTTPException(status_code=404, detail=str(e))
     except InvalidContractParametersError as e:
         raise HTTPException(status_code=400, detail=str(e))
+    except UtxoReservationConflictError as e:
+        raise HTTPException(status_code=409, detail=str(e)) from e
     except ContractCompilationError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except HTTPException:
@@ -1892,6 +1930,8 @@ async def update_project(
         raise HTTPException(status_code=404, detail=str(e))
     except InvalidContractParametersError as e:
         raise HTTPException(status_code=400, detail=str(e))
+    except UtxoReservationConflictError as e:
+        raise HTTPException(status_code=409, detail=str(e)) from e
     except ContractCompilationError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except HTTPException:
@@ -1997,6 +2037,7 @@ async def list_contracts(
                     invalidated_at=c.invalidated_at,
                     has_minted_tokens=status.get("has_minted_tokens"),
                     balance_lovelace=status.get("balance_lovelace"),
+                    onchain_status=status.get("onchain_status"),
                 )
             )
 
@@ -2061,11 +2102,13 @@ async def get_contract(
         # Enrich with on-chain status if requested
         has_minted_tokens = None
         balance_lovelace = None
+        onchain_status = None
         if enrich:
             enrichment = await contract_service.enrich_contract_status([contract], chain_context)
             status = enrichment.get(contract.policy_id, {})
             has_minted_tokens = status.get("has_minted_tokens")
             balance_lovelace = status.get("balance_lovelace")
+            onchain_status = status.get("onchain_status")
 
         return CompileContractResponse(
             success=True,
@@ -2086,6 +2129,7 @@ async def get_contract(
             invalidated_at=contract.invalidated_at,
             has_minted_tokens=has_minted_tokens,
             balance_lovelace=balance_lovelace,
+            onchain_status=onchain_status,
         )
 
     except ContractNotFoundError as e:
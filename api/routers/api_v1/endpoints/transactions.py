@@ -5,24 +5,30 @@ FastAPI endpoints for Cardano transaction operations.
 Provides ADA sending, transaction status checking, and transaction history.
 """
 
+import asyncio
 import logging
-import os
 import traceback
 from datetime import datetime, timezone
 
-logger = logging.getLogger(__name__)
-
 import pycardano as pc
-from blockfrost import ApiError
 from fastapi import APIRouter, Depends, HTTPException, Path, Query
 
 from api.database.models import TransactionMongo, WalletMongo
 from api.dependencies.auth import WalletAuthContext, get_wallet_from_token, require_core_wallet
+from api.dependencies.chain_context import get_chain_context
 from api.dependencies.tenant import require_tenant_context, get_tenant_database
+from api.services.chain_enrichment import EnrichmentTimeoutError, get_enrichment_engine
+from api.services.confirmation_tracker import get_confirmation_tracker
+from api.services.crypto_executor import CryptoQueueFullError
+from api.services.confirmed_tx_cache import get_confirmed_tx_cache
 from api.services.transaction_service_mongo import MongoTransactionService
+from api.services.utxo_reservations import UtxoReservationConflictError
 from api.enums import TransactionStatus as DBTransactionStatus
 from api.schemas.transaction import (
     AddressDestin,
+    BatchPayoutRequest,
+    BatchPayoutResponse,
+    BatchPayoutTransaction,
     BlockchainTransactionHistoryResponse,
     BlockchainTransactionItem,
     BlockchainTransactionInput,
@@ -31,6 +37,8 @@ from api.schemas.transaction import (
     BuildTransactionResponse,
     MinLovelaceResponse,
     MultiAssetItem,
+    SessionSignTransactionsRequest,
+    SessionSignTransactionsResponse,
     SignAndSubmitTransactionRequest,
     SignAndSubmitTransactionResponse,
     SignTransactionRequest,
@@ -53,29 +61,12 @@ from api.services.transaction_service_mongo import (
     _prepare_tx_dict_for_validation,
 )
 from cardano_offchain.chain_context import CardanoChainContext
+from cardano_offchain.chain_provider import ChainProviderError
 
 
-router = APIRouter()
-
-# Global state for chain context
-_chain_context: CardanoChainContext | None = None
-
-
-# ============================================================================
-# Dependencies
-# ============================================================================
-
+logger = logging.getLogger(__name__)
 
-def get_chain_context() -> CardanoChainContext:
-    """Get or initialize the chain context"""
-    global _chain_context
-    if _chain_context is None:
-        network = os.getenv("network", "testnet")
-        blockfrost_api_key = os.getenv("blockfrost_api_key")
-        if not blockfrost_api_key:
-            raise HTTPException(status_code=500, detail="Missing blockfrost_api_key environment variable")
-        _chain_context = CardanoChainContext(network, blockfrost_api_key)
-    return _chain_context
+router = APIRouter()
 
 # ============================================================================
 # Two-Stage Transaction Flow Endpoints
@@ -201,7 +192,7 @@ async def build_transaction(
                         pc.Value(0, ma)
                     )
                     cc = get_chain_context()
-                    ctx = cc.get_context()
+                    ctx = await cc.prepare_context()
                     min_lovelace_calculated = pc.min_lovelace(ctx, output=test_out)
                 except Exception:
                     # Non-critical: min_lovelace is informational
@@ -235,6 +226,9 @@ async def build_transaction(
     except InsufficientFundsError as e:
         logger.warning(f"Insufficient funds for wallet {wallet.wallet_id}: {e}")
         raise HTTPException(status_code=400, detail=str(e))
+    except UtxoReservationConflictError as e:
+        logger.warning(f"Input reservation conflict for wallet {wallet.wallet_id}: {e}")
+        raise HTTPException(status_code=409, detail=str(e)) from e
     except Exception as e:
         # Log full exception details for debugging
         error_type = type(e).__name__
@@ -250,6 +244,104 @@ async def build_transaction(
         )
 
 
+@router.post(
+    "/build-payout",
+    response_model=BatchPayoutResponse,
+    summary="Build unsigned batch payout transactions",
+    description="Build unsigned transactions paying many recipients, packed into as few transactions as the max "
+                "transaction size allows. No password required. Returns transaction IDs for signing.",
+    responses={
+        400: {"model": TransactionErrorResponse, "description": "Invalid request or insufficient funds"},
+        401: {"model": TransactionErrorResponse, "description": "Authentication required"},
+        409: {"model": TransactionErrorResponse, "description": "Inputs reserved by another in-flight transaction"},
+        500: {"model": TransactionErrorResponse, "description": "Failed to build transactions"},
+    },
+)
+async def build_batch_payout(
+    request: BatchPayoutRequest,
+    wallet: WalletAuthContext = Depends(get_wallet_from_token),
+    tenant_db = Depends(get_tenant_database),
+) -> BatchPayoutResponse:
+    """
+    Build a batch payout (Stage 1: Offchain).
+
+    Replaces one POST /transactions/build per recipient: UTXOs are fetched
+    and token balances checked once for the whole batch, each output is
+    topped up to its min lovelace, and outputs are packed (in request order)
+    into as few transactions as fit the max transaction size.
+
+    **Authentication Required:**
+    - JWT token from unlocked wallet
+    - Any wallet (USER or CORE) can build payouts
+
+    **Next Step:**
+    - Sign the group: POST /transactions/sign-session with `transaction_ids`
+    - Submit each transaction in `transaction_ids` order (later transactions
+      may spend the change of earlier ones)
+    """
+    try:
+        from api.services.wallet_service_mongo import MongoWalletService
+        wallet_service = MongoWalletService(database=tenant_db)
+        db_wallet = await wallet_service.get_wallet(wallet.wallet_id)
+
+        if not db_wallet:
+            raise HTTPException(status_code=404, detail=f"Wallet {wallet.wallet_id} not found")
+
+        tx_service = MongoTransactionService(database=tenant_db)
+
+        transactions = await tx_service.build_batch_payout(
+            wallet_id=wallet.wallet_id,
+            recipients=[recipient.model_dump() for recipient in request.recipients],
+            network=db_wallet.network,
+            metadata=request.metadata,
+        )
+
+        return BatchPayoutResponse(
+            success=True,
+            batch_id=transactions[0].batch_id,
+            from_address=transactions[0].from_address,
+            recipient_count=len(request.recipients),
+            transaction_count=len(transactions),
+            transaction_ids=[transaction.tx_hash for transaction in transactions],
+            total_amount_lovelace=sum(transaction.amount_lovelace or 0 for transaction in transactions),
+            total_fee_lovelace=sum(transaction.fee_lovelace or 0 for transaction in transactions),
+            transactions=[
+                BatchPayoutTransaction(
+                    transaction_id=transaction.tx_hash,
+                    tx_cbor=transaction.unsigned_cbor,
+                    batch_index=transaction.batch_index,
+                    recipient_indexes=transaction.batch_recipient_indexes,
+                    amount_lovelace=transaction.amount_lovelace or 0,
+                    fee_lovelace=transaction.fee_lovelace or 0,
+                    tx_size=len(bytes.fromhex(transaction.unsigned_cbor)),
+                    status=transaction.status,
+                )
+                for transaction in transactions
+            ],
+        )
+
+    except HTTPException:
+        raise
+    except InsufficientFundsError as e:
+        logger.warning(f"Insufficient funds for batch payout from wallet {wallet.wallet_id}: {e}")
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    except UtxoReservationConflictError as e:
+        logger.warning(f"Input reservation conflict for wallet {wallet.wallet_id}: {e}")
+        raise HTTPException(status_code=409, detail=str(e)) from e
+    except Exception as e:
+        error_type = type(e).__name__
+        error_msg = str(e) if str(e) else "No error message"
+        logger.error(
+            f"Failed to build batch payout for wallet {wallet.wallet_id}: "
+            f"[{error_type}] {error_msg}\n"
+            f"Traceback:\n{traceback.format_exc()}"
+        )
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to build batch payout ({error_type}): {error_msg}"
+        ) from e
+
+
 @router.post(
     "/sign",
     response_model=SignTransactionResponse,
@@ -326,6 +418,8 @@ async def sign_transaction(
     except InvalidTransactionStateError as e:
         logger.warning(f"Invalid transaction state for {request.transaction_id}: {e}")
         raise HTTPException(status_code=400, detail=str(e))
+    except CryptoQueueFullError as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": str(e.retry_after)}) from e
     except Exception as e:
         # Check for password error
         if "password" in str(e).lower() or "incorrect" in str(e).lower():
@@ -344,6 +438,89 @@ async def sign_transaction(
         )
 
 
+@router.post(
+    "/sign-session",
+    response_model=SessionSignTransactionsResponse,
+    summary="Sign transactions with the unlocked session wallet",
+    description="Sign one or more built transactions with the wallet unlocked for this session (Stage 2). No password required.",
+    responses={
+        400: {"model": TransactionErrorResponse, "description": "Invalid transaction state"},
+        401: {"model": TransactionErrorResponse, "description": "Authentication required"},
+        403: {"model": TransactionErrorResponse, "description": "Not authorized to sign these transactions"},
+        404: {"model": TransactionErrorResponse, "description": "Transaction not found"},
+        500: {"model": TransactionErrorResponse, "description": "Failed to sign transactions"},
+    },
+)
+async def sign_transactions_with_session(
+    request: SessionSignTransactionsRequest,
+    wallet: WalletAuthContext = Depends(get_wallet_from_token),
+    tenant_db = Depends(get_tenant_database),
+) -> SessionSignTransactionsResponse:
+    """
+    Sign built transactions with the unlocked session wallet (Stage 2).
+
+    Unlike POST /transactions/sign, the password is not verified and the
+    mnemonic is not decrypted again: the keys derived when the wallet was
+    unlocked sign directly. Several transactions (e.g. every step of a
+    multi-step mint flow) can be signed in one request.
+
+    Transactions are validated before any is signed; if one is missing, not
+    owned or not in BUILT state, none are signed.
+
+    **Authentication Required:**
+    - JWT token from unlocked wallet
+    - Must own every transaction being signed
+
+    **Next Step:**
+    - Submit each signed transaction: POST /transactions/submit
+    """
+    try:
+        tx_service = MongoTransactionService(database=tenant_db)
+
+        transactions = await tx_service.sign_transactions_with_session(
+            transaction_ids=request.transaction_ids,
+            wallet_id=wallet.wallet_id,
+            cardano_wallet=wallet.cardano_wallet,
+        )
+
+        return SessionSignTransactionsResponse(
+            success=True,
+            count=len(transactions),
+            transactions=[
+                SignTransactionResponse(
+                    success=True,
+                    transaction_id=transaction.tx_hash,
+                    signed_tx_cbor=transaction.signed_cbor,
+                    tx_hash=transaction.tx_hash,
+                    status=transaction.status,
+                )
+                for transaction in transactions
+            ],
+        )
+
+    except TransactionNotFoundError as e:
+        logger.warning(f"Session sign: {e}")
+        raise HTTPException(status_code=404, detail=str(e)) from e
+    except TransactionNotOwnedError as e:
+        logger.warning(f"Session sign by wallet {wallet.wallet_id}: {e}")
+        raise HTTPException(status_code=403, detail=str(e)) from e
+    except InvalidTransactionStateError as e:
+        logger.warning(f"Session sign: {e}")
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    except Exception as e:
+        error_type = type(e).__name__
+        error_msg = str(e) if str(e) else "No error message"
+        logger.error(
+            f"Failed to sign transactions {request.transaction_ids} with session: "
+            f"[{error_type}] {error_msg}\n"
+            f"Traceback:\n{traceback.format_exc()}"
+        )
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to sign transactions ({error_type}): {error_msg}"
+        ) from e
+
+
 @router.post(
     "/submit",
     response_model=SubmitTransactionResponse,
@@ -423,6 +600,9 @@ async def submit_transaction(
     except InvalidTransactionStateError as e:
         logger.warning(f"Invalid transaction state for submit {request.transaction_id}: {e}")
         raise HTTPException(status_code=400, detail=str(e))
+    except UtxoReservationConflictError as e:
+        logger.warning(f"Input reservation conflict for submit {request.transaction_id}: {e}")
+        raise HTTPException(status_code=409, detail=str(e)) from e
     except Exception as e:
         error_type = type(e).__name__
         error_msg = str(e) if str(e) else "No error message"
@@ -523,6 +703,11 @@ async def sign_and_submit_transaction(
     except InvalidTransactionStateError as e:
         logger.warning(f"Invalid transaction state for sign-and-submit {request.transaction_id}: {e}")
         raise HTTPException(status_code=400, detail=str(e))
+    except UtxoReservationConflictError as e:
+        logger.warning(f"Input reservation conflict for sign-and-submit {request.transaction_id}: {e}")
+        raise HTTPException(status_code=409, detail=str(e)) from e
+    except CryptoQueueFullError as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": str(e.retry_after)}) from e
     except Exception as e:
         # Check for password error
         if "password" in str(e).lower() or "incorrect" in str(e).lower():
@@ -558,12 +743,15 @@ async def sign_and_submit_transaction(
 async def get_transaction_status(
     tx_hash: str = Path(..., description="Transaction hash to query"),
     _tenant: str = Depends(require_tenant_context),
+    tenant_db=Depends(get_tenant_database),
     chain_context: CardanoChainContext = Depends(get_chain_context),
 ) -> TransactionStatusResponse:
     """
     Get the current status of a transaction.
 
-    Queries the blockchain to determine:
+    Transactions submitted through this API are tracked in the background
+    (SUBMITTED → CONFIRMED), so their status is read from the tenant database.
+    Other transactions are queried on the blockchain to determine:
     - Whether the transaction is confirmed
     - Number of confirmations (if confirmed)
     - Block height and timestamp
@@ -572,28 +760,46 @@ async def get_transaction_status(
     **Note:** A transaction needs ~20 seconds and 1 confirmation to be considered final.
     """
     try:
-        api = chain_context.get_api()
+        # Confirmed records kept current by the confirmation tracker
+        record = await tenant_db.get_collection("transactions").find_one({"tx_hash": tx_hash})
+        if record and record.get("status") == DBTransactionStatus.CONFIRMED.value and record.get("block_height"):
+            tracker_confirmations = get_confirmation_tracker().confirmations(record.get("network"), record["block_height"])
+            return TransactionStatusResponse(
+                tx_hash=tx_hash,
+                status=TransactionStatus.CONFIRMED,
+                confirmations=tracker_confirmations or record.get("confirmations"),
+                block_height=record["block_height"],
+                block_time=record.get("confirmed_at"),
+                fee_lovelace=record.get("fee_lovelace"),
+                explorer_url=chain_context.get_explorer_url(tx_hash),
+                submitted_at=record.get("submitted_at"),
+                confirmed_at=record.get("confirmed_at"),
+            )
 
-        # Query transaction from blockchain
+        provider = chain_context.get_provider()
+
+        # Query transaction from blockchain (confirmed transactions are served from cache)
         try:
-            tx_info = api.transaction(tx_hash)
+            tx_info = await get_confirmed_tx_cache().get_or_fetch(
+                chain_context.network, tx_hash, "transaction", lambda: provider.transaction(tx_hash)
+            )
 
             # Transaction is confirmed if we can retrieve it
             status = TransactionStatus.CONFIRMED
 
             # Get block info for confirmations
-            block_height = tx_info.block_height if hasattr(tx_info, "block_height") else None
+            block_height = tx_info.get("block_height")
             block_time = None
 
             if block_height:
                 try:
-                    latest_block = api.block_latest()
-                    latest_height = latest_block.height if hasattr(latest_block, "height") else None
+                    latest_block = await provider.block_latest()
+                    latest_height = latest_block.get("height")
                     confirmations = (latest_height - block_height + 1) if latest_height else None
 
                     # Get block timestamp
-                    if hasattr(tx_info, "block_time"):
-                        block_time = datetime.fromtimestamp(tx_info.block_time, tz=timezone.utc)
+                    if tx_info.get("block_time"):
+                        block_time = datetime.fromtimestamp(tx_info["block_time"], tz=timezone.utc)
 
                 except Exception:
                     confirmations = None
@@ -601,7 +807,7 @@ async def get_transaction_status(
                 confirmations = None
 
             # Get fee
-            fee_lovelace = int(tx_info.fees) if hasattr(tx_info, "fees") else None
+            fee_lovelace = int(tx_info["fees"]) if tx_info.get("fees") is not None else None
 
             # Get explorer URL
             explorer_url = chain_context.get_explorer_url(tx_hash)
@@ -816,33 +1022,35 @@ async def get_transaction_detail(
     - Asset transfers (if any)
     """
     try:
-        api = chain_context.get_api()
+        provider = chain_context.get_provider()
 
-        # Query transaction details
+        # Query transaction details (confirmed transactions are served from cache)
         try:
-            tx_info = api.transaction(tx_hash)
+            tx_info = await get_confirmed_tx_cache().get_or_fetch(
+                chain_context.network, tx_hash, "transaction", lambda: provider.transaction(tx_hash)
+            )
 
             # Determine status
             status = TransactionStatus.CONFIRMED
 
             # Get block info
-            block_height = tx_info.block_height if hasattr(tx_info, "block_height") else None
+            block_height = tx_info.get("block_height")
             block_time = None
             confirmations = None
 
             if block_height:
                 try:
-                    if hasattr(tx_info, "block_time"):
-                        block_time = datetime.fromtimestamp(tx_info.block_time, tz=timezone.utc)
+                    if tx_info.get("block_time"):
+                        block_time = datetime.fromtimestamp(tx_info["block_time"], tz=timezone.utc)
 
-                    latest_block = api.block_latest()
-                    latest_height = latest_block.height if hasattr(latest_block, "height") else None
+                    latest_block = await provider.block_latest()
+                    latest_height = latest_block.get("height")
                     confirmations = (latest_height - block_height + 1) if latest_height else None
                 except Exception:
                     pass
 
             # Get fee
-            fee_lovelace = int(tx_info.fees) if hasattr(tx_info, "fees") else None
+            fee_lovelace = int(tx_info["fees"]) if tx_info.get("fees") is not None else None
             fee_ada = fee_lovelace / 1_000_000 if fee_lovelace else None
 
             # Parse inputs and outputs
@@ -990,7 +1198,7 @@ async def calculate_min_lovelace(
         output = pc.TransactionOutput(address=address, amount=amount, datum=datum)
 
         # Calculate min lovelace using PyCardano
-        context = chain_context.get_context()
+        context = await chain_context.prepare_context()
         min_val = pc.min_lovelace(context, output=output)
 
         return MinLovelaceResponse(
@@ -1069,22 +1277,20 @@ async def get_blockchain_transaction_history(
         except Exception as e:
             raise HTTPException(status_code=400, detail=f"Invalid Cardano address: {str(e)}")
 
-        # Get Blockfrost API instance
-        api = chain_context.get_api()
+        provider = chain_context.get_provider()
 
         # Query address transactions from Blockfrost
         try:
-            transactions_list = api.address_transactions(
+            transactions_list = await provider.address_transactions(
                 address=address,
                 from_block=from_block,
                 to_block=to_block,
-                return_type="json",
                 count=limit,
                 page=page,
                 order="desc",  # Most recent first
             )
-        except ApiError as e:
-            if "404" in str(e):
+        except ChainProviderError as e:
+            if e.not_found:
                 # Address has no transactions yet
                 return BlockchainTransactionHistoryResponse(
                     transactions=[],
@@ -1095,52 +1301,69 @@ async def get_blockchain_transaction_history(
                 )
             raise HTTPException(status_code=500, detail=f"Blockfrost API error: {str(e)}")
 
-        # Enrich each transaction with full details
-        enriched_transactions = []
-        for tx_summary in transactions_list:
-            tx_hash = tx_summary["tx_hash"]
+        # Confirmed transactions are immutable: serve their payloads from the shared
+        # cache and fetch only what is missing, concurrently
+        engine = get_enrichment_engine()
+        tx_cache = get_confirmed_tx_cache()
+        network = chain_context.network
+        cached = await tx_cache.get_many(network, [tx["tx_hash"] for tx in transactions_list])
 
+        async def fetch_metadata(tx_hash: str) -> list[dict] | None:
+            # Metadata may be missing; a failed lookup is not cached
             try:
-                # Get full transaction details
-                tx_utxos = api.transaction_utxos(tx_hash, return_type="json")
-                tx_details = api.transaction(tx_hash, return_type="json")
+                return await engine.call(provider.transaction_metadata, tx_hash)
+            except ChainProviderError:
+                return None
 
-                # Get metadata (may be empty)
-                try:
-                    tx_metadata = api.transaction_metadata(tx_hash, return_type="json")
-                except ApiError:
-                    tx_metadata = None
-
-                # Build explorer URL
-                explorer_url = chain_context.get_explorer_url(tx_hash)
-
-                # Create enriched transaction item
-                enriched_tx = BlockchainTransactionItem(
-                    hash=tx_hash,
-                    block_height=tx_summary["block_height"],
-                    block_time=tx_summary["block_time"],
-                    block=tx_details.get("block", ""),
-                    slot=tx_details.get("slot", 0),
-                    inputs=tx_utxos.get("inputs", []),
-                    outputs=tx_utxos.get("outputs", []),
-                    fees=tx_details.get("fees", "0"),
-                    size=tx_details.get("size", 0),
-                    index=tx_details.get("index", 0),
-                    output_amount=tx_details.get("output_amount", []),
-                    deposit=tx_details.get("deposit", "0"),
-                    metadata=tx_metadata,
-                    invalid_before=tx_details.get("invalid_before"),
-                    invalid_hereafter=tx_details.get("invalid_hereafter"),
-                    valid_contract=tx_details.get("valid_contract", True),
-                    explorer_url=explorer_url,
-                )
-
-                enriched_transactions.append(enriched_tx)
+        async def enrich(tx_summary: dict) -> BlockchainTransactionItem:
+            tx_hash = tx_summary["tx_hash"]
+            record = dict(cached.get(tx_hash, {}))
+            fetchers = {
+                "transaction_utxos": lambda: engine.call(provider.transaction_utxos, tx_hash),
+                "transaction": lambda: engine.call(provider.transaction, tx_hash),
+                "transaction_metadata": lambda: fetch_metadata(tx_hash),
+            }
+            missing = [kind for kind in fetchers if kind not in record]
+            if missing:
+                payloads = await asyncio.gather(*(fetchers[kind]() for kind in missing))
+                fetched = dict(zip(missing, payloads, strict=True))
+                await tx_cache.put(network, tx_hash, {k: v for k, v in fetched.items() if v is not None})
+                record.update(fetched)
+
+            tx_utxos = record["transaction_utxos"]
+            tx_details = record["transaction"]
+            tx_metadata = record["transaction_metadata"]
+
+            return BlockchainTransactionItem(
+                hash=tx_hash,
+                block_height=tx_summary["block_height"],
+                block_time=tx_summary["block_time"],
+                block=tx_details.get("block", ""),
+                slot=tx_details.get("slot", 0),
+                inputs=tx_utxos.get("inputs", []),
+                outputs=tx_utxos.get("outputs", []),
+                fees=tx_details.get("fees", "0"),
+                size=tx_details.get("size", 0),
+                index=tx_details.get("index", 0),
+                output_amount=tx_details.get("output_amount", []),
+                deposit=tx_details.get("deposit", "0"),
+                metadata=tx_metadata,
+                invalid_before=tx_details.get("invalid_before"),
+                invalid_hereafter=tx_details.get("invalid_hereafter"),
+                valid_contract=tx_details.get("valid_contract", True),
+                explorer_url=chain_context.get_explorer_url(tx_hash),
+            )
 
-            except ApiError as e:
+        enriched_transactions = []
+        results = await engine.map(transactions_list, enrich)
+        for tx_summary, result in zip(transactions_list, results, strict=True):
+            if isinstance(result, (ChainProviderError, EnrichmentTimeoutError)):
                 # Log error but continue with other transactions
-                print(f"Warning: Failed to enrich transaction {tx_hash}: {str(e)}")
+                logger.warning(f"Failed to enrich transaction {tx_summary['tx_hash']}: {str(result)}")
                 continue
+            if isinstance(result, Exception):
+                raise result
+            enriched_transactions.append(result)
 
         # Determine if there are more results
         has_more = len(transactions_list) == limit
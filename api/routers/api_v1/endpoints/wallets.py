@@ -10,13 +10,15 @@ from datetime import datetime, timedelta, timezone
 
 from fastapi import APIRouter, Depends, Header, HTTPException, Path, Query, Request
 
-logger = logging.getLogger(__name__)
-
+from api.database.tenant_context import get_current_tenant
 from api.dependencies.auth import WalletAuthContext, get_wallet_from_token, require_core_wallet
 from api.dependencies.chain_context import get_chain_context
 from api.dependencies.tenant import get_tenant_database, require_tenant_context
 from api.enums import NetworkType, WalletRole
 from api.schemas.wallet import (
+    AddressLookupRequest,
+    AddressLookupResponse,
+    AddressOwnerInfo,
     AddressUtxoResponse,
     ChangeNameRequest,
     ChangeNameResponse,
@@ -55,7 +57,11 @@ from api.schemas.wallet import (
     WalletListResponse,
 )
 from cardano_offchain.chain_context import CardanoChainContext
-from api.services.session_manager import get_session_manager
+from api.services.address_registry import AddressRegistry
+from api.services.crypto_executor import CryptoQueueFullError, get_crypto_executor
+from api.services.session_store import get_session_store
+from api.services.session_validation_cache import get_session_revocations
+from api.services.wallet_balances import AddressBalance, fetch_address_balances, total_balance
 from api.services.token_service import InvalidTokenError, TokenService
 from api.services.wallet_service_mongo import (
     InvalidMnemonicError,
@@ -67,6 +73,8 @@ from api.services.wallet_service_mongo import (
 )
 
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
 
@@ -145,6 +153,8 @@ async def create_wallet(
     except ValueError as e:
         # Password validation or other value errors
         raise HTTPException(status_code=400, detail=str(e))
+    except CryptoQueueFullError as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": str(e.retry_after)}) from e
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to create wallet: {str(e)}")
 
@@ -218,6 +228,8 @@ async def import_wallet(
     except ValueError as e:
         # Password validation or other value errors
         raise HTTPException(status_code=400, detail=str(e))
+    except CryptoQueueFullError as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": str(e.retry_after)}) from e
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to import wallet: {str(e)}")
 
@@ -343,12 +355,13 @@ async def unlock_wallet(
             wallet_name=wallet.name,
         )
 
-        # Store session in memory (for transaction signing)
-        session_manager = get_session_manager()
-        session_manager.store_session(
+        # Store session (for transaction signing)
+        session_store = get_session_store()
+        await session_store.store(
             jti=access_jti,
             cardano_wallet=cardano_wallet,
             expires_at=access_expires_at,
+            wallet_id=wallet.id,
         )
 
         # Store session in database (for audit trail and revocation)
@@ -392,6 +405,8 @@ async def unlock_wallet(
         raise HTTPException(status_code=401, detail=str(e))
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
+    except CryptoQueueFullError as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": str(e.retry_after)}) from e
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to unlock wallet: {str(e)}")
 
@@ -438,18 +453,16 @@ async def lock_wallet(
             WalletSessionMongo.revoked == False
         ).to_list()
 
-        jtis = []
         for session_doc in sessions:
             # Mark as revoked
             session_doc.revoked = True
             session_doc.revoked_at = datetime.now(timezone.utc).replace(tzinfo=None)
             await session_doc.save()
-            jtis.append(session_doc.jti)
 
-        # Remove sessions from memory
-        session_manager = get_session_manager()
-        for jti in jtis:
-            session_manager.remove_session(jti)
+        # Remove sessions from session store
+        await get_session_store().remove_wallet(wallet_id)
+        # Other workers drop their cached trust in the tenant's sessions
+        await get_session_revocations().bump(get_current_tenant())
 
         return LockWalletResponse(
             success=True,
@@ -529,7 +542,7 @@ async def store_session_password(
         if not wallet:
             raise HTTPException(status_code=404, detail=f"Wallet {wallet_id} not found")
 
-        if not verify_password(request.password, wallet.password_hash):
+        if not await get_crypto_executor().run(verify_password, request.password, wallet.password_hash):
             raise HTTPException(status_code=401, detail="Invalid password")
 
         # 2. Encrypt password with session key
@@ -591,6 +604,8 @@ async def store_session_password(
 
     except HTTPException:
         raise
+    except CryptoQueueFullError as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": str(e.retry_after)}) from e
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to store session password: {str(e)}")
 
@@ -750,12 +765,13 @@ async def auto_unlock_wallet(
             wallet_name=wallet.name,
         )
 
-        # 7. Store in in-memory session manager
-        session_manager = get_session_manager()
-        session_manager.store_session(
+        # 7. Store in session store
+        session_store = get_session_store()
+        await session_store.store(
             jti=access_jti,
             cardano_wallet=cardano_wallet,
-            expires_at=access_expires_at
+            expires_at=access_expires_at,
+            wallet_id=wallet.id,
         )
 
         # 8. Store in MongoDB for audit trail
@@ -796,6 +812,8 @@ async def auto_unlock_wallet(
         raise
     except WalletNotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
+    except CryptoQueueFullError as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": str(e.retry_after)}) from e
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to auto-unlock wallet: {str(e)}")
 
@@ -883,8 +901,8 @@ async def refresh_access_token(
         )
 
         # Get the CardanoWallet instance from the old session (if still exists)
-        session_manager = get_session_manager()
-        cardano_wallet = session_manager.get_session(db_session.jti)
+        session_store = get_session_store()
+        cardano_wallet = await session_store.get(db_session.jti)
 
         if not cardano_wallet:
             # Session expired in memory, need to re-unlock
@@ -893,11 +911,12 @@ async def refresh_access_token(
                 detail="Session expired in memory. Please unlock the wallet again with your password.",
             )
 
-        # Store new session in memory
-        session_manager.store_session(
+        # Store new session
+        await session_store.store(
             jti=new_access_jti,
             cardano_wallet=cardano_wallet,
             expires_at=new_access_expires_at,
+            wallet_id=wallet_id,
         )
 
         # Update database session with new JTI (MongoDB version)
@@ -921,6 +940,8 @@ async def refresh_access_token(
         raise
     except WalletNotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
+    except CryptoQueueFullError as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": str(e.retry_after)}) from e
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to refresh token: {str(e)}")
 
@@ -974,9 +995,10 @@ async def revoke_token(
             session_doc.revoked_at = datetime.now(timezone.utc).replace(tzinfo=None)
             await session_doc.save()
 
-        # Remove from in-memory session manager
-        session_manager = get_session_manager()
-        session_manager.remove_session(jti)
+        # Remove from session store
+        await get_session_store().remove(jti)
+        # Other workers drop their cached trust in the tenant's sessions
+        await get_session_revocations().bump(get_current_tenant())
 
         return RevokeTokenResponse(
             success=True,
@@ -1145,9 +1167,10 @@ async def revoke_specific_session(
         session_doc.revoked_at = datetime.now(timezone.utc).replace(tzinfo=None)
         await session_doc.save()
 
-        # Remove from in-memory session manager
-        session_manager = get_session_manager()
-        session_manager.remove_session(jti)
+        # Remove from session store
+        await get_session_store().remove(jti)
+        # Other workers drop their cached trust in the tenant's sessions
+        await get_session_revocations().bump(get_current_tenant())
 
         return RevokeSessionResponse(
             success=True,
@@ -1346,20 +1369,18 @@ async def change_password(
             WalletSessionMongo.revoked == False
         ).to_list()
 
-        jtis = []
         now = datetime.now(timezone.utc).replace(tzinfo=None)
 
         # Revoke all sessions in database
         for session_doc in active_sessions:
-            jtis.append(session_doc.jti)
             session_doc.revoked = True
             session_doc.revoked_at = now
             await session_doc.save()
 
-        # Remove all sessions from memory
-        session_manager = get_session_manager()
-        for jti in jtis:
-            session_manager.remove_session(jti)
+        # Remove all sessions from session store
+        await get_session_store().remove_wallet(wallet_id)
+        # Other workers drop their cached trust in the tenant's sessions
+        await get_session_revocations().bump(get_current_tenant())
 
         return ChangePasswordResponse(
             success=True,
@@ -1378,6 +1399,8 @@ async def change_password(
         raise HTTPException(status_code=400, detail=str(e))
     except HTTPException:
         raise
+    except CryptoQueueFullError as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": str(e.retry_after)}) from e
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -1431,6 +1454,8 @@ async def change_name(
         raise HTTPException(status_code=400, detail=str(e))
     except HTTPException:
         raise
+    except CryptoQueueFullError as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": str(e.retry_after)}) from e
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -1587,18 +1612,10 @@ async def delete_wallet(
         # Delete wallet (includes password verification)
         await wallet_service.delete_wallet(wallet_id, request.password, WalletRole(wallet.wallet_role))
 
-        # Remove any active sessions from memory
-        from api.database.models import WalletSessionMongo
-
-        sessions = await WalletSessionMongo.find(
-            WalletSessionMongo.wallet_id == wallet_id
-        ).to_list()
-
-        jtis = [session_doc.jti for session_doc in sessions]
-
-        session_manager = get_session_manager()
-        for jti in jtis:
-            session_manager.remove_session(jti)
+        # Remove any active sessions from session store
+        await get_session_store().remove_wallet(wallet_id)
+        # Other workers drop their cached trust in the tenant's sessions
+        await get_session_revocations().bump(get_current_tenant())
 
         return DeleteWalletResponse(
             success=True,
@@ -1610,6 +1627,8 @@ async def delete_wallet(
         raise HTTPException(status_code=404, detail=str(e))
     except InvalidPasswordError as e:
         raise HTTPException(status_code=401, detail=str(e))
+    except CryptoQueueFullError as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": str(e.retry_after)}) from e
     except Exception as e:
         # Check if it's a PermissionDeniedError (last CORE wallet)
         if "last CORE wallet" in str(e):
@@ -1757,7 +1776,7 @@ async def unpromote_wallet(
     "/{wallet_id}/balance",
     response_model=WalletBalanceResponse,
     summary="Check wallet balance",
-    description="Get ADA balance for wallet addresses. Only requires API key authentication.",
+    description="Get ADA and native token balances for wallet addresses. Only requires API key authentication.",
     responses={
         404: {"model": ErrorResponse, "description": "Wallet not found"},
         500: {"model": ErrorResponse, "description": "Server error"},
@@ -1765,20 +1784,23 @@ async def unpromote_wallet(
 )
 async def get_wallet_balance(
     wallet_id: str = Path(..., description="Wallet ID (payment key hash)"),
+    include_derived: bool = Query(False, description="Also check the wallet's registered derived addresses"),
     chain_context: CardanoChainContext = Depends(get_chain_context),
     tenant_db = Depends(get_tenant_database),
 ) -> WalletBalanceResponse:
     """
-    Check wallet balance for main addresses.
+    Check wallet balance for main (and optionally derived) addresses.
 
     This endpoint:
-    1. Queries the blockchain for UTXOs on wallet addresses
-    2. Calculates total balance in lovelace and ADA
-    3. Returns balance breakdown by address
+    1. Queries the address totals of every wallet address concurrently
+    2. Counts lovelace and every native asset
+    3. Returns balance breakdown by address plus per-asset totals
 
     **Usage:**
     - Checks main enterprise and staking addresses
-    - Returns both lovelace and ADA amounts
+    - With include_derived=true, also the derived addresses registered for
+      the wallet (up to the configured gap limit)
+    - Returns lovelace, ADA and native asset amounts
 
     **Authorization:**
     - Requires API key (X-API-Key header)
@@ -1789,54 +1811,47 @@ async def get_wallet_balance(
         wallet_service = MongoWalletService(database=tenant_db)
         wallet = await wallet_service.get_wallet(wallet_id)
 
-        # Get balance for main addresses using blockchain API
-        main_addresses_balance = {}
-        total_lovelace = 0
-
-        # Check enterprise address balance
-        if wallet.enterprise_address:
-            try:
-                balance = chain_context.api.address(wallet.enterprise_address).amount
-                lovelace_balance = sum(int(a.quantity) for a in balance if a.unit == "lovelace")
-                main_addresses_balance["enterprise"] = WalletBalanceInfo(
-                    address=wallet.enterprise_address,
-                    balance_lovelace=lovelace_balance,
-                    balance_ada=lovelace_balance / 1_000_000
-                )
-                total_lovelace += lovelace_balance
-            except Exception:
-                # Address might not have any UTXOs yet
-                main_addresses_balance["enterprise"] = WalletBalanceInfo(
-                    address=wallet.enterprise_address,
-                    balance_lovelace=0,
-                    balance_ada=0.0
-                )
-
-        # Check staking address balance if available
-        if wallet.staking_address:
-            try:
-                balance = chain_context.api.address(wallet.staking_address).amount
-                lovelace_balance = sum(int(a.quantity) for a in balance if a.unit == "lovelace")
-                main_addresses_balance["staking"] = WalletBalanceInfo(
-                    address=wallet.staking_address,
-                    balance_lovelace=lovelace_balance,
-                    balance_ada=lovelace_balance / 1_000_000
-                )
-                total_lovelace += lovelace_balance
-            except Exception:
-                main_addresses_balance["staking"] = WalletBalanceInfo(
-                    address=wallet.staking_address,
-                    balance_lovelace=0,
-                    balance_ada=0.0
-                )
+        main_addresses = {
+            address_type: address
+            for address_type, address in [
+                ("enterprise", wallet.enterprise_address),
+                ("staking", wallet.staking_address),
+            ]
+            if address
+        }
+        derived = []
+        if include_derived:
+            # Derived index 0 is the main payment key, already covered by the main addresses
+            derived = [
+                owner
+                for owner in await AddressRegistry(tenant_db).list_wallet_addresses(wallet.id)
+                if owner.derivation_index > 0
+            ]
+
+        balances = await fetch_address_balances(
+            chain_context.get_provider(), [*main_addresses.values(), *(owner.address for owner in derived)]
+        )
+        total_lovelace, total_assets = total_balance(balances)
+
+        def balance_info(balance: AddressBalance) -> WalletBalanceInfo:
+            return WalletBalanceInfo(
+                address=balance.address,
+                balance_lovelace=balance.lovelace,
+                balance_ada=balance.lovelace / 1_000_000,
+                assets=balance.assets or None,
+            )
 
         return WalletBalanceResponse(
             wallet_name=wallet.name,
             balances=WalletBalances(
-                main_addresses=main_addresses_balance,
-                derived_addresses=[],
+                main_addresses={
+                    address_type: balance_info(balance)
+                    for address_type, balance in zip(main_addresses, balances, strict=False)
+                },
+                derived_addresses=[balance_info(balance) for balance in balances[len(main_addresses) :]],
                 total_balance_lovelace=total_lovelace,
-                total_balance_ada=total_lovelace / 1_000_000
+                total_balance_ada=total_lovelace / 1_000_000,
+                total_assets=total_assets,
             )
         )
 
@@ -1851,6 +1866,58 @@ async def get_wallet_balance(
         )
 
 
+@router.post(
+    "/addresses/lookup",
+    response_model=AddressLookupResponse,
+    summary="Resolve address owners",
+    description="Resolve which wallet and derivation index own a batch of addresses. Only requires API key authentication.",
+    responses={
+        500: {"model": ErrorResponse, "description": "Server error"},
+    },
+)
+async def lookup_addresses(
+    lookup_request: AddressLookupRequest,
+    tenant_db = Depends(get_tenant_database),
+) -> AddressLookupResponse:
+    """
+    Resolve the owners of up to 1000 addresses in one request.
+
+    Answered from the derived address registry with a single indexed query:
+    no wallet needs to be unlocked. Use it to attribute incoming payments to
+    wallets.
+
+    **Authorization:**
+    - Requires API key header (X-API-Key)
+    - Bearer token NOT required
+    """
+    try:
+        owners = await AddressRegistry(tenant_db).lookup(lookup_request.addresses)
+
+        results = []
+        for address in lookup_request.addresses:
+            owner = owners.get(address)
+            if owner is None:
+                results.append(AddressOwnerInfo(address=address, found=False))
+            else:
+                results.append(
+                    AddressOwnerInfo(
+                        address=address,
+                        found=True,
+                        wallet_id=owner.wallet_id,
+                        derivation_index=owner.derivation_index,
+                        address_type=owner.address_type,
+                    )
+                )
+
+        return AddressLookupResponse(results=results, found=sum(1 for r in results if r.found))
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to look up addresses: {str(e)}"
+        ) from e
+
+
 @router.get(
     "/{wallet_id}/addresses",
     response_model=GenerateAddressesResponse,
@@ -1868,9 +1935,13 @@ async def get_wallet_addresses(
     """
     Get wallet addresses stored in the database.
 
-    This endpoint returns the main addresses for a wallet:
+    This endpoint returns the wallet's registered derived addresses (up to
+    the configured gap limit), each with:
     - Enterprise address (payment-only)
-    - Staking address (if available)
+    - Staking address
+
+    Wallets created before the address registry list only their main
+    addresses until they are next unlocked.
 
     **Authorization:**
     - Requires API key header (X-API-Key)
@@ -1881,9 +1952,22 @@ async def get_wallet_addresses(
         wallet_service = MongoWalletService(database=tenant_db)
         wallet = await wallet_service.get_wallet(wallet_id)
 
-        # Build address list from stored addresses
-        addresses = []
-        if wallet.enterprise_address or wallet.staking_address:
+        # Build address list from the derived address registry
+        registered: dict[int, dict[str, str]] = {}
+        for owner in await AddressRegistry(tenant_db).list_wallet_addresses(wallet.id):
+            registered.setdefault(owner.derivation_index, {})[owner.address_type] = owner.address
+        addresses = [
+            DerivedAddressInfo(
+                index=index,
+                path=f"m/1852'/1815'/0'/0/{index}",
+                enterprise_address=entry.get("enterprise", ""),
+                staking_address=entry.get("staking", ""),
+            )
+            for index, entry in registered.items()
+        ]
+
+        # Wallets not yet registered (never unlocked since): main addresses only
+        if not addresses and (wallet.enterprise_address or wallet.staking_address):
             addresses.append(DerivedAddressInfo(
                 index=0,
                 path="m/1852'/1815'/0'/0/0",
@@ -1962,11 +2046,11 @@ async def get_wallet_utxos(
         if wallet.enterprise_address:
             try:
                 logger.debug(f"Querying UTXOs for enterprise address: {wallet.enterprise_address}")
-                address_utxos = chain_context.api.address_utxos(wallet.enterprise_address)
+                address_utxos = await chain_context.get_provider().address_utxos(wallet.enterprise_address)
                 logger.debug(f"Found {len(address_utxos)} UTXOs for enterprise address")
                 for utxo in address_utxos:
                     # Calculate lovelace amount
-                    lovelace_amount = sum(int(a.quantity) for a in utxo.amount if a.unit == "lovelace")
+                    lovelace_amount = sum(int(a["quantity"]) for a in utxo["amount"] if a["unit"] == "lovelace")
 
                     # Apply minimum filter
                     if lovelace_amount < min_lovelace:
@@ -1974,13 +2058,13 @@ async def get_wallet_utxos(
 
                     # Extract native tokens
                     tokens = {}
-                    for amount in utxo.amount:
-                        if amount.unit != "lovelace":
-                            tokens[amount.unit] = int(amount.quantity)
+                    for amount in utxo["amount"]:
+                        if amount["unit"] != "lovelace":
+                            tokens[amount["unit"]] = int(amount["quantity"])
 
                     utxos.append(UtxoInfo(
-                        tx_hash=utxo.tx_hash,
-                        output_index=utxo.output_index,
+                        tx_hash=utxo["tx_hash"],
+                        output_index=utxo["output_index"],
                         address=wallet.enterprise_address,
                         amount_lovelace=lovelace_amount,
                         amount_ada=lovelace_amount / 1_000_000,
@@ -2061,12 +2145,12 @@ async def get_address_utxos(
         min_lovelace = int(min_ada * 1_000_000) if min_ada else 0
 
         try:
-            address_utxos = chain_context.api.address_utxos(address)
+            address_utxos = await chain_context.get_provider().address_utxos(address)
             logger.debug(f"Found {len(address_utxos)} UTXOs for address {address}")
 
             for utxo in address_utxos:
                 # Calculate lovelace amount
-                lovelace_amount = sum(int(a.quantity) for a in utxo.amount if a.unit == "lovelace")
+                lovelace_amount = sum(int(a["quantity"]) for a in utxo["amount"] if a["unit"] == "lovelace")
 
                 # Apply minimum filter
                 if lovelace_amount < min_lovelace:
@@ -2074,13 +2158,13 @@ async def get_address_utxos(
 
                 # Extract native tokens
                 tokens = {}
-                for amount in utxo.amount:
-                    if amount.unit != "lovelace":
-                        tokens[amount.unit] = int(amount.quantity)
+                for amount in utxo["amount"]:
+                    if amount["unit"] != "lovelace":
+                        tokens[amount["unit"]] = int(amount["quantity"])
 
                 utxos.append(UtxoInfo(
-                    tx_hash=utxo.tx_hash,
-                    output_index=utxo.output_index,
+                    tx_hash=utxo["tx_hash"],
+                    output_index=utxo["output_index"],
                     address=address,
                     amount_lovelace=lovelace_amount,
                     amount_ada=lovelace_amount / 1_000_000,
@@ -140,6 +140,10 @@ class CompileContractResponse(BaseModel):
         None,
         description="On-chain balance in lovelace (spending validators only, requires ?enrich=true)."
     )
+    onchain_status: str | None = Field(
+        None,
+        description="Outcome of the on-chain query (ok/no_address/unlinked/error/timeout), requires ?enrich=true."
+    )
 
     class Config:
         json_schema_extra = {
@@ -815,6 +819,12 @@ class DbContractListItem(BaseModel):
         None,
         description="On-chain balance in lovelace (spending validators only, requires ?enrich=true)"
     )
+    onchain_status: str | None = Field(
+        None,
+        description="Outcome of the on-chain query, requires ?enrich=true. "
+        "ok, no_address, unlinked (no associated spending validator), error, "
+        "or timeout (deadline reached, partial results returned)"
+    )
 
 
 class DbContractListResponse(BaseModel):
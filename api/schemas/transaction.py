@@ -436,6 +436,81 @@ class BuildTransactionResponse(BaseModel):
         }
 
 
+class PayoutRecipient(BaseModel):
+    """One output of a batch payout"""
+
+    address: str = Field(description="Destination Cardano address")
+    lovelace: int | None = Field(
+        default=None,
+        ge=0,
+        description="Lovelace to send. Topped up to the output's min lovelace when lower or omitted."
+    )
+    assets: list[MultiAssetItem] | None = Field(None, description="Native tokens/assets to send")
+
+    @model_validator(mode="after")
+    def validate_lovelace_or_assets(self):
+        if self.lovelace is None and self.assets is None:
+            raise ValueError("At least one of 'lovelace' or 'assets' must be provided")
+        return self
+
+
+class BatchPayoutRequest(BaseModel):
+    """
+    Request to build unsigned transactions paying many recipients.
+
+    Outputs are packed into as few transactions as the max transaction size
+    allows. The source wallet is determined from the JWT token.
+    """
+
+    recipients: list[PayoutRecipient] = Field(
+        min_length=1, max_length=1000, description="Payout outputs, kept in this order across transactions"
+    )
+    metadata: dict | None = Field(
+        None,
+        description="Optional transaction metadata (CIP-20 or custom format), attached to every transaction"
+    )
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "recipients": [
+                    {"address": "addr_test1qz...", "lovelace": 5000000},
+                    {"address": "addr_test1vq...", "assets": [{"policyid": "abc123def456...", "tokens": {"GREY": 100}}]}
+                ],
+                "metadata": {"msg": "Quarterly stakeholder payout"}
+            }
+        }
+
+
+class BatchPayoutTransaction(BaseModel):
+    """One unsigned transaction of a batch payout"""
+
+    transaction_id: str = Field(description="Transaction ID for signing/submitting")
+    tx_cbor: str = Field(description="Unsigned transaction CBOR hex")
+    batch_index: int = Field(description="Position in the batch (submit in this order)")
+    recipient_indexes: list[int] = Field(description="Indexes into the request's recipients paid by this transaction")
+    amount_lovelace: int = Field(description="Lovelace paid to recipients (after min lovelace top-up)")
+    fee_lovelace: int = Field(description="Transaction fee in lovelace")
+    tx_size: int = Field(description="Transaction size in bytes (unsigned)")
+    status: str = Field(default="BUILT", description="Transaction status")
+
+
+class BatchPayoutResponse(BaseModel):
+    """Response after building a batch payout"""
+
+    success: bool = Field(default=True)
+    batch_id: str = Field(description="Identifier shared by the batch's transactions")
+    from_address: str = Field(description="Source address used")
+    recipient_count: int = Field(description="Number of outputs paid")
+    transaction_count: int = Field(description="Number of transactions built")
+    transaction_ids: list[str] = Field(
+        description="Transaction IDs in submission order (sign together via POST /transactions/sign-session)"
+    )
+    total_amount_lovelace: int = Field(description="Lovelace paid to all recipients")
+    total_fee_lovelace: int = Field(description="Sum of the transaction fees")
+    transactions: list[BatchPayoutTransaction] = Field(description="Built transactions, in submission order")
+
+
 class SignTransactionRequest(BaseModel):
     """
     Request to sign a built transaction.
@@ -476,6 +551,36 @@ class SignTransactionResponse(BaseModel):
         }
 
 
+class SessionSignTransactionsRequest(BaseModel):
+    """
+    Request to sign one or more built transactions with the unlocked session wallet.
+
+    No password required - the wallet unlocked for this session signs.
+    """
+
+    transaction_ids: list[str] = Field(
+        min_length=1, max_length=100, description="Transaction IDs from build endpoints, signed in order"
+    )
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "transaction_ids": [
+                    "6994b691d6c64fd141eee2d4380251730b44c99da599b82f14c3d29514ede38f",
+                    "a3c1f0e5b7d24c9e8f6a1b2c3d4e5f60718293a4b5c6d7e8f90a1b2c3d4e5f60"
+                ]
+            }
+        }
+
+
+class SessionSignTransactionsResponse(BaseModel):
+    """Response after signing transactions with the session wallet"""
+
+    success: bool = Field(default=True)
+    count: int = Field(description="Number of transactions signed")
+    transactions: list[SignTransactionResponse] = Field(description="Signed transactions, in request order")
+
+
 class SubmitTransactionRequest(BaseModel):
     """
     Request to submit a signed transaction to the blockchain.
@@ -36,6 +36,7 @@ class WalletBalanceInfo(BaseModel):
     address: str
     balance_lovelace: int = Field(description="Balance in lovelace")
     balance_ada: float = Field(description="Balance in ADA")
+    assets: dict[str, int] | None = Field(None, description="Native assets as {unit: quantity}")
 
 
 class WalletBalances(BaseModel):
@@ -49,6 +50,9 @@ class WalletBalances(BaseModel):
     )
     total_balance_lovelace: int = Field(description="Total balance across all addresses in lovelace")
     total_balance_ada: float = Field(description="Total balance across all addresses in ADA")
+    total_assets: dict[str, int] = Field(
+        default_factory=dict, description="Native asset totals across all addresses as {unit: quantity}"
+    )
 
 
 class WalletInfoResponse(BaseModel):
@@ -487,6 +491,32 @@ class GenerateAddressesResponse(BaseModel):
     count: int = Field(description="Number of addresses generated")
 
 
+class AddressLookupRequest(BaseModel):
+    """Request to resolve which wallets own a batch of addresses"""
+
+    addresses: list[str] = Field(min_length=1, max_length=1000, description="Bech32 addresses to resolve")
+
+    class Config:
+        json_schema_extra = {"example": {"addresses": ["addr_test1vz...", "addr_test1qz..."]}}
+
+
+class AddressOwnerInfo(BaseModel):
+    """Owner of a looked-up address"""
+
+    address: str
+    found: bool = Field(description="Whether the address belongs to a wallet of this tenant")
+    wallet_id: str | None = Field(None, description="Owning wallet ID (payment key hash)")
+    derivation_index: int | None = Field(None, description="Derivation index (m/1852'/1815'/0'/0/{index})")
+    address_type: str | None = Field(None, description="enterprise or staking")
+
+
+class AddressLookupResponse(BaseModel):
+    """Response with the owners of looked-up addresses"""
+
+    results: list[AddressOwnerInfo] = Field(description="One entry per requested address, in request order")
+    found: int = Field(description="Number of addresses owned by a wallet")
+
+
 class WalletBalanceRequest(BaseModel):
     """Request to check wallet balances"""
 
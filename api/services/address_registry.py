@@ -0,0 +1,132 @@
+"""
+Wallet Address Registry
+
+Persists the public derived addresses of every wallet (up to
+settings.wallet_address_gap_limit indices, enterprise and staking variants)
+in the tenant's "wallet_addresses" collection, keyed by address. Resolving
+which wallet and derivation index owns an address is then a single indexed
+query - no mnemonic, session or key derivation needed.
+
+Entries are written when a wallet is created or imported, backfilled on
+unlock for wallets created before the registry existed, and removed when
+the wallet is deleted.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any
+
+from motor.motor_asyncio import AsyncIOMotorCollection, AsyncIOMotorDatabase
+from pymongo import UpdateOne
+from pymongo.asynchronous.collection import AsyncCollection
+
+from api.config import settings
+from api.database.models import WalletAddressMongo
+from cardano_offchain.wallet import CardanoWallet
+
+
+COLLECTION_NAME = "wallet_addresses"
+
+
+@dataclass(frozen=True)
+class AddressOwner:
+    """Wallet and derivation index owning a registered address"""
+
+    address: str
+    wallet_id: str
+    derivation_index: int
+    address_type: str
+    network: str
+
+
+def _to_owner(doc: dict) -> AddressOwner:
+    return AddressOwner(
+        address=doc["_id"],
+        wallet_id=doc["wallet_id"],
+        derivation_index=doc["derivation_index"],
+        address_type=doc["address_type"],
+        network=doc["network"],
+    )
+
+
+class AddressRegistry:
+    """Reads and writes the per-tenant derived address registry"""
+
+    def __init__(self, database: AsyncIOMotorDatabase | None = None):
+        """
+        Initialize the registry.
+
+        Args:
+            database: Tenant MongoDB database (falls back to Beanie when None)
+        """
+        self.database = database
+
+    def _get_collection(self) -> AsyncIOMotorCollection | AsyncCollection[Any]:
+        if self.database is not None:
+            return self.database.get_collection(COLLECTION_NAME)
+        return WalletAddressMongo.get_pymongo_collection()
+
+    async def register_wallet(self, wallet_id: str, cardano_wallet: CardanoWallet, gap_limit: int | None = None) -> int:
+        """
+        Persist a wallet's derived addresses up to the gap limit.
+
+        Idempotent: re-registering (e.g. re-import) rewrites the same entries.
+
+        Args:
+            wallet_id: Wallet ID (payment key hash)
+            cardano_wallet: Wallet to derive the addresses from
+            gap_limit: Number of derivation indices to register (default: settings)
+
+        Returns:
+            Number of addresses registered
+        """
+        gap_limit = gap_limit or settings.wallet_address_gap_limit
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        operations = []
+        for index, enterprise_address, staking_address in cardano_wallet.derive_addresses(gap_limit):
+            for address_type, address in (("enterprise", enterprise_address), ("staking", staking_address)):
+                operations.append(
+                    UpdateOne(
+                        {"_id": str(address)},
+                        {
+                            "$set": {
+                                "wallet_id": wallet_id,
+                                "derivation_index": index,
+                                "address_type": address_type,
+                                "network": cardano_wallet.network,
+                            },
+                            "$setOnInsert": {"created_at": now},
+                        },
+                        upsert=True,
+                    )
+                )
+
+        await self._get_collection().bulk_write(operations, ordered=False)
+        return len(operations)
+
+    async def is_registered(self, wallet_id: str) -> bool:
+        """Whether a wallet has any registered addresses"""
+        return await self._get_collection().count_documents({"wallet_id": wallet_id}, limit=1) > 0
+
+    async def lookup(self, addresses: list[str]) -> dict[str, AddressOwner]:
+        """
+        Resolve the owners of many addresses in one query.
+
+        Args:
+            addresses: Bech32 addresses
+
+        Returns:
+            Mapping of address to owner; unregistered addresses are absent
+        """
+        cursor = self._get_collection().find({"_id": {"$in": list(set(addresses))}})
+        return {doc["_id"]: _to_owner(doc) for doc in await cursor.to_list(length=None)}
+
+    async def list_wallet_addresses(self, wallet_id: str) -> list[AddressOwner]:
+        """Registered addresses of a wallet, ordered by derivation index"""
+        cursor = self._get_collection().find({"wallet_id": wallet_id}).sort("derivation_index", 1)
+        return [_to_owner(doc) for doc in await cursor.to_list(length=None)]
+
+    async def remove_wallet(self, wallet_id: str) -> int:
+        """Remove a wallet's registered addresses; returns the number removed"""
+        result = await self._get_collection().delete_many({"wallet_id": wallet_id})
+        return result.deleted_count
@@ -15,7 +15,9 @@ from datetime import datetime, timezone, timedelta
 from beanie.operators import Set
 
 from api.database.models import WalletSessionMongo, WalletMongo
-from api.services.session_manager import get_session_manager
+from api.database.tenant_context import get_current_tenant
+from api.services.session_store import get_session_store
+from api.services.session_validation_cache import get_session_revocations
 
 
 class AdminSessionService:
@@ -40,7 +42,7 @@ class AdminSessionService:
             .to_list()
 
         # For each session, get wallet name and check memory
-        session_manager = get_session_manager()
+        session_store = get_session_store()
         results = []
 
         for session_doc in sessions:
@@ -49,7 +51,7 @@ class AdminSessionService:
             wallet_name = wallet.name if wallet else None
 
             # Check if session is in memory
-            in_memory = session_manager.session_exists(session_doc.jti)
+            in_memory = await session_store.exists(session_doc.jti)
 
             results.append((session_doc, wallet_name, in_memory))
 
@@ -82,8 +84,8 @@ class AdminSessionService:
         ).count()
 
         # In-memory count
-        session_manager = get_session_manager()
-        in_memory_count = session_manager.get_session_count()
+        session_store = get_session_store()
+        in_memory_count = await session_store.count()
 
         return {
             "total": total_count,
@@ -108,8 +110,8 @@ class AdminSessionService:
             - db_cleaned: Sessions marked as revoked in database
         """
         # Cleanup memory first
-        session_manager = get_session_manager()
-        memory_cleaned = session_manager.cleanup_expired()
+        session_store = get_session_store()
+        memory_cleaned = await session_store.cleanup_expired()
 
         # Mark expired sessions as revoked in MongoDB using bulk operation
         now = datetime.now(timezone.utc).replace(tzinfo=None)
@@ -200,8 +202,11 @@ class AdminSessionService:
         await session_doc.save()
 
         # Remove from memory
-        session_manager = get_session_manager()
-        session_manager.remove_session(jti)
+        session_store = get_session_store()
+        await session_store.remove(jti)
+
+        # Other workers drop their cached trust in the tenant's sessions
+        await get_session_revocations().bump(get_current_tenant())
 
         return True
 
@@ -232,8 +237,9 @@ class AdminSessionService:
         db_revoked = result.modified_count if result else 0
 
         # Clear all from memory
-        session_manager = get_session_manager()
-        memory_cleared = session_manager.clear_all()
+        session_store = get_session_store()
+        memory_cleared = await session_store.clear()
+        await get_session_revocations().bump(get_current_tenant())
 
         return {
             "memory_cleared": memory_cleared,
@@ -0,0 +1,250 @@
+"""
+API Key Cache
+
+Keeps tenant API-key authentication off the admin database on the hot path.
+
+- ApiKeyCache: remembers API-key hash → tenant resolutions for a short TTL,
+  and unknown/inactive hashes for a shorter one (negative cache), so neither
+  valid nor garbage keys hit MongoDB on every request. Revoke/delete endpoints
+  push invalidations into it, so a revoked key is rejected immediately.
+- ApiKeyRevocations: per-tenant API-key revocation revision shared by all
+  workers (admin database). Revoking bumps it; resolutions cached under an
+  older revision are looked up again, so a key revoked on another worker is
+  rejected within settings.api_key_revocation_poll_seconds.
+- ApiKeyLastUsedBuffer: write-behind buffer for ApiKey.last_used_at, flushed
+  periodically with one bulk_write instead of a save() per request.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo.asynchronous.collection import AsyncCollection
+
+from api.config import settings
+from api.services.session_validation_cache import LastUsedBuffer, SessionRevocations
+
+
+REVOCATIONS_COLLECTION_NAME = "api_key_revocations"
+
+
+@dataclass
+class ResolvedApiKey:
+    """API key state remembered by the cache"""
+
+    key_id: Any  # ApiKey document id (used for last_used_at writes)
+    tenant_id: str
+    api_key_prefix: str
+    expires_at: datetime | None  # Naive UTC, as stored in MongoDB
+    resolved_at: float  # time.monotonic() of the database lookup
+    revision: int = 0  # Tenant API-key revocation revision the lookup was made under
+
+
+@dataclass
+class ApiKeyCacheStats:
+    """Counters for the API key cache"""
+
+    hits: int = 0
+    negative_hits: int = 0
+    misses: int = 0
+    invalidations: int = 0
+
+    def snapshot(self) -> dict[str, Any]:
+        """Stats as a JSON-serializable dict"""
+        return {
+            "hits": self.hits,
+            "negative_hits": self.negative_hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+        }
+
+
+class ApiKeyCache:
+    """TTL cache of API-key hash → tenant resolutions, with a negative cache"""
+
+    def __init__(self, ttl_seconds: float = 60.0, negative_ttl_seconds: float = 10.0, max_entries: int = 10000):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl_seconds: How long a resolved key is trusted (bounds staleness for
+                revocations made outside this process)
+            negative_ttl_seconds: How long an unknown or inactive key is rejected
+                without a database lookup
+            max_entries: Maximum entries per cache (least recently used are evicted)
+        """
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self.max_entries = max_entries
+        self.stats = ApiKeyCacheStats()
+        self._entries: OrderedDict[str, ResolvedApiKey] = OrderedDict()
+        # key hash -> time.monotonic() of the failed lookup
+        self._rejected: OrderedDict[str, float] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key_hash: str) -> ResolvedApiKey | None:
+        """Cached resolution for a key hash, or None if not cached"""
+        with self._lock:
+            entry = self._entries.get(key_hash)
+            if entry is None:
+                return None
+            if time.monotonic() - entry.resolved_at >= self.ttl_seconds:
+                del self._entries[key_hash]
+                return None
+            self._entries.move_to_end(key_hash)
+            self.stats.hits += 1
+            return entry
+
+    def is_rejected(self, key_hash: str) -> bool:
+        """Whether a key hash recently failed a database lookup"""
+        with self._lock:
+            rejected_at = self._rejected.get(key_hash)
+            if rejected_at is None:
+                return False
+            if time.monotonic() - rejected_at >= self.negative_ttl_seconds:
+                del self._rejected[key_hash]
+                return False
+            self.stats.negative_hits += 1
+            return True
+
+    def put(
+        self,
+        key_hash: str,
+        key_id: Any,
+        tenant_id: str,
+        api_key_prefix: str,
+        expires_at: datetime | None,
+        revision: int = 0,
+    ) -> ResolvedApiKey:
+        """Remember a key found active in the database under a revocation revision"""
+        entry = ResolvedApiKey(
+            key_id=key_id,
+            tenant_id=tenant_id,
+            api_key_prefix=api_key_prefix,
+            expires_at=expires_at,
+            resolved_at=time.monotonic(),
+            revision=revision,
+        )
+        with self._lock:
+            self.stats.misses += 1
+            self._rejected.pop(key_hash, None)
+            self._entries.pop(key_hash, None)
+            self._entries[key_hash] = entry
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+    def put_rejected(self, key_hash: str) -> None:
+        """Remember a key that is unknown or inactive in the database"""
+        with self._lock:
+            self.stats.misses += 1
+            self._entries.pop(key_hash, None)
+            self._rejected.pop(key_hash, None)
+            self._rejected[key_hash] = time.monotonic()
+            while len(self._rejected) > self.max_entries:
+                self._rejected.popitem(last=False)
+
+    def invalidate(self, tenant_id: str, api_key_prefix: str | None = None) -> int:
+        """
+        Drop cached keys of a tenant (called on revocation and deletion).
+
+        Args:
+            tenant_id: Tenant the keys belong to
+            api_key_prefix: Only drop the key with this prefix (None = all of the tenant's keys)
+
+        Returns:
+            Number of entries dropped
+        """
+        with self._lock:
+            stale = [
+                key_hash
+                for key_hash, entry in self._entries.items()
+                if entry.tenant_id == tenant_id and (api_key_prefix is None or entry.api_key_prefix == api_key_prefix)
+            ]
+            for key_hash in stale:
+                del self._entries[key_hash]
+            self.stats.invalidations += len(stale)
+        return len(stale)
+
+    def clear(self) -> None:
+        """Drop all entries, positive and negative"""
+        with self._lock:
+            self.stats.invalidations += len(self._entries)
+            self._entries.clear()
+            self._rejected.clear()
+
+
+class ApiKeyRevocations(SessionRevocations):
+    """
+    Per-tenant API-key revocation revision shared by all workers.
+
+    Revoking or deleting a key bumps the tenant's revision; a cached resolution
+    is trusted only while its revision is still the tenant's current one.
+    """
+
+    collection_name = REVOCATIONS_COLLECTION_NAME
+
+
+class ApiKeyLastUsedBuffer(LastUsedBuffer):
+    """Write-behind buffer for ApiKey.last_used_at (admin database)"""
+
+    key_field = "_id"
+    label = "api-key"
+
+    async def _get_collection(self, tenant_id: str | None) -> AsyncIOMotorCollection | AsyncCollection[Any]:
+        # API keys live in the admin database regardless of tenant
+        from api.database.models import ApiKey
+
+        return ApiKey.get_pymongo_collection()
+
+
+# Global instances
+_api_key_cache: ApiKeyCache | None = None
+_api_key_revocations: ApiKeyRevocations | None = None
+_api_key_last_used_buffer: ApiKeyLastUsedBuffer | None = None
+
+
+def get_api_key_cache() -> ApiKeyCache:
+    """Get or create the global API key cache"""
+    global _api_key_cache
+    if _api_key_cache is None:
+        _api_key_cache = ApiKeyCache(
+            ttl_seconds=settings.api_key_cache_ttl_seconds,
+            negative_ttl_seconds=settings.api_key_negative_cache_ttl_seconds,
+        )
+    return _api_key_cache
+
+
+def get_api_key_revocations() -> ApiKeyRevocations:
+    """Get or create the global API-key revocation revision tracker"""
+    global _api_key_revocations
+    if _api_key_revocations is None:
+        _api_key_revocations = ApiKeyRevocations(poll_seconds=settings.api_key_revocation_poll_seconds)
+    return _api_key_revocations
+
+
+async def invalidate_api_key(tenant_id: str, api_key_prefix: str | None = None) -> None:
+    """
+    Stop trusting cached resolutions of a revoked or deleted key.
+
+    Applies at once on this worker and, through the shared revision, within
+    settings.api_key_revocation_poll_seconds on the others.
+
+    Args:
+        tenant_id: Tenant the key belongs to
+        api_key_prefix: Only the key with this prefix (None = all of the tenant's keys)
+    """
+    get_api_key_cache().invalidate(tenant_id, api_key_prefix)
+    await get_api_key_revocations().bump(tenant_id)
+
+
+def get_api_key_last_used_buffer() -> ApiKeyLastUsedBuffer:
+    """Get or create the global API key last_used_at write-behind buffer"""
+    global _api_key_last_used_buffer
+    if _api_key_last_used_buffer is None:
+        _api_key_last_used_buffer = ApiKeyLastUsedBuffer(flush_interval=settings.api_key_last_used_flush_seconds)
+    return _api_key_last_used_buffer
@@ -0,0 +1,107 @@
+"""
+Chain Contexts
+
+Shared CardanoChainContext instances, one per network, for the API process.
+
+Each context owns an HTTP connection pool and sits behind the shared UTxO
+cache, so routers (through api.dependencies.chain_context) and services reuse
+the same instances instead of building a new context per request.
+"""
+
+import logging
+import os
+
+from api.config import settings
+from api.services.utxo_cache import CachedChainProvider, get_utxo_cache
+from cardano_offchain.chain_context import CardanoChainContext
+
+
+logger = logging.getLogger(__name__)
+
+# Chain context for the configured default network
+_chain_context: CardanoChainContext | None = None
+
+# Chain contexts for explicitly requested networks (shared across requests)
+_network_chain_contexts: dict[str, CardanoChainContext] = {}
+
+
+class ChainContextConfigError(Exception):
+    """The chain backend cannot be configured from the environment"""
+
+    pass
+
+
+def _with_utxo_cache(chain_context: CardanoChainContext) -> CardanoChainContext:
+    """Put the shared UTxO cache in front of the context's chain provider"""
+    if settings.utxo_cache_enabled and chain_context.provider is not None:
+        chain_context.provider = CachedChainProvider(chain_context.provider, get_utxo_cache(chain_context.network))
+    return chain_context
+
+
+def get_default_chain_context() -> CardanoChainContext:
+    """
+    Get or initialize the chain context for the configured network.
+
+    Supported networks:
+    - "testnet" or "preview": Cardano Preview testnet
+    - "preprod": Cardano Pre-production testnet
+    - "mainnet": Cardano Mainnet
+
+    With settings.chain_backend == "emulator" the context runs on a shared
+    in-memory ledger and no BlockFrost key is needed.
+
+    Returns:
+        CardanoChainContext: Initialized chain context with BlockFrost API
+
+    Raises:
+        ChainContextConfigError: If blockfrost_api_key is missing from environment
+    """
+    global _chain_context
+    if _chain_context is None:
+        network = os.getenv("network", "testnet")
+        blockfrost_api_key = os.getenv("blockfrost_api_key")
+        if not blockfrost_api_key and settings.chain_backend != "emulator":
+            raise ChainContextConfigError("Missing blockfrost_api_key environment variable")
+        _chain_context = _with_utxo_cache(
+            CardanoChainContext(network, blockfrost_api_key, backend=settings.chain_backend)
+        )
+        logger.info(f"Chain context initialized: network={network}, base_url={_chain_context.base_url}")
+    return _chain_context
+
+
+def get_chain_context_for_network(network: str) -> CardanoChainContext:
+    """
+    Get or initialize a shared chain context for an explicit network.
+
+    Services that receive the network per request use this instead of building
+    a new CardanoChainContext (and HTTP connection pool) on every call.
+
+    Args:
+        network: "testnet", "preview", "preprod" or "mainnet"
+
+    Returns:
+        CardanoChainContext: Shared chain context for the network
+
+    Raises:
+        ChainContextConfigError: If blockfrost_api_key is missing from environment
+    """
+    default_context = get_default_chain_context()
+    if network == default_context.network:
+        return default_context
+
+    if network not in _network_chain_contexts:
+        _network_chain_contexts[network] = _with_utxo_cache(
+            CardanoChainContext(network, os.getenv("blockfrost_api_key"), backend=settings.chain_backend)
+        )
+        logger.info(f"Chain context initialized: network={network}")
+    return _network_chain_contexts[network]
+
+
+async def close_chain_contexts() -> None:
+    """Close pooled HTTP connections of all shared chain contexts"""
+    contexts = list(_network_chain_contexts.values())
+    if _chain_context is not None:
+        contexts.append(_chain_context)
+    for context in contexts:
+        if context.provider is not None:
+            await context.provider.close()
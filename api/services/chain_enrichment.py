@@ -0,0 +1,192 @@
+"""
+Chain Enrichment Engine
+
+Shared bounded-concurrency runner for endpoints that fan out one chain query
+per listed item (address history, policy asset details).
+
+- One process-wide concurrency cap on provider calls, so parallel requests
+  can't exceed the Blockfrost rate limit together
+- Per-item timeout: a slow item is dropped instead of stalling the page
+- Rate-limit-aware retries (429) with exponential backoff, honouring Retry-After
+- Memoization of records, optionally with a TTL (asset details); confirmed
+  transactions have their own persistent cache (confirmed_tx_cache)
+"""
+
+import asyncio
+import logging
+import random
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from typing import Any, TypeVar, cast
+
+from api.config import settings
+from cardano_offchain.chain_provider import ChainProviderError
+
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class EnrichmentTimeoutError(Exception):
+    """Raised when enriching a single item exceeds the per-item timeout"""
+
+    pass
+
+
+@dataclass
+class EnrichmentStats:
+    """Counters for the enrichment engine"""
+
+    calls: int = 0
+    retries: int = 0
+    rate_limited: int = 0
+    item_timeouts: int = 0
+    memo_hits: int = 0
+    memo_misses: int = 0
+
+    def snapshot(self) -> dict[str, Any]:
+        """Stats as a JSON-serializable dict"""
+        return {
+            "calls": self.calls,
+            "retries": self.retries,
+            "rate_limited": self.rate_limited,
+            "item_timeouts": self.item_timeouts,
+            "memo_hits": self.memo_hits,
+            "memo_misses": self.memo_misses,
+        }
+
+
+class EnrichmentEngine:
+    """Bounded-concurrency chain query runner with retries and memoization"""
+
+    def __init__(
+        self,
+        max_concurrency: int = 10,
+        item_timeout: float = 15.0,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 8.0,
+        memo_max_entries: int = 5000,
+    ):
+        """
+        Initialize the engine.
+
+        Args:
+            max_concurrency: Provider calls allowed in flight at once (across all requests)
+            item_timeout: Seconds allowed to enrich one item, retries included
+            max_retries: Retries of a rate-limited call before giving up
+            backoff_base: First backoff delay in seconds (doubles on each retry)
+            backoff_max: Upper bound for a single backoff delay
+            memo_max_entries: Memoized records kept (least recently used are evicted)
+        """
+        self.max_concurrency = max_concurrency
+        self.item_timeout = item_timeout
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.memo_max_entries = memo_max_entries
+        self.stats = EnrichmentStats()
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        # (namespace, key) -> (expires_at or None, value)
+        self._memo: OrderedDict[tuple[str, str], tuple[float | None, Any]] = OrderedDict()
+
+    async def call(self, fn: Callable[..., Awaitable[R]], *args: Any) -> R:
+        """
+        Run one provider call under the concurrency cap.
+
+        Rate-limited calls (HTTP 429) are retried with exponential backoff; the
+        backoff sleep happens outside the cap so other calls can proceed.
+        """
+        attempt = 0
+        while True:
+            try:
+                async with self._semaphore:
+                    self.stats.calls += 1
+                    return await fn(*args)
+            except ChainProviderError as e:
+                if not e.rate_limited:
+                    raise
+                self.stats.rate_limited += 1
+                if attempt >= self.max_retries:
+                    raise
+                delay = e.retry_after or min(self.backoff_max, self.backoff_base * 2**attempt)
+                delay *= random.uniform(1.0, 1.25)  # jitter so retries don't align
+                attempt += 1
+                self.stats.retries += 1
+                logger.debug(f"Rate limited, retry {attempt}/{self.max_retries} in {delay:.2f}s")
+                await asyncio.sleep(delay)
+
+    async def memoized(
+        self, namespace: str, key: str, loader: Callable[[], Awaitable[R]], ttl: float | None = None
+    ) -> R:
+        """
+        Return a memoized record or load and remember it.
+
+        Args:
+            namespace: Record kind, including the network (e.g. "preview:asset")
+            key: Record identity (tx hash, asset id)
+            loader: Coroutine factory producing the record; failures are not memoized
+            ttl: Seconds the record stays valid (None = immutable)
+        """
+        memo_key = (namespace, key)
+        entry = self._memo.get(memo_key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at is None or expires_at > time.monotonic():
+                self._memo.move_to_end(memo_key)
+                self.stats.memo_hits += 1
+                # Stored by a loader of this namespace, so it has the loader's type
+                return cast(R, value)
+            del self._memo[memo_key]
+
+        self.stats.memo_misses += 1
+        value = await loader()
+        self._memo[memo_key] = (time.monotonic() + ttl if ttl is not None else None, value)
+        while len(self._memo) > self.memo_max_entries:
+            self._memo.popitem(last=False)
+        return value
+
+    async def map(self, items: Iterable[T], enrich: Callable[[T], Awaitable[R]]) -> list[R | Exception]:
+        """
+        Enrich items concurrently, each under the per-item timeout.
+
+        Returns:
+            One entry per item, in order: the enrichment result, or the exception
+            it failed with (EnrichmentTimeoutError on timeout)
+        """
+
+        async def run(item: T) -> R | Exception:
+            try:
+                return await asyncio.wait_for(enrich(item), self.item_timeout)
+            except TimeoutError:
+                self.stats.item_timeouts += 1
+                return EnrichmentTimeoutError(f"Enrichment exceeded {self.item_timeout}s")
+            except Exception as e:
+                return e
+
+        return list(await asyncio.gather(*(run(item) for item in items)))
+
+    def clear(self) -> None:
+        """Drop all memoized records"""
+        self._memo.clear()
+
+
+# Global engine instance
+_enrichment_engine: EnrichmentEngine | None = None
+
+
+def get_enrichment_engine() -> EnrichmentEngine:
+    """Get or create the global enrichment engine"""
+    global _enrichment_engine
+    if _enrichment_engine is None:
+        _enrichment_engine = EnrichmentEngine(
+            max_concurrency=settings.chain_enrich_max_concurrency,
+            item_timeout=settings.chain_enrich_item_timeout_seconds,
+            max_retries=settings.chain_enrich_max_retries,
+            memo_max_entries=settings.chain_enrich_memo_max_entries,
+        )
+    return _enrichment_engine
@@ -0,0 +1,275 @@
+"""
+Coin Selection
+
+Picks the wallet UTxOs spent by a transaction instead of adding every UTxO
+at the address as an input. Strategies implement PyCardano's UTxOSelector
+interface, so they plug straight into TransactionBuilder.utxo_selectors:
+
+- largest_first: fewest inputs, consolidates large UTxOs (CIP-2)
+- random_improve: spreads selection over the UTxO set and aims for change
+  close to the payment, keeping the wallet's UTxO distribution healthy (CIP-2)
+- exact_match: single UTxO covering the request with the least excess,
+  leaving the rest of the wallet untouched
+
+Selection is multi-asset aware: native assets requested by the outputs must
+be covered together with lovelace, fees and the min-ADA of the change.
+"""
+
+from collections.abc import Iterable
+from copy import deepcopy
+
+import pycardano as pc
+from pycardano.coinselection import LargestFirstSelector, RandomImproveMultiAsset, UTxOSelector
+from pycardano.exception import (
+    InputUTxODepletedException,
+    InsufficientUTxOBalanceException,
+    MaxInputCountExceededException,
+    UTxOSelectionException,
+)
+from pycardano.utils import max_tx_fee, min_lovelace_post_alonzo
+
+from api.config import settings
+
+
+# Placeholder address for change/requested outputs (only its size matters)
+_FAKE_ADDRESS = pc.Address(pc.VerificationKeyHash(bytes(28)))
+
+
+class CoinSelectionError(Exception):
+    """The available UTxOs cannot cover the requested amount"""
+
+    pass
+
+
+class RandomImproveSelector(RandomImproveMultiAsset):
+    """
+    PyCardano's multi-asset random-improve with an iterative improve phase.
+
+    The upstream improve phase recurses once per remaining UTxO and copies
+    the remaining list at every level, so wallets with a few thousand UTxOs
+    hit the recursion limit (and quadratic copying) before selecting.
+
+    Native asset requests are also drawn only from UTxOs holding the asset;
+    drawing from the whole set picks hundreds of ADA-only UTxOs before it
+    finds the few token bundles of a large wallet.
+    """
+
+    def _random_select_subset(
+        self, amount: pc.Value, remaining: list[pc.UTxO], selected: list[pc.UTxO], selected_amount: pc.Value
+    ) -> None:
+        if amount.coin:
+            super()._random_select_subset(amount, remaining, selected, selected_amount)
+            return
+
+        [(policy_id, assets)] = amount.multi_asset.items()
+        [asset_name] = assets.keys()
+        holders = [
+            utxo
+            for utxo in remaining
+            if utxo.output.amount.multi_asset.get(policy_id, pc.Asset()).get(asset_name, 0) > 0
+        ]
+        while not amount <= selected_amount:
+            if not holders:
+                raise InputUTxODepletedException("Input UTxOs depleted!")
+            i, to_add = self._get_next_random(holders)
+            holders.pop(i)
+            selected.append(to_add)
+            selected_amount += to_add.output.amount
+            remaining[:] = [utxo for utxo in remaining if utxo is not to_add]
+
+    def _improve(
+        self,
+        selected: list[pc.UTxO],
+        selected_amount: pc.Value,
+        remaining: list[pc.UTxO],
+        ideal: pc.Value,
+        upper_bound: pc.Value,
+        max_input_count: int | None = None,
+    ) -> None:
+        while remaining and self._find_diff_by_former(ideal, selected_amount) > 0:
+            if max_input_count is not None and len(selected) > max_input_count:
+                raise MaxInputCountExceededException(f"Max input count: {max_input_count} exceeded!")
+
+            i, to_add = self._get_next_random(remaining)
+            candidate = selected_amount + to_add.output.amount
+            if (
+                abs(self._find_diff_by_former(ideal, candidate))
+                < abs(self._find_diff_by_former(ideal, selected_amount))
+                and self._find_diff_by_former(upper_bound, candidate) >= 0
+            ):
+                selected.append(to_add)
+                selected_amount += to_add.output.amount
+            remaining.pop(i)
+
+
+class ExactMatchSelector(UTxOSelector):
+    """
+    Select the single UTxO that covers the request with the smallest excess.
+
+    A UTxO is eligible when it holds every requested asset and its change
+    (if any) can carry its own min-ADA. Raises UTxOSelectionException when no
+    single UTxO is enough, so the next selector can combine several.
+    """
+
+    def select(
+        self,
+        utxos: list[pc.UTxO],
+        outputs: list[pc.TransactionOutput],
+        context: pc.ChainContext,
+        max_input_count: int | None = None,
+        include_max_fee: bool | None = True,
+        respect_min_utxo: bool | None = True,
+        existing_amount: pc.Value | None = None,
+    ) -> tuple[list[pc.UTxO], pc.Value]:
+        requested = pc.Value(max_tx_fee(context) if include_max_fee else 0)
+        for output in outputs:
+            requested += output.amount
+        existing = existing_amount if existing_amount is not None else pc.Value()
+
+        candidates: list[tuple[int, int, pc.UTxO, pc.Value]] = []
+        for utxo in utxos:
+            total = existing + utxo.output.amount
+            if requested <= total:
+                candidates.append((total.coin - requested.coin, len(candidates), utxo, total))
+        if not candidates:
+            raise UTxOSelectionException("No single UTxO covers the requested amount")
+
+        for excess, _, utxo, total in sorted(candidates, key=lambda c: c[:2]):
+            change = total - requested
+            if not respect_min_utxo or change == pc.Value():
+                return [utxo], change
+            min_change = min_lovelace_post_alonzo(pc.TransactionOutput(_FAKE_ADDRESS, deepcopy(change)), context)
+            if excess >= min_change:
+                return [utxo], change
+        raise UTxOSelectionException("No single UTxO covers the requested amount and the change min-ADA")
+
+
+STRATEGIES: dict[str, type[UTxOSelector]] = {
+    "largest_first": LargestFirstSelector,
+    "random_improve": RandomImproveSelector,
+    "exact_match": ExactMatchSelector,
+}
+
+
+def get_selectors(strategy: str | None = None) -> list[UTxOSelector]:
+    """
+    Selector chain for a strategy: the strategy itself, then largest-first.
+
+    Args:
+        strategy: Strategy name (default: settings.coin_selection_strategy)
+
+    Raises:
+        CoinSelectionError: Unknown strategy
+    """
+    strategy = strategy or settings.coin_selection_strategy
+    if strategy not in STRATEGIES:
+        raise CoinSelectionError(f"Unknown coin selection strategy '{strategy}'. Available: {', '.join(STRATEGIES)}")
+    selectors = [STRATEGIES[strategy]()]
+    if strategy != "largest_first":
+        selectors.append(LargestFirstSelector())
+    return selectors
+
+
+def _ref(utxo: pc.UTxO) -> tuple[bytes, int]:
+    # UTxO equality/hashing serializes to CBOR; compare by output reference instead
+    return utxo.input.transaction_id.payload, utxo.input.index
+
+
+def spendable_utxos(utxos: Iterable[pc.UTxO], exclude: Iterable[pc.UTxO] = ()) -> list[pc.UTxO]:
+    """UTxOs that can fund a transaction: no reference script and not already used elsewhere"""
+    excluded = {_ref(utxo) for utxo in exclude}
+    return [utxo for utxo in utxos if utxo.output.script is None and _ref(utxo) not in excluded]
+
+
+def select_inputs(
+    utxos: list[pc.UTxO],
+    amount: pc.Value,
+    context: pc.ChainContext,
+    strategy: str | None = None,
+    existing_amount: pc.Value | None = None,
+    max_input_count: int | None = None,
+) -> list[pc.UTxO]:
+    """
+    Select the inputs paying for an amount plus the maximum transaction fee.
+
+    Use directly when the input set must be fixed up front, e.g. redeemers
+    that embed the positions of the inputs. The change keeps its min-ADA.
+
+    Args:
+        utxos: Candidate UTxOs
+        amount: Value to cover (lovelace and native assets)
+        context: Chain context for protocol parameters
+        strategy: Strategy name (default: settings.coin_selection_strategy)
+        existing_amount: Value already provided by inputs added explicitly
+        max_input_count: Maximum number of UTxOs to select
+
+    Returns:
+        Selected UTxOs
+
+    Raises:
+        CoinSelectionError: The UTxOs cannot cover the amount
+    """
+    outputs = [pc.TransactionOutput(_FAKE_ADDRESS, amount)]
+    error: UTxOSelectionException | None = None
+    selected: list[pc.UTxO]
+    for selector in get_selectors(strategy):
+        try:
+            selected, _ = selector.select(
+                list(utxos),
+                outputs,
+                context,
+                max_input_count=max_input_count,
+                existing_amount=deepcopy(existing_amount) if existing_amount is not None else None,
+            )
+            return selected
+        except UTxOSelectionException as e:
+            error = e
+    if isinstance(error, InsufficientUTxOBalanceException):
+        raise CoinSelectionError(f"Insufficient funds: UTxO balance cannot cover {amount}")
+    raise CoinSelectionError(f"Insufficient funds: {error}")
+
+
+def add_selected_inputs(
+    builder: pc.TransactionBuilder, utxos: Iterable[pc.UTxO], strategy: str | None = None
+) -> list[pc.UTxO]:
+    """
+    Add the wallet inputs a TransactionBuilder still needs, chosen by coin selection.
+
+    Call after outputs, mint and explicit inputs are set. What the outputs
+    and burns request beyond the explicit inputs and positive mints (plus the
+    maximum fee) is selected from the candidates and added as inputs.
+    Replaces adding every UTxO, or add_input_address, which re-queries the
+    address synchronously and may spend reserved UTxOs.
+
+    Args:
+        builder: Transaction builder
+        utxos: Candidate UTxOs (already filtered of reserved ones)
+        strategy: Strategy name (default: settings.coin_selection_strategy)
+
+    Returns:
+        The UTxOs added as inputs
+
+    Raises:
+        CoinSelectionError: The UTxOs cannot cover the transaction
+    """
+    requested = pc.Value()
+    for output in builder.outputs:
+        requested += output.amount
+    provided = pc.Value()
+    for utxo in builder.inputs:
+        provided += utxo.output.amount
+    if builder.mint:
+        for policy_id, assets in builder.mint.items():
+            for name, quantity in assets.items():
+                minted = pc.Value(0, pc.MultiAsset({policy_id: pc.Asset({name: abs(quantity)})}))
+                if quantity > 0:
+                    provided += minted
+                else:
+                    requested += minted
+
+    selected = select_inputs(
+        spendable_utxos(utxos, exclude=builder.inputs), requested, builder.context, strategy, existing_amount=provided
+    )
+    for utxo in selected:
+        builder.add_input(utxo)
+    return selected
@@ -0,0 +1,304 @@
+"""
+Compile Executor
+
+Runs OpShin contract compilation in a bounded process pool so compiles never
+block the event loop (health checks and other requests keep being served).
+
+- Configurable worker count, queue depth limit and per-job timeout
+- Timed-out jobs still running in a worker keep counting against the queue
+  limit until the worker finishes, since the process cannot be interrupted
+- Identical in-flight jobs (same source hash and parameters) are merged
+- Queue-wait and compile-time metrics; rejected callers get a Retry-After
+  estimated from the backlog and the average compile time
+- Workers are started through a fork server (or spawned where that is
+  unavailable): forking the API process, which already runs Motor and
+  executor threads, can leave a child deadlocked on a lock held by a thread
+  that does not exist in it
+- Workers compile through ContractTemplateCache and run with the raised
+  recursion limit some validators need, so the API process never touches it
+"""
+
+import asyncio
+import hashlib
+import logging
+import math
+import multiprocessing
+import pathlib
+import sys
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from typing import Any
+
+import pycardano as pc
+
+from api.config import settings
+from api.services.contract_template_cache import COMPILE_RECURSION_LIMIT, ContractTemplateCache
+
+
+logger = logging.getLogger(__name__)
+
+# Start method for worker processes (see module docstring)
+_START_METHOD = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+
+
+class CompileExecutorError(Exception):
+    """Raised when the compile executor cannot run a job"""
+
+    def __init__(self, message: str, retry_after: int = 1):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class CompileQueueFullError(CompileExecutorError):
+    """Raised when the compile queue is at capacity"""
+
+    pass
+
+
+class CompileTimeoutError(CompileExecutorError):
+    """Raised when a compile job exceeds its timeout"""
+
+    pass
+
+
+# ============================================================================
+# Worker process side
+# ============================================================================
+
+_worker_cache: ContractTemplateCache | None = None
+
+
+def _init_worker(cache_dir: str | None) -> None:
+    """Process pool initializer: raise recursion limit and create the worker's template cache"""
+    global _worker_cache
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), COMPILE_RECURSION_LIMIT))
+    _worker_cache = ContractTemplateCache(cache_dir)
+
+
+def _compile_job(contract_file: str, params: tuple) -> tuple[bytes, float, float]:
+    """
+    Compile a contract in a worker process.
+
+    Returns:
+        Tuple of (script bytes, wall-clock start time, compile seconds)
+    """
+    started_at = time.time()
+    cache = _worker_cache if _worker_cache is not None else ContractTemplateCache()
+    script = cache.build(contract_file, *params)
+    return bytes(script), started_at, time.time() - started_at
+
+
+# ============================================================================
+# API process side
+# ============================================================================
+
+
+@dataclass
+class CompileMetrics:
+    """Counters and timings for the compile executor"""
+
+    jobs_submitted: int = 0
+    jobs_merged: int = 0
+    jobs_completed: int = 0
+    jobs_failed: int = 0
+    jobs_timed_out: int = 0
+    jobs_rejected: int = 0
+    queue_wait_total_seconds: float = 0.0
+    queue_wait_max_seconds: float = 0.0
+    compile_total_seconds: float = 0.0
+    compile_max_seconds: float = 0.0
+
+    def record(self, queue_wait: float, compile_time: float) -> None:
+        """Record a completed job"""
+        self.jobs_completed += 1
+        self.queue_wait_total_seconds += queue_wait
+        self.queue_wait_max_seconds = max(self.queue_wait_max_seconds, queue_wait)
+        self.compile_total_seconds += compile_time
+        self.compile_max_seconds = max(self.compile_max_seconds, compile_time)
+
+    @property
+    def compile_avg_seconds(self) -> float:
+        """Average compile time (0 before the first completed job)"""
+        return self.compile_total_seconds / self.jobs_completed if self.jobs_completed else 0.0
+
+    def snapshot(self) -> dict[str, Any]:
+        """Metrics as a JSON-serializable dict"""
+        completed = self.jobs_completed or 1
+        return {
+            "jobs_submitted": self.jobs_submitted,
+            "jobs_merged": self.jobs_merged,
+            "jobs_completed": self.jobs_completed,
+            "jobs_failed": self.jobs_failed,
+            "jobs_timed_out": self.jobs_timed_out,
+            "jobs_rejected": self.jobs_rejected,
+            "queue_wait_avg_seconds": round(self.queue_wait_total_seconds / completed, 4),
+            "queue_wait_max_seconds": round(self.queue_wait_max_seconds, 4),
+            "compile_avg_seconds": round(self.compile_avg_seconds, 4),
+            "compile_max_seconds": round(self.compile_max_seconds, 4),
+        }
+
+
+class CompileExecutor:
+    """Bounded process-pool executor for OpShin compile jobs"""
+
+    def __init__(
+        self, max_workers: int = 2, max_queue_depth: int = 16, job_timeout: float = 120.0, cache_dir: str | None = None
+    ):
+        """
+        Initialize the compile executor.
+
+        Args:
+            max_workers: Number of compile worker processes
+            max_queue_depth: Maximum number of distinct jobs waiting for a worker
+            job_timeout: Seconds a job may take (queue wait included) before it is abandoned;
+                         an abandoned job holds its queue slot until its worker returns
+            cache_dir: Template cache directory shared by the workers
+        """
+        self.max_workers = max_workers
+        self.max_queue_depth = max_queue_depth
+        self.job_timeout = job_timeout
+        self.cache_dir = cache_dir
+        self.metrics = CompileMetrics()
+        self._pool: ProcessPoolExecutor | None = None
+        self._pool_lock = threading.Lock()
+        self._in_flight: dict[str, asyncio.Future] = {}
+        self._abandoned: set[Future] = set()
+        # contract file -> ((mtime_ns, size), source sha256)
+        self._source_hashes: dict[str, tuple[tuple[int, int], bytes]] = {}
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context(_START_METHOD),
+                    initializer=_init_worker,
+                    initargs=(self.cache_dir,),
+                )
+            return self._pool
+
+    def _reset_pool(self, wait: bool = False) -> None:
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=wait, cancel_futures=True)
+                self._pool = None
+
+    def job_key(self, contract_file: str, params: tuple) -> str:
+        """
+        Identity of a compile job: contract source hash plus parameters.
+
+        The source is hashed once per path and modification time, so a build
+        only stats the contract file on the event loop.
+        """
+        stat = pathlib.Path(contract_file).stat()
+        version = (stat.st_mtime_ns, stat.st_size)
+        cached = self._source_hashes.get(contract_file)
+        if cached is None or cached[0] != version:
+            cached = (version, hashlib.sha256(pathlib.Path(contract_file).read_bytes()).digest())
+            self._source_hashes[contract_file] = cached
+        digest = hashlib.sha256(cached[1])
+        digest.update(repr(params).encode())
+        return digest.hexdigest()
+
+    @property
+    def pending_jobs(self) -> int:
+        """Number of distinct jobs queued or running, timed-out jobs still in a worker included"""
+        return len(self._in_flight) + len(self._abandoned)
+
+    def retry_after(self) -> int:
+        """Seconds a rejected caller should wait, estimated from the backlog and average compile time"""
+        backlog_rounds = self.pending_jobs / self.max_workers
+        return max(1, math.ceil(backlog_rounds * (self.metrics.compile_avg_seconds or 1.0)))
+
+    async def build(self, contract_path: str | pathlib.Path, *params: Any) -> pc.PlutusV2Script:
+        """
+        Compile a contract with parameters applied, without blocking the event loop.
+
+        Equivalent to ``opshin.builder.build(contract_path, *params)``.
+
+        Raises:
+            CompileQueueFullError: If too many jobs are already waiting
+            CompileTimeoutError: If the job exceeded the configured timeout
+        """
+        contract_file = str(contract_path)
+        key = self.job_key(contract_file, params)
+
+        job = self._in_flight.get(key)
+        if job is not None:
+            self.metrics.jobs_merged += 1
+        else:
+            if self.pending_jobs >= self.max_workers + self.max_queue_depth:
+                self.metrics.jobs_rejected += 1
+                raise CompileQueueFullError(
+                    f"Compile queue is full ({self.pending_jobs} jobs pending), retry later",
+                    retry_after=self.retry_after(),
+                )
+            self.metrics.jobs_submitted += 1
+            job = asyncio.ensure_future(self._run_job(contract_file, params))
+            self._in_flight[key] = job
+            job.add_done_callback(lambda _: self._in_flight.pop(key, None))
+
+        # Shield so one cancelled waiter does not cancel a job others are merged into
+        script_bytes = await asyncio.shield(job)
+        return pc.PlutusV2Script(script_bytes)
+
+    def _abandon(self, future: Future) -> None:
+        """Give up on a timed-out job, tracking it until its worker is free again"""
+        if future.cancel():
+            # Still queued: it will never run
+            return
+        self._abandoned.add(future)
+        future.add_done_callback(self._abandoned.discard)
+
+    async def _run_job(self, contract_file: str, params: tuple) -> bytes:
+        submitted_at = time.time()
+        try:
+            future = self._get_pool().submit(_compile_job, contract_file, params)
+            script_bytes, started_at, compile_time = await asyncio.wait_for(
+                asyncio.wrap_future(future), self.job_timeout
+            )
+        except TimeoutError as e:
+            self.metrics.jobs_timed_out += 1
+            self._abandon(future)
+            raise CompileTimeoutError(f"Compilation of {contract_file} exceeded {self.job_timeout}s") from e
+        except BrokenProcessPool as e:
+            self.metrics.jobs_failed += 1
+            self._reset_pool()
+            raise CompileExecutorError(f"Compile worker crashed: {e}", retry_after=self.retry_after()) from e
+        except Exception:
+            self.metrics.jobs_failed += 1
+            raise
+
+        queue_wait = max(0.0, started_at - submitted_at)
+        self.metrics.record(queue_wait, compile_time)
+        logger.info(f"Compiled {contract_file} in {compile_time:.3f}s (queue wait {queue_wait:.3f}s)")
+        return script_bytes
+
+    def shutdown(self, wait: bool = False) -> None:
+        """
+        Shut down worker processes (pending jobs are cancelled).
+
+        Args:
+            wait: Block until running jobs finish and the workers have exited
+        """
+        self._reset_pool(wait=wait)
+
+
+# Global executor instance
+_compile_executor: CompileExecutor | None = None
+
+
+def get_compile_executor() -> CompileExecutor:
+    """Get or create the global compile executor"""
+    global _compile_executor
+    if _compile_executor is None:
+        _compile_executor = CompileExecutor(
+            max_workers=settings.compile_max_workers,
+            max_queue_depth=settings.compile_max_queue_depth,
+            job_timeout=settings.compile_job_timeout_seconds,
+            cache_dir=settings.contract_template_cache_dir or None,
+        )
+    return _compile_executor
@@ -0,0 +1,325 @@
+"""
+Confirmation Tracker
+
+Background worker that advances submitted transactions to CONFIRMED.
+
+Each cycle, for every active tenant:
+1. Loads a batch of SUBMITTED transactions that are due for a check
+2. Fetches the latest block once per network (shared by all tenants)
+3. Looks the transactions up on-chain concurrently
+4. Bulk-writes status, block height, confirmed_at and confirmations for the
+   ones found; the rest are rescheduled with exponential backoff and marked
+   FAILED once they have been missing longer than the give-up window
+5. Releases the UTxO leases of confirmed and failed transactions
+
+With records kept current, status reads are a single indexed lookup.
+"""
+
+import asyncio
+import logging
+import os
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, cast
+
+from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo import UpdateOne
+
+from api.config import settings
+from api.enums import TransactionStatus
+from api.services.chain_contexts import get_chain_context_for_network
+from api.services.chain_enrichment import get_enrichment_engine
+from api.services.confirmed_tx_cache import get_confirmed_tx_cache
+from api.services.utxo_reservations import UtxoReservationLedger
+from cardano_offchain.chain_provider import ChainProviderError
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ConfirmationTrackerStats:
+    """Counters for the confirmation tracker"""
+
+    cycles: int = 0
+    checked: int = 0
+    confirmed: int = 0
+    rescheduled: int = 0
+    failed: int = 0
+    errors: int = 0
+    last_cycle_at: datetime | None = None
+
+    def snapshot(self) -> dict[str, Any]:
+        """Stats as a JSON-serializable dict"""
+        return {
+            "cycles": self.cycles,
+            "checked": self.checked,
+            "confirmed": self.confirmed,
+            "rescheduled": self.rescheduled,
+            "failed": self.failed,
+            "errors": self.errors,
+            "last_cycle_at": self.last_cycle_at.isoformat() if self.last_cycle_at else None,
+        }
+
+
+class ConfirmationTracker:
+    """Polls SUBMITTED transactions and records their confirmation"""
+
+    def __init__(
+        self,
+        poll_interval: float = 20.0,
+        batch_size: int = 100,
+        backoff_base: float = 20.0,
+        backoff_max: float = 600.0,
+        give_up_after: float = 86400.0,
+        chain_context_getter: Callable = get_chain_context_for_network,
+    ):
+        """
+        Initialize the tracker.
+
+        Args:
+            poll_interval: Seconds between cycles
+            batch_size: Transactions checked per tenant per cycle
+            backoff_base: Delay before re-checking a still-pending tx (doubles per check)
+            backoff_max: Upper bound for the re-check delay
+            give_up_after: Seconds after submission before a missing tx is marked FAILED
+            chain_context_getter: Returns the chain context for a network name
+        """
+        self.poll_interval = poll_interval
+        self.batch_size = batch_size
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.give_up_after = give_up_after
+        self.chain_context_getter = chain_context_getter
+        self.stats = ConfirmationTrackerStats()
+        # network -> latest block height seen by the tracker
+        self.latest_heights: dict[str, int] = {}
+        self._refreshed_networks: set[str] = set()
+        self._task: asyncio.Task | None = None
+
+    def backoff_delay(self, checks: int) -> float:
+        """Seconds to wait before re-checking a tx that has been checked `checks` times"""
+        return min(self.backoff_max, self.backoff_base * 2.0**checks)
+
+    def confirmations(self, network: str | None, block_height: int | None) -> int | None:
+        """Confirmations of a block as of the last cycle (None if unknown)"""
+        latest = self.latest_heights.get(network or os.getenv("network") or "testnet")
+        if latest is None or block_height is None:
+            return None
+        return max(0, latest - block_height + 1)
+
+    # ------------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------------
+
+    def start(self) -> None:
+        """Start the background loop on the running event loop"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="confirmation-tracker")
+
+    async def stop(self) -> None:
+        """Cancel the background loop and wait for it to exit"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.run_cycle()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.stats.errors += 1
+                logger.error(f"Confirmation tracker cycle failed: {e}", exc_info=True)
+            await asyncio.sleep(self.poll_interval)
+
+    # ------------------------------------------------------------------------
+    # Cycle
+    # ------------------------------------------------------------------------
+
+    async def run_cycle(self) -> dict[str, int]:
+        """Process every active tenant once"""
+        from api.database.models import Tenant
+        from api.database.multi_tenant_manager import get_multi_tenant_db_manager
+
+        db_manager = get_multi_tenant_db_manager()
+        tenants = await Tenant.find(Tenant.is_active == True, Tenant.is_suspended == False).to_list()  # noqa: E712
+
+        self._refreshed_networks = set()
+        totals = {"checked": 0, "confirmed": 0, "rescheduled": 0, "failed": 0}
+        for tenant in tenants:
+            try:
+                tenant_db = await db_manager.get_tenant_database(tenant.tenant_id)
+                result = await self.process_collection(
+                    tenant_db.get_collection("transactions"), UtxoReservationLedger(tenant_db)
+                )
+            except Exception as e:
+                self.stats.errors += 1
+                logger.warning(f"Confirmation tracking failed for tenant {tenant.tenant_id}: {e}")
+                continue
+            for key, value in result.items():
+                totals[key] += value
+
+        self.stats.cycles += 1
+        self.stats.last_cycle_at = datetime.now(timezone.utc).replace(tzinfo=None)
+        if totals["checked"]:
+            logger.info(
+                f"Confirmation tracker: {totals['checked']} checked, {totals['confirmed']} confirmed, "
+                f"{totals['rescheduled']} pending, {totals['failed']} failed"
+            )
+        return totals
+
+    async def _latest_height(self, network: str) -> int:
+        """Latest block height, fetched at most once per cycle per network"""
+        if network not in self._refreshed_networks:
+            provider = self.chain_context_getter(network).get_provider()
+            latest_block = await get_enrichment_engine().call(provider.block_latest)
+            self.latest_heights[network] = latest_block["height"]
+            self._refreshed_networks.add(network)
+        return self.latest_heights[network]
+
+    async def process_collection(
+        self, collection: AsyncIOMotorCollection, reservations: UtxoReservationLedger | None = None
+    ) -> dict[str, int]:
+        """
+        Check one tenant's due SUBMITTED transactions and bulk-write the results.
+
+        Args:
+            collection: The tenant's transactions collection
+            reservations: The tenant's UTxO ledger; leases of confirmed and failed
+                transactions are released
+        """
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        docs = (
+            await collection.find(
+                {
+                    "status": TransactionStatus.SUBMITTED.value,
+                    "$or": [{"next_check_at": None}, {"next_check_at": {"$lte": now}}],
+                },
+                {"tx_hash": 1, "network": 1, "submitted_at": 1, "confirmation_checks": 1},
+            )
+            .limit(self.batch_size)
+            .to_list(self.batch_size)
+        )
+        if not docs:
+            return {"checked": 0, "confirmed": 0, "rescheduled": 0, "failed": 0}
+
+        default_network = os.getenv("network", "testnet")
+        engine = get_enrichment_engine()
+        tx_cache = get_confirmed_tx_cache()
+
+        async def lookup(doc: dict) -> dict | None:
+            network = doc.get("network") or default_network
+            provider = self.chain_context_getter(network).get_provider()
+            tx_hash = doc["tx_hash"]
+            try:
+                return cast(
+                    dict,
+                    await tx_cache.get_or_fetch(
+                        network, tx_hash, "transaction", lambda: engine.call(provider.transaction, tx_hash)
+                    ),
+                )
+            except ChainProviderError as e:
+                if e.not_found:
+                    return None  # Not on-chain yet
+                raise
+
+        results = await engine.map(docs, lookup)
+
+        operations = []
+        confirmed = []  # their inputs no longer need a lease (see release_confirmed)
+        failed = []
+        counts = {"checked": len(docs), "confirmed": 0, "rescheduled": 0, "failed": 0}
+        for doc, tx_info in zip(docs, results, strict=True):
+            network = doc.get("network") or default_network
+            query = {"_id": doc["_id"], "status": TransactionStatus.SUBMITTED.value}
+
+            if isinstance(tx_info, dict) and tx_info.get("block_height") is not None:
+                block_height = tx_info["block_height"]
+                latest_height = await self._latest_height(network)
+                update = {
+                    "status": TransactionStatus.CONFIRMED.value,
+                    "block_height": block_height,
+                    "confirmations": max(0, latest_height - block_height + 1),
+                    "next_check_at": None,
+                    "updated_at": now,
+                }
+                if tx_info.get("block_time"):
+                    update["confirmed_at"] = datetime.fromtimestamp(tx_info["block_time"], tz=timezone.utc).replace(
+                        tzinfo=None
+                    )
+                if tx_info.get("fees") is not None:
+                    update["fee_lovelace"] = int(tx_info["fees"])
+                operations.append(UpdateOne(query, {"$set": update}))
+                confirmed.append(doc["tx_hash"])
+                counts["confirmed"] += 1
+                continue
+
+            if isinstance(tx_info, Exception):
+                logger.debug(f"Confirmation lookup failed for {doc['tx_hash']}: {tx_info}")
+
+            submitted_at = doc.get("submitted_at")
+            if tx_info is None and submitted_at and (now - submitted_at).total_seconds() > self.give_up_after:
+                operations.append(
+                    UpdateOne(
+                        query,
+                        {
+                            "$set": {
+                                "status": TransactionStatus.FAILED.value,
+                                "error_message": f"Not found on-chain {self.give_up_after:.0f}s after submission",
+                                "next_check_at": None,
+                                "updated_at": now,
+                            }
+                        },
+                    )
+                )
+                failed.append(doc["tx_hash"])
+                counts["failed"] += 1
+                continue
+
+            checks = doc.get("confirmation_checks") or 0
+            operations.append(
+                UpdateOne(
+                    query,
+                    {
+                        "$set": {"next_check_at": now + timedelta(seconds=self.backoff_delay(checks))},
+                        "$inc": {"confirmation_checks": 1},
+                    },
+                )
+            )
+            counts["rescheduled"] += 1
+
+        await collection.bulk_write(operations, ordered=False)
+        if reservations is not None:
+            await reservations.release_confirmed(confirmed)
+            await reservations.release_many(failed)
+
+        self.stats.checked += counts["checked"]
+        self.stats.confirmed += counts["confirmed"]
+        self.stats.rescheduled += counts["rescheduled"]
+        self.stats.failed += counts["failed"]
+        return counts
+
+
+# Global tracker instance
+_confirmation_tracker: ConfirmationTracker | None = None
+
+
+def get_confirmation_tracker() -> ConfirmationTracker:
+    """Get or create the global confirmation tracker"""
+    global _confirmation_tracker
+    if _confirmation_tracker is None:
+        _confirmation_tracker = ConfirmationTracker(
+            poll_interval=settings.confirmation_poll_interval_seconds,
+            batch_size=settings.confirmation_batch_size,
+            backoff_base=settings.confirmation_backoff_base_seconds,
+            backoff_max=settings.confirmation_backoff_max_seconds,
+            give_up_after=settings.confirmation_give_up_seconds,
+        )
+    return _confirmation_tracker
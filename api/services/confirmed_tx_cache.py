@@ -0,0 +1,216 @@
+"""
+Confirmed Transaction Cache
+
+Persistent cache of Blockfrost payloads for confirmed transactions. Once a
+transaction is on-chain its `transaction`, `transaction_utxos` and
+`transaction_metadata` payloads never change, so they are stored once in a
+collection shared by all tenants (admin database) and served from there.
+
+- Keyed by tx hash, one document per transaction, payloads stored as JSON text
+- In-process LRU in front of MongoDB, so hot pages are pure memory reads
+- Size-bounded: oldest documents are evicted once the collection grows past
+  the configured number of transactions
+- Works memory-only until a database is attached at startup
+"""
+
+import json
+import logging
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any
+
+from motor.motor_asyncio import AsyncIOMotorCollection, AsyncIOMotorDatabase
+from pymongo import ASCENDING
+
+from api.config import settings
+
+
+logger = logging.getLogger(__name__)
+
+COLLECTION_NAME = "confirmed_transactions"
+
+# Blockfrost payload kinds stored per transaction
+TX_PAYLOAD_KINDS = ("transaction", "transaction_utxos", "transaction_metadata")
+
+# How many writes between collection size checks
+EVICTION_CHECK_INTERVAL = 500
+
+
+@dataclass
+class ConfirmedTxCacheStats:
+    """Counters for the confirmed transaction cache"""
+
+    memory_hits: int = 0
+    database_hits: int = 0
+    misses: int = 0
+    writes: int = 0
+    evicted: int = 0
+
+    def snapshot(self) -> dict[str, Any]:
+        """Stats as a JSON-serializable dict"""
+        return {
+            "memory_hits": self.memory_hits,
+            "database_hits": self.database_hits,
+            "misses": self.misses,
+            "writes": self.writes,
+            "evicted": self.evicted,
+        }
+
+
+class ConfirmedTxCache:
+    """Two-level (memory LRU → MongoDB) cache of confirmed transaction payloads"""
+
+    def __init__(
+        self, database: AsyncIOMotorDatabase | None = None, memory_max_entries: int = 2000, max_documents: int = 200_000
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            database: Shared (admin) MongoDB database, or None for memory-only
+            memory_max_entries: Transactions kept in the in-process LRU
+            max_documents: Transactions kept in MongoDB before the oldest are evicted
+        """
+        self.database = database
+        self.memory_max_entries = memory_max_entries
+        self.max_documents = max_documents
+        self.stats = ConfirmedTxCacheStats()
+        # (network, tx_hash) -> {kind: payload}
+        self._memory: OrderedDict[tuple[str, str], dict[str, Any]] = OrderedDict()
+        self._writes_since_check = 0
+
+    def _get_collection(self) -> AsyncIOMotorCollection | None:
+        if self.database is not None:
+            return self.database.get_collection(COLLECTION_NAME)
+        return None
+
+    async def initialize(self, database: AsyncIOMotorDatabase) -> None:
+        """Attach the shared database and create the collection's indexes"""
+        self.database = database
+        await database.get_collection(COLLECTION_NAME).create_index([("cached_at", ASCENDING)])
+
+    def _remember(self, network: str, tx_hash: str, payloads: dict[str, Any]) -> dict[str, Any]:
+        key = (network, tx_hash)
+        record = {**self._memory.pop(key, {}), **payloads}
+        self._memory[key] = record
+        while len(self._memory) > self.memory_max_entries:
+            self._memory.popitem(last=False)
+        return record
+
+    async def get_many(self, network: str, tx_hashes: list[str]) -> dict[str, dict[str, Any]]:
+        """
+        Cached payloads for several transactions (one database query for all memory misses).
+
+        Returns:
+            Dict of tx_hash -> {kind: payload} for the transactions found; a record
+            may hold only some of the payload kinds
+        """
+        found: dict[str, dict[str, Any]] = {}
+        missing = []
+        for tx_hash in dict.fromkeys(tx_hashes):
+            record = self._memory.get((network, tx_hash))
+            if record is not None:
+                self._memory.move_to_end((network, tx_hash))
+                self.stats.memory_hits += 1
+                found[tx_hash] = record
+            else:
+                missing.append(tx_hash)
+
+        collection = self._get_collection()
+        if missing and collection is not None:
+            try:
+                docs = await collection.find({"_id": {"$in": missing}, "network": network}).to_list(None)
+            except Exception as e:
+                logger.warning(f"Confirmed tx cache lookup failed: {e}")
+                docs = []
+            for doc in docs:
+                payloads = {kind: json.loads(doc[kind]) for kind in TX_PAYLOAD_KINDS if kind in doc}
+                found[doc["_id"]] = self._remember(network, doc["_id"], payloads)
+                self.stats.database_hits += 1
+
+        self.stats.misses += len([h for h in missing if h not in found])
+        return found
+
+    async def put(self, network: str, tx_hash: str, payloads: dict[str, Any]) -> None:
+        """
+        Store payloads of a confirmed transaction.
+
+        Only call this for transactions already on-chain; failures to persist are
+        logged and never surface to the caller.
+        """
+        payloads = {kind: payload for kind, payload in payloads.items() if kind in TX_PAYLOAD_KINDS}
+        if not payloads:
+            return
+        self._remember(network, tx_hash, payloads)
+
+        collection = self._get_collection()
+        if collection is None:
+            return
+        try:
+            await collection.update_one(
+                {"_id": tx_hash},
+                {
+                    "$set": {"network": network, **{kind: json.dumps(p) for kind, p in payloads.items()}},
+                    "$setOnInsert": {"cached_at": datetime.now(timezone.utc).replace(tzinfo=None)},
+                },
+                upsert=True,
+            )
+            self.stats.writes += 1
+            self._writes_since_check += 1
+            if self._writes_since_check >= EVICTION_CHECK_INTERVAL:
+                self._writes_since_check = 0
+                await self.evict()
+        except Exception as e:
+            logger.warning(f"Confirmed tx cache write failed for {tx_hash}: {e}")
+
+    async def get_or_fetch(self, network: str, tx_hash: str, kind: str, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """Cached payload of one kind for a transaction, fetched through `loader` and stored on miss"""
+        record = (await self.get_many(network, [tx_hash])).get(tx_hash, {})
+        if kind in record:
+            return record[kind]
+        payload = await loader()
+        await self.put(network, tx_hash, {kind: payload})
+        return payload
+
+    async def evict(self) -> int:
+        """
+        Delete the oldest documents once the collection exceeds max_documents.
+
+        Evicts down to 90% of the bound so the check doesn't trigger on every write.
+
+        Returns:
+            Number of documents deleted
+        """
+        collection = self._get_collection()
+        if collection is None:
+            return 0
+        count = await collection.estimated_document_count()
+        if count <= self.max_documents:
+            return 0
+        excess = count - int(self.max_documents * 0.9)
+        oldest = await collection.find({}, {"_id": 1}).sort("cached_at", ASCENDING).limit(excess).to_list(excess)
+        result = await collection.delete_many({"_id": {"$in": [doc["_id"] for doc in oldest]}})
+        self.stats.evicted += result.deleted_count
+        logger.info(f"Evicted {result.deleted_count} confirmed transactions from cache")
+        return result.deleted_count
+
+    def clear_memory(self) -> None:
+        """Drop the in-process LRU (MongoDB is untouched)"""
+        self._memory.clear()
+
+
+# Global cache instance
+_confirmed_tx_cache: ConfirmedTxCache | None = None
+
+
+def get_confirmed_tx_cache() -> ConfirmedTxCache:
+    """Get or create the global confirmed transaction cache"""
+    global _confirmed_tx_cache
+    if _confirmed_tx_cache is None:
+        _confirmed_tx_cache = ConfirmedTxCache(
+            memory_max_entries=settings.confirmed_tx_cache_memory_entries,
+            max_documents=settings.confirmed_tx_cache_max_documents,
+        )
+    return _confirmed_tx_cache
@@ -0,0 +1,195 @@
+"""
+Contract Artifact Cache
+
+Process-wide cache of compiled contracts, keyed by (tenant, policy_id).
+
+A policy ID is the hash of the compiled script, so everything derived from
+the script (CBOR, script hash, addresses, compilation parameters) never
+changes for a given key. Builders keep the validated ContractMongo together
+with the parsed PlutusV2Script, ScriptHash and addresses, and only re-read the
+mutable lifecycle fields (LIFECYCLE_FIELDS) with a small projection.
+
+- Filled on first use and warmed from every active tenant at startup
+- MongoContractService invalidates entries when it replaces or deletes a contract
+- The tenant is the tenant database name (one database per tenant)
+"""
+
+import dataclasses
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+import pycardano as pc
+from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo.asynchronous.collection import AsyncCollection
+
+from api.config import settings
+from api.database.models import ContractMongo
+
+
+logger = logging.getLogger(__name__)
+
+# Contract fields that change after compilation (invalidation, reference script deployment)
+LIFECYCLE_FIELDS = ("is_active", "invalidated_at", "storage_type", "reference_utxo", "reference_tx_hash", "updated_at")
+LIFECYCLE_PROJECTION = {field: 1 for field in LIFECYCLE_FIELDS}
+
+
+@dataclass(frozen=True)
+class ContractArtifact:
+    """A compiled contract with its parsed script objects"""
+
+    contract: ContractMongo
+    script: pc.PlutusV2Script
+    script_hash: pc.ScriptHash
+    testnet_address: pc.Address | None
+    mainnet_address: pc.Address | None
+
+    @classmethod
+    def from_contract(cls, contract: ContractMongo) -> "ContractArtifact":
+        """Parse the script and addresses of a contract"""
+        return cls(
+            contract=contract,
+            script=pc.PlutusV2Script(bytes.fromhex(contract.cbor_hex)),
+            script_hash=pc.ScriptHash(bytes.fromhex(contract.policy_id)),
+            testnet_address=pc.Address.from_primitive(contract.testnet_addr) if contract.testnet_addr else None,
+            mainnet_address=pc.Address.from_primitive(contract.mainnet_addr) if contract.mainnet_addr else None,
+        )
+
+    def address(self, network: str) -> pc.Address | None:
+        """Script address on a network ("testnet" or "mainnet")"""
+        return self.testnet_address if network == "testnet" else self.mainnet_address
+
+    def with_lifecycle(self, doc: dict[str, Any]) -> "ContractArtifact":
+        """Copy carrying the lifecycle fields of a (projected) contract document"""
+        update = {field: doc[field] for field in LIFECYCLE_FIELDS if field in doc}
+        return dataclasses.replace(self, contract=self.contract.model_copy(update=update))
+
+
+@dataclass
+class ContractArtifactStats:
+    """Counters for the contract artifact cache"""
+
+    hits: int = 0
+    misses: int = 0
+    invalidations: int = 0
+    warmed: int = 0
+
+    def snapshot(self) -> dict[str, Any]:
+        """Stats as a JSON-serializable dict"""
+        return {"hits": self.hits, "misses": self.misses, "invalidations": self.invalidations, "warmed": self.warmed}
+
+
+class ContractArtifactCache:
+    """LRU of ContractArtifact keyed by (tenant, policy_id)"""
+
+    def __init__(self, max_entries: int = 5000):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum cached contracts across all tenants (least recently used are evicted)
+        """
+        self.max_entries = max_entries
+        self.stats = ContractArtifactStats()
+        self._entries: OrderedDict[tuple[str | None, str], ContractArtifact] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, tenant: str | None, policy_id: str) -> ContractArtifact | None:
+        """Cached artifact, or None if the contract must be loaded"""
+        key = (tenant, policy_id)
+        with self._lock:
+            artifact = self._entries.get(key)
+            if artifact is None:
+                self.stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return artifact
+
+    def put(self, tenant: str | None, contract: ContractMongo) -> ContractArtifact:
+        """Parse and remember a contract loaded from the database"""
+        artifact = ContractArtifact.from_contract(contract)
+        key = (tenant, contract.policy_id)
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = artifact
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return artifact
+
+    def invalidate(self, tenant: str | None, policy_id: str | None = None) -> None:
+        """Drop one contract, or every contract of the tenant when policy_id is None"""
+        with self._lock:
+            keys = [k for k in self._entries if k[0] == tenant and policy_id in (None, k[1])]
+            for key in keys:
+                del self._entries[key]
+            self.stats.invalidations += len(keys)
+
+    def clear(self) -> None:
+        """Drop all contracts"""
+        with self._lock:
+            self.stats.invalidations += len(self._entries)
+            self._entries.clear()
+
+    async def warm(self, tenant: str | None, collection: AsyncIOMotorCollection | AsyncCollection[Any]) -> int:
+        """
+        Load every contract of a tenant.
+
+        Args:
+            tenant: Tenant key (tenant database name)
+            collection: The tenant's contracts collection
+
+        Returns:
+            Number of contracts cached
+        """
+        count = 0
+        async for doc in collection.find({}):
+            doc["policy_id"] = doc.pop("_id")
+            try:
+                self.put(tenant, ContractMongo.model_validate(doc))
+            except Exception as e:
+                logger.warning(f"Skipping contract {doc['policy_id']} while warming artifacts: {e}")
+                continue
+            count += 1
+        self.stats.warmed += count
+        return count
+
+
+# Global artifact cache instance
+_contract_artifact_cache: ContractArtifactCache | None = None
+
+
+def get_contract_artifact_cache() -> ContractArtifactCache:
+    """Get or create the global contract artifact cache"""
+    global _contract_artifact_cache
+    if _contract_artifact_cache is None:
+        _contract_artifact_cache = ContractArtifactCache(max_entries=settings.contract_artifact_cache_max_entries)
+    return _contract_artifact_cache
+
+
+async def warm_contract_artifact_cache() -> int:
+    """
+    Warm the artifact cache from every active tenant database (called at startup).
+
+    Tenants whose database cannot be opened are skipped with a warning.
+
+    Returns:
+        Number of contracts cached
+    """
+    from api.database.models import Tenant
+    from api.database.multi_tenant_manager import get_multi_tenant_db_manager
+
+    db_manager = get_multi_tenant_db_manager()
+    tenants = await Tenant.find(Tenant.is_active == True, Tenant.is_suspended == False).to_list()  # noqa: E712
+
+    cache = get_contract_artifact_cache()
+    total = 0
+    for tenant in tenants:
+        try:
+            tenant_db = await db_manager.get_tenant_database(tenant.tenant_id)
+            total += await cache.warm(tenant_db.name, tenant_db.get_collection("contracts"))
+        except Exception as e:
+            logger.warning(f"Failed to warm contract artifacts for tenant {tenant.tenant_id}: {e}")
+    return total
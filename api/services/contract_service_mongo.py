@@ -7,20 +7,30 @@ Supports Opshin contract compilation with versioning and multi-tenant isolation.
 MongoDB/Beanie version for multi-tenant architecture.
 """
 
+import asyncio
 import hashlib
-import sys
+import logging
 import tempfile
 import pathlib
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Optional, cast
 
-from opshin.builder import PlutusContract, build
+from opshin.builder import PlutusContract
 import pycardano as pc
 
+from api.config import settings
 from api.database.models import ContractMongo, TransactionMongo
 from api.enums import TransactionStatus
+from api.services.coin_selection import CoinSelectionError, add_selected_inputs, select_inputs, spendable_utxos
+from api.services.compile_executor import CompileExecutorError, get_compile_executor
+from api.services.confirmed_tx_cache import get_confirmed_tx_cache
+from api.services.contract_artifact_cache import LIFECYCLE_PROJECTION, ContractArtifact, get_contract_artifact_cache
+from api.services.utxo_reservations import UtxoReservationLedger
+from cardano_offchain.chain_provider import ChainProviderError, utxo_from_json
 
 
+logger = logging.getLogger(__name__)
+
 # Custom exceptions
 class ContractCompilationError(Exception):
     """Raised when Opshin compilation fails"""
@@ -153,9 +163,11 @@ class MongoContractService:
                         # Keep as is
                         processed_params.append(param)
 
-                compiled = build(str(contract_file), *processed_params)
+                compiled = await get_compile_executor().build(contract_file, *processed_params)
             else:
-                compiled = build(str(contract_file))
+                compiled = await get_compile_executor().build(contract_file)
+        except CompileExecutorError:
+            raise
         except Exception as e:
             raise ContractCompilationError(f"Opshin compilation failed: {str(e)}")
 
@@ -400,6 +412,181 @@ class MongoContractService:
                     reserved.add(first_param)
         return reserved
 
+    async def _available_wallet_utxos(
+        self, address: pc.Address, utxos: list[pc.UTxO], network: str, chain_pending: bool = False
+    ) -> list[pc.UTxO]:
+        """
+        Wallet UTXOs a new transaction may spend.
+
+        Reserved compilation UTXOs and inputs leased by in-flight transactions
+        are excluded. Outputs of our own submitted, unconfirmed transactions are
+        only included with chain_pending=True (see UtxoReservationLedger.available_utxos):
+        Plutus builds are evaluated through Blockfrost, which cannot resolve them.
+        """
+        reserved_utxos = await self.get_reserved_compilation_utxos()
+        utxos = [
+            u for u in utxos
+            if f"{u.input.transaction_id.payload.hex()}:{u.input.index}" not in reserved_utxos
+        ]
+        return await UtxoReservationLedger(self.database).available_utxos(
+            str(address), utxos, network, chain_pending=chain_pending
+        )
+
+    @staticmethod
+    def _add_wallet_inputs(builder: pc.TransactionBuilder, utxos: list[pc.UTxO]) -> None:
+        """
+        Fund a transaction from wallet UTXOs chosen by coin selection.
+
+        Call once outputs and mint are set.
+
+        Raises:
+            InvalidContractParametersError: Wallet UTXOs cannot cover outputs and fees
+        """
+        try:
+            add_selected_inputs(builder, utxos)
+        except CoinSelectionError as e:
+            raise InvalidContractParametersError(str(e)) from e
+
+    @staticmethod
+    def _select_fee_inputs(
+        utxos: list[pc.UTxO], required: list[pc.UTxO], context: pc.ChainContext
+    ) -> list[pc.UTxO]:
+        """
+        Wallet inputs of a script transaction whose redeemer embeds input positions.
+
+        The input set must be fixed before the redeemer is built, so the
+        required UTXOs are topped up by coin selection to cover the maximum fee
+        and a valid change output.
+
+        Args:
+            utxos: Wallet UTXOs available to spend (see _available_wallet_utxos)
+            required: Wallet UTXOs that must be spent (e.g. the USER token)
+            context: PyCardano chain context
+
+        Returns:
+            Required UTXOs followed by the selected fee UTXOs
+
+        Raises:
+            InvalidContractParametersError: Wallet UTXOs cannot cover the fee
+        """
+        existing = pc.Value()
+        for utxo in required:
+            existing += utxo.output.amount
+        try:
+            selected = select_inputs(
+                spendable_utxos(utxos, exclude=required), pc.Value(), context, existing_amount=existing
+            )
+        except CoinSelectionError as e:
+            raise InvalidContractParametersError(str(e)) from e
+        return list(required) + selected
+
+    async def _load_artifact(self, policy_id: str) -> ContractArtifact | None:
+        """Load a full contract document and cache its artifact."""
+        contract_doc = await self._get_contract_collection().find_one({"_id": policy_id})
+        if not contract_doc:
+            return None
+        contract_doc["policy_id"] = contract_doc.pop("_id")
+        return get_contract_artifact_cache().put(self.database.name, ContractMongo.model_validate(contract_doc))
+
+    async def _get_artifact(self, policy_id: str) -> ContractArtifact | None:
+        """
+        Find a compiled contract with its parsed script and addresses.
+
+        Cached contracts only re-read their lifecycle fields (see
+        api.services.contract_artifact_cache); others are loaded in full and cached.
+        """
+        artifact = get_contract_artifact_cache().get(self.database.name, policy_id)
+        if artifact is None:
+            return await self._load_artifact(policy_id)
+        lifecycle = await self._get_contract_collection().find_one({"_id": policy_id}, LIFECYCLE_PROJECTION)
+        if not lifecycle:
+            get_contract_artifact_cache().invalidate(self.database.name, policy_id)
+            return None
+        return artifact.with_lifecycle(lifecycle)
+
+    async def _find_latest_artifact(self, query: dict) -> ContractArtifact | None:
+        """Most recently compiled contract matching a query, loaded through the artifact cache."""
+        docs = await (
+            self._get_contract_collection()
+            .find(query, LIFECYCLE_PROJECTION)
+            .sort("compiled_at", -1)
+            .limit(1)
+            .to_list(1)
+        )
+        if not docs:
+            return None
+        artifact = get_contract_artifact_cache().get(self.database.name, docs[0]["_id"])
+        if artifact is None:
+            return await self._load_artifact(docs[0]["_id"])
+        return artifact.with_lifecycle(docs[0])
+
+    def _invalidate_artifact(self, policy_id: str) -> None:
+        """Drop a replaced or deleted contract from the artifact cache."""
+        if self.database is not None:
+            get_contract_artifact_cache().invalidate(self.database.name, policy_id)
+
+    async def _script_source(self, artifact: ContractArtifact, chain_context) -> pc.PlutusV2Script | pc.UTxO:
+        """
+        Script argument for add_script_input / add_minting_script.
+
+        Contracts deployed with build_deploy_reference_script_transaction are
+        attached through their reference UTXO, so the script is read from a
+        reference input instead of being carried in the witness set. The inline
+        script is used when the contract has no reference script or its
+        reference UTXO is not (or no longer) an unspent output holding it.
+
+        The deployment transaction's outputs come from the confirmed transaction
+        cache; whether the reference UTXO is still unspent is checked against
+        the address UTXOs, which the API serves from the short-TTL UTxO cache.
+        """
+        contract, script = artifact.contract, artifact.script
+        if contract.storage_type != "reference_script" or not contract.reference_utxo:
+            return script
+
+        ref_tx_hash, _, ref_index = contract.reference_utxo.partition(":")
+        provider = chain_context.get_provider()
+        try:
+            tx_utxos = await get_confirmed_tx_cache().get_or_fetch(
+                chain_context.network, ref_tx_hash, "transaction_utxos", lambda: provider.transaction_utxos(ref_tx_hash)
+            )
+        except ChainProviderError as e:
+            logger.warning(f"Reference script {contract.reference_utxo} unavailable ({e}), attaching {contract.name} inline")
+            return script
+
+        output = next((o for o in tx_utxos.get("outputs", []) if str(o["output_index"]) == ref_index), None)
+        if output is None:
+            logger.warning(f"Reference UTXO {contract.reference_utxo} does not exist, attaching {contract.name} inline")
+            return script
+        if output.get("reference_script_hash") != artifact.script_hash.payload.hex():
+            logger.warning(f"Reference UTXO {contract.reference_utxo} does not hold {contract.name}, attaching inline")
+            return script
+
+        # A cached payload may predate the spend, so ask the address's current UTXO set
+        ref_input = pc.TransactionInput.from_primitive([ref_tx_hash, int(ref_index)])
+        try:
+            unspent = output.get("consumed_by_tx") is None and any(
+                u.input == ref_input for u in await provider.utxos(output["address"])
+            )
+        except ChainProviderError as e:
+            logger.warning(f"Reference script {contract.reference_utxo} unavailable ({e}), attaching {contract.name} inline")
+            return script
+        if not unspent:
+            logger.warning(f"Reference script {contract.reference_utxo} is spent, attaching {contract.name} inline")
+            return script
+
+        return utxo_from_json({**output, "tx_hash": ref_tx_hash}, output["address"], script)
+
+    @staticmethod
+    def _reference_input_index(utxo: pc.UTxO, *scripts: pc.PlutusV2Script | pc.UTxO) -> int:
+        """
+        Position of a data reference input in the script context.
+
+        Reference inputs reach validators sorted by (transaction id, index), so
+        reference script UTXOs attached by _script_source can shift it.
+        """
+        refs = {utxo.input} | {s.input for s in scripts if isinstance(s, pc.UTxO)}
+        return sorted(refs, key=lambda i: (i.transaction_id.payload, i.index)).index(utxo.input)
+
     async def get_contract_datum(self, policy_id: str, chain_context) -> dict:
         """
         Query the current on-chain datum for a contract identified by policy_id.
@@ -510,7 +697,7 @@ class MongoContractService:
         minting_script_hash = pc.ScriptHash(bytes.fromhex(minting_policy_id_hex))
 
         # 4. Query UTXOs at the spending address and find the one with the minting policy's token
-        utxos = chain_context.context.utxos(spending_address)
+        utxos = await chain_context.get_provider().utxos(spending_address)
         if not utxos:
             raise InvalidContractParametersError(
                 f"No UTXOs found at contract address {spending_address}"
@@ -619,102 +806,144 @@ class MongoContractService:
         }
 
     async def enrich_contract_status(
-        self, contracts: list[ContractMongo], chain_context
+        self,
+        contracts: list[ContractMongo],
+        chain_context,
+        max_concurrency: int | None = None,
+        deadline_seconds: float | None = None,
     ) -> dict[str, dict]:
         """
-        For each spending validator, check if it has active tokens on-chain.
-        Returns dict keyed by policy_id -> {has_minted_tokens, balance_lovelace}.
-
-        For minting policies, maps their status to the associated spending validator's status.
+        For each contract, check if its spending validator has active tokens on-chain.
+        Returns dict keyed by policy_id -> {has_minted_tokens, balance_lovelace, onchain_status}.
+
+        Minting policies mirror the status of their associated spending validator.
+        Missing spending pairs are resolved with a single database query, each distinct
+        address is queried once, and queries run concurrently under a concurrency cap.
+        When the deadline is reached, unfinished contracts are returned with
+        onchain_status "timeout" instead of failing the whole request.
+
+        onchain_status values:
+            ok: On-chain state was queried
+            no_address: Spending validator has no address for its network
+            unlinked: No associated spending validator was found (minting policies)
+            error: The UTxO query failed
+            timeout: The UTxO query did not finish before the deadline
         """
         enrichment: dict[str, dict] = {}
         if self.database is None or not contracts:
             return enrichment
 
-        collection = self._get_contract_collection()
+        max_concurrency = max_concurrency or settings.contract_enrich_max_concurrency
+        if deadline_seconds is None:
+            deadline_seconds = settings.contract_enrich_deadline_seconds
 
-        # Separate spending validators and minting policies
         spending_contracts = [c for c in contracts if c.contract_type == "spending"]
         minting_contracts = [c for c in contracts if c.contract_type == "minting"]
 
-        # Query on-chain status for each spending validator
-        spending_status: dict[str, dict] = {}  # policy_id -> {has_minted_tokens, balance_lovelace}
-        for sc in spending_contracts:
-            network = sc.network
-            address_str = sc.testnet_addr if network == "testnet" else sc.mainnet_addr
-            if not address_str:
-                enrichment[sc.policy_id] = {"has_minted_tokens": False, "balance_lovelace": 0}
-                spending_status[sc.policy_id] = enrichment[sc.policy_id]
-                continue
-
-            try:
-                spending_address = pc.Address.from_primitive(address_str)
-                utxos = chain_context.context.utxos(spending_address)
-
-                total_lovelace = sum(u.output.amount.coin for u in utxos)
-                has_tokens = any(
-                    u.output.amount.multi_asset
-                    for u in utxos
-                )
-                enrichment[sc.policy_id] = {
-                    "has_minted_tokens": has_tokens,
-                    "balance_lovelace": total_lovelace,
-                }
-                spending_status[sc.policy_id] = enrichment[sc.policy_id]
-            except Exception:
-                enrichment[sc.policy_id] = {"has_minted_tokens": None, "balance_lovelace": None}
-                spending_status[sc.policy_id] = enrichment[sc.policy_id]
-
-        # For minting policies, find the linked spending validator and mirror its status
+        # 1. Resolve the spending validator behind each minting policy
         spending_name_map = {
             "protocol_nfts": "protocol",
             "project_nfts": "project",
         }
+        linked: dict[str, ContractMongo] = {}  # minting policy_id -> spending contract
+        unresolved: list[tuple[ContractMongo, str]] = []  # (minting contract, expected spending name)
         for mc in minting_contracts:
-            registry_name = mc.registry_contract_name
-            expected_spending = spending_name_map.get(registry_name)
+            expected_spending = spending_name_map.get(mc.registry_contract_name or "")
             if not expected_spending:
-                enrichment[mc.policy_id] = {"has_minted_tokens": None, "balance_lovelace": None}
                 continue
+            sc = next(
+                (
+                    sc for sc in spending_contracts
+                    if sc.registry_contract_name == expected_spending
+                    and sc.compilation_params
+                    and mc.policy_id in sc.compilation_params
+                ),
+                None,
+            )
+            if sc:
+                linked[mc.policy_id] = sc
+            else:
+                unresolved.append((mc, expected_spending))
 
-            # Check if linked spending validator is already in our list
-            linked = None
-            for sc in spending_contracts:
-                if (sc.registry_contract_name == expected_spending
-                        and sc.compilation_params
-                        and mc.policy_id in sc.compilation_params):
-                    linked = sc
-                    break
+        if unresolved:
+            # Single query for all pairs not in the list (latest compilation wins)
+            collection = self._get_contract_collection()
+            spending_docs = await collection.find({
+                "registry_contract_name": {"$in": sorted({expected for _, expected in unresolved})},
+                "compilation_params.0": {"$in": [mc.policy_id for mc, _ in unresolved]},
+            }).sort("compiled_at", -1).to_list(None)
+
+            found: dict[tuple[str, str], ContractMongo] = {}
+            for sd in spending_docs:
+                key = (sd["registry_contract_name"], sd["compilation_params"][0])
+                if key not in found:
+                    sd["policy_id"] = sd.pop("_id")
+                    found[key] = ContractMongo.model_validate(sd)
+            for mc, expected_spending in unresolved:
+                sc = found.get((expected_spending, mc.policy_id))
+                if sc:
+                    linked[mc.policy_id] = sc
+
+        # 2. Query each distinct address once, concurrently, under the deadline
+        def address_of(contract: ContractMongo) -> str | None:
+            return contract.testnet_addr if contract.network == "testnet" else contract.mainnet_addr
+
+        # Contracts without an address for their network are reported as no_address below
+        addresses = {address for c in [*spending_contracts, *linked.values()] if (address := address_of(c))}
+
+        provider = chain_context.get_provider()
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def query_utxos(address: str) -> list[pc.UTxO]:
+            async with semaphore:
+                return cast(list[pc.UTxO], await provider.utxos(pc.Address.from_primitive(address)))
+
+        tasks = {address: asyncio.ensure_future(query_utxos(address)) for address in addresses}
+        if tasks:
+            _, pending = await asyncio.wait(tasks.values(), timeout=deadline_seconds)
+            for task in pending:
+                task.cancel()
+            if pending:
+                logger.warning(
+                    f"Contract enrichment deadline ({deadline_seconds}s) reached with "
+                    f"{len(pending)}/{len(tasks)} address queries unfinished"
+                )
+
+        address_status: dict[str, dict] = {}
+        for address, task in tasks.items():
+            if not task.done() or task.cancelled():
+                address_status[address] = {"has_minted_tokens": None, "balance_lovelace": None, "onchain_status": "timeout"}
+            elif task.exception() is not None:
+                address_status[address] = {"has_minted_tokens": None, "balance_lovelace": None, "onchain_status": "error"}
+            else:
+                utxos = task.result()
+                address_status[address] = {
+                    "has_minted_tokens": any(u.output.amount.multi_asset for u in utxos),
+                    "balance_lovelace": sum(u.output.amount.coin for u in utxos),
+                    "onchain_status": "ok",
+                }
 
-            if linked and linked.policy_id in spending_status:
+        # 3. Assemble per-contract status
+        for sc in spending_contracts:
+            address = address_of(sc)
+            if not address:
+                enrichment[sc.policy_id] = {"has_minted_tokens": False, "balance_lovelace": 0, "onchain_status": "no_address"}
+            else:
+                enrichment[sc.policy_id] = dict(address_status[address])
+
+        for mc in minting_contracts:
+            sc = linked.get(mc.policy_id)
+            if sc is None:
+                enrichment[mc.policy_id] = {"has_minted_tokens": None, "balance_lovelace": None, "onchain_status": "unlinked"}
+                continue
+            address = address_of(sc)
+            if not address:
+                enrichment[mc.policy_id] = {"has_minted_tokens": False, "balance_lovelace": None, "onchain_status": "no_address"}
+            else:
                 enrichment[mc.policy_id] = {
-                    "has_minted_tokens": spending_status[linked.policy_id]["has_minted_tokens"],
+                    **address_status[address],
                     "balance_lovelace": None,  # minting policies don't have addresses
                 }
-            else:
-                # Look up in DB
-                spending_docs = await collection.find({
-                    "registry_contract_name": expected_spending,
-                    "compilation_params": [mc.policy_id],
-                }).sort("compiled_at", -1).limit(1).to_list(1)
-
-                if spending_docs:
-                    sd = spending_docs[0]
-                    sd["policy_id"] = sd.pop("_id")
-                    sp_contract = ContractMongo.model_validate(sd)
-                    addr = sp_contract.testnet_addr if sp_contract.network == "testnet" else sp_contract.mainnet_addr
-                    if addr:
-                        try:
-                            sp_addr = pc.Address.from_primitive(addr)
-                            utxos = chain_context.context.utxos(sp_addr)
-                            has_tokens = any(u.output.amount.multi_asset for u in utxos)
-                            enrichment[mc.policy_id] = {"has_minted_tokens": has_tokens, "balance_lovelace": None}
-                        except Exception:
-                            enrichment[mc.policy_id] = {"has_minted_tokens": None, "balance_lovelace": None}
-                    else:
-                        enrichment[mc.policy_id] = {"has_minted_tokens": False, "balance_lovelace": None}
-                else:
-                    enrichment[mc.policy_id] = {"has_minted_tokens": None, "balance_lovelace": None}
 
         return enrichment
 
@@ -759,6 +988,7 @@ class MongoContractService:
             result = await collection.delete_one({"_id": policy_id})
             if result.deleted_count == 0:
                 raise ContractNotFoundError(f"Contract not found: {policy_id}")
+            self._invalidate_artifact(policy_id)
 
             deleted_ids = [policy_id]
 
@@ -766,6 +996,7 @@ class MongoContractService:
             pair_policy_id = await self._find_pair_policy_id(contract, collection)
             if pair_policy_id:
                 await collection.delete_one({"_id": pair_policy_id})
+                self._invalidate_artifact(pair_policy_id)
                 deleted_ids.append(pair_policy_id)
 
             return {"deleted_policy_ids": deleted_ids}
@@ -810,7 +1041,7 @@ class MongoContractService:
                 if addr:
                     try:
                         sp_addr = pc.Address.from_primitive(addr)
-                        utxos = chain_context.context.utxos(sp_addr)
+                        utxos = await chain_context.get_provider().utxos(sp_addr)
                         has_tokens = any(u.output.amount.multi_asset for u in utxos)
                         total_lovelace = sum(u.output.amount.coin for u in utxos)
                         if has_tokens or total_lovelace > 0:
@@ -839,7 +1070,7 @@ class MongoContractService:
             if addr:
                 try:
                     sp_addr = pc.Address.from_primitive(addr)
-                    utxos = chain_context.context.utxos(sp_addr)
+                    utxos = await chain_context.get_provider().utxos(sp_addr)
                     has_tokens = any(u.output.amount.multi_asset for u in utxos)
                     total_lovelace = sum(u.output.amount.coin for u in utxos)
                     if has_tokens or total_lovelace > 0:
@@ -949,7 +1180,7 @@ class MongoContractService:
             - skipped: bool
             - error: str or None
         """
-        from opshin.builder import PlutusContract, build
+        from opshin.builder import PlutusContract
         from opshin.prelude import TxId, TxOutRef
 
         # Contract source paths
@@ -982,7 +1213,7 @@ class MongoContractService:
                     )
 
                 # Find the specific UTXO
-                utxos = chain_context.context.utxos(address)
+                utxos = await chain_context.get_provider().utxos(address)
                 for utxo in utxos:
                     if (utxo.input.transaction_id.payload.hex() == tx_hash and
                         utxo.input.index == target_index):
@@ -995,7 +1226,7 @@ class MongoContractService:
                     )
             else:
                 # Auto-select UTXO with >3 ADA, excluding reserved compilation UTXOs
-                utxos = chain_context.context.utxos(address)
+                utxos = await chain_context.get_provider().utxos(address)
                 used_utxo_refs = await self.get_reserved_compilation_utxos()
                 for utxo in utxos:
                     if utxo.output.amount.coin > 3_000_000:
@@ -1024,7 +1255,7 @@ class MongoContractService:
             )
 
             # Compile protocol_nfts minting policy
-            protocol_nfts_compiled = build(str(protocol_nfts_path), protocol_oref)
+            protocol_nfts_compiled = await get_compile_executor().build(protocol_nfts_path, protocol_oref)
             protocol_nfts_plutus = PlutusContract(protocol_nfts_compiled)
 
             # Check if contract with this policy_id already exists
@@ -1078,7 +1309,7 @@ class MongoContractService:
 
             # Compile protocol spending validator using protocol_nfts policy ID
             protocol_nfts_policy_id_bytes = bytes.fromhex(protocol_nfts_plutus.policy_id)
-            protocol_compiled = build(str(protocol_path), protocol_nfts_policy_id_bytes)
+            protocol_compiled = await get_compile_executor().build(protocol_path, protocol_nfts_policy_id_bytes)
             protocol_plutus = PlutusContract(protocol_compiled)
 
             # Read source for hash
@@ -1128,6 +1359,7 @@ class MongoContractService:
                     contract_dict,
                     upsert=True
                 )
+                self._invalidate_artifact(protocol_nfts_contract.policy_id)
 
                 # Save protocol (keep policy_id field for the unique index)
                 contract_dict = protocol_contract.model_dump(by_alias=True, exclude={"id"})
@@ -1138,6 +1370,7 @@ class MongoContractService:
                     contract_dict,
                     upsert=True
                 )
+                self._invalidate_artifact(protocol_contract.policy_id)
 
             return {
                 "success": True,
@@ -1149,7 +1382,7 @@ class MongoContractService:
                 "error": None,
             }
 
-        except (ContractCompilationError, InvalidContractParametersError):
+        except (ContractCompilationError, InvalidContractParametersError, CompileExecutorError):
             raise
         except Exception as e:
             raise ContractCompilationError(f"Protocol compilation failed: {str(e)}")
@@ -1205,35 +1438,27 @@ class MongoContractService:
         if self.database is None:
             raise ContractCompilationError("Database context required for mint operations")
 
-        collection = self._get_contract_collection()
-
         # 1. Find protocol_nfts contract by policy_id
-        nfts_doc = await collection.find_one({"_id": protocol_nfts_policy_id})
-        if not nfts_doc:
+        protocol_nfts_artifact = await self._get_artifact(protocol_nfts_policy_id)
+        if protocol_nfts_artifact is None:
             raise ContractNotFoundError(
                 f"protocol_nfts contract with policy_id '{protocol_nfts_policy_id}' not found. "
                 "Use GET /contracts/ to list available compiled contracts."
             )
 
-        nfts_doc["policy_id"] = nfts_doc.pop("_id")
-        protocol_nfts_contract = ContractMongo.model_validate(nfts_doc)
+        protocol_nfts_contract = protocol_nfts_artifact.contract
 
         # 2. Find protocol spending validator (by its compilation param = protocol_nfts policy_id)
-        protocol_docs = await collection.find({
+        protocol_artifact = await self._find_latest_artifact({
             "registry_contract_name": "protocol",
             "category": "core_protocol",
             "compilation_params": [protocol_nfts_contract.policy_id],
-        }).sort("compiled_at", -1).limit(1).to_list(1)
-
-        if not protocol_docs:
+        })
+        if protocol_artifact is None:
             raise ContractNotFoundError(
                 "protocol spending validator not found. Run POST /compile-protocol first."
             )
 
-        protocol_doc = protocol_docs[0]
-        protocol_doc["policy_id"] = protocol_doc.pop("_id")
-        protocol_contract = ContractMongo.model_validate(protocol_doc)
-
         # 3. Get compilation UTXO from protocol_nfts compilation_params
         if not protocol_nfts_contract.compilation_params:
             raise InvalidContractParametersError(
@@ -1251,7 +1476,7 @@ class MongoContractService:
 
         # 4. Find the UTXO on-chain at the wallet address
         address = pc.Address.from_primitive(wallet_address)
-        utxos = chain_context.context.utxos(address)
+        utxos = await chain_context.get_provider().utxos(address)
 
         utxo_to_spend = None
         for utxo in utxos:
@@ -1267,14 +1492,11 @@ class MongoContractService:
             )
 
         # 5. Reconstruct script and build transaction
-        minting_script = pc.PlutusV2Script(bytes.fromhex(protocol_nfts_contract.cbor_hex))
-        minting_policy_id = pc.ScriptHash(bytes.fromhex(protocol_nfts_contract.policy_id))
+        minting_script = await self._script_source(protocol_nfts_artifact, chain_context)
+        minting_policy_id = protocol_nfts_artifact.script_hash
 
         # Determine protocol contract address
-        if network == "testnet":
-            protocol_address = pc.Address.from_primitive(protocol_contract.testnet_addr)
-        else:
-            protocol_address = pc.Address.from_primitive(protocol_contract.mainnet_addr)
+        protocol_address = protocol_artifact.address(network)
 
         # Determine destination for USER token
         if destination_address:
@@ -1303,9 +1525,8 @@ class MongoContractService:
         total_mint = protocol_nft_asset.union(user_nft_asset)
 
         # Build transaction
-        builder = pc.TransactionBuilder(chain_context.context)
+        builder = pc.TransactionBuilder(await chain_context.prepare_context())
         builder.add_input(utxo_to_spend)
-        builder.add_input_address(address)
         builder.mint = total_mint
         builder.add_minting_script(script=minting_script, redeemer=pc.Redeemer(Mint()))
 
@@ -1364,8 +1585,11 @@ class MongoContractService:
         )
         builder.add_output(user_output)
 
+        # Fee coverage
+        self._add_wallet_inputs(builder, await self._available_wallet_utxos(address, utxos, network))
+
         # 6. Build unsigned transaction (no signing key needed)
-        tx_body = builder.build(change_address=address)
+        tx_body = await asyncio.to_thread(builder.build, change_address=address)
 
         # Extract partial witness set (scripts + redeemers, no vkeys)
         # PyCardano's build_witness_set() returns everything except vkey witnesses
@@ -1426,6 +1650,9 @@ class MongoContractService:
             updated_at=now,
         )
 
+        # Lease the inputs so concurrent builds don't select them
+        await UtxoReservationLedger(self.database).reserve_transaction(tx_body, tx_hash, wallet_id)
+
         tx_collection = self.database.get_collection("transactions")
         tx_dict = transaction.model_dump(by_alias=True, exclude_unset=False)
         if "id" in tx_dict:
@@ -1502,50 +1729,41 @@ class MongoContractService:
         if self.database is None:
             raise ContractCompilationError("Database context required for burn operations")
 
-        collection = self._get_contract_collection()
-
         # 1. Find protocol_nfts contract by policy_id
-        nfts_doc = await collection.find_one({"_id": protocol_nfts_policy_id})
-        if not nfts_doc:
+        protocol_nfts_artifact = await self._get_artifact(protocol_nfts_policy_id)
+        if protocol_nfts_artifact is None:
             raise ContractNotFoundError(
                 f"protocol_nfts contract with policy_id '{protocol_nfts_policy_id}' not found. "
                 "Use GET /contracts/ to list available compiled contracts."
             )
 
-        nfts_doc["policy_id"] = nfts_doc.pop("_id")
-        protocol_nfts_contract = ContractMongo.model_validate(nfts_doc)
+        protocol_nfts_contract = protocol_nfts_artifact.contract
 
         # 2. Find protocol spending validator (by its compilation param = protocol_nfts policy_id)
-        protocol_docs = await collection.find({
+        protocol_artifact = await self._find_latest_artifact({
             "registry_contract_name": "protocol",
             "category": "core_protocol",
             "compilation_params": [protocol_nfts_contract.policy_id],
-        }).sort("compiled_at", -1).limit(1).to_list(1)
-
-        if not protocol_docs:
+        })
+        if protocol_artifact is None:
             raise ContractNotFoundError(
                 "protocol spending validator not found. Run POST /compile-protocol first."
             )
 
-        protocol_doc = protocol_docs[0]
-        protocol_doc["policy_id"] = protocol_doc.pop("_id")
-        protocol_contract = ContractMongo.model_validate(protocol_doc)
-
         # 3. Reconstruct scripts
-        minting_script = pc.PlutusV2Script(bytes.fromhex(protocol_nfts_contract.cbor_hex))
-        minting_policy_id = pc.ScriptHash(bytes.fromhex(protocol_nfts_contract.policy_id))
-        protocol_script = pc.PlutusV2Script(bytes.fromhex(protocol_contract.cbor_hex))
+        minting_script, protocol_script = await asyncio.gather(
+            self._script_source(protocol_nfts_artifact, chain_context),
+            self._script_source(protocol_artifact, chain_context),
+        )
+        minting_policy_id = protocol_nfts_artifact.script_hash
 
         # Determine protocol contract address
-        if network == "testnet":
-            protocol_address = pc.Address.from_primitive(protocol_contract.testnet_addr)
-        else:
-            protocol_address = pc.Address.from_primitive(protocol_contract.mainnet_addr)
+        protocol_address = protocol_artifact.address(network)
 
         address = pc.Address.from_primitive(wallet_address)
 
         # 4. Find protocol UTXO on-chain (REF token at protocol contract address)
-        protocol_utxos = chain_context.context.utxos(protocol_address)
+        protocol_utxos = await chain_context.get_provider().utxos(protocol_address)
         if not protocol_utxos:
             raise InvalidContractParametersError(
                 f"No UTXOs found at protocol address {protocol_address}"
@@ -1567,7 +1785,7 @@ class MongoContractService:
             )
 
         # 5. Find user UTXO on-chain (USER token at wallet address)
-        user_utxos = chain_context.context.utxos(address)
+        user_utxos = await chain_context.get_provider().utxos(address)
         if not user_utxos:
             raise InvalidContractParametersError(
                 f"No UTXOs found at wallet address {wallet_address}"
@@ -1596,9 +1814,12 @@ class MongoContractService:
                 f"No UTXO with policy {protocol_nfts_policy_id} found at wallet address"
             )
 
-        # 6. Calculate sorted input indices for EndProtocol redeemer
+        # 6. Select wallet inputs, then calculate sorted input indices for EndProtocol redeemer
+        wallet_inputs = self._select_fee_inputs(
+            await self._available_wallet_utxos(address, user_utxos, network), [user_utxo], await chain_context.prepare_context()
+        )
         all_inputs = sorted(
-            user_utxos + [protocol_utxo],
+            wallet_inputs + [protocol_utxo],
             key=lambda u: (u.input.transaction_id.payload, u.input.index),
         )
         protocol_input_index = all_inputs.index(protocol_utxo)
@@ -1607,8 +1828,8 @@ class MongoContractService:
         # 7. Build transaction
         builder = pc.TransactionBuilder(chain_context.context)
 
-        # Add all user UTXOs as regular inputs
-        for u in user_utxos:
+        # Add USER token and fee UTXOs as regular inputs
+        for u in wallet_inputs:
             builder.add_input(u)
 
         # Add minting script with Burn redeemer
@@ -1638,11 +1859,8 @@ class MongoContractService:
             })
         })
 
-        # Fee coverage
-        builder.add_input_address(address)
-
         # 8. Build unsigned transaction
-        tx_body = builder.build(change_address=address)
+        tx_body = await asyncio.to_thread(builder.build, change_address=address)
         partial_witness = builder.build_witness_set()
 
         unsigned_cbor = tx_body.to_cbor_hex()
@@ -1703,6 +1921,9 @@ class MongoContractService:
             updated_at=now,
         )
 
+        # Lease the inputs so concurrent builds don't select them
+        await UtxoReservationLedger(self.database).reserve_transaction(tx_body, tx_hash, wallet_id)
+
         tx_collection = self.database.get_collection("transactions")
         tx_dict = transaction.model_dump(by_alias=True, exclude_unset=False)
         if "id" in tx_dict:
@@ -1771,33 +1992,27 @@ class MongoContractService:
         if self.database is None:
             raise ContractCompilationError("Database context required for burn operations")
 
-        collection = self._get_contract_collection()
-
         # 1. Find project_nfts contract by policy_id
-        nfts_doc = await collection.find_one({"_id": project_nfts_policy_id})
-        if not nfts_doc:
+        project_nfts_artifact = await self._get_artifact(project_nfts_policy_id)
+        if project_nfts_artifact is None:
             raise ContractNotFoundError(
                 f"project_nfts contract with policy_id '{project_nfts_policy_id}' not found. "
                 "Use GET /contracts/ to list available compiled contracts."
             )
 
-        nfts_doc["policy_id"] = nfts_doc.pop("_id")
-        project_nfts_contract = ContractMongo.model_validate(nfts_doc)
+        project_nfts_contract = project_nfts_artifact.contract
 
         # 2. Find project spending validator (compilation_params[0] == project_nfts policy_id)
-        project_docs = await collection.find({
+        project_artifact = await self._find_latest_artifact({
             "registry_contract_name": "project",
             "compilation_params": [project_nfts_contract.policy_id],
-        }).sort("compiled_at", -1).limit(1).to_list(1)
-
-        if not project_docs:
+        })
+        if project_artifact is None:
             raise ContractNotFoundError(
                 "project spending validator not found. Run POST /compile-project first."
             )
 
-        project_doc = project_docs[0]
-        project_doc["policy_id"] = project_doc.pop("_id")
-        project_contract = ContractMongo.model_validate(project_doc)
+        project_contract = project_artifact.contract
 
         # 3. Derive protocol_nfts_policy_id from project_nfts compilation_params[1]
         if not project_nfts_contract.compilation_params or len(project_nfts_contract.compilation_params) < 2:
@@ -1808,24 +2023,23 @@ class MongoContractService:
         protocol_nfts_policy_id = project_nfts_contract.compilation_params[1]
 
         # 4. Find protocol spending validator
-        protocol_docs = await collection.find({
+        protocol_artifact = await self._find_latest_artifact({
             "registry_contract_name": "protocol",
             "compilation_params": [protocol_nfts_policy_id],
-        }).sort("compiled_at", -1).limit(1).to_list(1)
-
-        if not protocol_docs:
+        })
+        if protocol_artifact is None:
             raise ContractNotFoundError(
                 "protocol spending validator not found. Ensure protocol contracts are compiled."
             )
 
-        protocol_doc = protocol_docs[0]
-        protocol_doc["policy_id"] = protocol_doc.pop("_id")
-        protocol_contract = ContractMongo.model_validate(protocol_doc)
+        protocol_contract = protocol_artifact.contract
 
         # 5. Reconstruct scripts and addresses
-        project_minting_script = pc.PlutusV2Script(bytes.fromhex(project_nfts_contract.cbor_hex))
-        project_minting_policy_id = pc.ScriptHash(bytes.fromhex(project_nfts_contract.policy_id))
-        project_script = pc.PlutusV2Script(bytes.fromhex(project_contract.cbor_hex))
+        project_minting_script, project_script = await asyncio.gather(
+            self._script_source(project_nfts_artifact, chain_context),
+            self._script_source(project_artifact, chain_context),
+        )
+        project_minting_policy_id = project_nfts_artifact.script_hash
         protocol_minting_policy_id = pc.ScriptHash(bytes.fromhex(protocol_nfts_policy_id))
 
         if network == "testnet":
@@ -1838,7 +2052,7 @@ class MongoContractService:
         address = pc.Address.from_primitive(wallet_address)
 
         # 6. Find protocol UTXO on-chain (for reference input)
-        protocol_utxos = chain_context.context.utxos(protocol_address)
+        protocol_utxos = await chain_context.get_provider().utxos(protocol_address)
         if not protocol_utxos:
             raise InvalidContractParametersError(
                 f"No UTXOs found at protocol address {protocol_address}. "
@@ -1861,7 +2075,7 @@ class MongoContractService:
             )
 
         # 7. Find REF UTXO at project contract address
-        project_utxos = chain_context.context.utxos(project_address)
+        project_utxos = await chain_context.get_provider().utxos(project_address)
         if not project_utxos:
             raise InvalidContractParametersError(
                 f"No UTXOs found at project address {project_address}"
@@ -1883,7 +2097,7 @@ class MongoContractService:
             )
 
         # 8. Find USER UTXO at wallet address
-        user_utxos = chain_context.context.utxos(address)
+        user_utxos = await chain_context.get_provider().utxos(address)
         if not user_utxos:
             raise InvalidContractParametersError(
                 f"No UTXOs found at wallet address {wallet_address}"
@@ -1912,9 +2126,12 @@ class MongoContractService:
                 f"No UTXO with policy {project_nfts_policy_id} found at wallet address"
             )
 
-        # 9. Calculate sorted input indices for EndProject redeemer
+        # 9. Select wallet inputs, then calculate sorted input indices for EndProject redeemer
+        wallet_inputs = self._select_fee_inputs(
+            await self._available_wallet_utxos(address, user_utxos, network), [user_utxo], await chain_context.prepare_context()
+        )
         all_inputs = sorted(
-            user_utxos + [project_utxo],
+            wallet_inputs + [project_utxo],
             key=lambda u: (u.input.transaction_id.payload, u.input.index),
         )
         project_input_index = all_inputs.index(project_utxo)
@@ -1923,8 +2140,8 @@ class MongoContractService:
         # 10. Build transaction
         builder = pc.TransactionBuilder(chain_context.context)
 
-        # Add all user UTXOs as regular inputs
-        for u in user_utxos:
+        # Add USER token and fee UTXOs as regular inputs
+        for u in wallet_inputs:
             builder.add_input(u)
 
         # Add project UTXO as script input with EndProject redeemer
@@ -1937,7 +2154,7 @@ class MongoContractService:
             )),
         )
 
-        # Add protocol UTXO as reference input (index 0 — only reference input)
+        # Add protocol UTXO as reference input (alongside any reference script UTXOs)
         builder.reference_inputs.add(protocol_utxo)
 
         # Prevent PyCardano from auto-adding input vkey hashes as required_signers.
@@ -1946,10 +2163,11 @@ class MongoContractService:
         # check. With project_admins potentially empty, any required_signer fails.
         builder.required_signers = []
 
-        # Add minting script with BurnProject redeemer (protocol is reference_input[0])
+        # Add minting script with BurnProject redeemer pointing at the protocol reference input
+        protocol_input_index = self._reference_input_index(protocol_utxo, project_script, project_minting_script)
         builder.add_minting_script(
             script=project_minting_script,
-            redeemer=pc.Redeemer(BurnProject(protocol_input_index=0)),
+            redeemer=pc.Redeemer(BurnProject(protocol_input_index=protocol_input_index)),
         )
 
         # Extract token names from UTXOs for burn amounts
@@ -1966,11 +2184,8 @@ class MongoContractService:
             })
         })
 
-        # Fee coverage
-        builder.add_input_address(address)
-
         # 11. Build unsigned transaction
-        tx_body = builder.build(change_address=address)
+        tx_body = await asyncio.to_thread(builder.build, change_address=address)
         partial_witness = builder.build_witness_set()
 
         unsigned_cbor = tx_body.to_cbor_hex()
@@ -2030,6 +2245,9 @@ class MongoContractService:
             updated_at=now,
         )
 
+        # Lease the inputs so concurrent builds don't select them
+        await UtxoReservationLedger(self.database).reserve_transaction(tx_body, tx_hash, wallet_id)
+
         tx_collection = self.database.get_collection("transactions")
         tx_dict = transaction.model_dump(by_alias=True, exclude_unset=False)
         if "id" in tx_dict:
@@ -2072,62 +2290,55 @@ class MongoContractService:
         nfts_registry_name: str,
         spending_registry_name: str,
         spending_category: Optional[str] = None,
-    ) -> tuple:
+    ) -> tuple[ContractArtifact, ContractArtifact]:
         """
-        Resolve (nfts_contract, spending_contract) from either a minting policy ID
-        or a spending validator policy ID.
+        Resolve the (nfts, spending) contract artifacts from either a minting
+        policy ID or a spending validator policy ID.
 
         Mirrors the resolution logic used in get_contract_datum so that any endpoint
         accepting a policy_id works with both ID types.
         """
-        collection = self._get_contract_collection()
-
-        contract_doc = await collection.find_one({"_id": policy_id})
-        if not contract_doc:
+        contract_artifact = await self._get_artifact(policy_id)
+        if contract_artifact is None:
             raise ContractNotFoundError(
                 f"Contract '{policy_id}' not found. "
                 "Pass either the minting policy ID or the spending validator policy ID."
             )
-        contract_doc["policy_id"] = contract_doc.pop("_id")
-        contract = ContractMongo.model_validate(contract_doc)
+        contract = contract_artifact.contract
 
         if contract.contract_type == "spending":
             # Spending validator given — derive nfts contract from compilation_params[0]
-            spending_contract = contract
+            spending_artifact = contract_artifact
             if not contract.compilation_params:
                 raise InvalidContractParametersError(
                     f"Spending validator '{policy_id}' has no compilation_params — "
                     "cannot determine the associated minting policy."
                 )
             nfts_policy_id = contract.compilation_params[0]
-            nfts_doc = await collection.find_one({"_id": nfts_policy_id})
-            if not nfts_doc:
+            nfts_artifact = await self._get_artifact(nfts_policy_id)
+            if nfts_artifact is None:
                 raise ContractNotFoundError(
                     f"Minting policy '{nfts_policy_id}' (from {spending_registry_name} "
                     f"compilation_params) not found."
                 )
-            nfts_doc["policy_id"] = nfts_doc.pop("_id")
-            nfts_contract = ContractMongo.model_validate(nfts_doc)
         else:
             # Minting policy given — find the spending validator
-            nfts_contract = contract
+            nfts_artifact = contract_artifact
             query = {
                 "registry_contract_name": spending_registry_name,
-                "compilation_params": [nfts_contract.policy_id],
+                "compilation_params": [contract.policy_id],
             }
             if spending_category:
                 query["category"] = spending_category
-            spending_docs = await collection.find(query).sort("compiled_at", -1).limit(1).to_list(1)
-            if not spending_docs:
+            latest_spending = await self._find_latest_artifact(query)
+            if latest_spending is None:
                 raise ContractNotFoundError(
                     f"Spending validator '{spending_registry_name}' compiled with "
                     f"policy {policy_id} not found."
                 )
-            spending_doc = spending_docs[0]
-            spending_doc["policy_id"] = spending_doc.pop("_id")
-            spending_contract = ContractMongo.model_validate(spending_doc)
+            spending_artifact = latest_spending
 
-        return nfts_contract, spending_contract
+        return nfts_artifact, spending_artifact
 
     async def build_update_protocol_transaction(
         self,
@@ -2169,7 +2380,7 @@ class MongoContractService:
             raise ContractCompilationError("Database context required for update operations")
 
         # 1. Resolve protocol_nfts and protocol contracts (accepts minting or spending policy_id)
-        protocol_nfts_contract, protocol_contract = await self._resolve_nfts_and_spending_contracts(
+        protocol_nfts_artifact, protocol_artifact = await self._resolve_nfts_and_spending_contracts(
             policy_id=protocol_nfts_policy_id,
             nfts_registry_name="protocol_nfts",
             spending_registry_name="protocol",
@@ -2177,19 +2388,16 @@ class MongoContractService:
         )
 
         # 2. Reconstruct scripts
-        protocol_script = pc.PlutusV2Script(bytes.fromhex(protocol_contract.cbor_hex))
-        minting_policy_id = pc.ScriptHash(bytes.fromhex(protocol_nfts_contract.policy_id))
+        protocol_script = await self._script_source(protocol_artifact, chain_context)
+        minting_policy_id = protocol_nfts_artifact.script_hash
 
         # Determine protocol contract address
-        if network == "testnet":
-            protocol_address = pc.Address.from_primitive(protocol_contract.testnet_addr)
-        else:
-            protocol_address = pc.Address.from_primitive(protocol_contract.mainnet_addr)
+        protocol_address = protocol_artifact.address(network)
 
         address = pc.Address.from_primitive(wallet_address)
 
         # 4. Find protocol UTXO on-chain (REF token at protocol contract address)
-        protocol_utxos = chain_context.context.utxos(protocol_address)
+        protocol_utxos = await chain_context.get_provider().utxos(protocol_address)
         if not protocol_utxos:
             raise InvalidContractParametersError(
                 f"No UTXOs found at protocol address {protocol_address}"
@@ -2211,7 +2419,7 @@ class MongoContractService:
             )
 
         # 5. Find user UTXO on-chain (USER token at wallet address)
-        user_utxos = chain_context.context.utxos(address)
+        user_utxos = await chain_context.get_provider().utxos(address)
         if not user_utxos:
             raise InvalidContractParametersError(
                 f"No UTXOs found at wallet address {wallet_address}"
@@ -2292,9 +2500,12 @@ class MongoContractService:
             "projects": [p.hex() for p in new_projects],
         }
 
-        # 9. Calculate sorted input indices for UpdateProtocol redeemer
+        # 9. Select wallet inputs, then calculate sorted input indices for UpdateProtocol redeemer
+        wallet_inputs = self._select_fee_inputs(
+            await self._available_wallet_utxos(address, user_utxos, network), [user_utxo], await chain_context.prepare_context()
+        )
         all_inputs = sorted(
-            user_utxos + [protocol_utxo],
+            wallet_inputs + [protocol_utxo],
             key=lambda u: (u.input.transaction_id.payload, u.input.index),
         )
         protocol_input_index = all_inputs.index(protocol_utxo)
@@ -2303,8 +2514,8 @@ class MongoContractService:
         # 10. Build transaction
         builder = pc.TransactionBuilder(chain_context.context)
 
-        # Add all user UTXOs as regular inputs
-        for u in user_utxos:
+        # Add USER token and fee UTXOs as regular inputs
+        for u in wallet_inputs:
             builder.add_input(u)
 
         # Add protocol UTXO as script input with UpdateProtocol redeemer
@@ -2340,7 +2551,7 @@ class MongoContractService:
         builder.add_output(protocol_output)
 
         # 11. Build unsigned transaction
-        tx_body = builder.build(change_address=address)
+        tx_body = await asyncio.to_thread(builder.build, change_address=address)
         partial_witness = builder.build_witness_set()
 
         unsigned_cbor = tx_body.to_cbor_hex()
@@ -2383,7 +2594,7 @@ class MongoContractService:
         transaction = TransactionMongo(
             tx_hash=tx_hash,
             wallet_id=wallet_id,
-            contract_policy_id=protocol_nfts_contract.policy_id,
+            contract_policy_id=protocol_nfts_artifact.contract.policy_id,
             status=TransactionStatus.BUILT.value,
             operation="update_protocol",
             description="Update protocol datum",
@@ -2400,6 +2611,9 @@ class MongoContractService:
             updated_at=now,
         )
 
+        # Lease the inputs so concurrent builds don't select them
+        await UtxoReservationLedger(self.database).reserve_transaction(tx_body, tx_hash, wallet_id)
+
         tx_collection = self.database.get_collection("transactions")
         tx_dict = transaction.model_dump(by_alias=True, exclude_unset=False)
         if "id" in tx_dict:
@@ -2494,34 +2708,26 @@ class MongoContractService:
         if self.database is None:
             raise ContractCompilationError("Database context required for mint operations")
 
-        collection = self._get_contract_collection()
-
         # 1. Find project_nfts contract by policy_id
-        nfts_doc = await collection.find_one({"_id": project_nfts_policy_id})
-        if not nfts_doc:
+        project_nfts_artifact = await self._get_artifact(project_nfts_policy_id)
+        if project_nfts_artifact is None:
             raise ContractNotFoundError(
                 f"project_nfts contract with policy_id '{project_nfts_policy_id}' not found. "
                 "Use GET /contracts/ to list available compiled contracts."
             )
 
-        nfts_doc["policy_id"] = nfts_doc.pop("_id")
-        project_nfts_contract = ContractMongo.model_validate(nfts_doc)
+        project_nfts_contract = project_nfts_artifact.contract
 
         # 2. Find project spending validator (by compilation_params containing project_nfts policy_id)
-        project_docs = await collection.find({
+        project_artifact = await self._find_latest_artifact({
             "registry_contract_name": "project",
             "compilation_params": [project_nfts_contract.policy_id],
-        }).sort("compiled_at", -1).limit(1).to_list(1)
-
-        if not project_docs:
+        })
+        if project_artifact is None:
             raise ContractNotFoundError(
                 "project spending validator not found. Run POST /compile-project first."
             )
 
-        project_doc = project_docs[0]
-        project_doc["policy_id"] = project_doc.pop("_id")
-        project_contract = ContractMongo.model_validate(project_doc)
-
         # 3. Derive protocol_nfts_policy_id from project_nfts compilation_params[1]
         if not project_nfts_contract.compilation_params or len(project_nfts_contract.compilation_params) < 2:
             raise InvalidContractParametersError(
@@ -2532,28 +2738,20 @@ class MongoContractService:
         protocol_nfts_policy_id = project_nfts_contract.compilation_params[1]
 
         # 4. Find protocol spending validator to get protocol address
-        protocol_docs = await collection.find({
+        protocol_artifact = await self._find_latest_artifact({
             "registry_contract_name": "protocol",
             "compilation_params": [protocol_nfts_policy_id],
-        }).sort("compiled_at", -1).limit(1).to_list(1)
-
-        if not protocol_docs:
+        })
+        if protocol_artifact is None:
             raise ContractNotFoundError(
                 "protocol spending validator not found. Ensure protocol contracts are compiled."
             )
 
-        protocol_doc = protocol_docs[0]
-        protocol_doc["policy_id"] = protocol_doc.pop("_id")
-        protocol_contract = ContractMongo.model_validate(protocol_doc)
-
         # 5. Get protocol address and find protocol UTXO on-chain (for reference input)
-        if network == "testnet":
-            protocol_address = pc.Address.from_primitive(protocol_contract.testnet_addr)
-        else:
-            protocol_address = pc.Address.from_primitive(protocol_contract.mainnet_addr)
+        protocol_address = protocol_artifact.address(network)
 
         protocol_minting_policy_id = pc.ScriptHash(bytes.fromhex(protocol_nfts_policy_id))
-        protocol_utxos = chain_context.context.utxos(protocol_address)
+        protocol_utxos = await chain_context.get_provider().utxos(protocol_address)
         if not protocol_utxos:
             raise InvalidContractParametersError(
                 f"No UTXOs found at protocol address {protocol_address}. "
@@ -2587,7 +2785,7 @@ class MongoContractService:
 
         # 7. Find the compilation UTXO on-chain at the wallet address
         address = pc.Address.from_primitive(wallet_address)
-        utxos = chain_context.context.utxos(address)
+        utxos = await chain_context.get_provider().utxos(address)
 
         utxo_to_spend = None
         for utxo in utxos:
@@ -2603,14 +2801,11 @@ class MongoContractService:
             )
 
         # 8. Reconstruct minting script
-        minting_script = pc.PlutusV2Script(bytes.fromhex(project_nfts_contract.cbor_hex))
-        minting_policy_id = pc.ScriptHash(bytes.fromhex(project_nfts_contract.policy_id))
+        minting_script = await self._script_source(project_nfts_artifact, chain_context)
+        minting_policy_id = project_nfts_artifact.script_hash
 
         # Determine project contract address
-        if network == "testnet":
-            project_address = pc.Address.from_primitive(project_contract.testnet_addr)
-        else:
-            project_address = pc.Address.from_primitive(project_contract.mainnet_addr)
+        project_address = project_artifact.address(network)
 
         # Determine destination for USER token
         if destination_address:
@@ -2689,16 +2884,17 @@ class MongoContractService:
         )
 
         # 11. Build transaction
-        builder = pc.TransactionBuilder(chain_context.context)
+        builder = pc.TransactionBuilder(await chain_context.prepare_context())
         builder.add_input(utxo_to_spend)
-        builder.add_input_address(address)
 
         builder.mint = total_mint
 
-        # MintProject redeemer — protocol_input_index = 0 (first reference input)
+        # MintProject redeemer — protocol_input_index is the protocol UTXO's reference input position
         builder.add_minting_script(
             script=minting_script,
-            redeemer=pc.Redeemer(MintProject(protocol_input_index=0)),
+            redeemer=pc.Redeemer(
+                MintProject(protocol_input_index=self._reference_input_index(protocol_utxo, minting_script))
+            ),
         )
 
         # Add protocol UTXO as reference input
@@ -2742,8 +2938,11 @@ class MongoContractService:
         )
         builder.add_output(user_output)
 
+        # Fee coverage
+        self._add_wallet_inputs(builder, await self._available_wallet_utxos(address, utxos, network))
+
         # 12. Build unsigned transaction
-        tx_body = builder.build(change_address=address)
+        tx_body = await asyncio.to_thread(builder.build, change_address=address)
         partial_witness = builder.build_witness_set()
 
         unsigned_cbor = tx_body.to_cbor_hex()
@@ -2801,6 +3000,9 @@ class MongoContractService:
             updated_at=now,
         )
 
+        # Lease the inputs so concurrent builds don't select them
+        await UtxoReservationLedger(self.database).reserve_transaction(tx_body, tx_hash, wallet_id)
+
         tx_collection = self.database.get_collection("transactions")
         tx_dict = transaction.model_dump(by_alias=True, exclude_unset=False)
         if "id" in tx_dict:
@@ -2900,26 +3102,23 @@ class MongoContractService:
             raise ContractCompilationError("Database context required for update operations")
 
         # 1. Resolve project_nfts and project contracts (accepts minting or spending policy_id)
-        project_nfts_contract, project_contract = await self._resolve_nfts_and_spending_contracts(
+        project_nfts_artifact, project_artifact = await self._resolve_nfts_and_spending_contracts(
             policy_id=project_nfts_policy_id,
             nfts_registry_name="project_nfts",
             spending_registry_name="project",
         )
 
         # 2. Reconstruct script
-        project_script = pc.PlutusV2Script(bytes.fromhex(project_contract.cbor_hex))
-        minting_policy_id = pc.ScriptHash(bytes.fromhex(project_nfts_contract.policy_id))
+        project_script = await self._script_source(project_artifact, chain_context)
+        minting_policy_id = project_nfts_artifact.script_hash
 
         # Determine project contract address
-        if network == "testnet":
-            project_address = pc.Address.from_primitive(project_contract.testnet_addr)
-        else:
-            project_address = pc.Address.from_primitive(project_contract.mainnet_addr)
+        project_address = project_artifact.address(network)
 
         address = pc.Address.from_primitive(wallet_address)
 
         # 4. Find project UTXO on-chain (REF token at project contract address)
-        project_utxos = chain_context.context.utxos(project_address)
+        project_utxos = await chain_context.get_provider().utxos(project_address)
         if not project_utxos:
             raise InvalidContractParametersError(
                 f"No UTXOs found at project address {project_address}"
@@ -2941,7 +3140,7 @@ class MongoContractService:
             )
 
         # 5. Find user UTXO on-chain (USER token at wallet address)
-        user_utxos = chain_context.context.utxos(address)
+        user_utxos = await chain_context.get_provider().utxos(address)
         if not user_utxos:
             raise InvalidContractParametersError(
                 f"No UTXOs found at wallet address {wallet_address}"
@@ -3110,9 +3309,12 @@ class MongoContractService:
             ],
         }
 
-        # 9. Calculate sorted input indices for UpdateProject redeemer
+        # 9. Select wallet inputs, then calculate sorted input indices for UpdateProject redeemer
+        wallet_inputs = self._select_fee_inputs(
+            await self._available_wallet_utxos(address, user_utxos, network), [user_utxo], await chain_context.prepare_context()
+        )
         all_inputs = sorted(
-            user_utxos + [project_utxo],
+            wallet_inputs + [project_utxo],
             key=lambda u: (u.input.transaction_id.payload, u.input.index),
         )
         project_input_index = all_inputs.index(project_utxo)
@@ -3121,8 +3323,8 @@ class MongoContractService:
         # 10. Build transaction
         builder = pc.TransactionBuilder(chain_context.context)
 
-        # Add all user UTXOs as regular inputs
-        for u in user_utxos:
+        # Add USER token and fee UTXOs as regular inputs
+        for u in wallet_inputs:
             builder.add_input(u)
 
         # Add project UTXO as script input with UpdateProject redeemer
@@ -3158,7 +3360,7 @@ class MongoContractService:
         builder.add_output(project_output)
 
         # 11. Build unsigned transaction
-        tx_body = builder.build(change_address=address)
+        tx_body = await asyncio.to_thread(builder.build, change_address=address)
         partial_witness = builder.build_witness_set()
 
         unsigned_cbor = tx_body.to_cbor_hex()
@@ -3201,7 +3403,7 @@ class MongoContractService:
         transaction = TransactionMongo(
             tx_hash=tx_hash,
             wallet_id=wallet_id,
-            contract_policy_id=project_nfts_contract.policy_id,
+            contract_policy_id=project_nfts_artifact.contract.policy_id,
             status=TransactionStatus.BUILT.value,
             operation="update_project",
             description="Update project datum",
@@ -3218,6 +3420,9 @@ class MongoContractService:
             updated_at=now,
         )
 
+        # Lease the inputs so concurrent builds don't select them
+        await UtxoReservationLedger(self.database).reserve_transaction(tx_body, tx_hash, wallet_id)
+
         tx_collection = self.database.get_collection("transactions")
         tx_dict = transaction.model_dump(by_alias=True, exclude_unset=False)
         if "id" in tx_dict:
@@ -3383,7 +3588,7 @@ class MongoContractService:
         Returns:
             Dictionary with compilation results
         """
-        from opshin.builder import PlutusContract, build
+        from opshin.builder import PlutusContract
         from opshin.prelude import TxId, TxOutRef
 
         if self.database is None:
@@ -3445,7 +3650,7 @@ class MongoContractService:
                         f"Invalid UTXO reference format: {utxo_ref}. Expected tx_hash:index"
                     )
 
-                utxos = chain_context.context.utxos(address)
+                utxos = await chain_context.get_provider().utxos(address)
                 for utxo in utxos:
                     if (utxo.input.transaction_id.payload.hex() == tx_hash and
                         utxo.input.index == target_index):
@@ -3457,7 +3662,7 @@ class MongoContractService:
                         f"Specified UTXO {utxo_ref} not found at address {wallet_address}"
                     )
             else:
-                utxos = chain_context.context.utxos(address)
+                utxos = await chain_context.get_provider().utxos(address)
 
                 # Exclude UTXOs reserved for other compilations
                 used_utxo_refs = await self.get_reserved_compilation_utxos()
@@ -3495,7 +3700,9 @@ class MongoContractService:
             )
             protocol_nfts_policy_id_bytes = bytes.fromhex(protocol_nfts_policy_id)
 
-            project_nfts_compiled = build(str(project_nfts_path), oref, protocol_nfts_policy_id_bytes)
+            project_nfts_compiled = await get_compile_executor().build(
+                project_nfts_path, oref, protocol_nfts_policy_id_bytes
+            )
             project_nfts_plutus = PlutusContract(project_nfts_compiled)
 
             # Check if contracts already exist with same policy_id
@@ -3509,12 +3716,8 @@ class MongoContractService:
 
             # 6. Compile project with build(path, project_nfts_policy_id_bytes)
             project_nfts_policy_id_bytes_new = bytes.fromhex(project_nfts_plutus.policy_id)
-            old_recursion_limit = sys.getrecursionlimit()
-            sys.setrecursionlimit(2000)
-            try:
-                project_compiled = build(str(project_path), project_nfts_policy_id_bytes_new)
-            finally:
-                sys.setrecursionlimit(old_recursion_limit)
+            # Compile workers run with the raised recursion limit project.py needs
+            project_compiled = await get_compile_executor().build(project_path, project_nfts_policy_id_bytes_new)
             project_plutus = PlutusContract(project_compiled)
 
             # 7. Read sources for hashes
@@ -3594,6 +3797,7 @@ class MongoContractService:
                 contract_dict,
                 upsert=True
             )
+            self._invalidate_artifact(project_nfts_contract.policy_id)
 
             contract_dict = project_contract.model_dump(by_alias=True, exclude={"id"})
             contract_dict["_id"] = project_contract.policy_id
@@ -3602,6 +3806,7 @@ class MongoContractService:
                 contract_dict,
                 upsert=True
             )
+            self._invalidate_artifact(project_contract.policy_id)
 
             return {
                 "success": True,
@@ -3615,7 +3820,7 @@ class MongoContractService:
                 "error": None,
             }
 
-        except (ContractCompilationError, InvalidContractParametersError, ContractAlreadyExistsError):
+        except (ContractCompilationError, InvalidContractParametersError, ContractAlreadyExistsError, CompileExecutorError):
             raise
         except Exception as e:
             raise ContractCompilationError(f"Project compilation failed: {str(e)}")
@@ -3648,17 +3853,14 @@ class MongoContractService:
         if self.database is None:
             raise ContractCompilationError("Database context required for reference script deployment")
 
-        collection = self._get_contract_collection()
-
         # 1. Look up contract
-        contract_doc = await collection.find_one({"_id": policy_id})
-        if not contract_doc:
+        contract_artifact = await self._get_artifact(policy_id)
+        if contract_artifact is None:
             raise ContractNotFoundError(
                 f"Contract with policy_id '{policy_id}' not found."
             )
 
-        contract_doc["policy_id"] = contract_doc.pop("_id")
-        contract = ContractMongo.model_validate(contract_doc)
+        contract = contract_artifact.contract
 
         if not contract.is_active:
             raise InvalidContractParametersError(
@@ -3677,8 +3879,8 @@ class MongoContractService:
                 f"(reference_utxo: {contract.reference_utxo})."
             )
 
-        # 3. Reconstruct script
-        script = pc.PlutusV2Script(bytes.fromhex(contract.cbor_hex))
+        # 3. Parsed script
+        script = contract_artifact.script
 
         # 4. Resolve destination address
         address = pc.Address.from_primitive(wallet_address)
@@ -3689,38 +3891,29 @@ class MongoContractService:
 
         # 5. Calculate min_lovelace for reference script output
         ref_output = pc.TransactionOutput(dest_addr, pc.Value(0), script=script)
-        min_lovelace = pc.min_lovelace(chain_context.context, output=ref_output)
-
-        # 6. Find suitable UTXO (need min_lovelace + fee buffer)
-        utxos = chain_context.context.utxos(address)
-        required = min_lovelace + 2_000_000  # fee buffer
+        min_lovelace = pc.min_lovelace(await chain_context.prepare_context(), output=ref_output)
 
-        # Exclude UTXOs reserved for contract compilation
-        reserved_utxos = await self.get_reserved_compilation_utxos()
-
-        suitable_utxo = None
-        for utxo in utxos:
-            ref = f"{utxo.input.transaction_id.payload.hex()}:{utxo.input.index}"
-            if ref in reserved_utxos:
-                continue
-            if utxo.output.amount.coin > required:
-                suitable_utxo = utxo
-                break
-
-        if not suitable_utxo:
+        # 6. Select UTXOs covering min_lovelace, fees and change (reserved and leased UTXOs excluded).
+        # No script runs here, so outputs of our pending transactions may be chained.
+        utxos = await chain_context.get_provider().utxos(address)
+        candidates = spendable_utxos(await self._available_wallet_utxos(address, utxos, network, chain_pending=True))
+        try:
+            selected_utxos = select_inputs(candidates, pc.Value(min_lovelace), chain_context.context)
+        except CoinSelectionError as e:
             raise InvalidContractParametersError(
-                f"No suitable UTXO found for reference script deployment "
-                f"(need >{required / 1_000_000:.1f} ADA = {min_lovelace / 1_000_000:.1f} ADA min_lovelace + 2 ADA fee buffer)"
-            )
+                f"No suitable UTXOs found for reference script deployment "
+                f"(need {min_lovelace / 1_000_000:.1f} ADA min_lovelace plus fees): {e}"
+            ) from e
 
         # 7. Build transaction
         builder = pc.TransactionBuilder(chain_context.context)
-        builder.add_input(suitable_utxo)
+        for u in selected_utxos:
+            builder.add_input(u)
 
         ref_script_output = pc.TransactionOutput(dest_addr, min_lovelace, script=script)
         builder.add_output(ref_script_output)
 
-        tx_body = builder.build(change_address=address)
+        tx_body = await asyncio.to_thread(builder.build, change_address=address)
         unsigned_cbor = tx_body.to_cbor_hex()
         tx_hash = tx_body.hash().hex()
 
@@ -3784,6 +3977,9 @@ class MongoContractService:
             updated_at=now,
         )
 
+        # Lease the inputs so concurrent builds don't select them
+        await UtxoReservationLedger(self.database).reserve_transaction(tx_body, tx_hash, wallet_id)
+
         tx_collection = self.database.get_collection("transactions")
         tx_dict = transaction.model_dump(by_alias=True, exclude_unset=False)
         if "id" in tx_dict:
@@ -3970,7 +4166,7 @@ class MongoContractService:
         try:
             # 4. Compile grey.py with project_nfts_policy_id as parameter
             project_nfts_policy_id_bytes = bytes.fromhex(project_nfts_policy_id)
-            grey_compiled = build(str(grey_path), project_nfts_policy_id_bytes)
+            grey_compiled = await get_compile_executor().build(grey_path, project_nfts_policy_id_bytes)
             grey_plutus = PlutusContract(grey_compiled)
 
             # 5. Check policy_id uniqueness
@@ -4024,6 +4220,7 @@ class MongoContractService:
                 contract_dict,
                 upsert=True,
             )
+            self._invalidate_artifact(grey_contract.policy_id)
 
             return {
                 "success": True,
@@ -4036,7 +4233,7 @@ class MongoContractService:
                 "error": None,
             }
 
-        except (ContractCompilationError, InvalidContractParametersError, ContractAlreadyExistsError):
+        except (ContractCompilationError, InvalidContractParametersError, ContractAlreadyExistsError, CompileExecutorError):
             raise
         except Exception as e:
             raise ContractCompilationError(f"Grey contract compilation failed: {str(e)}")
@@ -4087,15 +4284,14 @@ class MongoContractService:
         collection = self._get_contract_collection()
 
         # 1. Look up grey contract
-        grey_doc = await collection.find_one({"_id": grey_policy_id})
-        if not grey_doc:
+        grey_artifact = await self._get_artifact(grey_policy_id)
+        if grey_artifact is None:
             raise ContractNotFoundError(
                 f"Grey contract with policy_id '{grey_policy_id}' not found. "
                 "Compile grey contract first with POST /compile-grey."
             )
 
-        grey_doc["policy_id"] = grey_doc.pop("_id")
-        grey_contract = ContractMongo.model_validate(grey_doc)
+        grey_contract = grey_artifact.contract
 
         if not grey_contract.compilation_params or len(grey_contract.compilation_params) < 1:
             raise InvalidContractParametersError(
@@ -4105,19 +4301,16 @@ class MongoContractService:
         project_nfts_policy_id = grey_contract.compilation_params[0]
 
         # 2. Look up project spending validator
-        project_docs = await collection.find({
+        project_artifact = await self._find_latest_artifact({
             "registry_contract_name": "project",
             "compilation_params": [project_nfts_policy_id],
-        }).sort("compiled_at", -1).limit(1).to_list(1)
-
-        if not project_docs:
+        })
+        if project_artifact is None:
             raise ContractNotFoundError(
                 "Project spending validator not found. Run POST /compile-project first."
             )
 
-        project_doc = project_docs[0]
-        project_doc["policy_id"] = project_doc.pop("_id")
-        project_contract = ContractMongo.model_validate(project_doc)
+        project_contract = project_artifact.contract
 
         # 3. Derive project name from grey contract name (e.g. 'myproject_grey' → 'myproject')
         project_name = grey_contract.name.removesuffix("_grey")
@@ -4133,8 +4326,10 @@ class MongoContractService:
 
         # 5. Build addresses and scripts
         project_minting_policy_id = pc.ScriptHash(bytes.fromhex(project_nfts_policy_id))
-        project_script = pc.PlutusV2Script(bytes.fromhex(project_contract.cbor_hex))
-        grey_script = pc.PlutusV2Script(bytes.fromhex(grey_contract.cbor_hex))
+        project_script, grey_script = await asyncio.gather(
+            self._script_source(project_artifact, chain_context),
+            self._script_source(grey_artifact, chain_context),
+        )
         grey_minting_policy_id = pc.ScriptHash(bytes.fromhex(grey_policy_id))
 
         if network == "testnet":
@@ -4147,7 +4342,7 @@ class MongoContractService:
         address = pc.Address.from_primitive(wallet_address)
 
         # 6. Find project UTXO on-chain (holds REF token and DatumProject)
-        project_utxos = chain_context.context.utxos(project_address)
+        project_utxos = await chain_context.get_provider().utxos(project_address)
         if not project_utxos:
             raise InvalidContractParametersError(
                 f"No UTXOs found at project address {project_address}. "
@@ -4178,7 +4373,7 @@ class MongoContractService:
         grey_token_name = project_datum.project_token.token_name
 
         # 8. Find user UTXOs and locate USER token UTXO (authorization)
-        user_utxos = chain_context.context.utxos(address)
+        user_utxos = await chain_context.get_provider().utxos(address)
         if not user_utxos:
             raise InvalidContractParametersError(
                 f"No UTXOs found at wallet address {wallet_address}"
@@ -4200,9 +4395,13 @@ class MongoContractService:
                 "Wallet must hold the project USER token for free-mode minting authorization."
             )
 
-        # 9. Calculate sorted input indices
+        # Fee coverage excludes reserved compilation UTXOs and leased inputs
+        fee_candidates = await self._available_wallet_utxos(address, user_utxos, network)
+
+        # 9. Select wallet inputs, then calculate sorted input indices
+        wallet_inputs = self._select_fee_inputs(fee_candidates, [user_token_utxo], await chain_context.prepare_context())
         all_inputs_sorted = sorted(
-            user_utxos + [project_utxo],
+            wallet_inputs + [project_utxo],
             key=lambda u: (u.input.transaction_id.payload, u.input.index),
         )
         project_index = all_inputs_sorted.index(project_utxo)
@@ -4222,8 +4421,8 @@ class MongoContractService:
             )),
         )
 
-        # Add all user UTXOs for fees
-        for u in user_utxos:
+        # Add USER token and fee UTXOs
+        for u in wallet_inputs:
             builder.add_input(u)
 
         # Grey minting script
@@ -4290,7 +4489,7 @@ class MongoContractService:
         builder.add_output(investor_output)
 
         # 13. Build unsigned transaction
-        tx_body = builder.build(change_address=address)
+        tx_body = await asyncio.to_thread(builder.build, change_address=address)
         partial_witness = builder.build_witness_set()
 
         unsigned_cbor = tx_body.to_cbor_hex()
@@ -4350,6 +4549,9 @@ class MongoContractService:
             updated_at=now,
         )
 
+        # Lease the inputs so concurrent builds don't select them
+        await UtxoReservationLedger(self.database).reserve_transaction(tx_body, tx_hash, wallet_id)
+
         tx_collection = self.database.get_collection("transactions")
         tx_dict = transaction.model_dump(by_alias=True, exclude_unset=False)
         if "id" in tx_dict:
@@ -4419,17 +4621,14 @@ class MongoContractService:
         if self.database is None:
             raise ContractCompilationError("Database context required for burn operations")
 
-        collection = self._get_contract_collection()
-
         # 1. Look up grey contract
-        grey_doc = await collection.find_one({"_id": grey_policy_id})
-        if not grey_doc:
+        grey_artifact = await self._get_artifact(grey_policy_id)
+        if grey_artifact is None:
             raise ContractNotFoundError(
                 f"Grey contract with policy_id '{grey_policy_id}' not found."
             )
 
-        grey_doc["policy_id"] = grey_doc.pop("_id")
-        grey_contract = ContractMongo.model_validate(grey_doc)
+        grey_contract = grey_artifact.contract
 
         if not grey_contract.compilation_params or len(grey_contract.compilation_params) < 1:
             raise InvalidContractParametersError(
@@ -4439,34 +4638,26 @@ class MongoContractService:
         project_nfts_policy_id = grey_contract.compilation_params[0]
 
         # 2. Look up project spending validator
-        project_docs = await collection.find({
+        project_artifact = await self._find_latest_artifact({
             "registry_contract_name": "project",
             "compilation_params": [project_nfts_policy_id],
-        }).sort("compiled_at", -1).limit(1).to_list(1)
-
-        if not project_docs:
+        })
+        if project_artifact is None:
             raise ContractNotFoundError(
                 "Project spending validator not found for this grey contract."
             )
 
-        project_doc = project_docs[0]
-        project_doc["policy_id"] = project_doc.pop("_id")
-        project_contract = ContractMongo.model_validate(project_doc)
-
         # 3. Build addresses and scripts
         project_minting_policy_id = pc.ScriptHash(bytes.fromhex(project_nfts_policy_id))
-        grey_script = pc.PlutusV2Script(bytes.fromhex(grey_contract.cbor_hex))
+        grey_script = await self._script_source(grey_artifact, chain_context)
         grey_minting_policy_id = pc.ScriptHash(bytes.fromhex(grey_policy_id))
 
-        if network == "testnet":
-            project_address = pc.Address.from_primitive(project_contract.testnet_addr)
-        else:
-            project_address = pc.Address.from_primitive(project_contract.mainnet_addr)
+        project_address = project_artifact.address(network)
 
         address = pc.Address.from_primitive(wallet_address)
 
         # 4. Find project UTXO on-chain (used as reference input)
-        project_utxos = chain_context.context.utxos(project_address)
+        project_utxos = await chain_context.get_provider().utxos(project_address)
         if not project_utxos:
             raise InvalidContractParametersError(
                 f"No UTXOs found at project address {project_address}. "
@@ -4497,20 +4688,18 @@ class MongoContractService:
         grey_token_name = project_datum.project_token.token_name
 
         # 6. Find grey token UTXOs in wallet
-        user_utxos = chain_context.context.utxos(address)
+        user_utxos = await chain_context.get_provider().utxos(address)
         if not user_utxos:
             raise InvalidContractParametersError(
                 f"No UTXOs found at wallet address {wallet_address}"
             )
 
-        grey_token_utxos = []
         total_available = 0
         for utxo in user_utxos:
             if utxo.output.amount.multi_asset:
                 if grey_minting_policy_id in utxo.output.amount.multi_asset:
                     asset_dict = utxo.output.amount.multi_asset[grey_minting_policy_id]
                     if pc.AssetName(grey_token_name) in asset_dict:
-                        grey_token_utxos.append(utxo)
                         total_available += asset_dict[pc.AssetName(grey_token_name)]
 
         if total_available < burn_quantity:
@@ -4518,44 +4707,38 @@ class MongoContractService:
                 f"Insufficient grey tokens. Available: {total_available}, Required: {burn_quantity}"
             )
 
-        # 7. Select minimum UTXOs to cover burn amount
-        selected_utxos = []
-        selected_tokens = 0
-        for utxo in grey_token_utxos:
-            selected_utxos.append(utxo)
-            selected_tokens += utxo.output.amount.multi_asset[grey_minting_policy_id][pc.AssetName(grey_token_name)]
-            if selected_tokens >= burn_quantity:
-                break
+        # 7. Select UTXOs covering the burn amount, fees and change (reserved and leased UTXOs excluded)
+        candidates = spendable_utxos(await self._available_wallet_utxos(address, user_utxos, network))
+        burn_value = pc.Value(0, pc.MultiAsset({
+            grey_minting_policy_id: pc.Asset({pc.AssetName(grey_token_name): burn_quantity})
+        }))
+        try:
+            selected_utxos = select_inputs(candidates, burn_value, await chain_context.prepare_context())
+        except CoinSelectionError as e:
+            raise InvalidContractParametersError(str(e)) from e
 
+        selected_tokens = sum(
+            u.output.amount.multi_asset.get(grey_minting_policy_id, pc.Asset()).get(pc.AssetName(grey_token_name), 0)
+            for u in selected_utxos
+        )
         remaining_tokens = selected_tokens - burn_quantity
 
-        # 8. Check if selected UTXOs have enough lovelace for fees; add extra if not
-        MIN_FEE_ESTIMATE = 2_000_000
-        total_lovelace_selected = sum(u.output.amount.coin for u in selected_utxos)
-
-        # 9. Build transaction
+        # 8. Build transaction
         builder = pc.TransactionBuilder(chain_context.context)
 
-        # Project UTXO as reference input (index 0 — only reference input)
+        # Project UTXO as reference input (alongside the grey reference script UTXO, if any)
         builder.reference_inputs.add(project_utxo)
 
-        # Add selected grey token UTXOs as inputs
+        # Add selected grey token and fee UTXOs as inputs
         for u in selected_utxos:
             builder.add_input(u)
 
-        if total_lovelace_selected < MIN_FEE_ESTIMATE:
-            fee_utxos = [u for u in user_utxos if u not in selected_utxos and u.output.amount.coin >= 1_000_000]
-            if not fee_utxos:
-                raise InvalidContractParametersError(
-                    f"Insufficient lovelace for fees. Have {total_lovelace_selected / 1_000_000:.2f} ADA, "
-                    f"need ~{MIN_FEE_ESTIMATE / 1_000_000:.2f} ADA"
-                )
-            builder.add_input(fee_utxos[0])
-
         # Burn minting script with BurnGrey redeemer
         builder.add_minting_script(
             script=grey_script,
-            redeemer=pc.Redeemer(BurnGrey(project_reference_index=0)),
+            redeemer=pc.Redeemer(
+                BurnGrey(project_reference_index=self._reference_input_index(project_utxo, grey_script))
+            ),
         )
 
         # Set burn amounts (negative = burn)
@@ -4579,15 +4762,15 @@ class MongoContractService:
             )
             builder.add_output(token_output)
 
-        # 10. Build unsigned transaction
-        tx_body = builder.build(change_address=address)
+        # 9. Build unsigned transaction
+        tx_body = await asyncio.to_thread(builder.build, change_address=address)
         partial_witness = builder.build_witness_set()
 
         unsigned_cbor = tx_body.to_cbor_hex()
         witness_cbor = partial_witness.to_cbor_hex()
         tx_hash = tx_body.hash().hex()
 
-        # 11. Extract inputs/outputs for response
+        # 10. Extract inputs/outputs for response
         utxo_map = {}
         for utxo in user_utxos:
             key = f"{utxo.input.transaction_id.payload.hex()}:{utxo.input.index}"
@@ -4616,7 +4799,7 @@ class MongoContractService:
                 "output_index": idx,
             })
 
-        # 12. Save TransactionMongo
+        # 11. Save TransactionMongo
         now = datetime.now(timezone.utc).replace(tzinfo=None)
         transaction = TransactionMongo(
             tx_hash=tx_hash,
@@ -4638,6 +4821,9 @@ class MongoContractService:
             updated_at=now,
         )
 
+        # Lease the inputs so concurrent builds don't select them
+        await UtxoReservationLedger(self.database).reserve_transaction(tx_body, tx_hash, wallet_id)
+
         tx_collection = self.database.get_collection("transactions")
         tx_dict = transaction.model_dump(by_alias=True, exclude_unset=False)
         if "id" in tx_dict:
@@ -0,0 +1,200 @@
+"""
+Contract Template Cache
+
+Compile-once, apply-parameters-later cache for OpShin contracts.
+
+Each contract source is compiled a single time into unapplied UPLC (the
+"template") and persisted on disk, keyed by the SHA-256 of the source, the
+SHA-256 of the terrasacha_contracts package (OpShin inlines the imported
+util.py, fast_util.py, ... into every contract) and the OpShin version.
+Parameterized scripts are then produced by applying the parameters as UPLC
+arguments to the template, which is exactly what
+``opshin.builder.build(path, *params)`` does after compiling, so the resulting
+CBOR, policy IDs and addresses are byte-identical to a full build.
+"""
+
+import hashlib
+import importlib.util
+import logging
+import os
+import pathlib
+import tempfile
+import threading
+from typing import Any
+
+import pycardano as pc
+from opshin import __version__ as opshin_version
+from opshin.builder import _build, _static_compile, apply_parameters
+
+
+logger = logging.getLogger(__name__)
+
+# Some validators (e.g. project.py) exceed the default recursion limit while compiling.
+# Compile workers (api.services.compile_executor) run with this limit.
+COMPILE_RECURSION_LIMIT = 2000
+
+
+def compute_source_hash(source_code: str) -> str:
+    """SHA-256 hex digest of a contract source, as stored in ContractMongo.source_hash"""
+    return hashlib.sha256(source_code.encode()).hexdigest()
+
+
+def contracts_package_dir() -> pathlib.Path | None:
+    """Directory of the importable terrasacha_contracts package (what OpShin inlines)"""
+    spec = importlib.util.find_spec("terrasacha_contracts")
+    if spec is None or not spec.submodule_search_locations:
+        return None
+    return pathlib.Path(list(spec.submodule_search_locations)[0])
+
+
+def compute_package_hash(package_dir: pathlib.Path | None) -> str:
+    """
+    SHA-256 hex digest of every module in a contract package.
+
+    Contracts import shared helpers (``from terrasacha_contracts.util import *``)
+    that OpShin compiles into the template, so a change to any of them must
+    produce a new template key even if the contract file itself is unchanged.
+    """
+    digest = hashlib.sha256()
+    if package_dir is not None:
+        for path in sorted(package_dir.rglob("*.py")):
+            digest.update(path.relative_to(package_dir).as_posix().encode())
+            digest.update(b"\0")
+            digest.update(path.read_bytes())
+            digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def compile_template(source_code: str, contract_file: str) -> bytes:
+    """
+    Compile OpShin source into an unapplied (parameterless) UPLC script.
+
+    Args:
+        source_code: Contract source code
+        contract_file: Path of the contract, forwarded to the compiler for diagnostics
+
+    Returns:
+        CBOR-wrapped flat encoding of the unapplied program
+    """
+    return bytes(_build(_static_compile(source_code, contract_file=contract_file)))
+
+
+class ContractTemplateCache:
+    """
+    Two-level (memory + disk) cache of unapplied OpShin contract templates.
+
+    Thread-safe: concurrent requests for the same template compile it only once.
+    The contract package is hashed once at construction; a process picks up
+    edits to the package when it restarts.
+    """
+
+    def __init__(self, cache_dir: str | pathlib.Path | None = None, package_dir: str | pathlib.Path | None = None):
+        """
+        Initialize the template cache.
+
+        Args:
+            cache_dir: Directory where compiled templates are persisted.
+                       If None, templates are only kept in memory.
+            package_dir: Contract package whose modules are part of every template key.
+                         Defaults to the importable terrasacha_contracts package.
+        """
+        self.cache_dir = pathlib.Path(cache_dir) if cache_dir else None
+        self.package_dir = pathlib.Path(package_dir) if package_dir else contracts_package_dir()
+        self.package_hash = compute_package_hash(self.package_dir)
+        self._templates: dict[str, bytes] = {}
+        self._lock = threading.Lock()
+        self._key_locks: dict[str, threading.Lock] = {}
+
+    @staticmethod
+    def template_key(source_hash: str, package_hash: str) -> str:
+        """Cache key for a source hash and the package it imports (includes the compiler version)"""
+        return f"{source_hash}-{package_hash[:16]}-opshin{opshin_version}"
+
+    def _template_file(self, key: str) -> pathlib.Path | None:
+        if self.cache_dir is None:
+            return None
+        return self.cache_dir / f"{key}.cbor"
+
+    def _load_from_disk(self, key: str) -> bytes | None:
+        path = self._template_file(key)
+        if path is None or not path.exists():
+            return None
+        try:
+            return path.read_bytes()
+        except OSError as e:
+            logger.warning(f"Failed to read contract template {path}: {e}")
+            return None
+
+    def _save_to_disk(self, key: str, template: bytes) -> None:
+        path = self._template_file(key)
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write atomically so concurrent processes never read a partial template
+            fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(template)
+            os.replace(tmp_name, path)
+        except OSError as e:
+            logger.warning(f"Failed to persist contract template {path}: {e}")
+
+    def get_template(self, source_code: str, contract_file: str) -> bytes:
+        """
+        Get the unapplied template for a contract source, compiling it on first use.
+
+        Args:
+            source_code: Contract source code
+            contract_file: Path of the contract file
+
+        Returns:
+            CBOR-wrapped flat encoding of the unapplied program
+        """
+        key = self.template_key(compute_source_hash(source_code), self.package_hash)
+
+        template = self._templates.get(key)
+        if template is not None:
+            return template
+
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            template = self._templates.get(key)
+            if template is not None:
+                return template
+
+            template = self._load_from_disk(key)
+            if template is None:
+                logger.info(f"Compiling contract template for {contract_file} ({key})")
+                template = compile_template(source_code, contract_file)
+                self._save_to_disk(key, template)
+
+            self._templates[key] = template
+            return template
+
+    def build(self, contract_path: str | pathlib.Path, *params: Any) -> pc.PlutusV2Script:
+        """
+        Drop-in replacement for ``opshin.builder.build(contract_path, *params)``.
+
+        Args:
+            contract_path: Path to the OpShin contract file
+            *params: Contract parameters (PlutusData, bytes, int, ...)
+
+        Returns:
+            The compiled script with all parameters applied
+        """
+        contract_file = str(contract_path)
+        with open(contract_file) as f:
+            source_code = f.read()
+
+        template = pc.PlutusV2Script(self.get_template(source_code, contract_file))
+        if not params:
+            return template
+        return apply_parameters(template, *params)
+
+    def clear(self) -> None:
+        """Drop all in-memory templates (persisted templates are kept)"""
+        with self._lock:
+            self._templates.clear()
+            self._key_locks.clear()
@@ -0,0 +1,184 @@
+"""
+Crypto Executor
+
+Runs CPU- and memory-heavy wallet cryptography off the event loop in a
+bounded thread pool:
+
+- Argon2id password hashing/verification (64 MiB per call, see api/utils/password.py)
+- PBKDF2 mnemonic encryption/decryption (api/utils/encryption.py)
+- BIP32 wallet derivation (CardanoWallet from a mnemonic)
+
+The concurrency cap bounds peak memory (cap x Argon2 memory cost) and keeps a
+burst of unlocks from stalling other requests. Jobs beyond the cap wait in a
+bounded queue; once that is full, new jobs fail fast with CryptoQueueFullError
+(mapped to 503 + Retry-After by the endpoints).
+"""
+
+import asyncio
+import functools
+import math
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+from api.config import settings
+
+
+R = TypeVar("R")
+
+
+class CryptoExecutorError(Exception):
+    """Raised when the crypto executor cannot run a job"""
+
+    pass
+
+
+class CryptoQueueFullError(CryptoExecutorError):
+    """Raised when the crypto queue is at capacity"""
+
+    def __init__(self, message: str, retry_after: int):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+@dataclass
+class CryptoMetrics:
+    """Counters and timings for the crypto executor"""
+
+    jobs_submitted: int = 0
+    jobs_completed: int = 0
+    jobs_failed: int = 0
+    jobs_rejected: int = 0
+    queue_wait_total_seconds: float = 0.0
+    queue_wait_max_seconds: float = 0.0
+    run_total_seconds: float = 0.0
+    run_max_seconds: float = 0.0
+
+    def record(self, queue_wait: float, run_time: float) -> None:
+        """Record a finished job"""
+        self.queue_wait_total_seconds += queue_wait
+        self.queue_wait_max_seconds = max(self.queue_wait_max_seconds, queue_wait)
+        self.run_total_seconds += run_time
+        self.run_max_seconds = max(self.run_max_seconds, run_time)
+
+    @property
+    def run_avg_seconds(self) -> float:
+        """Average job run time (0 before the first job)"""
+        finished = self.jobs_completed + self.jobs_failed
+        return self.run_total_seconds / finished if finished else 0.0
+
+    def snapshot(self) -> dict[str, Any]:
+        """Metrics as a JSON-serializable dict"""
+        finished = (self.jobs_completed + self.jobs_failed) or 1
+        return {
+            "jobs_submitted": self.jobs_submitted,
+            "jobs_completed": self.jobs_completed,
+            "jobs_failed": self.jobs_failed,
+            "jobs_rejected": self.jobs_rejected,
+            "queue_wait_avg_seconds": round(self.queue_wait_total_seconds / finished, 4),
+            "queue_wait_max_seconds": round(self.queue_wait_max_seconds, 4),
+            "run_avg_seconds": round(self.run_avg_seconds, 4),
+            "run_max_seconds": round(self.run_max_seconds, 4),
+        }
+
+
+class CryptoExecutor:
+    """Bounded thread-pool executor for wallet key derivation and password hashing"""
+
+    def __init__(self, max_concurrency: int = 4, max_queue_depth: int = 32):
+        """
+        Initialize the crypto executor.
+
+        Args:
+            max_concurrency: Jobs running at once (peak memory ~ max_concurrency x Argon2 memory cost)
+            max_queue_depth: Jobs allowed to wait for a free slot before new ones are rejected
+        """
+        self.max_concurrency = max_concurrency
+        self.max_queue_depth = max_queue_depth
+        self.metrics = CryptoMetrics()
+        self._pool: ThreadPoolExecutor | None = None
+        self._pending = 0
+        # Jobs are released from worker threads (see _job_done)
+        self._lock = threading.Lock()
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="crypto")
+        return self._pool
+
+    @property
+    def pending_jobs(self) -> int:
+        """Number of jobs queued or running"""
+        return self._pending
+
+    def retry_after(self) -> int:
+        """Seconds a rejected caller should wait, estimated from the backlog and average run time"""
+        backlog_rounds = self._pending / self.max_concurrency
+        return max(1, math.ceil(backlog_rounds * (self.metrics.run_avg_seconds or 1.0)))
+
+    async def run(self, fn: Callable[..., R], *args: Any) -> R:
+        """
+        Run a blocking crypto function in the pool without blocking the event loop.
+
+        Raises:
+            CryptoQueueFullError: If too many jobs are already waiting
+        """
+        if self._pending >= self.max_concurrency + self.max_queue_depth:
+            self.metrics.jobs_rejected += 1
+            raise CryptoQueueFullError(
+                f"Wallet crypto queue is full ({self._pending} jobs pending), retry later",
+                retry_after=self.retry_after(),
+            )
+
+        with self._lock:
+            self.metrics.jobs_submitted += 1
+            self._pending += 1
+        submitted_at = time.monotonic()
+        timings: dict[str, float] = {}
+
+        def job() -> R:
+            timings["started_at"] = time.monotonic()
+            return fn(*args)
+
+        future = self._get_pool().submit(job)
+        # Registered before wrap_future's callback, so the slot is free when the caller resumes
+        future.add_done_callback(functools.partial(self._job_done, submitted_at, timings))
+        return await asyncio.wrap_future(future)
+
+    def _job_done(self, submitted_at: float, timings: dict[str, float], future: Future) -> None:
+        """Release a job's slot once its worker thread is free, even if the caller was cancelled"""
+        finished_at = time.monotonic()
+        with self._lock:
+            self._pending -= 1
+            if future.cancelled():
+                # Cancelled while still queued: it never ran
+                return
+            if future.exception() is None:
+                self.metrics.jobs_completed += 1
+            else:
+                self.metrics.jobs_failed += 1
+            started_at = timings.get("started_at", finished_at)
+            self.metrics.record(started_at - submitted_at, finished_at - started_at)
+
+    def shutdown(self) -> None:
+        """Shut down the pool (running jobs finish, queued jobs are cancelled)"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+
+# Global executor instance
+_crypto_executor: CryptoExecutor | None = None
+
+
+def get_crypto_executor() -> CryptoExecutor:
+    """Get or create the global crypto executor"""
+    global _crypto_executor
+    if _crypto_executor is None:
+        _crypto_executor = CryptoExecutor(
+            max_concurrency=settings.crypto_max_concurrency, max_queue_depth=settings.crypto_max_queue_depth
+        )
+    return _crypto_executor
@@ -14,7 +14,7 @@ from datetime import datetime, timezone
 import logging
 
 from api.database.models import WalletMongo, WalletSessionMongo
-from api.services.session_manager import get_session_manager
+from api.services.session_store import get_session_store
 from api.database.multi_tenant_manager import get_multi_tenant_db_manager
 
 logger = logging.getLogger(__name__)
@@ -56,7 +56,7 @@ class SessionCleanupService:
             db_manager = get_multi_tenant_db_manager()
             await db_manager.get_tenant_database(tenant_id)
 
-            session_manager = get_session_manager()
+            session_store = get_session_store()
             now = datetime.now(timezone.utc).replace(tzinfo=None)
 
             wallets_locked = 0
@@ -96,11 +96,13 @@ class SessionCleanupService:
 
             for session in expired_or_revoked_sessions:
                 # Remove from in-memory storage if present
-                if session_manager.get_session(session.jti) is not None:
-                    session_manager.remove_session(session.jti)
+                if await session_store.remove(session.jti):
                     sessions_removed_from_memory += 1
                     logger.debug(f"Removed expired/revoked session {session.jti} from memory")
 
+            # Any other expired sessions still in memory (expiry heap, no scan)
+            sessions_removed_from_memory += await session_store.cleanup_expired()
+
             logger.info(
                 f"Session cleanup completed: {wallets_locked} wallets locked, "
                 f"{sessions_removed_from_memory} sessions removed from memory, "
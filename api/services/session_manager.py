@@ -5,38 +5,103 @@ In-memory storage for unlocked wallet sessions.
 Stores CardanoWallet instances keyed by JWT ID (jti) for fast access.
 """
 
+import heapq
 import threading
+import zlib
 from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Dict
 
+from api.config import settings
+from api.services.session_validation_cache import get_session_validation_cache
 from cardano_offchain.wallet import CardanoWallet
 
 
+@dataclass
+class _Session:
+    """A stored session"""
+
+    cardano_wallet: CardanoWallet
+    expires_at: datetime
+    wallet_id: str | None
+
+
+class _Shard:
+    """One lock-protected slice of the session store (LRU ordered)"""
+
+    def __init__(self) -> None:
+        self.sessions: OrderedDict[str, _Session] = OrderedDict()
+        self.lock = threading.Lock()
+
+
 class SessionManager:
     """
     Thread-safe in-memory session manager for unlocked wallets.
 
     Stores CardanoWallet instances with their JWT IDs (jti) for quick access.
     Includes automatic cleanup of expired sessions and LRU eviction.
+
+    Layout:
+    - Sessions are spread over shards by jti, each with its own lock, so
+      concurrent lookups of different sessions don't contend
+    - A wallet_id -> {jti} index makes removing a wallet's sessions O(k)
+    - A min-heap of (expires_at, jti) makes expiry O(log n) per session
+      instead of a full scan; stale heap entries are skipped lazily
+    - LRU eviction is per shard (each holds max_sessions / shards)
     """
 
-    def __init__(self, max_sessions: int = 1000):
+    def __init__(self, max_sessions: int = 1000, shards: int = 16):
         """
         Initialize session manager.
 
         Args:
             max_sessions: Maximum number of concurrent sessions (LRU eviction)
+            shards: Number of independently locked shards
         """
-        self._sessions: OrderedDict[str, tuple[CardanoWallet, datetime]] = OrderedDict()
-        self._lock = threading.RLock()  # Reentrant lock for thread safety
         self._max_sessions = max_sessions
+        self._shards = [_Shard() for _ in range(max(1, shards))]
+        self._shard_capacity = max(1, -(-max_sessions // len(self._shards)))
+        # wallet_id -> jtis of its stored sessions
+        self._wallet_index: dict[str, set[str]] = {}
+        self._index_lock = threading.Lock()
+        # (expires_at, jti); entries for removed/re-stored sessions are skipped on pop
+        self._expiry_heap: list[tuple[datetime, str]] = []
+        self._heap_lock = threading.Lock()
+
+    def _shard(self, jti: str) -> _Shard:
+        return self._shards[zlib.crc32(jti.encode()) % len(self._shards)]
+
+    def _index_add(self, wallet_id: str | None, jti: str) -> None:
+        if wallet_id is not None:
+            with self._index_lock:
+                self._wallet_index.setdefault(wallet_id, set()).add(jti)
+
+    def _index_discard(self, wallet_id: str | None, jti: str) -> None:
+        if wallet_id is not None:
+            with self._index_lock:
+                jtis = self._wallet_index.get(wallet_id)
+                if jtis is not None:
+                    jtis.discard(jti)
+                    if not jtis:
+                        del self._wallet_index[wallet_id]
+
+    def _pop(self, jti: str, expires_at: datetime | None = None) -> _Session | None:
+        """Remove a session (only if it still has `expires_at`, when given) and unindex it"""
+        shard = self._shard(jti)
+        with shard.lock:
+            session = shard.sessions.get(jti)
+            if session is None or (expires_at is not None and session.expires_at != expires_at):
+                return None
+            del shard.sessions[jti]
+        self._index_discard(session.wallet_id, jti)
+        return session
 
     def store_session(
         self,
         jti: str,
         cardano_wallet: CardanoWallet,
-        expires_at: datetime
+        expires_at: datetime,
+        wallet_id: str | None = None
     ) -> None:
         """
         Store an unlocked wallet session.
@@ -45,22 +110,43 @@ class SessionManager:
             jti: JWT ID (token identifier)
             cardano_wallet: Unlocked CardanoWallet instance
             expires_at: Session expiration time
+            wallet_id: Wallet the session belongs to (enables remove_wallet_sessions)
 
         Example:
-            >>> manager.store_session(jti, cardano_wallet, expires_at)
+            >>> manager.store_session(jti, cardano_wallet, expires_at, wallet_id=wallet.id)
         """
-        with self._lock:
-            # Remove if already exists (to update order)
-            if jti in self._sessions:
-                del self._sessions[jti]
+        shard = self._shard(jti)
+        evicted = []
+        with shard.lock:
+            previous = shard.sessions.pop(jti, None)
 
             # Add to end (most recent)
-            self._sessions[jti] = (cardano_wallet, expires_at)
+            shard.sessions[jti] = _Session(cardano_wallet, expires_at, wallet_id)
 
             # LRU eviction if over limit
-            while len(self._sessions) > self._max_sessions:
-                # Remove oldest (first item)
-                self._sessions.popitem(last=False)
+            while len(shard.sessions) > self._shard_capacity:
+                evicted.append(shard.sessions.popitem(last=False))
+
+        if previous is not None and previous.wallet_id != wallet_id:
+            self._index_discard(previous.wallet_id, jti)
+        self._index_add(wallet_id, jti)
+        for evicted_jti, session in evicted:
+            self._index_discard(session.wallet_id, evicted_jti)
+
+        with self._heap_lock:
+            heapq.heappush(self._expiry_heap, (expires_at, jti))
+            # Drop stale entries once they dominate (sessions re-stored or removed early)
+            if len(self._expiry_heap) > 2 * self._max_sessions + 64:
+                self._rebuild_heap()
+
+    def _rebuild_heap(self) -> None:
+        """Rebuild the expiry heap from live sessions (caller holds the heap lock)"""
+        live: list[tuple[datetime, str]] = []
+        for shard in self._shards:
+            with shard.lock:
+                live.extend((session.expires_at, jti) for jti, session in shard.sessions.items())
+        heapq.heapify(live)
+        self._expiry_heap = live
 
     def get_session(self, jti: str) -> CardanoWallet | None:
         """
@@ -77,22 +163,21 @@ class SessionManager:
             >>> if wallet:
             ...     # Use wallet to sign transactions
         """
-        with self._lock:
-            if jti not in self._sessions:
+        shard = self._shard(jti)
+        with shard.lock:
+            session = shard.sessions.get(jti)
+            if session is None:
                 return None
 
-            cardano_wallet, expires_at = self._sessions[jti]
-
             # Check if expired
-            if datetime.now(timezone.utc) >= expires_at:
-                # Remove expired session
-                del self._sessions[jti]
-                return None
+            if datetime.now(timezone.utc) < session.expires_at:
+                # Move to end (mark as recently used)
+                shard.sessions.move_to_end(jti)
+                return session.cardano_wallet
 
-            # Move to end (mark as recently used)
-            self._sessions.move_to_end(jti)
-
-            return cardano_wallet
+        # Remove expired session
+        self._pop(jti, session.expires_at)
+        return None
 
     def remove_session(self, jti: str) -> bool:
         """
@@ -108,54 +193,48 @@ class SessionManager:
             >>> if manager.remove_session(jti):
             ...     print("Wallet locked successfully")
         """
-        with self._lock:
-            if jti in self._sessions:
-                del self._sessions[jti]
-                return True
-            return False
+        # Revocation push: the next request must hit the database again
+        get_session_validation_cache().invalidate(jti)
+
+        return self._pop(jti) is not None
 
-    def remove_wallet_sessions(self, wallet_id: int) -> int:
+    def remove_wallet_sessions(self, wallet_id: str) -> int:
         """
         Remove all sessions for a specific wallet.
 
-        Useful when locking a wallet or changing password.
+        Useful when locking a wallet or changing password. Uses the
+        wallet_id -> jti index, so the cost is proportional to the wallet's
+        own sessions.
 
         Args:
-            wallet_id: Wallet database ID
+            wallet_id: Wallet ID (payment key hash)
 
         Returns:
             Number of sessions removed
 
-        Note:
-            This is a simplification - in production you'd want to store
-            wallet_id with the session for efficient lookup.
-
         Example:
             >>> count = manager.remove_wallet_sessions(wallet_id)
             >>> print(f"Removed {count} sessions")
         """
-        with self._lock:
-            # Note: This iterates all sessions. For production with many sessions,
-            # consider maintaining a wallet_id -> [jti] index
-            jtis_to_remove = []
-
-            for jti, (wallet, _) in self._sessions.items():
-                # This is a limitation - CardanoWallet doesn't store wallet_id
-                # In production, store (wallet_id, CardanoWallet, expires_at)
-                # For now, we'll skip this optimization
-                pass
-
-            # Remove collected jtis
-            for jti in jtis_to_remove:
-                del self._sessions[jti]
-
-            return len(jtis_to_remove)
+        with self._index_lock:
+            jtis = self._wallet_index.pop(wallet_id, set())
+
+        validation_cache = get_session_validation_cache()
+        removed = 0
+        for jti in jtis:
+            validation_cache.invalidate(jti)
+            shard = self._shard(jti)
+            with shard.lock:
+                if shard.sessions.pop(jti, None) is not None:
+                    removed += 1
+        return removed
 
     def cleanup_expired(self) -> int:
         """
         Remove all expired sessions.
 
         Should be called periodically (e.g., every 5 minutes via background task).
+        Pops due entries off the expiry heap, so only expired sessions are visited.
 
         Returns:
             Number of sessions removed
@@ -164,20 +243,14 @@ class SessionManager:
             >>> count = manager.cleanup_expired()
             >>> print(f"Cleaned up {count} expired sessions")
         """
-        with self._lock:
-            now = datetime.now(timezone.utc)
-            jtis_to_remove = []
-
-            # Find expired sessions
-            for jti, (_, expires_at) in self._sessions.items():
-                if now >= expires_at:
-                    jtis_to_remove.append(jti)
-
-            # Remove expired sessions
-            for jti in jtis_to_remove:
-                del self._sessions[jti]
+        now = datetime.now(timezone.utc)
+        due = []
+        with self._heap_lock:
+            while self._expiry_heap and self._expiry_heap[0][0] <= now:
+                due.append(heapq.heappop(self._expiry_heap))
 
-            return len(jtis_to_remove)
+        # A session re-stored with a later expiry no longer matches its old entry
+        return sum(1 for expires_at, jti in due if self._pop(jti, expires_at) is not None)
 
     def session_exists(self, jti: str) -> bool:
         """
@@ -193,19 +266,17 @@ class SessionManager:
             >>> if manager.session_exists(jti):
             ...     print("Session is active")
         """
-        with self._lock:
-            if jti not in self._sessions:
-                return False
-
-            _, expires_at = self._sessions[jti]
-
-            # Check if expired
-            if datetime.now(timezone.utc) >= expires_at:
-                # Remove expired session
-                del self._sessions[jti]
+        shard = self._shard(jti)
+        with shard.lock:
+            session = shard.sessions.get(jti)
+            if session is None:
                 return False
+            if datetime.now(timezone.utc) < session.expires_at:
+                return True
 
-            return True
+        # Remove expired session
+        self._pop(jti, session.expires_at)
+        return False
 
     def get_session_count(self) -> int:
         """
@@ -218,8 +289,7 @@ class SessionManager:
             >>> count = manager.get_session_count()
             >>> print(f"{count} active sessions")
         """
-        with self._lock:
-            return len(self._sessions)
+        return sum(len(shard.sessions) for shard in self._shards)
 
     def clear_all(self) -> int:
         """
@@ -232,10 +302,18 @@ class SessionManager:
             >>> count = manager.clear_all()
             >>> print(f"Cleared {count} sessions")
         """
-        with self._lock:
-            count = len(self._sessions)
-            self._sessions.clear()
-            return count
+        get_session_validation_cache().clear()
+
+        count = 0
+        for shard in self._shards:
+            with shard.lock:
+                count += len(shard.sessions)
+                shard.sessions.clear()
+        with self._index_lock:
+            self._wallet_index.clear()
+        with self._heap_lock:
+            self._expiry_heap.clear()
+        return count
 
 
 # Global session manager instance
@@ -255,5 +333,7 @@ def get_session_manager() -> SessionManager:
     """
     global _session_manager
     if _session_manager is None:
-        _session_manager = SessionManager()
+        _session_manager = SessionManager(
+            max_sessions=settings.session_max_sessions, shards=settings.session_manager_shards
+        )
     return _session_manager
@@ -0,0 +1,311 @@
+"""
+Session Store
+
+Pluggable backend for unlocked wallet sessions, selected by
+settings.session_backend:
+
+- "memory" (default): the process-local SessionManager. Sessions are only
+  visible to the worker that unlocked the wallet, so run a single worker.
+- "mongo": the wallet's account-level key is encrypted under a server Fernet
+  key (settings.session_encryption_key) and stored in a collection shared by
+  all workers (admin database), with the process-local SessionManager as
+  an L1 cache in front. A token minted on one worker resolves on any other.
+
+An L1 hit is trusted for settings.session_validation_ttl_seconds after the
+shared collection last confirmed it, and only while the tenant's shared
+revocation revision (SessionRevocations) is unchanged. A session revoked or
+locked on another worker therefore stops resolving here within
+settings.session_revocation_poll_seconds (revocations on this worker apply at
+once). Sessions only resolve for the tenant that stored them.
+"""
+
+import logging
+import time
+from abc import ABC, abstractmethod
+from datetime import datetime, timezone
+
+from motor.motor_asyncio import AsyncIOMotorCollection, AsyncIOMotorDatabase
+from pymongo import ASCENDING
+
+from api.config import settings
+from api.services.crypto_executor import get_crypto_executor
+from api.services.session_manager import SessionManager, get_session_manager
+from api.services.session_validation_cache import SessionRevocations, get_session_revocations
+from api.utils.session_encryption import decrypt_session_material, encrypt_session_material, validate_server_session_key
+from cardano_offchain.wallet import CardanoWallet
+
+
+logger = logging.getLogger(__name__)
+
+COLLECTION_NAME = "shared_wallet_sessions"
+
+
+class SessionStore(ABC):
+    """Async interface for storing and resolving unlocked wallet sessions"""
+
+    @abstractmethod
+    async def store(
+        self, jti: str, cardano_wallet: CardanoWallet, expires_at: datetime, wallet_id: str | None = None
+    ) -> None:
+        """Store an unlocked wallet session under its JWT ID"""
+
+    @abstractmethod
+    async def get(self, jti: str) -> CardanoWallet | None:
+        """Unlocked wallet for a session, or None if not found or expired"""
+
+    @abstractmethod
+    async def exists(self, jti: str) -> bool:
+        """Whether a session exists and has not expired"""
+
+    @abstractmethod
+    async def remove(self, jti: str) -> bool:
+        """Remove a session; True if it existed"""
+
+    @abstractmethod
+    async def remove_wallet(self, wallet_id: str) -> int:
+        """Remove all sessions of a wallet; returns the number removed"""
+
+    @abstractmethod
+    async def count(self) -> int:
+        """Number of stored sessions"""
+
+    @abstractmethod
+    async def cleanup_expired(self) -> int:
+        """Remove expired sessions; returns the number removed"""
+
+    @abstractmethod
+    async def clear(self) -> int:
+        """Remove all sessions; returns the number removed"""
+
+
+class MemorySessionStore(SessionStore):
+    """Process-local store backed by the SessionManager"""
+
+    def __init__(self, manager: SessionManager):
+        self.manager = manager
+
+    async def store(
+        self, jti: str, cardano_wallet: CardanoWallet, expires_at: datetime, wallet_id: str | None = None
+    ) -> None:
+        self.manager.store_session(jti, cardano_wallet, expires_at, wallet_id=wallet_id)
+
+    async def get(self, jti: str) -> CardanoWallet | None:
+        return self.manager.get_session(jti)
+
+    async def exists(self, jti: str) -> bool:
+        return self.manager.session_exists(jti)
+
+    async def remove(self, jti: str) -> bool:
+        return self.manager.remove_session(jti)
+
+    async def remove_wallet(self, wallet_id: str) -> int:
+        return self.manager.remove_wallet_sessions(wallet_id)
+
+    async def count(self) -> int:
+        return self.manager.get_session_count()
+
+    async def cleanup_expired(self) -> int:
+        return self.manager.cleanup_expired()
+
+    async def clear(self) -> int:
+        return self.manager.clear_all()
+
+
+class MongoSessionStore(SessionStore):
+    """Shared store of encrypted session key material with a process-local L1"""
+
+    def __init__(
+        self,
+        server_key: str,
+        l1: SessionManager,
+        database: AsyncIOMotorDatabase | None = None,
+        confirm_ttl_seconds: float = 30.0,
+        revocations: SessionRevocations | None = None,
+    ):
+        """
+        Initialize the store.
+
+        Args:
+            server_key: Fernet key the session key material is encrypted under
+            l1: Process-local session cache
+            database: Shared (admin) MongoDB database; attached at startup via initialize()
+            confirm_ttl_seconds: How long an L1 hit is trusted without re-checking the
+                                 shared collection while no revocation is signalled
+            revocations: Shared revocation revisions (defaults to the global tracker)
+        """
+        self.server_key = validate_server_session_key(server_key)
+        self.l1 = l1
+        self.database = database
+        self.confirm_ttl_seconds = confirm_ttl_seconds
+        self.revocations = revocations or get_session_revocations()
+        # (jti, tenant) -> (when the shared collection last confirmed the session,
+        #                   tenant revocation revision at that time)
+        self._confirmed: dict[tuple[str, str | None], tuple[float, int]] = {}
+
+    def _get_collection(self) -> AsyncIOMotorCollection:
+        if self.database is None:
+            raise RuntimeError("Shared session store used before initialize()")
+        return self.database.get_collection(COLLECTION_NAME)
+
+    async def initialize(self, database: AsyncIOMotorDatabase) -> None:
+        """Attach the shared database and create the collection's indexes"""
+        self.database = database
+        collection = self._get_collection()
+        # MongoDB drops expired sessions on its own
+        await collection.create_index([("expires_at", ASCENDING)], expireAfterSeconds=0)
+        await collection.create_index([("wallet_id", ASCENDING), ("tenant_id", ASCENDING)])
+
+    async def store(
+        self, jti: str, cardano_wallet: CardanoWallet, expires_at: datetime, wallet_id: str | None = None
+    ) -> None:
+        from api.database.tenant_context import get_current_tenant
+
+        revision = await self.revocations.current(get_current_tenant())
+        self.l1.store_session(jti, cardano_wallet, expires_at, wallet_id=wallet_id)
+        self._confirm(jti, revision)
+        await self._get_collection().replace_one(
+            {"_id": jti},
+            {
+                "wallet_id": wallet_id,
+                "tenant_id": get_current_tenant(),
+                "network": cardano_wallet.network,
+                # Naive UTC for consistency with the rest of the database
+                "expires_at": expires_at.astimezone(timezone.utc).replace(tzinfo=None),
+                # Account-level key only: enough to sign, not to recover the root or other accounts
+                "material": encrypt_session_material(cardano_wallet.export_account_key(), self.server_key),
+            },
+            upsert=True,
+        )
+
+    @staticmethod
+    def _live_query(jti: str) -> dict:
+        """Query for an unexpired shared session of the current tenant"""
+        from api.database.tenant_context import get_current_tenant
+
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        return {"_id": jti, "tenant_id": get_current_tenant(), "expires_at": {"$gt": now}}
+
+    async def _shared_exists(self, jti: str) -> bool:
+        return await self._get_collection().count_documents(self._live_query(jti), limit=1) > 0
+
+    def _confirm(self, jti: str, revision: int) -> None:
+        from api.database.tenant_context import get_current_tenant
+
+        self._confirmed[(jti, get_current_tenant())] = (time.monotonic(), revision)
+
+    def _recently_confirmed(self, jti: str, revision: int) -> bool:
+        from api.database.tenant_context import get_current_tenant
+
+        confirmed = self._confirmed.get((jti, get_current_tenant()))
+        if confirmed is None:
+            return False
+        confirmed_at, confirmed_revision = confirmed
+        return confirmed_revision == revision and time.monotonic() - confirmed_at < self.confirm_ttl_seconds
+
+    def _forget(self, jti: str) -> None:
+        for key in [key for key in self._confirmed if key[0] == jti]:
+            del self._confirmed[key]
+
+    async def _load(self, jti: str, revision: int) -> CardanoWallet | None:
+        """Restore a session of the current tenant from the shared collection into the L1"""
+        doc = await self._get_collection().find_one(self._live_query(jti))
+        if doc is None:
+            return None
+        try:
+            account_key = decrypt_session_material(doc["material"], self.server_key)
+        except ValueError as e:
+            # Written under a different server key; unusable on this worker
+            logger.warning(f"Cannot decrypt shared session {jti[:8]}...: {e}")
+            return None
+        # BIP32 derivation of the chain keys; keep it off the event loop
+        cardano_wallet = await get_crypto_executor().run(CardanoWallet.from_account_key, account_key, doc["network"])
+        self.l1.store_session(
+            jti, cardano_wallet, doc["expires_at"].replace(tzinfo=timezone.utc), wallet_id=doc.get("wallet_id")
+        )
+        self._confirm(jti, revision)
+        return cardano_wallet
+
+    async def get(self, jti: str) -> CardanoWallet | None:
+        from api.database.tenant_context import get_current_tenant
+
+        # Read before checking the shared collection, so a revocation racing the
+        # check moves the revision past what gets confirmed
+        revision = await self.revocations.current(get_current_tenant())
+        cardano_wallet = self.l1.get_session(jti)
+        if cardano_wallet is None:
+            return await self._load(jti, revision)
+        if self._recently_confirmed(jti, revision):
+            return cardano_wallet
+        # The L1 copy may have been revoked on another worker
+        if not await self._shared_exists(jti):
+            self._forget(jti)
+            self.l1.remove_session(jti)
+            return None
+        self._confirm(jti, revision)
+        return cardano_wallet
+
+    async def exists(self, jti: str) -> bool:
+        if await self._shared_exists(jti):
+            return True
+        self._forget(jti)
+        self.l1.remove_session(jti)
+        return False
+
+    async def remove(self, jti: str) -> bool:
+        from api.database.tenant_context import get_current_tenant
+
+        self._forget(jti)
+        removed_locally = self.l1.remove_session(jti)
+        result = await self._get_collection().delete_one({"_id": jti, "tenant_id": get_current_tenant()})
+        return removed_locally or result.deleted_count > 0
+
+    async def remove_wallet(self, wallet_id: str) -> int:
+        from api.database.tenant_context import get_current_tenant
+
+        self.l1.remove_wallet_sessions(wallet_id)
+        query = {"wallet_id": wallet_id}
+        tenant_id = get_current_tenant()
+        if tenant_id is not None:
+            query["tenant_id"] = tenant_id
+        result = await self._get_collection().delete_many(query)
+        return result.deleted_count
+
+    async def count(self) -> int:
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        return await self._get_collection().count_documents({"expires_at": {"$gt": now}})
+
+    async def cleanup_expired(self) -> int:
+        removed = self.l1.cleanup_expired()
+        stale_before = time.monotonic() - self.confirm_ttl_seconds
+        self._confirmed = {key: confirmed for key, confirmed in self._confirmed.items() if confirmed[0] > stale_before}
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        # The TTL index does this too, but only about once a minute
+        result = await self._get_collection().delete_many({"expires_at": {"$lte": now}})
+        return max(removed, result.deleted_count)
+
+    async def clear(self) -> int:
+        self.l1.clear_all()
+        self._confirmed.clear()
+        result = await self._get_collection().delete_many({})
+        return result.deleted_count
+
+
+# Global store instance
+_session_store: SessionStore | None = None
+
+
+def get_session_store() -> SessionStore:
+    """Get or create the global session store for the configured backend"""
+    global _session_store
+    if _session_store is None:
+        if settings.session_backend == "mongo":
+            _session_store = MongoSessionStore(
+                server_key=settings.session_encryption_key,
+                l1=get_session_manager(),
+                confirm_ttl_seconds=settings.session_validation_ttl_seconds,
+            )
+        elif settings.session_backend == "memory":
+            _session_store = MemorySessionStore(get_session_manager())
+        else:
+            raise ValueError(f"Unknown session_backend: {settings.session_backend!r} (expected 'memory' or 'mongo')")
+    return _session_store
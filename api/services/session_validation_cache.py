@@ -0,0 +1,371 @@
+"""
+Session Validation Cache
+
+Keeps JWT session authentication off the database on the hot path.
+
+- SessionValidationCache: remembers that a session (tenant, jti) was found
+  active in the tenant's MongoDB for a short TTL. SessionManager pushes revocations into it, so a
+  session revoked on this worker is rejected immediately.
+- SessionRevocations: per-tenant revocation revision shared by all workers
+  (admin database). Revoking bumps it; cached validations made under an
+  older revision are dropped, so a session revoked on another worker is
+  rejected within settings.session_revocation_poll_seconds.
+- LastUsedBuffer: write-behind buffer for WalletSessionMongo.last_used_at,
+  flushed periodically with one bulk_write per tenant instead of a save()
+  per request.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any
+
+from motor.motor_asyncio import AsyncIOMotorCollection, AsyncIOMotorDatabase
+from pymongo import ReturnDocument, UpdateOne
+from pymongo.asynchronous.collection import AsyncCollection
+
+from api.config import settings
+
+
+logger = logging.getLogger(__name__)
+
+REVOCATIONS_COLLECTION_NAME = "session_revocations"
+
+
+@dataclass
+class ValidatedSession:
+    """Database session state remembered by the validation cache"""
+
+    session_id: str
+    wallet_id: str
+    tenant_id: str | None  # Tenant whose database holds the session
+    expires_at: datetime  # Naive UTC, as stored in MongoDB
+    validated_at: float  # time.monotonic() of the database check
+    revision: int = 0  # Tenant revocation revision the check was made under
+
+
+@dataclass
+class SessionValidationStats:
+    """Counters for the session validation cache"""
+
+    hits: int = 0
+    misses: int = 0
+    invalidations: int = 0
+
+    def snapshot(self) -> dict[str, Any]:
+        """Stats as a JSON-serializable dict"""
+        return {"hits": self.hits, "misses": self.misses, "invalidations": self.invalidations}
+
+
+class SessionValidationCache:
+    """
+    Short-TTL cache of sessions validated against MongoDB, keyed by (tenant_id, jti).
+
+    A session is only trusted in the tenant whose database it was found in.
+    """
+
+    def __init__(self, ttl_seconds: float = 30.0, max_entries: int = 10000):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl_seconds: How long a database check is trusted while the tenant's
+                revocation revision is unchanged
+            max_entries: Maximum cached sessions (least recently used are evicted)
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.stats = SessionValidationStats()
+        self._entries: OrderedDict[tuple[str | None, str], ValidatedSession] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, jti: str, wallet_id: str, tenant_id: str | None, revision: int = 0) -> ValidatedSession | None:
+        """
+        Cached validation for a session in a tenant, or None if it must be checked in the database.
+
+        Args:
+            revision: The tenant's current revocation revision; validations made
+                      under an older one are not trusted
+        """
+        key = (tenant_id, jti)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.wallet_id != wallet_id or entry.tenant_id != tenant_id:
+                self.stats.misses += 1
+                return None
+            if entry.revision != revision or time.monotonic() - entry.validated_at >= self.ttl_seconds:
+                del self._entries[key]
+                self.stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return entry
+
+    def put(
+        self, jti: str, wallet_id: str, tenant_id: str | None, session_id: str, expires_at: datetime, revision: int = 0
+    ) -> ValidatedSession:
+        """Remember a session found active in a tenant's database under a revocation revision"""
+        entry = ValidatedSession(
+            session_id=session_id,
+            wallet_id=wallet_id,
+            tenant_id=tenant_id,
+            expires_at=expires_at,
+            validated_at=time.monotonic(),
+            revision=revision,
+        )
+        key = (tenant_id, jti)
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = entry
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+    def invalidate(self, jti: str) -> None:
+        """Drop a session in every tenant (called on revocation, lock and expiry)"""
+        with self._lock:
+            keys = [key for key in self._entries if key[1] == jti]
+            for key in keys:
+                del self._entries[key]
+            self.stats.invalidations += len(keys)
+
+    def clear(self) -> None:
+        """Drop all sessions"""
+        with self._lock:
+            self.stats.invalidations += len(self._entries)
+            self._entries.clear()
+
+
+class SessionRevocations:
+    """
+    Per-tenant session revocation revision shared by all workers.
+
+    Every revocation (token revoke, lock, password change, admin revoke) bumps
+    the tenant's revision in the admin database. Workers re-read it at most
+    every poll_seconds, so cached trust in a session (validation cache, shared
+    store L1) is dropped on every worker within that interval. Works
+    process-local until a database is attached at startup.
+    """
+
+    # Admin collection holding the revisions (one document per tenant)
+    collection_name = REVOCATIONS_COLLECTION_NAME
+
+    def __init__(self, database: AsyncIOMotorDatabase | None = None, poll_seconds: float = 1.0):
+        """
+        Initialize the revision tracker.
+
+        Args:
+            database: Shared (admin) MongoDB database, or None for process-local revisions
+            poll_seconds: How long a read revision is reused (bounds cross-worker revocation delay)
+        """
+        self.database = database
+        self.poll_seconds = poll_seconds
+        # tenant -> (revision, time.monotonic() it was read)
+        self._revisions: dict[str | None, tuple[int, float]] = {}
+        # tenant -> in-flight read, shared by concurrent requests
+        self._reads: dict[str | None, asyncio.Future[int]] = {}
+
+    def _get_collection(self) -> AsyncIOMotorCollection:
+        if self.database is None:
+            raise RuntimeError(f"{type(self).__name__} used without a database")
+        return self.database.get_collection(self.collection_name)
+
+    async def initialize(self, database: AsyncIOMotorDatabase) -> None:
+        """Attach the shared database"""
+        self.database = database
+        self._revisions.clear()
+
+    @staticmethod
+    def _key(tenant_id: str | None) -> str:
+        return tenant_id or ""
+
+    def _remember(self, tenant_id: str | None, revision: int) -> None:
+        known = self._revisions.get(tenant_id)
+        # Never step back if a slower read lands after a bump
+        if known is not None and known[0] > revision:
+            revision = known[0]
+        self._revisions[tenant_id] = (revision, time.monotonic())
+
+    async def _read(self, tenant_id: str | None) -> int:
+        doc = await self._get_collection().find_one({"_id": self._key(tenant_id)})
+        revision = int(doc["revision"]) if doc else 0
+        self._remember(tenant_id, revision)
+        return self._revisions[tenant_id][0]
+
+    async def current(self, tenant_id: str | None) -> int:
+        """The tenant's revocation revision, read from the database at most every poll_seconds"""
+        known = self._revisions.get(tenant_id)
+        if self.database is None:
+            return known[0] if known else 0
+        if known is not None and time.monotonic() - known[1] < self.poll_seconds:
+            return known[0]
+
+        read = self._reads.get(tenant_id)
+        if read is None:
+            read = asyncio.ensure_future(self._read(tenant_id))
+            self._reads[tenant_id] = read
+            read.add_done_callback(lambda _: self._reads.pop(tenant_id, None))
+        # Shielded so one cancelled request doesn't fail the others waiting on the read
+        return await asyncio.shield(read)
+
+    def known_before(self, tenant_id: str | None, started_at: float) -> int:
+        """
+        The tenant's revision as read no later than a time.monotonic() instant, or -1.
+
+        For state loaded before its tenant is known: a revision read before the
+        load can't hide a revocation made while the load ran. -1 never matches
+        a real revision, so state tagged with it is re-checked on first use.
+        """
+        known = self._revisions.get(tenant_id)
+        if known is None:
+            return 0 if self.database is None else -1
+        return known[0] if known[1] <= started_at else -1
+
+    async def bump(self, tenant_id: str | None) -> int:
+        """Record a revocation in the tenant; returns the new revision"""
+        if self.database is None:
+            known = self._revisions.get(tenant_id)
+            revision = (known[0] if known else 0) + 1
+        else:
+            doc = await self._get_collection().find_one_and_update(
+                {"_id": self._key(tenant_id)},
+                {"$inc": {"revision": 1}},
+                upsert=True,
+                return_document=ReturnDocument.AFTER,
+            )
+            revision = int(doc["revision"])
+        self._remember(tenant_id, revision)
+        return revision
+
+
+class LastUsedBuffer:
+    """Write-behind buffer for session last_used_at timestamps"""
+
+    # Document field the buffered keys are matched on, and a label for logs/tasks
+    key_field = "jti"
+    label = "session"
+
+    def __init__(self, flush_interval: float = 15.0):
+        """
+        Initialize the buffer.
+
+        Args:
+            flush_interval: Seconds between background flushes
+        """
+        self.flush_interval = flush_interval
+        # (tenant_id, key) -> latest use (naive UTC)
+        self._pending: dict[tuple[str | None, Any], datetime] = {}
+        self._lock = threading.Lock()
+        self._task: asyncio.Task | None = None
+        self.flushed = 0
+
+    def touch(self, key: Any, tenant_id: str | None, used_at: datetime | None = None) -> None:
+        """Record a use; only the latest timestamp per key is written"""
+        used_at = used_at or datetime.now(timezone.utc).replace(tzinfo=None)
+        with self._lock:
+            self._pending[(tenant_id, key)] = used_at
+
+    @property
+    def pending(self) -> int:
+        """Number of keys waiting to be flushed"""
+        return len(self._pending)
+
+    async def _get_collection(self, tenant_id: str | None) -> AsyncIOMotorCollection | AsyncCollection[Any]:
+        if tenant_id is None:
+            # Same collection the auth lookup used (Beanie's current binding)
+            from api.database.models import WalletSessionMongo
+
+            return WalletSessionMongo.get_pymongo_collection()
+        from api.database.multi_tenant_manager import get_multi_tenant_db_manager
+
+        tenant_db: AsyncIOMotorDatabase = await get_multi_tenant_db_manager().get_tenant_database(tenant_id)
+        return tenant_db.get_collection("wallet_sessions")
+
+    async def flush(self) -> int:
+        """
+        Write buffered timestamps with one bulk_write per tenant.
+
+        Returns:
+            Number of documents updated
+        """
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return 0
+
+        by_tenant: dict[str | None, list[UpdateOne]] = {}
+        for (tenant_id, key), used_at in pending.items():
+            # $max keeps last_used_at monotonic if flushes race
+            by_tenant.setdefault(tenant_id, []).append(
+                UpdateOne({self.key_field: key}, {"$max": {"last_used_at": used_at}})
+            )
+
+        written = 0
+        for tenant_id, operations in by_tenant.items():
+            try:
+                collection = await self._get_collection(tenant_id)
+                await collection.bulk_write(operations, ordered=False)
+                written += len(operations)
+            except Exception as e:
+                # Timestamps are best-effort audit data; drop rather than grow unbounded
+                logger.warning(f"Failed to flush {len(operations)} {self.label} timestamps for tenant {tenant_id}: {e}")
+        self.flushed += written
+        return written
+
+    def start(self) -> None:
+        """Start periodic flushing on the running event loop"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name=f"{self.label}-last-used-flush")
+
+    async def stop(self) -> None:
+        """Stop periodic flushing and write what is left"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"{self.label.capitalize()} timestamp flush failed: {e}", exc_info=True)
+
+
+# Global instances
+_session_validation_cache: SessionValidationCache | None = None
+_last_used_buffer: LastUsedBuffer | None = None
+_session_revocations: SessionRevocations | None = None
+
+
+def get_session_validation_cache() -> SessionValidationCache:
+    """Get or create the global session validation cache"""
+    global _session_validation_cache
+    if _session_validation_cache is None:
+        _session_validation_cache = SessionValidationCache(ttl_seconds=settings.session_validation_ttl_seconds)
+    return _session_validation_cache
+
+
+def get_session_revocations() -> SessionRevocations:
+    """Get or create the global session revocation tracker"""
+    global _session_revocations
+    if _session_revocations is None:
+        _session_revocations = SessionRevocations(poll_seconds=settings.session_revocation_poll_seconds)
+    return _session_revocations
+
+
+def get_last_used_buffer() -> LastUsedBuffer:
+    """Get or create the global last_used_at write-behind buffer"""
+    global _last_used_buffer
+    if _last_used_buffer is None:
+        _last_used_buffer = LastUsedBuffer(flush_interval=settings.session_last_used_flush_seconds)
+    return _last_used_buffer
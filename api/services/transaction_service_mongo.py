@@ -7,20 +7,33 @@ Supports two-stage flow: BUILD → SIGN → SUBMIT
 MongoDB/Beanie version for multi-tenant architecture.
 """
 
+import asyncio
 import hashlib
 import json
-import os
+import uuid
+from copy import deepcopy
 from datetime import datetime, timezone
 
+from api.config import settings
 from api.database.models import TransactionMongo, WalletMongo
-from api.enums import TransactionStatus, NetworkType
+from api.enums import TransactionStatus, TransactionType, NetworkType
+from api.services.coin_selection import CoinSelectionError, add_selected_inputs
+from api.services.crypto_executor import get_crypto_executor
+from api.services.utxo_reservations import (
+    UtxoReservationConflictError,
+    UtxoReservationLedger,
+    input_ref,
+    utxo_ref,
+)
 from api.utils.encryption import decrypt_mnemonic
 from api.utils.password import verify_password
 from api.utils.metadata import prepare_metadata, validate_metadata_size
-from cardano_offchain.wallet import CardanoWallet
 from cardano_offchain.chain_context import CardanoChainContext
+from cardano_offchain.wallet import CardanoWallet
+from api.services.chain_contexts import get_chain_context_for_network
 import pycardano as pc
 from bson import ObjectId
+from pymongo import ReplaceOne
 
 
 def _extract_amount_from_value(value: pc.Value) -> list[dict]:
@@ -40,6 +53,47 @@ def _extract_amount_from_value(value: pc.Value) -> list[dict]:
     return amounts
 
 
+def _extract_tx_inputs(tx_body: pc.TransactionBody, utxo_map: dict[str, pc.UTxO]) -> list[dict]:
+    """
+    Describe a built transaction's inputs with full UTXO amount data (Blockfrost-compatible format).
+
+    Inputs missing from utxo_map ("tx_hash:index" -> UTxO) are skipped.
+    """
+    inputs = []
+    for tx_input in tx_body.inputs:
+        tx_hash_hex = tx_input.transaction_id.payload.hex()
+        idx = tx_input.index
+        utxo = utxo_map.get(f"{tx_hash_hex}:{idx}")
+        if utxo:
+            inputs.append({
+                "address": str(utxo.output.address),
+                "tx_hash": tx_hash_hex,
+                "output_index": idx,
+                "amount": _extract_amount_from_value(utxo.output.amount),
+                "collateral": False,
+                "data_hash": utxo.output.datum_hash.payload.hex() if utxo.output.datum_hash else None,
+                "inline_datum": None,
+                "reference_script_hash": None
+            })
+    return inputs
+
+
+def _extract_tx_outputs(tx_body: pc.TransactionBody) -> list[dict]:
+    """Describe a built transaction's outputs with amounts and indexes (Blockfrost-compatible format)."""
+    outputs = []
+    for idx, tx_output in enumerate(tx_body.outputs):
+        outputs.append({
+            "address": str(tx_output.address),
+            "amount": _extract_amount_from_value(tx_output.amount),
+            "output_index": idx,
+            "data_hash": tx_output.datum_hash.payload.hex() if tx_output.datum_hash else None,
+            "inline_datum": None,
+            "collateral": False,
+            "reference_script_hash": None
+        })
+    return outputs
+
+
 def _prepare_tx_dict_for_validation(tx_dict: dict) -> dict:
     """
     Prepare a MongoDB transaction document for Pydantic model validation.
@@ -148,6 +202,56 @@ def _validate_wallet_has_tokens(
                 )
 
 
+def _normalize_token_name(token_name: str) -> str:
+    """Token name as hex (names that aren't valid hex are UTF-8 encoded)"""
+    try:
+        return bytes.fromhex(token_name).hex()
+    except ValueError:
+        return token_name.encode("utf-8").hex()
+
+
+def _merge_asset_items(asset_lists: list[list[dict] | None]) -> list[dict]:
+    """
+    Sum several MultiAssetItem lists into one (token names normalized to hex).
+
+    Used to validate a whole batch of outputs against the wallet at once.
+    """
+    totals: dict[str, dict[str, int]] = {}
+    for assets in asset_lists:
+        for item in assets or []:
+            tokens = totals.setdefault(item["policyid"], {})
+            for token_name, quantity in item["tokens"].items():
+                token_hex = _normalize_token_name(token_name)
+                tokens[token_hex] = tokens.get(token_hex, 0) + quantity
+    return [{"policyid": policy_id, "tokens": tokens} for policy_id, tokens in totals.items()]
+
+
+def _build_payout_outputs(recipients: list[dict], context: pc.ChainContext) -> list[pc.TransactionOutput]:
+    """
+    Build one output per payout recipient, topped up to its min lovelace.
+
+    Computes min lovelace for all outputs from a single protocol parameter
+    lookup (same formula as pc.min_lovelace for post-Alonzo outputs) instead
+    of one pc.min_lovelace call per output.
+
+    Each recipient dict has:
+    - address: destination address
+    - lovelace: requested lovelace (None or below min lovelace: min lovelace is used)
+    - assets: optional MultiAssetItem list
+    """
+    coins_per_utxo_byte = context.protocol_param.coins_per_utxo_byte
+    outputs = []
+    for recipient in recipients:
+        address = pc.Address.from_primitive(recipient["address"])
+        multi_asset = _build_multi_asset_from_items(recipient["assets"]) if recipient.get("assets") else pc.MultiAsset()
+        requested = recipient.get("lovelace") or 0
+        output = pc.TransactionOutput(address, pc.Value(max(requested, 1_000_000), multi_asset), post_alonzo=True)
+        min_lovelace = (160 + len(output.to_cbor())) * coins_per_utxo_byte
+        output.amount.coin = max(requested, min_lovelace)
+        outputs.append(output)
+    return outputs
+
+
 # Custom exceptions
 class TransactionNotFoundError(Exception):
     """Transaction not found in database"""
@@ -229,19 +333,24 @@ class MongoTransactionService:
         else:
             return await TransactionMongo.find_one(TransactionMongo.tx_hash == tx_hash)
 
+    @staticmethod
+    def _transaction_document(transaction: TransactionMongo) -> dict:
+        """Tenant database document for a transaction, keyed by its tx_hash."""
+        tx_dict: dict = transaction.model_dump(by_alias=True, exclude_unset=False)
+        # Remove 'id' if present and use tx_hash as _id
+        if "id" in tx_dict:
+            tx_dict.pop("id")
+        # Ensure _id is set to tx_hash for MongoDB
+        tx_dict["_id"] = transaction.tx_hash
+        return tx_dict
+
     async def _save_transaction(self, transaction: TransactionMongo):
         """Save transaction to tenant database."""
         if self.database is not None:
             collection = self._get_transaction_collection()
-            tx_dict = transaction.model_dump(by_alias=True, exclude_unset=False)
-            # Remove 'id' if present and use tx_hash as _id
-            if "id" in tx_dict:
-                tx_dict.pop("id")
-            # Ensure _id is set to tx_hash for MongoDB
-            tx_dict["_id"] = transaction.tx_hash
             await collection.replace_one(
                 {"_id": transaction.tx_hash},
-                tx_dict,
+                self._transaction_document(transaction),
                 upsert=True
             )
         else:
@@ -266,6 +375,47 @@ class MongoTransactionService:
             await transaction.insert()
             logger.info(f"✅ Inserted transaction {transaction.tx_hash} using Beanie")
 
+    async def _get_available_utxos(
+        self, chain_context: CardanoChainContext, from_address: str, network: str
+    ) -> list[pc.UTxO]:
+        """
+        UTXOs a new transaction from the address may spend.
+
+        Excludes UTXOs reserved for contract compilation and inputs leased by
+        in-flight builds; adds pending outputs of our submitted transactions.
+
+        Raises:
+            InsufficientFundsError: No UTXOs are available
+        """
+        utxos = await chain_context.get_provider().utxos(from_address)
+
+        if not utxos:
+            raise InsufficientFundsError(f"No UTXOs found at address {from_address}")
+
+        # Exclude UTXOs reserved for contract compilation (not yet minted)
+        from api.services.contract_service_mongo import MongoContractService
+        contract_service = MongoContractService(database=self.database)
+        reserved_utxos = await contract_service.get_reserved_compilation_utxos()
+        if reserved_utxos:
+            utxos = [
+                u for u in utxos
+                if f"{u.input.transaction_id.payload.hex()}:{u.input.index}" not in reserved_utxos
+            ]
+            if not utxos:
+                raise InsufficientFundsError(
+                    f"No available UTXOs at address {from_address} "
+                    "(all UTXOs are reserved for contract compilation)"
+                )
+
+        # Skip inputs leased by in-flight builds; add pending outputs of our submitted transactions
+        utxos = await UtxoReservationLedger(self.database).available_utxos(from_address, utxos, network)
+        if not utxos:
+            raise InsufficientFundsError(
+                f"No available UTXOs at address {from_address} "
+                "(all UTXOs are reserved by in-flight transactions)"
+            )
+        return utxos
+
     async def build_transaction(
         self,
         wallet_id: str,
@@ -299,12 +449,8 @@ class MongoTransactionService:
         if not wallet:
             raise Exception(f"Wallet {wallet_id} not found")
 
-        # Create chain context
-        blockfrost_api_key = os.getenv("blockfrost_api_key")
-        if not blockfrost_api_key:
-            raise Exception("Missing blockfrost_api_key environment variable")
-
-        chain_context = CardanoChainContext(network=network, blockfrost_api_key=blockfrost_api_key)
+        # Shared chain context for the network
+        chain_context = get_chain_context_for_network(network)
 
         # Use wallet's enterprise address as the source
         from_address = wallet.enterprise_address
@@ -312,35 +458,16 @@ class MongoTransactionService:
         # Determine operation type
         operation = "send_tokens" if assets else "send_ada"
 
-        # Get UTXOs for the address
-        context = chain_context.get_context()
-        utxos = context.utxos(from_address)
+        # Spendable UTXOs (not reserved or leased, plus pending outputs of our submitted transactions)
+        utxos = await self._get_available_utxos(chain_context, from_address, network)
+        reservations = UtxoReservationLedger(self.database)
 
-        if not utxos:
-            raise InsufficientFundsError(f"No UTXOs found at address {from_address}")
+        # Build transaction (protocol parameters are loaded off the event loop)
+        builder = pc.TransactionBuilder(await chain_context.prepare_context())
 
-        # Exclude UTXOs reserved for contract compilation (not yet minted)
-        from api.services.contract_service_mongo import MongoContractService
-        contract_service = MongoContractService(database=self.database)
-        reserved_utxos = await contract_service.get_reserved_compilation_utxos()
-        if reserved_utxos:
-            utxos = [
-                u for u in utxos
-                if f"{u.input.transaction_id.payload.hex()}:{u.input.index}" not in reserved_utxos
-            ]
-            if not utxos:
-                raise InsufficientFundsError(
-                    f"No available UTXOs at address {from_address} "
-                    "(all UTXOs are reserved for contract compilation)"
-                )
-
-        # Build transaction
-        builder = pc.TransactionBuilder(chain_context.context)
-
-        # Add inputs (all available UTXOs) and track in lookup map for later extraction
+        # Track candidate UTXOs in lookup map for later extraction of the selected inputs
         utxo_map = {}  # tx_hash:index -> utxo
         for utxo in utxos:
-            builder.add_input(utxo)
             key = f"{utxo.input.transaction_id.payload.hex()}:{utxo.input.index}"
             utxo_map[key] = utxo
 
@@ -360,7 +487,7 @@ class MongoTransactionService:
                 pc.Address.from_primitive(to_address),
                 pc.Value(0, multi_asset)
             )
-            min_lovelace_calculated = pc.min_lovelace(context, output=test_output)
+            min_lovelace_calculated = pc.min_lovelace(chain_context.context, output=test_output)
 
             # Determine coin amount: max(requested, min_lovelace)
             if amount_ada is not None:
@@ -392,6 +519,12 @@ class MongoTransactionService:
         # Set fee buffer (will be calculated properly during build)
         builder.fee_buffer = 1_000_000  # 1 ADA fee buffer
 
+        # Spend only the UTXOs coin selection picks for the output, fee and change
+        try:
+            add_selected_inputs(builder, utxos)
+        except CoinSelectionError as e:
+            raise InsufficientFundsError(str(e)) from e
+
         # Add metadata if provided
         if metadata:
             # Validate metadata size
@@ -406,7 +539,7 @@ class MongoTransactionService:
 
         # Build the transaction (WITHOUT signing)
         try:
-            tx_body = builder.build(change_address=pc.Address.from_primitive(from_address))
+            tx_body = await asyncio.to_thread(builder.build, change_address=pc.Address.from_primitive(from_address))
         except Exception as e:
             if "insufficient" in str(e).lower():
                 raise InsufficientFundsError(f"Insufficient funds: {str(e)}")
@@ -433,42 +566,13 @@ class MongoTransactionService:
             else:
                 raise Exception(f"Failed to calculate transaction hash: {str(e)}")
 
-        # Extract detailed inputs with full UTXO amount data (Blockfrost-compatible format)
-        inputs = []
-        total_input_lovelace = 0
-        for tx_input in tx_body.inputs:
-            tx_hash_hex = tx_input.transaction_id.payload.hex()
-            idx = tx_input.index
-            utxo = utxo_map.get(f"{tx_hash_hex}:{idx}")
-            if utxo:
-                amount = _extract_amount_from_value(utxo.output.amount)
-                total_input_lovelace += utxo.output.amount.coin
-                inputs.append({
-                    "address": str(utxo.output.address),
-                    "tx_hash": tx_hash_hex,
-                    "output_index": idx,
-                    "amount": amount,
-                    "collateral": False,
-                    "data_hash": utxo.output.datum_hash.payload.hex() if utxo.output.datum_hash else None,
-                    "inline_datum": None,
-                    "reference_script_hash": None
-                })
-
-        # Extract detailed outputs with amounts and indexes (Blockfrost-compatible format)
-        outputs = []
-        total_output_lovelace = 0
-        for idx, tx_output in enumerate(tx_body.outputs):
-            amount = _extract_amount_from_value(tx_output.amount)
-            total_output_lovelace += tx_output.amount.coin
-            outputs.append({
-                "address": str(tx_output.address),
-                "amount": amount,
-                "output_index": idx,
-                "data_hash": tx_output.datum_hash.payload.hex() if hasattr(tx_output, 'datum_hash') and tx_output.datum_hash else None,
-                "inline_datum": None,
-                "collateral": False,
-                "reference_script_hash": None
-            })
+        # Lease the selected inputs so concurrent builds pick different UTXOs
+        await reservations.reserve_transaction(tx_body, tx_hash, wallet_id)
+
+        # Detailed inputs and outputs (Blockfrost-compatible format)
+        inputs = _extract_tx_inputs(tx_body, utxo_map)
+        outputs = _extract_tx_outputs(tx_body)
+        total_output_lovelace = sum(tx_output.amount.coin for tx_output in tx_body.outputs)
 
         # Calculate transaction size in bytes
         tx_size = len(bytes.fromhex(unsigned_cbor))
@@ -570,6 +674,8 @@ class MongoTransactionService:
 
         if existing_tx:
             # Return the existing transaction instead of creating a duplicate
+            if existing_tx.tx_hash != tx_hash:
+                await reservations.release(tx_hash)
             return existing_tx
 
         # Validate tx_hash before creating transaction
@@ -627,6 +733,159 @@ class MongoTransactionService:
         await self._insert_transaction(transaction)
         return transaction
 
+    async def build_batch_payout(
+        self,
+        wallet_id: str,
+        recipients: list[dict],
+        network: str,
+        metadata: dict | None = None
+    ) -> list[TransactionMongo]:
+        """
+        Build unsigned transactions paying many recipients from one wallet.
+
+        Recipient outputs are packed, in request order, into as few
+        transactions as the max transaction size allows (one UTXO fetch and
+        token check for the whole batch). Each transaction leases its inputs;
+        with utxo_chaining_enabled the next one may spend the change of the
+        previous one, so the group must be submitted in order.
+
+        Args:
+            wallet_id: Payment key hash (wallet ID)
+            recipients: Dicts with address, lovelace (optional, topped up to
+                min lovelace) and assets (optional MultiAssetItem list)
+            network: testnet or mainnet
+            metadata: Optional metadata attached to every transaction
+
+        Returns:
+            BUILT TransactionMongo records sharing a batch_id, in submission order
+
+        Raises:
+            InsufficientFundsError: Not enough funds or tokens for the whole batch
+            Exception: Other blockchain errors
+        """
+        wallet = await self._find_wallet_by_id(wallet_id)
+
+        if not wallet:
+            raise Exception(f"Wallet {wallet_id} not found")
+
+        auxiliary_data = None
+        if metadata:
+            is_valid, error_message = validate_metadata_size(metadata)
+            if not is_valid:
+                raise Exception(f"Invalid metadata: {error_message}")
+            auxiliary_data = prepare_metadata(metadata)
+
+        chain_context = get_chain_context_for_network(network)
+        context = await chain_context.prepare_context()
+        from_address = wallet.enterprise_address
+        change_address = pc.Address.from_primitive(from_address)
+
+        utxos = await self._get_available_utxos(chain_context, from_address, network)
+        _validate_wallet_has_tokens(utxos, _merge_asset_items([r.get("assets") for r in recipients]))
+
+        outputs = _build_payout_outputs(recipients, context)
+        output_sizes = [len(output.to_cbor()) for output in outputs]
+        size_budget = context.protocol_param.max_tx_size - settings.payout_tx_reserved_bytes
+        if auxiliary_data:
+            size_budget -= len(auxiliary_data.to_cbor())
+
+        reservations = UtxoReservationLedger(self.database)
+        pool = {utxo_ref(utxo): utxo for utxo in utxos}  # candidates for the next transaction
+        batch_id = uuid.uuid4().hex
+        transactions: list[TransactionMongo] = []
+        start = 0
+        try:
+            while start < len(outputs):
+                # Fill the transaction up to the size budget, then halve until it builds
+                end, size = start + 1, output_sizes[start]
+                while end < len(outputs) and size + output_sizes[end] <= size_budget:
+                    size += output_sizes[end]
+                    end += 1
+                while True:
+                    try:
+                        # Building evaluates and may query the chain; keep it off the event loop
+                        tx_body = await asyncio.to_thread(
+                            self._build_payout_body,
+                            context,
+                            outputs[start:end],
+                            list(pool.values()),
+                            change_address,
+                            auxiliary_data,
+                        )
+                        break
+                    except pc.InvalidTransactionException as e:
+                        if end - start == 1 or "exceeds the max limit" not in str(e):
+                            raise
+                        end = start + (end - start) // 2
+
+                tx_hash = tx_body.hash().hex()
+                await reservations.reserve_transaction(tx_body, tx_hash, wallet_id)
+
+                chunk = recipients[start:end]
+                transactions.append(TransactionMongo(
+                    wallet_id=wallet_id,
+                    tx_hash=tx_hash,
+                    status=TransactionStatus.BUILT.value,
+                    operation=TransactionType.BATCH_PAYOUT.value,
+                    description=f"Batch payout to {len(chunk)} recipients",
+                    unsigned_cbor=tx_body.to_cbor_hex(),
+                    from_address=from_address,
+                    amount_lovelace=sum(output.amount.coin for output in outputs[start:end]),
+                    estimated_fee=int(tx_body.fee),
+                    fee_lovelace=int(tx_body.fee),
+                    total_output_lovelace=sum(tx_output.amount.coin for tx_output in tx_body.outputs),
+                    inputs=_extract_tx_inputs(tx_body, pool),
+                    outputs=_extract_tx_outputs(tx_body),
+                    tx_metadata=metadata if metadata else {},
+                    assets_sent=_merge_asset_items([r.get("assets") for r in chunk]) or None,
+                    batch_id=batch_id,
+                    batch_index=len(transactions),
+                    batch_recipient_indexes=list(range(start, end)),
+                ))
+
+                # Later transactions spend what this one left: its change, if chaining
+                for tx_input in tx_body.inputs:
+                    pool.pop(input_ref(tx_input), None)
+                if settings.utxo_chaining_enabled:
+                    tx_id = pc.TransactionId(bytes.fromhex(tx_hash))
+                    for index in range(end - start, len(tx_body.outputs)):
+                        change = pc.UTxO(pc.TransactionInput(tx_id, index), tx_body.outputs[index])
+                        pool[utxo_ref(change)] = change
+                start = end
+
+            for transaction in transactions:
+                await self._insert_transaction(transaction)
+        except Exception:
+            await reservations.release_many(transaction.tx_hash for transaction in transactions)
+            raise
+
+        return transactions
+
+    @staticmethod
+    def _build_payout_body(
+        context: pc.ChainContext,
+        outputs: list[pc.TransactionOutput],
+        utxos: list[pc.UTxO],
+        change_address: pc.Address,
+        auxiliary_data: pc.AuxiliaryData | None = None
+    ) -> pc.TransactionBody:
+        """Build the body of one payout transaction, selecting inputs for its outputs."""
+        builder = pc.TransactionBuilder(context)
+        for output in outputs:
+            builder.add_output(deepcopy(output))
+        if auxiliary_data:
+            builder.auxiliary_data = auxiliary_data
+
+        try:
+            add_selected_inputs(builder, utxos)
+            return builder.build(change_address=change_address)
+        except CoinSelectionError as e:
+            raise InsufficientFundsError(str(e)) from e
+        except Exception as e:
+            if "insufficient" in str(e).lower():
+                raise InsufficientFundsError(f"Insufficient funds: {str(e)}") from e
+            raise
+
     async def sign_transaction(
         self,
         transaction_id: str,
@@ -674,21 +933,117 @@ class MongoTransactionService:
         if not wallet:
             raise Exception(f"Wallet {wallet_id} not found")
 
+        crypto = get_crypto_executor()
+
         # Verify password
-        if not verify_password(password, wallet.password_hash):
+        if not await crypto.run(verify_password, password, wallet.password_hash):
             from api.services.wallet_service_mongo import InvalidPasswordError
 
             raise InvalidPasswordError("Incorrect password")
 
         # Decrypt mnemonic TEMPORARILY
-        mnemonic = decrypt_mnemonic(
+        mnemonic = await crypto.run(
+            decrypt_mnemonic,
             wallet.mnemonic_encrypted,
             password,
             wallet.encryption_salt
         )
 
         # Create CardanoWallet instance (network is already a string)
-        cardano_wallet = CardanoWallet(mnemonic, network)
+        cardano_wallet = await crypto.run(CardanoWallet, mnemonic, network)
+
+        self._apply_signature(transaction, cardano_wallet)
+
+        # Clear sensitive data immediately
+        del mnemonic
+        del cardano_wallet
+
+        await self._save_transaction(transaction)
+        return transaction
+
+    async def sign_transactions_with_session(
+        self,
+        transaction_ids: list[str],
+        wallet_id: str,
+        cardano_wallet: CardanoWallet
+    ) -> list[TransactionMongo]:
+        """
+        Sign one or more built transactions with an already-unlocked session wallet.
+
+        Skips the password check, mnemonic decryption and key derivation of
+        sign_transaction: the session's CardanoWallet already holds the keys.
+        All transactions are loaded in one query, validated and witnessed in
+        memory before any of them is saved, then written with a single
+        bulk_write, so a failure while signing leaves the whole batch BUILT.
+
+        Args:
+            transaction_ids: Transaction hashes (tx_hash), signed in this order
+            wallet_id: Wallet ID of the session (must own every transaction)
+            cardano_wallet: Unlocked wallet from the session
+
+        Returns:
+            TransactionMongo records with signed CBOR, in request order
+
+        Raises:
+            TransactionNotFoundError: A transaction doesn't exist
+            TransactionNotOwnedError: Wallet doesn't own a transaction
+            InvalidTransactionStateError: A transaction is not in BUILT state
+        """
+        # Preserve request order, ignoring repeated hashes
+        transaction_ids = list(dict.fromkeys(transaction_ids))
+
+        if self.database is not None:
+            collection = self._get_transaction_collection()
+            tx_dicts = await collection.find({"_id": {"$in": transaction_ids}}).to_list(length=None)
+            found = {
+                tx.tx_hash: tx
+                for tx in (TransactionMongo.model_validate(_prepare_tx_dict_for_validation(d)) for d in tx_dicts)
+            }
+        else:
+            found = {}
+            for transaction_id in transaction_ids:
+                transaction = await TransactionMongo.find_one(TransactionMongo.tx_hash == transaction_id)
+                if transaction:
+                    found[transaction.tx_hash] = transaction
+
+        missing = [transaction_id for transaction_id in transaction_ids if transaction_id not in found]
+        if missing:
+            raise TransactionNotFoundError(f"Transactions not found: {', '.join(missing)}")
+
+        transactions = [found[transaction_id] for transaction_id in transaction_ids]
+        for transaction in transactions:
+            if transaction.wallet_id != wallet_id:
+                raise TransactionNotOwnedError(f"You don't own transaction {transaction.tx_hash}")
+            if transaction.status != TransactionStatus.BUILT.value:
+                raise InvalidTransactionStateError(
+                    f"Transaction {transaction.tx_hash} must be in BUILT state, currently: {transaction.status}"
+                )
+        # Reject the whole batch before witnessing any of it
+        unsignable = [transaction.tx_hash for transaction in transactions if not transaction.unsigned_cbor]
+        if unsignable:
+            raise InvalidTransactionStateError(f"Transactions have no unsigned CBOR to sign: {', '.join(unsignable)}")
+
+        for transaction in transactions:
+            self._apply_signature(transaction, cardano_wallet)
+
+        if self.database is not None:
+            await self._get_transaction_collection().bulk_write(
+                [
+                    ReplaceOne({"_id": transaction.tx_hash}, self._transaction_document(transaction), upsert=True)
+                    for transaction in transactions
+                ],
+                ordered=True,
+            )
+        else:
+            for transaction in transactions:
+                await transaction.save()
+
+        return transactions
+
+    def _apply_signature(self, transaction: TransactionMongo, cardano_wallet: CardanoWallet) -> None:
+        """Witness a BUILT transaction with the wallet's payment key and mark it SIGNED (not saved)."""
+        if not transaction.unsigned_cbor:
+            raise InvalidTransactionStateError(f"Transaction {transaction.tx_hash} has no unsigned CBOR to sign")
 
         # Get signing key for the enterprise address (index 0)
         signing_key = cardano_wallet.get_signing_key(0)
@@ -745,20 +1100,14 @@ class MongoTransactionService:
         # Cardano allows this because the transaction body (which determines the ID)
         # doesn't change when adding witnesses.
 
-        # Clear sensitive data immediately
-        del mnemonic
-        del cardano_wallet
         del signing_key
 
-        # Update transaction in MongoDB (keep original tx_hash!)
+        # Update transaction record; the caller saves it (keep original tx_hash!)
         transaction.signed_cbor = signed_cbor
         transaction.status = TransactionStatus.SIGNED.value
         transaction.fee_lovelace = int(unsigned_tx_body.fee)
         transaction.updated_at = datetime.now(timezone.utc).replace(tzinfo=None)
 
-        await self._save_transaction(transaction)
-        return transaction
-
     async def submit_transaction(
         self,
         transaction_id: str,
@@ -797,28 +1146,39 @@ class MongoTransactionService:
                 f"Transaction must be in SIGNED state, currently: {transaction.status}"
             )
 
-        # Create chain context
-        blockfrost_api_key = os.getenv("blockfrost_api_key")
-        if not blockfrost_api_key:
-            raise Exception("Missing blockfrost_api_key environment variable")
+        chain_context = get_chain_context_for_network(network)
 
-        chain_context = CardanoChainContext(network=network, blockfrost_api_key=blockfrost_api_key)
-        context = chain_context.get_context()
+        # Hold the inputs until the tracker confirms or fails the transaction.
+        # Re-reserving also catches a lease that expired and was taken by another build.
+        reservations = UtxoReservationLedger(self.database)
+        signed_body = pc.Transaction.from_cbor(transaction.signed_cbor).transaction_body
+        try:
+            await reservations.reserve_transaction(
+                signed_body, transaction.tx_hash, wallet_id, ttl_seconds=settings.confirmation_give_up_seconds
+            )
+        except UtxoReservationConflictError as e:
+            transaction.status = TransactionStatus.FAILED.value
+            transaction.error_message = str(e)
+            transaction.updated_at = datetime.now(timezone.utc).replace(tzinfo=None)
+            await self._save_transaction(transaction)
+            raise
 
         # Submit raw CBOR hex directly — avoids parsing and re-serializing the
         # Transaction object, which would re-sort inputs and change the body hash.
         try:
-            context.submit_tx(transaction.signed_cbor)
+            await chain_context.get_provider().submit_tx(transaction.signed_cbor)
         except Exception as e:
             # Update with error
             transaction.status = TransactionStatus.FAILED.value
             transaction.error_message = str(e)
             transaction.updated_at = datetime.now(timezone.utc).replace(tzinfo=None)
             await self._save_transaction(transaction)
+            await reservations.release(transaction.tx_hash)
             raise Exception(f"Failed to submit transaction: {str(e)}")
 
         # Update transaction
         transaction.status = TransactionStatus.SUBMITTED.value
+        transaction.network = network
         transaction.submitted_at = datetime.now(timezone.utc).replace(tzinfo=None)
         transaction.updated_at = datetime.now(timezone.utc).replace(tzinfo=None)
 
@@ -0,0 +1,294 @@
+"""
+UTxO Cache
+
+Shared, address-keyed UTxO cache in front of the async chain provider.
+
+A single API flow (e.g. mint grey → get_contract_datum → enrich_contract_status)
+queries the same script and wallet addresses several times within seconds.
+Entries live for a short TTL and are invalidated immediately when a submitted
+transaction spends an input from, or pays an output to, a cached address.
+
+- Optional per-tenant memory limit (entries are charged to the tenant that
+  loaded them; least recently used entries are evicted first)
+- Hit/miss/invalidation counters (stats expose only aggregate memory use)
+- Concurrent misses for the same address share one provider request
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any, cast
+
+import pycardano as pc
+
+from api.config import settings
+from api.database.tenant_context import get_current_tenant
+from cardano_offchain.chain_provider import ChainProvider, utxo_to_json
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TENANT = "_default"
+
+
+@dataclass
+class _CacheEntry:
+    utxos: list[pc.UTxO]
+    expires_at: float
+    size: int
+    tenant: str
+
+
+@dataclass
+class UtxoCacheStats:
+    """Counters for the UTxO cache"""
+
+    hits: int = 0
+    misses: int = 0
+    invalidations: int = 0
+    evictions: int = 0
+    tenant_bytes: dict[str, int] = field(default_factory=dict)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Stats as a JSON-serializable dict"""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            "invalidations": self.invalidations,
+            "evictions": self.evictions,
+            # Aggregates only: this is served on the unauthenticated /health endpoint
+            "cached_bytes": sum(self.tenant_bytes.values()),
+            "tenant_count": len(self.tenant_bytes),
+        }
+
+
+class UtxoCache:
+    """Address → UTxO list cache with TTL, per-tenant memory limits and invalidation"""
+
+    def __init__(self, ttl_seconds: float = 10.0, tenant_max_bytes: int = 0):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl_seconds: How long an address's UTxO set is served from cache
+            tenant_max_bytes: Memory budget per tenant (0 = unlimited)
+        """
+        self.ttl_seconds = ttl_seconds
+        self.tenant_max_bytes = tenant_max_bytes
+        self.stats = UtxoCacheStats()
+        self._entries: OrderedDict[str, _CacheEntry] = OrderedDict()
+        # "tx_hash#index" -> address, to find which cached addresses a tx spends from
+        self._input_index: dict[str, str] = {}
+        # Addresses invalidated while their load was in flight; that load's result is not cached
+        self._invalidated_loads: set[str] = set()
+        self._loading: dict[str, asyncio.Future[list[pc.UTxO]]] = {}
+
+    @staticmethod
+    def _input_key(tx_input: pc.TransactionInput) -> str:
+        return f"{tx_input.transaction_id.payload.hex()}#{tx_input.index}"
+
+    @staticmethod
+    def _estimate_size(utxos: list[pc.UTxO]) -> int:
+        return sum(len(u.output.to_cbor()) + 40 for u in utxos)
+
+    def get(self, address: str) -> list[pc.UTxO] | None:
+        """Cached UTxOs for an address, or None on miss/expiry"""
+        entry = self._entries.get(address)
+        if entry is None:
+            return None
+        if entry.expires_at <= time.monotonic():
+            self._remove(address)
+            return None
+        self._entries.move_to_end(address)
+        return entry.utxos
+
+    def put(self, address: str, utxos: list[pc.UTxO], tenant: str | None = None) -> None:
+        """Store an address's UTxO set"""
+        tenant = tenant or DEFAULT_TENANT
+        self._remove(address)
+        entry = _CacheEntry(
+            utxos=utxos, expires_at=time.monotonic() + self.ttl_seconds, size=self._estimate_size(utxos), tenant=tenant
+        )
+        if self.tenant_max_bytes and entry.size > self.tenant_max_bytes:
+            return  # Larger than the whole budget, don't cache
+        self._entries[address] = entry
+        self.stats.tenant_bytes[tenant] = self.stats.tenant_bytes.get(tenant, 0) + entry.size
+        for utxo in utxos:
+            self._input_index[self._input_key(utxo.input)] = address
+        self._enforce_tenant_limit(tenant)
+
+    def _remove(self, address: str) -> None:
+        entry = self._entries.pop(address, None)
+        if entry is None:
+            return
+        remaining = self.stats.tenant_bytes.get(entry.tenant, 0) - entry.size
+        if remaining > 0:
+            self.stats.tenant_bytes[entry.tenant] = remaining
+        else:
+            self.stats.tenant_bytes.pop(entry.tenant, None)
+        for utxo in entry.utxos:
+            self._input_index.pop(self._input_key(utxo.input), None)
+
+    def _enforce_tenant_limit(self, tenant: str) -> None:
+        if not self.tenant_max_bytes:
+            return
+        for address in list(self._entries):
+            if self.stats.tenant_bytes.get(tenant, 0) <= self.tenant_max_bytes:
+                return
+            if self._entries[address].tenant == tenant:
+                self._remove(address)
+                self.stats.evictions += 1
+
+    def invalidate(self, address: str) -> None:
+        """Drop an address's cached UTxOs (and any in-flight load result)"""
+        if address in self._loading:
+            self._invalidated_loads.add(address)
+        if address in self._entries:
+            self._remove(address)
+            self.stats.invalidations += 1
+
+    def invalidate_transaction(self, tx: pc.Transaction) -> set[str]:
+        """
+        Invalidate every cached address a transaction spends from or pays to.
+
+        Inputs are mapped to addresses through cached entries only, so an input
+        from an address whose first load is still in flight can't be traced;
+        every in-flight load is therefore discarded rather than cached.
+
+        Returns:
+            The cached addresses that were invalidated
+        """
+        self._invalidated_loads.update(self._loading)
+        touched = set()
+        for tx_input in tx.transaction_body.inputs:
+            address = self._input_index.get(self._input_key(tx_input))
+            if address is not None:
+                touched.add(address)
+        for output in tx.transaction_body.outputs:
+            touched.add(str(output.address))
+        for address in touched:
+            self.invalidate(address)
+        return touched
+
+    def clear(self) -> None:
+        """Drop all entries"""
+        for address in list(self._entries):
+            self.invalidate(address)
+
+    async def get_or_load(self, address: str, loader: Callable[[str], Awaitable[list[pc.UTxO]]]) -> list[pc.UTxO]:
+        """
+        Serve from cache or load through `loader` (an async callable taking the address).
+
+        Concurrent misses for the same address share a single load.
+        """
+        cached = self.get(address)
+        if cached is not None:
+            self.stats.hits += 1
+            return cached
+        self.stats.misses += 1
+
+        pending = self._loading.get(address)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        future = asyncio.ensure_future(loader(address))
+        self._loading[address] = future
+        try:
+            utxos = await asyncio.shield(future)
+        finally:
+            self._loading.pop(address, None)
+            invalidated = address in self._invalidated_loads
+            self._invalidated_loads.discard(address)
+
+        if not invalidated:
+            self.put(address, utxos, get_current_tenant())
+        return utxos
+
+
+class CachedChainProvider(ChainProvider):
+    """ChainProvider decorator that serves address UTxO queries from a UtxoCache"""
+
+    def __init__(self, provider: ChainProvider, cache: "UtxoCache"):
+        self.provider = provider
+        self.cache = cache
+
+    async def utxos(self, address: str | pc.Address) -> list[pc.UTxO]:
+        return list(await self.cache.get_or_load(str(address), self.provider.utxos))
+
+    async def address_utxos(self, address: str) -> list[dict]:
+        return [utxo_to_json(u) for u in await self.utxos(address)]
+
+    async def submit_tx(self, cbor: bytes | str) -> str:
+        tx_hash = await self.provider.submit_tx(cbor)
+        try:
+            tx = pc.Transaction.from_cbor(cbor)
+            touched = self.cache.invalidate_transaction(tx)
+            logger.debug(f"Submitted {tx_hash}: invalidated UTxO cache for {len(touched)} addresses")
+        except Exception as e:
+            # Unparseable CBOR can't tell us which addresses changed; fall back to a full flush
+            logger.warning(f"Could not decode submitted tx {tx_hash} for cache invalidation: {e}")
+            self.cache.clear()
+        return cast(str, tx_hash)
+
+    async def address(self, address: str) -> dict:
+        return cast(dict, await self.provider.address(address))
+
+    async def address_transactions(
+        self,
+        address: str,
+        count: int = 100,
+        page: int = 1,
+        order: str = "desc",
+        from_block: str | None = None,
+        to_block: str | None = None,
+    ) -> list[dict]:
+        return cast(
+            list[dict], await self.provider.address_transactions(address, count, page, order, from_block, to_block)
+        )
+
+    async def transaction(self, tx_hash: str) -> dict:
+        return cast(dict, await self.provider.transaction(tx_hash))
+
+    async def transaction_utxos(self, tx_hash: str) -> dict:
+        return cast(dict, await self.provider.transaction_utxos(tx_hash))
+
+    async def transaction_metadata(self, tx_hash: str) -> list[dict]:
+        return cast(list[dict], await self.provider.transaction_metadata(tx_hash))
+
+    async def protocol_params(self) -> dict:
+        return cast(dict, await self.provider.protocol_params())
+
+    async def block_latest(self) -> dict:
+        return cast(dict, await self.provider.block_latest())
+
+    async def asset(self, asset_id: str) -> dict:
+        return cast(dict, await self.provider.asset(asset_id))
+
+    async def assets_policy(self, policy_id: str, count: int = 100, page: int = 1, order: str = "asc") -> list[dict]:
+        return cast(list[dict], await self.provider.assets_policy(policy_id, count, page, order))
+
+    async def close(self) -> None:
+        await self.provider.close()
+
+
+# Global UTxO caches, one per network (preview and preprod share address prefixes)
+_utxo_caches: dict[str, UtxoCache] = {}
+
+
+def get_utxo_cache(network: str) -> UtxoCache:
+    """Get or create the global UTxO cache for a network"""
+    if network not in _utxo_caches:
+        _utxo_caches[network] = UtxoCache(
+            ttl_seconds=settings.utxo_cache_ttl_seconds, tenant_max_bytes=settings.utxo_cache_tenant_max_bytes
+        )
+    return _utxo_caches[network]
+
+
+def get_utxo_cache_stats() -> dict[str, dict[str, Any]]:
+    """Stats of every UTxO cache, keyed by network"""
+    return {network: cache.stats.snapshot() for network, cache in _utxo_caches.items()}
@@ -0,0 +1,238 @@
+"""
+UTxO Reservation Ledger
+
+Per-tenant leases on the UTxOs spent by transactions we built, stored in the
+tenant's "utxo_reservations" collection keyed by "tx_hash:index".
+
+Between BUILT and SUBMITTED (and until the chain reflects the spend) the
+provider still reports a transaction's inputs as unspent, so without a lease
+a concurrent build picks the same inputs and the later submission fails.
+
+- Builders skip UTxOs with an active lease and lease the inputs of every
+  transaction they build (acquisition is atomic per UTxO; a conflicting
+  lease fails the build instead of producing a double spend)
+- Leases expire after settings.utxo_lease_ttl_seconds; submission extends
+  them until the transaction is confirmed or fails, when they are released
+  (a confirmed transaction keeps its leases on outputs of our still-SUBMITTED
+  transactions, which chaining would otherwise offer again)
+- Outputs of our own SUBMITTED transactions are offered as spendable before
+  they confirm (chaining), so one wallet can issue several transactions per
+  block
+"""
+
+import logging
+from collections.abc import Iterable
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+import pycardano as pc
+from motor.motor_asyncio import AsyncIOMotorCollection, AsyncIOMotorDatabase
+from pymongo import UpdateOne
+from pymongo.asynchronous.collection import AsyncCollection
+from pymongo.errors import BulkWriteError
+
+from api.config import settings
+from api.database.models import TransactionMongo, UtxoReservationMongo
+from api.enums import TransactionStatus
+
+
+logger = logging.getLogger(__name__)
+
+COLLECTION_NAME = "utxo_reservations"
+DUPLICATE_KEY = 11000
+
+
+class UtxoReservationConflictError(Exception):
+    """Inputs are leased by another in-flight transaction"""
+
+    def __init__(self, refs: list[str]):
+        self.refs = refs
+        super().__init__(
+            f"{len(refs)} input(s) already reserved by another in-flight transaction "
+            f"({', '.join(refs[:3])}{'...' if len(refs) > 3 else ''}); rebuild the transaction"
+        )
+
+
+def utxo_ref(utxo: pc.UTxO) -> str:
+    """Lease key of a UTxO ("tx_hash:index", as used for reserved compilation UTxOs)"""
+    return input_ref(utxo.input)
+
+
+def input_ref(tx_input: pc.TransactionInput) -> str:
+    """Lease key of a transaction input"""
+    return f"{tx_input.transaction_id.payload.hex()}:{tx_input.index}"
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+class UtxoReservationLedger:
+    """Reads and writes the per-tenant UTxO reservation ledger"""
+
+    def __init__(self, database: AsyncIOMotorDatabase | None = None):
+        """
+        Initialize the ledger.
+
+        Args:
+            database: Tenant MongoDB database (falls back to Beanie when None)
+        """
+        self.database = database
+
+    def _get_collection(self) -> AsyncIOMotorCollection | AsyncCollection[Any]:
+        if self.database is not None:
+            return self.database.get_collection(COLLECTION_NAME)
+        return UtxoReservationMongo.get_pymongo_collection()
+
+    def _get_transaction_collection(self) -> AsyncIOMotorCollection | AsyncCollection[Any]:
+        if self.database is not None:
+            return self.database.get_collection("transactions")
+        return TransactionMongo.get_pymongo_collection()
+
+    async def leased_refs(self, refs: Iterable[str]) -> set[str]:
+        """The refs among `refs` holding an active lease"""
+        refs = list(set(refs))
+        if not refs:
+            return set()
+        cursor = self._get_collection().find({"_id": {"$in": refs}, "expires_at": {"$gt": _now()}}, {"_id": 1})
+        return {doc["_id"] for doc in await cursor.to_list(length=None)}
+
+    async def reserve(
+        self, tx_hash: str, refs: Iterable[str], wallet_id: str | None = None, ttl_seconds: float | None = None
+    ) -> None:
+        """
+        Lease UTxOs for a transaction.
+
+        Idempotent for the same transaction (re-reserving renews the lease).
+        Each UTxO is acquired atomically: an active lease held by another
+        transaction makes its upsert collide on _id.
+
+        Args:
+            tx_hash: Transaction spending the UTxOs
+            refs: "tx_hash:index" of each input
+            wallet_id: Wallet that built the transaction
+            ttl_seconds: Lease duration (default: settings.utxo_lease_ttl_seconds)
+
+        Raises:
+            UtxoReservationConflictError: Some UTxOs are leased by another transaction
+                (no lease is kept for this transaction)
+        """
+        refs = list(dict.fromkeys(refs))
+        if not refs:
+            return
+        now = _now()
+        expires_at = now + timedelta(seconds=ttl_seconds or settings.utxo_lease_ttl_seconds)
+        operations = [
+            UpdateOne(
+                {"_id": ref, "$or": [{"tx_hash": tx_hash}, {"expires_at": {"$lte": now}}]},
+                {
+                    "$set": {"tx_hash": tx_hash, "wallet_id": wallet_id, "expires_at": expires_at},
+                    "$setOnInsert": {"created_at": now},
+                },
+                upsert=True,
+            )
+            for ref in refs
+        ]
+        try:
+            await self._get_collection().bulk_write(operations, ordered=False)
+        except BulkWriteError as e:
+            errors = e.details.get("writeErrors", [])
+            if not errors or any(error.get("code") != DUPLICATE_KEY for error in errors):
+                raise
+            await self.release(tx_hash)
+            raise UtxoReservationConflictError([refs[error["index"]] for error in errors]) from e
+
+    async def reserve_transaction(
+        self, tx_body: pc.TransactionBody, tx_hash: str, wallet_id: str | None = None, ttl_seconds: float | None = None
+    ) -> None:
+        """Lease every input of a built transaction (see reserve)"""
+        await self.reserve(tx_hash, [input_ref(tx_input) for tx_input in tx_body.inputs], wallet_id, ttl_seconds)
+
+    async def release(self, tx_hash: str) -> int:
+        """Release a transaction's leases; returns the number released"""
+        result = await self._get_collection().delete_many({"tx_hash": tx_hash})
+        return result.deleted_count
+
+    async def release_many(self, tx_hashes: Iterable[str]) -> int:
+        """Release the leases of many transactions in one delete"""
+        tx_hashes = list(tx_hashes)
+        if not tx_hashes:
+            return 0
+        result = await self._get_collection().delete_many({"tx_hash": {"$in": tx_hashes}})
+        return result.deleted_count
+
+    async def release_confirmed(self, tx_hashes: Iterable[str]) -> int:
+        """
+        Release the leases of confirmed transactions.
+
+        Leases on outputs of our own SUBMITTED transactions are kept: the
+        confirmation tracker checks each transaction on its own backoff, so a
+        parent can still be SUBMITTED after the child spending its output has
+        confirmed, and pending_outputs would offer that spent output again.
+        Kept leases expire with their TTL.
+        """
+        tx_hashes = list(tx_hashes)
+        if not tx_hashes:
+            return 0
+        collection = self._get_collection()
+        leases = await collection.find({"tx_hash": {"$in": tx_hashes}}, {"_id": 1}).to_list(length=None)
+        parents = list({doc["_id"].partition(":")[0] for doc in leases})
+        cursor = self._get_transaction_collection().find(
+            {"_id": {"$in": parents}, "status": TransactionStatus.SUBMITTED.value}, {"_id": 1}
+        )
+        pending_parents = {doc["_id"] for doc in await cursor.to_list(length=None)}
+        refs = [doc["_id"] for doc in leases if doc["_id"].partition(":")[0] not in pending_parents]
+        if not refs:
+            return 0
+        result = await collection.delete_many({"_id": {"$in": refs}, "tx_hash": {"$in": tx_hashes}})
+        return result.deleted_count
+
+    async def pending_outputs(self, address: str, network: str | None = None) -> list[pc.UTxO]:
+        """
+        Outputs paying `address` from our SUBMITTED (not yet confirmed) transactions.
+
+        Decoded from the signed CBOR, so datums, scripts and assets are exact.
+        """
+        query = {"outputs.address": address, "status": TransactionStatus.SUBMITTED.value}
+        if network is not None:
+            query["network"] = network
+        cursor = self._get_transaction_collection().find(query, {"signed_cbor": 1})
+
+        utxos = []
+        for doc in await cursor.to_list(length=None):
+            if not doc.get("signed_cbor"):
+                continue
+            try:
+                tx = pc.Transaction.from_cbor(doc["signed_cbor"])
+            except Exception as e:
+                logger.warning(f"Skipping pending outputs of {doc['_id']}: undecodable CBOR ({e})")
+                continue
+            tx_id = pc.TransactionId(bytes.fromhex(doc["_id"]))
+            for index, output in enumerate(tx.transaction_body.outputs):
+                if str(output.address) == address:
+                    utxos.append(pc.UTxO(pc.TransactionInput(tx_id, index), output))
+        return utxos
+
+    async def available_utxos(
+        self, address: str, utxos: list[pc.UTxO], network: str | None = None, chain_pending: bool = True
+    ) -> list[pc.UTxO]:
+        """
+        UTxOs a new transaction from `address` may spend.
+
+        On-chain UTxOs plus pending outputs of our submitted transactions
+        (when chaining is enabled), minus everything under an active lease.
+
+        Args:
+            address: Wallet address the UTxOs belong to
+            utxos: On-chain UTxOs at the address
+            network: Network the pending transactions were submitted to
+            chain_pending: Include pending outputs. Pass False for transactions
+                           whose scripts are evaluated by Blockfrost, which
+                           cannot resolve unconfirmed inputs.
+        """
+        candidates = list(utxos)
+        if chain_pending and settings.utxo_chaining_enabled:
+            known = {utxo_ref(u) for u in candidates}
+            candidates += [u for u in await self.pending_outputs(address, network) if utxo_ref(u) not in known]
+        leased = await self.leased_refs(utxo_ref(u) for u in candidates)
+        return [u for u in candidates if utxo_ref(u) not in leased]
@@ -0,0 +1,112 @@
+"""
+Wallet Balances
+
+Multi-asset balance and UTxO aggregation across many wallet addresses.
+
+- Totals come from the address summary endpoint (/addresses/{address}): one
+  request per address however many UTxOs it holds
+- UTxO listings follow every page (ChainProvider.address_utxos)
+- Addresses are queried concurrently through the shared enrichment engine,
+  so the process-wide provider concurrency cap and 429 retries apply
+- Every amount is counted: lovelace and each native asset unit
+"""
+
+import logging
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+
+from api.services.chain_enrichment import EnrichmentEngine, get_enrichment_engine
+from cardano_offchain.chain_provider import ChainProvider, ChainProviderError
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class AddressBalance:
+    """Lovelace and native asset totals held at one address"""
+
+    address: str
+    lovelace: int = 0
+    assets: dict[str, int] = field(default_factory=dict)  # unit (policy id + asset name hex) -> quantity
+    error: str | None = None  # set when the address could not be queried
+
+
+def split_amounts(amounts: Iterable[dict]) -> tuple[int, dict[str, int]]:
+    """Split a Blockfrost amount list into lovelace and {unit: quantity} of native assets"""
+    lovelace = 0
+    assets: dict[str, int] = {}
+    for amount in amounts:
+        if amount["unit"] == "lovelace":
+            lovelace += int(amount["quantity"])
+        else:
+            assets[amount["unit"]] = assets.get(amount["unit"], 0) + int(amount["quantity"])
+    return lovelace, assets
+
+
+def total_balance(balances: Iterable[AddressBalance]) -> tuple[int, dict[str, int]]:
+    """Sum lovelace and per-asset quantities over many addresses"""
+    lovelace = 0
+    assets: dict[str, int] = {}
+    for balance in balances:
+        lovelace += balance.lovelace
+        for unit, quantity in balance.assets.items():
+            assets[unit] = assets.get(unit, 0) + quantity
+    return lovelace, assets
+
+
+async def fetch_address_balances(
+    provider: ChainProvider, addresses: Sequence[str], engine: EnrichmentEngine | None = None
+) -> list[AddressBalance]:
+    """
+    Query the totals of many addresses concurrently.
+
+    Unused addresses (404) have a zero balance. Other failures are reported
+    on the entry (error) with a zero balance instead of failing the batch.
+
+    Returns:
+        One AddressBalance per address, in input order
+    """
+    engine = engine or get_enrichment_engine()
+
+    async def load(address: str) -> AddressBalance:
+        try:
+            summary = await engine.call(provider.address, address)
+        except ChainProviderError as e:
+            if e.not_found:
+                return AddressBalance(address=address)
+            raise
+        lovelace, assets = split_amounts(summary.get("amount", []))
+        return AddressBalance(address=address, lovelace=lovelace, assets=assets)
+
+    results = await engine.map(addresses, load)
+    balances = []
+    for address, result in zip(addresses, results, strict=True):
+        if isinstance(result, Exception):
+            logger.warning(f"Balance query for {address} failed: {type(result).__name__}: {result}")
+            result = AddressBalance(address=address, error=str(result) or type(result).__name__)
+        balances.append(result)
+    return balances
+
+
+async def fetch_address_utxos(
+    provider: ChainProvider, addresses: Sequence[str], engine: EnrichmentEngine | None = None
+) -> list[tuple[str, list[dict]]]:
+    """
+    List the UTxOs (all pages) of many addresses concurrently.
+
+    Addresses that fail to load are logged and returned with no UTxOs.
+
+    Returns:
+        (address, Blockfrost-shaped UTxOs) per address, in input order
+    """
+    engine = engine or get_enrichment_engine()
+
+    results = await engine.map(addresses, lambda address: engine.call(provider.address_utxos, address))
+    utxos = []
+    for address, result in zip(addresses, results, strict=True):
+        if isinstance(result, Exception):
+            logger.warning(f"UTxO query for {address} failed: {type(result).__name__}: {result}")
+            result = []
+        utxos.append((address, result))
+    return utxos
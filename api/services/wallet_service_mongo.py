@@ -9,13 +9,22 @@ from datetime import datetime, timezone
 from typing import Any
 
 import pycardano as pc
-from blockfrost import ApiError, BlockFrostApi
 from cryptography.fernet import InvalidToken
 
 from api.database.models import WalletMongo, WalletSessionMongo
 from api.enums import NetworkType, WalletRole
+from api.services.address_registry import AddressRegistry
+from api.services.crypto_executor import CryptoQueueFullError, get_crypto_executor
+from api.services.wallet_balances import (
+    AddressBalance,
+    fetch_address_balances,
+    fetch_address_utxos,
+    split_amounts,
+    total_balance,
+)
 from api.utils.encryption import decrypt_mnemonic, encrypt_mnemonic
 from api.utils.password import hash_password, needs_rehash, validate_password_strength, verify_password
+from cardano_offchain.chain_provider import ChainProvider
 from cardano_offchain.wallet import CardanoWallet
 
 
@@ -185,14 +194,16 @@ class MongoWalletService:
         # Generate 24-word mnemonic (256-bit entropy)
         mnemonic = pc.HDWallet.generate_mnemonic(strength=256)
 
+        crypto = get_crypto_executor()
+
         # Create CardanoWallet to get addresses
-        cardano_wallet = CardanoWallet(mnemonic, network.value)
+        cardano_wallet = await crypto.run(CardanoWallet, mnemonic, network.value)
 
         # Encrypt mnemonic with password
-        encrypted_mnemonic, salt = encrypt_mnemonic(mnemonic, password)
+        encrypted_mnemonic, salt = await crypto.run(encrypt_mnemonic, mnemonic, password)
 
         # Hash password
-        password_hash_str = hash_password(password)
+        password_hash_str = await crypto.run(hash_password, password)
 
         # Get payment key hash as hex string
         payment_key_hash = cardano_wallet.get_payment_verification_key_hash().hex()
@@ -225,6 +236,9 @@ class MongoWalletService:
         else:
             await wallet.insert()
 
+        # Persist derived addresses for key-free address -> wallet lookups
+        await AddressRegistry(self.database).register_wallet(wallet.id, cardano_wallet)
+
         # Return wallet and mnemonic (user must save mnemonic!)
         return wallet, mnemonic
 
@@ -269,17 +283,21 @@ class MongoWalletService:
             import logging
             logging.info(f"Auto-promoting first imported wallet '{name}' to CORE role for tenant")
 
+        crypto = get_crypto_executor()
+
         # Validate mnemonic by trying to create a wallet
         try:
-            cardano_wallet = CardanoWallet(mnemonic, network.value)
+            cardano_wallet = await crypto.run(CardanoWallet, mnemonic, network.value)
+        except CryptoQueueFullError:
+            raise
         except Exception as e:
             raise InvalidMnemonicError(f"Invalid mnemonic: {e}") from e
 
         # Encrypt mnemonic with password
-        encrypted_mnemonic, salt = encrypt_mnemonic(mnemonic, password)
+        encrypted_mnemonic, salt = await crypto.run(encrypt_mnemonic, mnemonic, password)
 
         # Hash password
-        password_hash_str = hash_password(password)
+        password_hash_str = await crypto.run(hash_password, password)
 
         # Get payment key hash as hex string
         payment_key_hash = cardano_wallet.get_payment_verification_key_hash().hex()
@@ -312,6 +330,9 @@ class MongoWalletService:
         else:
             await wallet.insert()
 
+        # Persist derived addresses for key-free address -> wallet lookups
+        await AddressRegistry(self.database).register_wallet(wallet.id, cardano_wallet)
+
         return wallet
 
     async def is_wallet_locked(self, payment_key_hash: str) -> bool:
@@ -391,25 +412,29 @@ class MongoWalletService:
         if not wallet:
             raise WalletNotFoundError(f"Wallet with PKH {payment_key_hash} not found")
 
+        crypto = get_crypto_executor()
+
         # Verify password
-        if not verify_password(password, wallet.password_hash):
+        if not await crypto.run(verify_password, password, wallet.password_hash):
             raise InvalidPasswordError("Incorrect password")
 
         # Check if password hash needs rehashing (security upgrade)
         if needs_rehash(wallet.password_hash):
             # Rehash password with updated parameters
-            wallet.password_hash = hash_password(password)
+            wallet.password_hash = await crypto.run(hash_password, password)
             await self._save_wallet(wallet)
 
         # Decrypt mnemonic
         try:
-            mnemonic = decrypt_mnemonic(wallet.mnemonic_encrypted, password, wallet.encryption_salt)
+            mnemonic = await crypto.run(decrypt_mnemonic, wallet.mnemonic_encrypted, password, wallet.encryption_salt)
         except (ValueError, InvalidToken) as e:
             raise InvalidPasswordError("Failed to decrypt mnemonic") from e
 
         # Create CardanoWallet instance
         try:
-            cardano_wallet = CardanoWallet(mnemonic, wallet.network)
+            cardano_wallet = await crypto.run(CardanoWallet, mnemonic, wallet.network)
+        except CryptoQueueFullError:
+            raise
         except Exception as e:
             raise InvalidMnemonicError(f"Failed to create wallet from stored mnemonic: {e}") from e
 
@@ -419,6 +444,11 @@ class MongoWalletService:
         wallet.updated_at = datetime.now(timezone.utc).replace(tzinfo=None)
         await self._save_wallet(wallet)
 
+        # Backfill the address registry for wallets created before it existed
+        registry = AddressRegistry(self.database)
+        if not await registry.is_registered(wallet.id):
+            await registry.register_wallet(wallet.id, cardano_wallet)
+
         return wallet, cardano_wallet
 
     async def get_active_sessions(self, payment_key_hash: str) -> list[WalletSessionMongo]:
@@ -546,11 +576,12 @@ class MongoWalletService:
             raise PermissionDeniedError("User wallets cannot delete core wallets")
 
         # Verify password
-        if not verify_password(password, wallet.password_hash):
+        if not await get_crypto_executor().run(verify_password, password, wallet.password_hash):
             raise InvalidPasswordError("Incorrect password")
 
-        # Delete wallet
+        # Delete wallet and its registered addresses
         await self._delete_wallet(wallet)
+        await AddressRegistry(self.database).remove_wallet(wallet.id)
 
         return True
 
@@ -575,8 +606,10 @@ class MongoWalletService:
         if not wallet:
             raise WalletNotFoundError(f"Wallet with PKH {payment_key_hash} not found")
 
+        crypto = get_crypto_executor()
+
         # Verify current password
-        if not verify_password(current_password, wallet.password_hash):
+        if not await crypto.run(verify_password, current_password, wallet.password_hash):
             raise InvalidPasswordError("Incorrect current password")
 
         # Validate new password strength
@@ -584,15 +617,17 @@ class MongoWalletService:
 
         # Decrypt with current password
         try:
-            mnemonic = decrypt_mnemonic(wallet.mnemonic_encrypted, current_password, wallet.encryption_salt)
+            mnemonic = await crypto.run(
+                decrypt_mnemonic, wallet.mnemonic_encrypted, current_password, wallet.encryption_salt
+            )
         except (ValueError, InvalidToken) as e:
             raise InvalidPasswordError("Failed to decrypt mnemonic") from e
 
         # Re-encrypt with new password
-        encrypted_mnemonic, salt = encrypt_mnemonic(mnemonic, new_password)
+        encrypted_mnemonic, salt = await crypto.run(encrypt_mnemonic, mnemonic, new_password)
 
         # Hash new password
-        password_hash_str = hash_password(new_password)
+        password_hash_str = await crypto.run(hash_password, new_password)
 
         # Update wallet
         wallet.mnemonic_encrypted = encrypted_mnemonic
@@ -624,7 +659,7 @@ class MongoWalletService:
         if not wallet:
             raise WalletNotFoundError(f"Wallet with PKH {payment_key_hash} not found")
 
-        if not verify_password(password, wallet.password_hash):
+        if not await get_crypto_executor().run(verify_password, password, wallet.password_hash):
             raise InvalidPasswordError("Incorrect password")
 
         existing = await self._find_wallet_by_name(new_name)
@@ -746,15 +781,18 @@ class MongoWalletService:
     async def get_wallet_balance(
         self,
         cardano_wallet: CardanoWallet,
-        blockfrost_api: BlockFrostApi,
+        provider: ChainProvider,
         limit_addresses: int = 5,
     ) -> dict[str, Any]:
         """
-        Get balance for wallet addresses.
+        Get multi-asset balance for wallet addresses.
+
+        The main addresses and the first derived addresses are queried
+        concurrently through the address totals endpoint.
 
         Args:
             cardano_wallet: Unlocked CardanoWallet instance
-            blockfrost_api: BlockFrost API instance
+            provider: Async chain provider
             limit_addresses: Number of derived addresses to check
 
         Returns:
@@ -762,10 +800,32 @@ class MongoWalletService:
             {
                 "main_addresses": {"enterprise": {...}, "staking": {...}},
                 "derived_addresses": [...],
-                "total_balance": int (lovelace)
+                "total_balance": int (lovelace),
+                "total_assets": {unit: int}
             }
         """
-        return cardano_wallet.check_balances(blockfrost_api, limit_addresses)
+        cardano_wallet.ensure_addresses(limit_addresses)
+        # Derived index 0 is the main payment key, already covered by the main addresses
+        derived = cardano_wallet.addresses[1 : limit_addresses + 1]
+        addresses = [str(cardano_wallet.enterprise_address), str(cardano_wallet.staking_address)]
+        addresses += [str(addr_info["enterprise_address"]) for addr_info in derived]
+
+        balances = await fetch_address_balances(provider, addresses)
+        enterprise, staking, derived_balances = balances[0], balances[1], balances[2:]
+        total_lovelace, total_assets = total_balance(balances)
+
+        def entry(balance: AddressBalance) -> dict[str, Any]:
+            return {"address": balance.address, "balance": balance.lovelace, "assets": balance.assets}
+
+        return {
+            "main_addresses": {"enterprise": entry(enterprise), "staking": entry(staking)},
+            "derived_addresses": [
+                {"index": addr_info["index"], **entry(balance)}
+                for addr_info, balance in zip(derived, derived_balances, strict=True)
+            ],
+            "total_balance": total_lovelace,
+            "total_assets": total_assets,
+        }
 
     async def get_wallet_addresses(
         self,
@@ -788,7 +848,7 @@ class MongoWalletService:
     async def get_wallet_utxos(
         self,
         cardano_wallet: CardanoWallet,
-        blockfrost_api: BlockFrostApi,
+        provider: ChainProvider,
         address_index: int | None = None,
         min_ada: float | None = None,
     ) -> dict[str, Any]:
@@ -797,7 +857,7 @@ class MongoWalletService:
 
         Args:
             cardano_wallet: Unlocked CardanoWallet instance
-            blockfrost_api: BlockFrost API instance
+            provider: Async chain provider
             address_index: Specific address index (None = all addresses)
             min_ada: Minimum ADA filter
 
@@ -809,72 +869,40 @@ class MongoWalletService:
                 "total_ada": float
             }
         """
-        utxos_list = []
-        total_lovelace = 0
-
         # Determine which addresses to check
-        addresses_to_check = []
         if address_index is not None:
-            # Check specific address
-            if address_index == 0:
-                addresses_to_check = [
-                    ("enterprise", str(cardano_wallet.enterprise_address)),
-                    ("staking", str(cardano_wallet.staking_address)),
-                ]
-            else:
-                # Generate the specific derived address
-                addr_info = cardano_wallet.generate_addresses(address_index)
-                if addr_info:
-                    addr = addr_info[-1]  # Get the last generated address
-                    addresses_to_check = [
-                        ("enterprise", str(addr["enterprise_address"])),
-                        ("staking", str(addr["staking_address"])),
-                    ]
-        else:
-            # Check all main addresses
+            # Check a specific address (index 0 = main addresses)
             addresses_to_check = [
-                ("enterprise", str(cardano_wallet.enterprise_address)),
-                ("staking", str(cardano_wallet.staking_address)),
+                str(cardano_wallet.get_address(address_index)),
+                str(cardano_wallet.get_address(address_index, use_staking=True)),
             ]
+        else:
+            # Check all main addresses
+            addresses_to_check = [str(cardano_wallet.enterprise_address), str(cardano_wallet.staking_address)]
+
+        utxos_list = []
+        total_lovelace = 0
 
-        # Query UTXOs for each address
-        for addr_type, address in addresses_to_check:
-            try:
-                utxos = blockfrost_api.address_utxos(address)
-                for utxo in utxos:
-                    # Extract lovelace amount
-                    lovelace_amount = 0
-                    tokens = []
-
-                    for amount in utxo.amount:
-                        if amount.unit == "lovelace":
-                            lovelace_amount = int(amount.quantity)
-                        else:
-                            tokens.append({
-                                "unit": amount.unit,
-                                "quantity": amount.quantity
-                            })
-
-                    ada_amount = lovelace_amount / 1_000_000
-
-                    # Apply min_ada filter
-                    if min_ada is not None and ada_amount < min_ada:
-                        continue
-
-                    utxos_list.append({
-                        "tx_hash": utxo.tx_hash,
-                        "output_index": utxo.output_index,
-                        "address": address,
-                        "amount_lovelace": lovelace_amount,
-                        "amount_ada": ada_amount,
-                        "tokens": tokens if tokens else None,
-                    })
-
-                    total_lovelace += lovelace_amount
-
-            except ApiError:
-                # Address might not exist on chain yet or have no UTXOs
-                continue
+        # Query UTXOs (all pages) for every address concurrently
+        for address, utxos in await fetch_address_utxos(provider, addresses_to_check):
+            for utxo in utxos:
+                lovelace_amount, tokens = split_amounts(utxo["amount"])
+                ada_amount = lovelace_amount / 1_000_000
+
+                # Apply min_ada filter
+                if min_ada is not None and ada_amount < min_ada:
+                    continue
+
+                utxos_list.append({
+                    "tx_hash": utxo["tx_hash"],
+                    "output_index": utxo["output_index"],
+                    "address": address,
+                    "amount_lovelace": lovelace_amount,
+                    "amount_ada": ada_amount,
+                    "tokens": [{"unit": unit, "quantity": str(quantity)} for unit, quantity in tokens.items()] or None,
+                })
+
+                total_lovelace += lovelace_amount
 
         return {
             "utxos": utxos_list,
@@ -4,8 +4,15 @@ Mock Services for API Testing
 Provides mock implementations of external services for isolated testing.
 """
 
+import copy
+from fractions import Fraction
+from types import SimpleNamespace
 from unittest.mock import MagicMock
 
+import pycardano as pc
+from pymongo import InsertOne, ReplaceOne, ReturnDocument, UpdateOne
+from pymongo.errors import BulkWriteError, DuplicateKeyError
+
 
 class MockBlockfrostAPI:
     """Mock Blockfrost API client for testing"""
@@ -165,3 +172,346 @@ class MockCardanoTransactions:
     def get_transaction_info(self, tx_hash: str) -> dict:
         """Mock transaction info"""
         return {"tx_hash": tx_hash, "explorer_url": self.chain_context.get_explorer_url(tx_hash)}
+
+
+PROTOCOL_PARAMS = pc.ProtocolParameters(
+    min_fee_constant=155381,
+    min_fee_coefficient=44,
+    max_block_size=90112,
+    max_tx_size=16384,
+    max_block_header_size=1100,
+    key_deposit=2_000_000,
+    pool_deposit=500_000_000,
+    pool_influence=Fraction(3, 10),
+    monetary_expansion=Fraction(3, 1000),
+    treasury_expansion=Fraction(1, 5),
+    decentralization_param=Fraction(0),
+    extra_entropy="",
+    protocol_major_version=9,
+    protocol_minor_version=0,
+    min_utxo=1_000_000,
+    min_pool_cost=170_000_000,
+    price_mem=Fraction(577, 10000),
+    price_step=Fraction(721, 10000000),
+    max_tx_ex_mem=14_000_000,
+    max_tx_ex_steps=10_000_000_000,
+    max_block_ex_mem=62_000_000,
+    max_block_ex_steps=20_000_000_000,
+    max_val_size=5000,
+    collateral_percent=150,
+    max_collateral_inputs=3,
+    coins_per_utxo_word=34482,
+    coins_per_utxo_byte=4310,
+    cost_models={},
+)
+
+
+class FixedChainContext(pc.ChainContext):
+    """Chain context with fixed protocol parameters and no UTxOs of its own"""
+
+    @property
+    def protocol_param(self):
+        return PROTOCOL_PARAMS
+
+    @property
+    def genesis_param(self):
+        return None
+
+    @property
+    def network(self):
+        return pc.Network.TESTNET
+
+    @property
+    def epoch(self):
+        return 100
+
+    @property
+    def last_block_slot(self):
+        return 1_000_000
+
+    def _utxos(self, address):
+        return []
+
+
+def _values(value, path):
+    """Values at a dotted path, descending into arrays the way MongoDB queries do"""
+    if not path:
+        return [value]
+    head, rest = path[0], path[1:]
+    if isinstance(value, list):
+        if head.isdigit():
+            index = int(head)
+            return _values(value[index], rest) if index < len(value) else []
+        return [found for item in value for found in _values(item, path)]
+    if isinstance(value, dict) and head in value:
+        return _values(value[head], rest)
+    return []
+
+
+def _condition_holds(values, condition):
+    """Whether any of the values satisfies every operator of a condition"""
+    candidates = values or [None]
+    candidates = candidates + [item for value in candidates if isinstance(value, list) for item in value]
+    for operator, operand in condition.items():
+        if operator == "$exists":
+            if bool(values) != bool(operand):
+                return False
+        elif operator == "$in":
+            if not any(value in operand for value in candidates):
+                return False
+        elif operator == "$nin":
+            if any(value in operand for value in candidates):
+                return False
+        elif operator == "$ne":
+            if any(value == operand for value in candidates):
+                return False
+        elif operator in _COMPARISONS:
+            compare = _COMPARISONS[operator]
+            if not any(value is not None and compare(value, operand) for value in candidates):
+                return False
+        else:
+            raise NotImplementedError(f"query operator {operator}")
+    return True
+
+
+_COMPARISONS = {
+    "$gt": lambda value, operand: value > operand,
+    "$gte": lambda value, operand: value >= operand,
+    "$lt": lambda value, operand: value < operand,
+    "$lte": lambda value, operand: value <= operand,
+}
+
+
+def _matches(doc, query):
+    """Subset of MongoDB query matching used by the services under test"""
+    for field, condition in query.items():
+        if field == "$or":
+            if not any(_matches(doc, option) for option in condition):
+                return False
+        elif field == "$and":
+            if not all(_matches(doc, option) for option in condition):
+                return False
+        elif isinstance(condition, dict) and all(key.startswith("$") for key in condition):
+            if not _condition_holds(_values(doc, field.split(".")), condition):
+                return False
+        elif not _condition_holds(_values(doc, field.split(".")), {"$in": [condition]}):
+            return False
+    return True
+
+
+def _project(doc, projection):
+    """Copy of a document restricted to a find() projection"""
+    doc = copy.deepcopy(doc)
+    if not projection:
+        return doc
+    if any(projection.values()):
+        kept = {field: doc[field] for field, value in projection.items() if value and field in doc and field != "_id"}
+        if projection.get("_id", 1) and "_id" in doc:
+            kept = {"_id": doc["_id"], **kept}
+        return kept
+    return {field: value for field, value in doc.items() if projection.get(field, 1)}
+
+
+def _sort_key(value):
+    # Missing fields sort first, as in MongoDB
+    return (value is not None, value)
+
+
+class FakeCursor:
+    """Motor cursor supporting sort, skip, limit, projection and async iteration"""
+
+    def __init__(self, docs, projection=None):
+        self.docs = list(docs)
+        self.projection = projection
+        self._skip = 0
+        self._limit = 0
+
+    def sort(self, key_or_list, direction=1):
+        keys = [(key_or_list, direction)] if isinstance(key_or_list, str) else list(key_or_list)
+        # Stable sorts applied from the least significant key keep MongoDB's compound order
+        for field, field_direction in reversed(keys):
+            self.docs.sort(
+                key=lambda doc, field=field: _sort_key(next(iter(_values(doc, field.split("."))), None)),
+                reverse=field_direction < 0,
+            )
+        return self
+
+    def skip(self, n):
+        self._skip = n
+        return self
+
+    def limit(self, n):
+        self._limit = n
+        return self
+
+    def _results(self):
+        docs = self.docs[self._skip :]
+        if self._limit:
+            docs = docs[: self._limit]
+        return [_project(doc, self.projection) for doc in docs]
+
+    async def to_list(self, length=None):
+        docs = self._results()
+        return docs[:length] if length else docs
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for doc in self._results():
+            yield doc
+
+
+def _apply_update(doc, update, inserting):
+    """Apply the update operators the services use to a stored document"""
+    for operator, fields in update.items():
+        for field, value in fields.items():
+            if operator == "$set" or (operator == "$setOnInsert" and inserting):
+                doc[field] = value
+            elif operator == "$inc":
+                doc[field] = doc.get(field, 0) + value
+            elif operator == "$max":
+                if field not in doc or doc[field] is None or value > doc[field]:
+                    doc[field] = value
+            elif operator == "$unset":
+                doc.pop(field, None)
+            elif operator != "$setOnInsert":
+                raise NotImplementedError(f"update operator {operator}")
+
+
+def _upserted(query):
+    """New document seeded from the equality fields of an upsert filter"""
+    return {field: value for field, value in query.items() if not field.startswith("$") and not isinstance(value, dict)}
+
+
+class FakeCollection:
+    """
+    In-memory collection with upsert-on-_id semantics close enough to MongoDB's.
+
+    Reads are recorded in ``reads`` as (method, query, projection) and bulk
+    writes in ``bulk_writes`` so tests can assert what reached the database.
+    """
+
+    def __init__(self, name=None):
+        self.name = name
+        self.docs = {}
+        self.reads = []
+        self.bulk_writes = []
+        self.indexes = []
+
+    def _matching(self, query):
+        return [doc for doc in self.docs.values() if _matches(doc, query)]
+
+    def _insert(self, doc):
+        if doc["_id"] in self.docs:
+            raise DuplicateKeyError(f"duplicate _id {doc['_id']}")
+        self.docs[doc["_id"]] = doc
+
+    def _update(self, query, update, upsert):
+        """Update the first matching document; returns (before, after, upserted_id)"""
+        matched = self._matching(query)
+        if matched:
+            before = copy.deepcopy(matched[0])
+            _apply_update(matched[0], update, inserting=False)
+            return before, matched[0], None
+        if not upsert:
+            return None, None, None
+        doc = _upserted(query)
+        _apply_update(doc, update, inserting=True)
+        self._insert(doc)
+        return None, doc, doc["_id"]
+
+    def _replace(self, query, replacement, upsert):
+        matched = self._matching(query)
+        if not matched and not upsert:
+            return 0, None
+        key = matched[0]["_id"] if matched else query["_id"]
+        if not matched and key in self.docs:
+            raise DuplicateKeyError(f"duplicate _id {key}")
+        self.docs[key] = {**replacement, "_id": key}
+        return len(matched), None if matched else key
+
+    async def create_index(self, keys, **kwargs):
+        self.indexes.append(keys)
+
+    async def insert_one(self, doc):
+        self._insert(doc)
+        return SimpleNamespace(inserted_id=doc["_id"])
+
+    async def find_one(self, query, projection=None):
+        self.reads.append(("find_one", query, projection))
+        matched = self._matching(query)
+        return _project(matched[0], projection) if matched else None
+
+    def find(self, query=None, projection=None):
+        query = query or {}
+        self.reads.append(("find", query, projection))
+        return FakeCursor(self._matching(query), projection)
+
+    async def count_documents(self, query, limit=0):
+        self.reads.append(("count_documents", query, None))
+        count = len(self._matching(query))
+        return min(count, limit) if limit else count
+
+    async def estimated_document_count(self):
+        return len(self.docs)
+
+    async def update_one(self, query, update, upsert=False):
+        before, after, upserted_id = self._update(query, update, upsert)
+        matched = int(before is not None)
+        return SimpleNamespace(matched_count=matched, modified_count=matched, upserted_id=upserted_id)
+
+    async def replace_one(self, query, replacement, upsert=False):
+        matched, upserted_id = self._replace(query, replacement, upsert)
+        return SimpleNamespace(matched_count=matched, modified_count=matched, upserted_id=upserted_id)
+
+    async def find_one_and_update(self, query, update, projection=None, upsert=False, return_document=False):
+        before, after, _ = self._update(query, update, upsert)
+        doc = after if return_document == ReturnDocument.AFTER else before
+        return _project(doc, projection) if doc is not None else None
+
+    async def bulk_write(self, operations, ordered=True):
+        self.bulk_writes.append(operations)
+        errors = []
+        for index, operation in enumerate(operations):
+            try:
+                if isinstance(operation, ReplaceOne):
+                    self._replace(operation._filter, operation._doc, operation._upsert)
+                elif isinstance(operation, UpdateOne):
+                    self._update(operation._filter, operation._doc, operation._upsert)
+                elif isinstance(operation, InsertOne):
+                    self._insert(operation._doc)
+                else:
+                    raise NotImplementedError(f"bulk operation {type(operation).__name__}")
+            except DuplicateKeyError:
+                errors.append({"index": index, "code": 11000})
+                if ordered:
+                    break
+        if errors:
+            raise BulkWriteError({"writeErrors": errors})
+
+    async def delete_one(self, query):
+        matched = self._matching(query)[:1]
+        for doc in matched:
+            del self.docs[doc["_id"]]
+        return SimpleNamespace(deleted_count=len(matched))
+
+    async def delete_many(self, query):
+        matched = self._matching(query)
+        for doc in matched:
+            del self.docs[doc["_id"]]
+        return SimpleNamespace(deleted_count=len(matched))
+
+
+class FakeDatabase:
+    """Tenant (or admin) database handing out in-memory collections"""
+
+    def __init__(self, name="test"):
+        self.name = name
+        self.collections = {}
+
+    def get_collection(self, name):
+        return self.collections.setdefault(name, FakeCollection(name))
+
+    def __getitem__(self, name):
+        return self.get_collection(name)
@@ -0,0 +1,52 @@
+"""
+Address Registry Tests
+
+Derived addresses persisted per wallet and resolved back to their owner
+without key material.
+"""
+
+import pycardano as pc
+import pytest
+
+from api.services.address_registry import COLLECTION_NAME, AddressRegistry
+from api.tests.mocks import FakeDatabase
+from cardano_offchain.wallet import CardanoWallet
+
+
+@pytest.mark.unit
+class TestAddressRegistry:
+    """Tests for AddressRegistry"""
+
+    async def test_register_and_lookup(self):
+        registry = AddressRegistry(FakeDatabase())
+        wallet = CardanoWallet(pc.HDWallet.generate_mnemonic())
+
+        assert await registry.register_wallet("wallet-a", wallet, gap_limit=5) == 10
+        # Re-import rewrites the same entries
+        assert await registry.register_wallet("wallet-a", wallet, gap_limit=5) == 10
+        assert len(registry.database.get_collection(COLLECTION_NAME).docs) == 10
+        # Indexing derives addresses without generating them on the wallet
+        assert wallet.addresses == []
+
+        main = str(wallet.enterprise_address)
+        derived = str(wallet.derive_addresses(5)[4][2])
+        unknown = str(CardanoWallet(pc.HDWallet.generate_mnemonic()).enterprise_address)
+        owners = await registry.lookup([main, derived, unknown])
+
+        assert owners[main].wallet_id == "wallet-a"
+        assert owners[main].derivation_index == 0
+        assert owners[derived].derivation_index == 4
+        assert owners[derived].address_type == "staking"
+        assert unknown not in owners
+
+    async def test_list_and_remove_wallet(self):
+        registry = AddressRegistry(FakeDatabase())
+        await registry.register_wallet("wallet-a", CardanoWallet(pc.HDWallet.generate_mnemonic()), gap_limit=3)
+        await registry.register_wallet("wallet-b", CardanoWallet(pc.HDWallet.generate_mnemonic()), gap_limit=3)
+
+        listed = await registry.list_wallet_addresses("wallet-a")
+        assert [owner.derivation_index for owner in listed] == [0, 0, 1, 1, 2, 2]
+
+        assert await registry.remove_wallet("wallet-a") == 6
+        assert not await registry.is_registered("wallet-a")
+        assert await registry.is_registered("wallet-b")
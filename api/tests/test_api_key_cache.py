@@ -0,0 +1,130 @@
+"""
+API Key Cache Tests
+
+Positive/negative caching, revocation invalidation (local and across
+workers) and write-behind last_used_at flushing for tenant API keys.
+"""
+
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+from api.database.models import ApiKey
+from api.services import api_key_cache
+from api.services.api_key_cache import ApiKeyCache, ApiKeyLastUsedBuffer, ApiKeyRevocations, invalidate_api_key
+from api.tests.mocks import FakeCollection, FakeDatabase
+from api.utils.security import get_api_key_and_tenant
+
+
+API_KEY = "tenant-key-0123456789"
+
+
+class Worker:
+    """One API process: its own key cache and revision tracker over the shared admin database"""
+
+    def __init__(self, admin_database, poll_seconds=60):
+        self.cache = ApiKeyCache()
+        self.revocations = ApiKeyRevocations(admin_database, poll_seconds=poll_seconds)
+
+    def activate(self, monkeypatch):
+        monkeypatch.setattr(api_key_cache, "_api_key_cache", self.cache)
+        monkeypatch.setattr(api_key_cache, "_api_key_revocations", self.revocations)
+
+
+@pytest.fixture
+def api_key_record(monkeypatch):
+    """The tenant's key as stored in the admin database; counts lookups"""
+    record = SimpleNamespace(
+        id="id-a", tenant_id="acme", api_key_prefix=API_KEY[:8], is_active=True, expires_at=None, lookups=0
+    )
+
+    async def find_one(*args):
+        record.lookups += 1
+        return record
+
+    # Beanie is never initialized; the lookup is answered by the record above
+    monkeypatch.setattr(ApiKey, "api_key_hash", "api_key_hash", raising=False)
+    monkeypatch.setattr(ApiKey, "find_one", find_one)
+    monkeypatch.setattr(
+        "api.database.multi_tenant_manager.get_multi_tenant_db_manager", lambda: SimpleNamespace(_initialized=True)
+    )
+    monkeypatch.setattr(api_key_cache, "_api_key_last_used_buffer", ApiKeyLastUsedBuffer())
+    return record
+
+
+@pytest.mark.unit
+class TestApiKeyCache:
+    """Tests for ApiKeyCache and ApiKeyLastUsedBuffer"""
+
+    def test_positive_and_negative_ttl(self):
+        cache = ApiKeyCache(ttl_seconds=60, negative_ttl_seconds=60)
+        cache.put("hash-a", key_id="id-a", tenant_id="acme", api_key_prefix="aaaaaaaa", expires_at=None)
+        cache.put_rejected("hash-bad")
+
+        assert cache.get("hash-a").tenant_id == "acme"
+        assert cache.get("hash-bad") is None
+        assert cache.is_rejected("hash-bad")
+        assert not cache.is_rejected("hash-a")
+
+        cache.ttl_seconds = 0
+        cache.negative_ttl_seconds = 0
+        assert cache.get("hash-a") is None
+        assert not cache.is_rejected("hash-bad")
+        assert cache.stats.snapshot() == {"hits": 1, "negative_hits": 1, "misses": 2, "invalidations": 0}
+
+    def test_revocation_invalidates_only_that_key(self):
+        cache = ApiKeyCache()
+        cache.put("hash-a", key_id="id-a", tenant_id="acme", api_key_prefix="aaaaaaaa", expires_at=None)
+        cache.put("hash-b", key_id="id-b", tenant_id="acme", api_key_prefix="bbbbbbbb", expires_at=None)
+        cache.put("hash-c", key_id="id-c", tenant_id="globex", api_key_prefix="aaaaaaaa", expires_at=None)
+
+        assert cache.invalidate("acme", "aaaaaaaa") == 1
+        assert cache.get("hash-a") is None
+        assert cache.get("hash-b") is not None
+        assert cache.get("hash-c") is not None
+
+        assert cache.invalidate("acme") == 1
+        assert cache.get("hash-b") is None
+
+    async def test_last_used_flush_is_one_batch_by_id(self, monkeypatch):
+        api_keys = FakeCollection()
+        buffer = ApiKeyLastUsedBuffer()
+
+        async def get_collection(tenant_id):
+            return api_keys
+
+        monkeypatch.setattr(buffer, "_get_collection", get_collection)
+
+        used_at = datetime(2025, 1, 1, 12, 0)
+        for _ in range(10):
+            buffer.touch("id-a", None, used_at)
+        buffer.touch("id-b", None, used_at)
+
+        assert await buffer.flush() == 2
+        assert len(api_keys.bulk_writes) == 1
+        assert api_keys.bulk_writes[0][0]._filter == {"_id": "id-a"}
+
+    async def test_revocation_on_another_worker_applies_within_poll_interval(self, monkeypatch, api_key_record):
+        admin = FakeDatabase("terrasacha_admin")
+        worker_a, worker_b = Worker(admin), Worker(admin, poll_seconds=0)
+
+        worker_b.activate(monkeypatch)
+        assert await get_api_key_and_tenant(API_KEY) == (API_KEY, "acme")
+        # The first resolution predates any revision read, so it is confirmed once
+        assert await get_api_key_and_tenant(API_KEY) == (API_KEY, "acme")
+        assert await get_api_key_and_tenant(API_KEY) == (API_KEY, "acme")
+        assert api_key_record.lookups == 2
+
+        # Revoked through worker A: worker B's cached resolution is dropped
+        worker_a.activate(monkeypatch)
+        api_key_record.is_active = False
+        await invalidate_api_key("acme", API_KEY[:8])
+        assert admin.get_collection("api_key_revocations").docs["acme"]["revision"] == 1
+
+        worker_b.activate(monkeypatch)
+        with pytest.raises(HTTPException) as rejected:
+            await get_api_key_and_tenant(API_KEY)
+        assert rejected.value.status_code == 401
+        assert api_key_record.lookups == 3
@@ -0,0 +1,115 @@
+"""
+Batch Payout Tests
+
+Many recipient outputs packed into as few transactions as the max
+transaction size allows.
+"""
+
+from types import SimpleNamespace
+
+import pycardano as pc
+import pytest
+
+from api.database.models import TransactionMongo
+from api.services import transaction_service_mongo
+from api.services.transaction_service_mongo import MongoTransactionService, _build_payout_outputs
+from api.tests.mocks import FakeDatabase, FixedChainContext
+
+
+POLICY = pc.ScriptHash(bytes.fromhex("cd" * 28))
+WALLET = pc.Address(pc.VerificationKeyHash(bytes.fromhex("11" * 28)), network=pc.Network.TESTNET)
+
+
+def _recipient(index: int) -> str:
+    return str(pc.Address(pc.VerificationKeyHash(index.to_bytes(28, "big")), network=pc.Network.TESTNET))
+
+
+def _utxo(index: int, lovelace: int, tokens: int = 0) -> pc.UTxO:
+    amount = pc.Value(lovelace)
+    if tokens:
+        amount = pc.Value(lovelace, pc.MultiAsset({POLICY: pc.Asset({pc.AssetName(b"GREY"): tokens})}))
+    tx_id = pc.TransactionId(index.to_bytes(32, "big"))
+    return pc.UTxO(pc.TransactionInput(tx_id, 0), pc.TransactionOutput(WALLET, amount))
+
+
+@pytest.mark.unit
+class TestBatchPayout:
+    """Tests for MongoTransactionService.build_batch_payout"""
+
+    def test_outputs_are_topped_up_to_min_lovelace(self):
+        context = FixedChainContext()
+        recipients = [
+            {"address": _recipient(1), "lovelace": 5_000_000, "assets": None},
+            {
+                "address": _recipient(2),
+                "lovelace": None,
+                "assets": [{"policyid": POLICY.payload.hex(), "tokens": {"GREY": 10}}],
+            },
+            {"address": _recipient(3), "lovelace": 1, "assets": None},
+        ]
+
+        outputs = _build_payout_outputs(recipients, context)
+
+        assert outputs[0].amount.coin == 5_000_000
+        for output in outputs[1:]:
+            assert output.amount.coin == pc.min_lovelace(context, output=output)
+        assert outputs[1].amount.multi_asset[POLICY][pc.AssetName(b"GREY")] == 10
+
+    async def test_recipients_packed_into_chained_transactions(self, monkeypatch):
+        context = FixedChainContext()
+        utxos = [_utxo(1, 2_000_000_000), _utxo(2, 5_000_000, tokens=1000)]
+        database = FakeDatabase()
+        service = MongoTransactionService(database=database)
+
+        async def find_wallet(wallet_id):
+            return SimpleNamespace(enterprise_address=str(WALLET))
+
+        async def available_utxos(chain_context, from_address, network):
+            return utxos
+
+        # Records are written through the fake tenant database; Beanie itself is never initialized
+        monkeypatch.setattr(TransactionMongo, "get_pymongo_collection", classmethod(lambda cls: None))
+        monkeypatch.setattr(service, "_find_wallet_by_id", find_wallet)
+        monkeypatch.setattr(service, "_get_available_utxos", available_utxos)
+
+        async def prepare_context():
+            return context
+
+        monkeypatch.setattr(
+            transaction_service_mongo,
+            "get_chain_context_for_network",
+            lambda network: SimpleNamespace(context=context, prepare_context=prepare_context),
+        )
+
+        grey = [{"policyid": POLICY.payload.hex(), "tokens": {"GREY": 3}}]
+        recipients = [
+            {"address": _recipient(i), "lovelace": 2_000_000, "assets": grey if i % 10 == 0 else None}
+            for i in range(1, 401)
+        ]
+
+        transactions = await service.build_batch_payout("w", recipients, "testnet", metadata={"msg": "payout"})
+
+        # 400 outputs of ~70 bytes need a few transactions, not one per recipient
+        assert 1 < len(transactions) < 6
+        assert [i for tx in transactions for i in tx.batch_recipient_indexes] == list(range(400))
+        assert len({tx.batch_id for tx in transactions}) == 1
+        for index, tx in enumerate(transactions):
+            body = pc.TransactionBody.from_cbor(tx.unsigned_cbor)
+            assert len(bytes.fromhex(tx.unsigned_cbor)) < context.protocol_param.max_tx_size
+            assert tx.batch_index == index
+            assert [str(o.address) for o in body.outputs[: len(tx.batch_recipient_indexes)]] == [
+                recipients[i]["address"] for i in tx.batch_recipient_indexes
+            ]
+            if index:
+                # Spends the change of the previous transaction
+                assert transactions[index - 1].tx_hash in {i.transaction_id.payload.hex() for i in body.inputs}
+
+        paid_grey = sum(
+            o.amount.multi_asset.get(POLICY, {}).get(pc.AssetName(b"GREY"), 0)
+            for tx in transactions
+            for o in pc.TransactionBody.from_cbor(tx.unsigned_cbor).outputs
+            if str(o.address) != str(WALLET)
+        )
+        assert paid_grey == 40 * 3
+        assert len(database.get_collection("transactions").docs) == len(transactions)
+        assert database.get_collection("utxo_reservations").docs  # inputs leased
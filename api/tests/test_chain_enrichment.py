@@ -0,0 +1,86 @@
+"""
+Chain Enrichment Engine Tests
+
+Concurrency cap, rate-limit retries, per-item timeouts and memoization.
+"""
+
+import asyncio
+
+import pytest
+
+from api.services.chain_enrichment import EnrichmentEngine, EnrichmentTimeoutError
+from cardano_offchain.chain_provider import ChainProviderError
+
+
+@pytest.mark.unit
+class TestEnrichmentEngine:
+    """Tests for EnrichmentEngine"""
+
+    async def test_concurrency_cap(self):
+        engine = EnrichmentEngine(max_concurrency=3)
+        active = 0
+        peak = 0
+
+        async def query(i):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return i
+
+        results = await engine.map(range(10), lambda i: engine.call(query, i))
+
+        assert results == list(range(10))
+        assert peak == 3
+
+    async def test_rate_limited_calls_are_retried(self):
+        engine = EnrichmentEngine(max_retries=2, backoff_base=0.001)
+        attempts = []
+
+        async def query():
+            attempts.append(1)
+            if len(attempts) < 3:
+                raise ChainProviderError("rate limited", status_code=429)
+            return "ok"
+
+        assert await engine.call(query) == "ok"
+        assert engine.stats.retries == 2
+
+        attempts.clear()
+        engine.max_retries = 1
+        with pytest.raises(ChainProviderError):
+            await engine.call(query)
+
+    async def test_item_timeout_and_errors_do_not_fail_the_batch(self):
+        engine = EnrichmentEngine(item_timeout=0.05)
+
+        async def enrich(i):
+            if i == 1:
+                await asyncio.sleep(1)
+            if i == 2:
+                raise ChainProviderError("not found", status_code=404)
+            return i
+
+        results = await engine.map([0, 1, 2], enrich)
+
+        assert results[0] == 0
+        assert isinstance(results[1], EnrichmentTimeoutError)
+        assert isinstance(results[2], ChainProviderError)
+        assert engine.stats.item_timeouts == 1
+
+    async def test_memoization(self):
+        engine = EnrichmentEngine(memo_max_entries=2)
+        loads = []
+
+        async def load(key):
+            loads.append(key)
+            return key.upper()
+
+        assert await engine.memoized("tx", "a", lambda: load("a")) == "A"
+        assert await engine.memoized("tx", "a", lambda: load("a")) == "A"
+        assert await engine.memoized("asset", "a", lambda: load("a"), ttl=0) == "A"
+        assert await engine.memoized("asset", "a", lambda: load("a"), ttl=0) == "A"
+
+        assert loads == ["a", "a", "a"]
+        assert engine.stats.memo_hits == 1
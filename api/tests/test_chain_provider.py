@@ -0,0 +1,115 @@
+"""
+Chain Provider Tests
+
+Offline tests for the async chain-query layer.
+"""
+
+import httpx
+import pycardano as pc
+import pytest
+
+from cardano_offchain.chain_context import CardanoChainContext
+from cardano_offchain.chain_provider import (
+    BlockfrostChainProvider,
+    ChainProviderError,
+    StubChainProvider,
+    utxo_from_json,
+    utxo_to_json,
+)
+
+
+ADDRESS = "addr_test1vrm9x2zsux7va6w892g38tvchnzahvcd9tykqf3ygnmwtaqyfg52x"
+POLICY = "b" * 56
+
+
+def _utxo(index: int, lovelace: int, tokens: int = 0) -> pc.UTxO:
+    multi_asset = pc.MultiAsset.from_primitive({bytes.fromhex(POLICY): {b"GREY": tokens}}) if tokens else None
+    return pc.UTxO(
+        pc.TransactionInput.from_primitive(["a" * 64, index]),
+        pc.TransactionOutput(pc.Address.from_primitive(ADDRESS), pc.Value(lovelace, multi_asset or pc.MultiAsset())),
+    )
+
+
+@pytest.mark.unit
+class TestUtxoConversion:
+    """Blockfrost JSON <-> pycardano conversion"""
+
+    def test_roundtrip(self):
+        utxo = _utxo(1, 2_000_000, tokens=5)
+        assert utxo_from_json(utxo_to_json(utxo), ADDRESS) == utxo
+
+
+@pytest.mark.unit
+class TestStubChainProvider:
+    """Tests for StubChainProvider"""
+
+    async def test_utxo_queries(self):
+        provider = StubChainProvider()
+        provider.add_utxo(_utxo(0, 3_000_000))
+        provider.add_utxo(_utxo(1, 2_000_000, tokens=7))
+
+        assert len(await provider.utxos(ADDRESS)) == 2
+        address = await provider.address(ADDRESS)
+        assert {"unit": "lovelace", "quantity": "5000000"} in address["amount"]
+        assert {"unit": POLICY + b"GREY".hex(), "quantity": "7"} in address["amount"]
+        assert await provider.address_utxos("addr_test1unused") == []
+
+    async def test_missing_transaction_is_404(self):
+        provider = StubChainProvider()
+        with pytest.raises(ChainProviderError) as exc:
+            await provider.transaction("f" * 64)
+        assert exc.value.not_found
+
+    async def test_chain_context_accepts_stub(self):
+        provider = StubChainProvider()
+        chain_context = CardanoChainContext("testnet", provider=provider)
+        assert chain_context.get_provider() is provider
+
+
+@pytest.mark.unit
+class TestBlockfrostChainProvider:
+    """Tests for BlockfrostChainProvider against a mock transport"""
+
+    async def test_paginates_utxos_and_reuses_client(self):
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            assert request.headers["project_id"] == "key"
+            page = int(request.url.params["page"])
+            size = 100 if page == 1 else 3
+            return httpx.Response(
+                200,
+                json=[
+                    {
+                        "tx_hash": "c" * 64,
+                        "output_index": (page - 1) * 100 + i,
+                        "amount": [{"unit": "lovelace", "quantity": "1000000"}],
+                        "data_hash": None,
+                        "inline_datum": None,
+                        "reference_script_hash": None,
+                    }
+                    for i in range(size)
+                ],
+            )
+
+        provider = BlockfrostChainProvider("https://example.invalid/api", "key", transport=httpx.MockTransport(handler))
+        utxos = await provider.utxos(ADDRESS)
+        await provider.close()
+
+        assert len(utxos) == 103
+        assert len(calls) == 2
+        assert calls[0].url.path == f"/api/v0/addresses/{ADDRESS}/utxos"
+
+    async def test_unused_address_has_no_utxos(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                404, json={"status_code": 404, "message": "The requested component has not been found."}
+            )
+
+        provider = BlockfrostChainProvider("https://example.invalid/api", "key", transport=httpx.MockTransport(handler))
+        assert await provider.utxos(ADDRESS) == []
+        with pytest.raises(ChainProviderError) as exc:
+            await provider.transaction("f" * 64)
+        assert exc.value.status_code == 404
+        await provider.close()
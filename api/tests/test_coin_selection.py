@@ -0,0 +1,115 @@
+"""
+Coin Selection Tests
+
+Input selection strategies on wallets holding thousands of UTxOs. Their
+running time is measured by the benchmarks at the end (pytest-benchmark).
+"""
+
+import pycardano as pc
+import pytest
+
+from api.services.coin_selection import CoinSelectionError, add_selected_inputs, select_inputs
+from api.tests.mocks import FixedChainContext
+
+
+POLICY = pc.ScriptHash(bytes.fromhex("cd" * 28))
+WALLET = pc.Address(pc.VerificationKeyHash(bytes.fromhex("11" * 28)), network=pc.Network.TESTNET)
+RECIPIENT = pc.Address(pc.VerificationKeyHash(bytes.fromhex("22" * 28)), network=pc.Network.TESTNET)
+
+
+def _utxo(index: int, lovelace: int, tokens: int = 0) -> pc.UTxO:
+    amount = pc.Value(lovelace)
+    if tokens:
+        amount = pc.Value(lovelace, pc.MultiAsset({POLICY: pc.Asset({pc.AssetName(b"GREY"): tokens})}))
+    tx_id = pc.TransactionId(index.to_bytes(32, "big"))
+    return pc.UTxO(pc.TransactionInput(tx_id, 0), pc.TransactionOutput(WALLET, amount))
+
+
+def _large_wallet(count: int = 3000) -> list[pc.UTxO]:
+    """Many small ADA UTxOs, a few larger ones and some token bundles"""
+    utxos = [_utxo(i, 1_500_000 + (i * 7919) % 3_000_000) for i in range(count)]
+    utxos += [_utxo(count + i, 50_000_000 * (i + 1)) for i in range(3)]
+    utxos += [_utxo(count + 10 + i, 1_800_000, tokens=100) for i in range(20)]
+    return utxos
+
+
+def _select_and_build(context: pc.ChainContext, utxos: list[pc.UTxO]) -> tuple[list[pc.UTxO], pc.TransactionBody]:
+    """Pay RECIPIENT 5 ADA and 150 GREY, spending only the selected UTxOs"""
+    tokens = pc.MultiAsset({POLICY: pc.Asset({pc.AssetName(b"GREY"): 150})})
+    builder = pc.TransactionBuilder(context)
+    builder.add_output(pc.TransactionOutput(RECIPIENT, pc.Value(5_000_000, tokens)))
+    selected = add_selected_inputs(builder, utxos, strategy="random_improve")
+    return selected, builder.build(change_address=WALLET)
+
+
+@pytest.mark.unit
+class TestCoinSelection:
+    """Tests for coin selection strategies"""
+
+    def test_strategies_pick_few_inputs_from_large_wallet(self):
+        context = FixedChainContext()
+        utxos = _large_wallet()
+
+        for strategy, max_inputs in (("largest_first", 1), ("exact_match", 1), ("random_improve", 60)):
+            selected = select_inputs(utxos, pc.Value(20_000_000), context, strategy=strategy)
+
+            assert 1 <= len(selected) <= max_inputs, strategy
+            assert len(set(selected)) == len(selected)
+            assert all(u in utxos for u in selected)
+            assert sum(u.output.amount.coin for u in selected) >= 20_000_000
+
+        # Exact match leaves the large UTxOs alone when a small one is enough
+        [single] = select_inputs(utxos, pc.Value(500_000), context, strategy="exact_match")
+        assert single.output.amount.coin < 10_000_000
+
+        # Tokens are covered together with ADA
+        selected = select_inputs(
+            utxos, pc.Value(0, pc.MultiAsset({POLICY: pc.Asset({pc.AssetName(b"GREY"): 250})})), context
+        )
+        assert sum(u.output.amount.multi_asset.get(POLICY, {}).get(pc.AssetName(b"GREY"), 0) for u in selected) >= 250
+
+        with pytest.raises(CoinSelectionError):
+            select_inputs(utxos[:5], pc.Value(500_000_000), context)
+
+    def test_builder_spends_only_selected_utxos(self):
+        context = FixedChainContext()
+        utxos = _large_wallet()
+
+        selected, tx_body = _select_and_build(context, utxos)
+
+        assert len(tx_body.inputs) == len(selected) < 60
+        assert set(tx_body.inputs) == {u.input for u in selected}
+        grey = pc.AssetName(b"GREY")
+        assert tx_body.outputs[0].amount.multi_asset[POLICY][grey] == 150
+        assert sum(o.amount.multi_asset[POLICY][grey] for o in tx_body.outputs) == sum(
+            u.output.amount.multi_asset.get(POLICY, pc.Asset()).get(grey, 0) for u in selected
+        )
+        # Everything not paid out or spent on fees comes back as change
+        assert sum(o.amount.coin for o in tx_body.outputs) + tx_body.fee == sum(u.output.amount.coin for u in selected)
+        assert all(o.address == WALLET for o in tx_body.outputs[1:])
+
+
+@pytest.mark.slow
+@pytest.mark.performance
+class TestCoinSelectionBenchmarks:
+    """Running time of coin selection over a 3000-UTxO wallet"""
+
+    @pytest.fixture
+    def selection_benchmark(self, request):
+        if not request.config.pluginmanager.hasplugin("benchmark"):
+            pytest.skip("pytest-benchmark not installed")
+        return request.getfixturevalue("benchmark")
+
+    @pytest.mark.parametrize("strategy", ["largest_first", "exact_match", "random_improve"])
+    def test_select_inputs(self, selection_benchmark, strategy):
+        context = FixedChainContext()
+        utxos = _large_wallet()
+
+        selected = selection_benchmark(select_inputs, utxos, pc.Value(20_000_000), context, strategy=strategy)
+
+        assert sum(u.output.amount.coin for u in selected) >= 20_000_000
+
+    def test_select_and_build(self, selection_benchmark):
+        selected, tx_body = selection_benchmark(_select_and_build, FixedChainContext(), _large_wallet())
+
+        assert len(tx_body.inputs) == len(selected)
@@ -0,0 +1,104 @@
+"""
+Compile Executor Tests
+
+Process-pool compilation, in-flight job merging, queue limits and timeouts.
+"""
+
+import asyncio
+import pathlib
+
+import pytest
+from opshin.builder import build
+
+from api.services.compile_executor import CompileExecutor, CompileQueueFullError, CompileTimeoutError
+
+
+GREY = pathlib.Path(__file__).parent.parent.parent / "src" / "terrasacha_contracts" / "minting_policies" / "grey.py"
+
+
+@pytest.fixture
+def executor(tmp_path):
+    executor = CompileExecutor(max_workers=1, max_queue_depth=1, job_timeout=120, cache_dir=str(tmp_path))
+    yield executor
+    executor.shutdown(wait=True)
+
+
+@pytest.mark.unit
+@pytest.mark.contracts
+class TestCompileExecutor:
+    """Tests for CompileExecutor"""
+
+    async def test_build_matches_opshin_build(self, executor):
+        """Scripts compiled in the pool are identical to build()"""
+        policy_id = bytes.fromhex("b" * 56)
+        script = await executor.build(GREY, policy_id)
+
+        assert script == build(str(GREY), policy_id)
+        assert executor.metrics.jobs_completed == 1
+
+    async def test_identical_jobs_are_merged(self, executor):
+        """Concurrent identical jobs share a single compile"""
+        policy_id = bytes.fromhex("c" * 56)
+        results = await asyncio.gather(*(executor.build(GREY, policy_id) for _ in range(3)))
+
+        assert results[0] == results[1] == results[2]
+        assert executor.metrics.jobs_submitted == 1
+        assert executor.metrics.jobs_merged == 2
+        assert executor.pending_jobs == 0
+
+    async def test_queue_full_rejects_new_jobs(self, executor):
+        """Distinct jobs beyond workers + queue depth are rejected"""
+        jobs = [asyncio.ensure_future(executor.build(GREY, bytes([i]) * 28)) for i in range(2)]
+        await asyncio.sleep(0)
+
+        with pytest.raises(CompileQueueFullError) as exc_info:
+            await executor.build(GREY, bytes([9]) * 28)
+        assert exc_info.value.retry_after >= 1
+
+        await asyncio.gather(*jobs)
+        assert executor.metrics.jobs_rejected == 1
+
+    def test_retry_after_follows_backlog_and_compile_time(self, executor, monkeypatch):
+        """Retry-After estimate is the backlog per worker times the average compile time"""
+        assert executor.retry_after() == 1
+
+        executor.metrics.record(0.0, 10.0)
+        executor.metrics.record(0.0, 14.0)
+        monkeypatch.setattr(CompileExecutor, "pending_jobs", property(lambda self: 3))
+        assert executor.retry_after() == 36
+
+    async def test_timed_out_job_holds_its_slot_until_worker_returns(self, tmp_path):
+        """A timed-out compile keeps counting against the queue limit while it still runs"""
+        executor = CompileExecutor(max_workers=1, max_queue_depth=0, job_timeout=0.05, cache_dir=str(tmp_path))
+        try:
+            with pytest.raises(CompileTimeoutError):
+                await executor.build(GREY, bytes([1]) * 28)
+            assert executor.pending_jobs == 1
+
+            with pytest.raises(CompileQueueFullError):
+                await executor.build(GREY, bytes([2]) * 28)
+
+            while executor.pending_jobs:
+                await asyncio.sleep(0.05)
+            executor.job_timeout = 120
+            await executor.build(GREY, bytes([2]) * 28)
+            assert executor.metrics.jobs_timed_out == 1
+        finally:
+            executor.shutdown(wait=True)
+
+    def test_job_key_hashes_source_once_per_version(self, executor, tmp_path, monkeypatch):
+        """The contract source is re-read only when the file changes"""
+        contract = tmp_path / "contract.py"
+        contract.write_text("a = 1\n")
+        reads = []
+        read_bytes = pathlib.Path.read_bytes
+        monkeypatch.setattr(pathlib.Path, "read_bytes", lambda path: reads.append(path) or read_bytes(path))
+
+        key = executor.job_key(str(contract), (1,))
+        assert executor.job_key(str(contract), (1,)) == key
+        assert executor.job_key(str(contract), (2,)) != key
+        assert len(reads) == 1
+
+        contract.write_text("a = 22\n")
+        assert executor.job_key(str(contract), (1,)) != key
+        assert len(reads) == 2
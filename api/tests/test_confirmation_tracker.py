@@ -0,0 +1,105 @@
+"""
+Confirmation Tracker Tests
+
+Batch confirmation, backoff and give-up against a stub chain provider.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from api.enums import TransactionStatus
+from api.services.confirmation_tracker import ConfirmationTracker
+from api.services.confirmed_tx_cache import get_confirmed_tx_cache
+from api.tests.mocks import FakeDatabase
+from cardano_offchain.chain_context import CardanoChainContext
+from cardano_offchain.chain_provider import StubChainProvider
+
+
+class CountingStubChainProvider(StubChainProvider):
+    def __init__(self):
+        super().__init__()
+        self.block_latest_calls = 0
+
+    async def block_latest(self):
+        self.block_latest_calls += 1
+        return await super().block_latest()
+
+
+@pytest.fixture
+def provider():
+    get_confirmed_tx_cache().clear_memory()
+    provider = CountingStubChainProvider()
+    provider.set_block({"height": 1010})
+    provider.add_transaction(
+        "a" * 64, {"hash": "a" * 64, "block_height": 1001, "block_time": 1_700_000_000, "fees": "180000"}
+    )
+    provider.add_transaction(
+        "b" * 64, {"hash": "b" * 64, "block_height": 1005, "block_time": 1_700_000_100, "fees": "170000"}
+    )
+    return provider
+
+
+@pytest.mark.unit
+class TestConfirmationTracker:
+    """Tests for ConfirmationTracker.process_collection"""
+
+    async def test_confirms_in_one_bulk_write(self, provider):
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        collection = FakeDatabase().get_collection("transactions")
+        for doc in [
+            {"_id": 1, "tx_hash": "a" * 64, "status": "SUBMITTED", "network": "preview", "submitted_at": now},
+            {"_id": 2, "tx_hash": "b" * 64, "status": "SUBMITTED", "network": "preview", "submitted_at": now},
+            {
+                "_id": 3,
+                "tx_hash": "c" * 64,
+                "status": "SUBMITTED",
+                "network": "preview",
+                "submitted_at": now,
+                "confirmation_checks": 2,
+            },
+            {
+                "_id": 4,
+                "tx_hash": "d" * 64,
+                "status": "SUBMITTED",
+                "network": "preview",
+                "submitted_at": now - timedelta(days=2),
+            },
+            # Not due yet
+            {
+                "_id": 5,
+                "tx_hash": "e" * 64,
+                "status": "SUBMITTED",
+                "network": "preview",
+                "submitted_at": now,
+                "next_check_at": now + timedelta(minutes=5),
+            },
+        ]:
+            collection.docs[doc["_id"]] = doc
+        chain_context = CardanoChainContext("preview", provider=provider)
+        tracker = ConfirmationTracker(
+            backoff_base=10, backoff_max=600, chain_context_getter=lambda network: chain_context
+        )
+
+        counts = await tracker.process_collection(collection)
+
+        assert counts == {"checked": 4, "confirmed": 2, "rescheduled": 1, "failed": 1}
+        assert provider.block_latest_calls == 1
+        assert len(collection.bulk_writes) == 1
+
+        updates = {op._filter["_id"]: op._doc for op in collection.bulk_writes[0]}
+        assert updates[1]["$set"]["status"] == TransactionStatus.CONFIRMED.value
+        assert updates[1]["$set"]["block_height"] == 1001
+        assert updates[1]["$set"]["confirmations"] == 10
+        assert updates[1]["$set"]["fee_lovelace"] == 180000
+        assert updates[3]["$inc"] == {"confirmation_checks": 1}
+        assert updates[3]["$set"]["next_check_at"] >= now + timedelta(seconds=40)
+        assert updates[4]["$set"]["status"] == TransactionStatus.FAILED.value
+        assert collection.docs[2]["status"] == TransactionStatus.CONFIRMED.value
+        assert collection.docs[3]["confirmation_checks"] == 3
+        assert collection.docs[5]["status"] == "SUBMITTED"
+        assert tracker.confirmations("preview", 1005) == 6
+
+    def test_backoff_is_capped(self):
+        tracker = ConfirmationTracker(backoff_base=20, backoff_max=600)
+        assert [tracker.backoff_delay(n) for n in range(7)] == [20, 40, 80, 160, 320, 600, 600]
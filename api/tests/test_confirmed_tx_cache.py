@@ -0,0 +1,72 @@
+"""
+Confirmed Transaction Cache Tests
+
+Memory LRU, MongoDB read-through and size-bounded eviction.
+"""
+
+import pytest
+
+from api.services.confirmed_tx_cache import COLLECTION_NAME, ConfirmedTxCache
+from api.tests.mocks import FakeDatabase
+
+
+@pytest.mark.unit
+class TestConfirmedTxCache:
+    """Tests for ConfirmedTxCache"""
+
+    async def test_memory_lru(self):
+        cache = ConfirmedTxCache(memory_max_entries=2)
+        await cache.put("preview", "a", {"transaction": {"fees": "1"}})
+        await cache.put("preview", "b", {"transaction": {"fees": "2"}})
+        await cache.put("preview", "c", {"transaction": {"fees": "3"}})
+
+        found = await cache.get_many("preview", ["a", "b", "c"])
+
+        assert set(found) == {"b", "c"}
+        assert await cache.get_many("preprod", ["c"]) == {}
+
+    async def test_database_read_through(self):
+        database = FakeDatabase()
+        collection = database.get_collection(COLLECTION_NAME)
+        writer = ConfirmedTxCache()
+        await writer.initialize(database)
+        await writer.put("preview", "a", {"transaction": {"fees": "1"}, "transaction_metadata": []})
+        await writer.put("preview", "a", {"transaction_utxos": {"inputs": []}})
+
+        # A fresh process only has the database
+        reader = ConfirmedTxCache(database=database)
+        found = await reader.get_many("preview", ["a", "missing"])
+        again = await reader.get_many("preview", ["a"])
+
+        assert found["a"] == {
+            "transaction": {"fees": "1"},
+            "transaction_metadata": [],
+            "transaction_utxos": {"inputs": []},
+        }
+        assert again == {"a": found["a"]}
+        assert [method for method, _, _ in collection.reads] == ["find"]
+        assert reader.stats.database_hits == 1
+        assert reader.stats.memory_hits == 1
+        assert reader.stats.misses == 1
+
+    async def test_get_or_fetch_and_eviction(self):
+        database = FakeDatabase()
+        collection = database.get_collection(COLLECTION_NAME)
+        cache = ConfirmedTxCache(database=database, max_documents=10)
+        calls = []
+
+        async def load():
+            calls.append(1)
+            return {"fees": "1"}
+
+        assert await cache.get_or_fetch("preview", "a", "transaction", load) == {"fees": "1"}
+        assert await cache.get_or_fetch("preview", "a", "transaction", load) == {"fees": "1"}
+        assert len(calls) == 1
+
+        for i in range(14):
+            await cache.put("preview", f"tx{i}", {"transaction": {}})
+        assert await cache.evict() == 6
+
+        assert len(collection.docs) == 9
+        assert "a" not in collection.docs
+        assert "tx13" in collection.docs
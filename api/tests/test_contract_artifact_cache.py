@@ -0,0 +1,120 @@
+"""
+Contract Artifact Cache Tests
+
+Builders parse a compiled contract once per (tenant, policy_id) and only
+re-read its lifecycle fields afterwards.
+"""
+
+from datetime import datetime
+
+import pycardano as pc
+import pytest
+
+from api.database.models import ContractMongo
+from api.services.contract_artifact_cache import LIFECYCLE_PROJECTION, ContractArtifactCache
+from api.services.contract_service_mongo import MongoContractService
+from api.tests.mocks import FakeDatabase
+
+
+SCRIPT = pc.PlutusV2Script(bytes.fromhex("4e4d01000033222220051200120011"))
+POLICY_ID = pc.plutus_script_hash(SCRIPT).payload.hex()
+
+
+def _contract_doc(policy_id: str = POLICY_ID, compiled_at: datetime = datetime(2025, 1, 1)) -> dict:
+    return {
+        "_id": policy_id,
+        "name": "project",
+        "contract_type": "spending",
+        "cbor_hex": SCRIPT.hex(),
+        "testnet_addr": str(pc.Address(pc.plutus_script_hash(SCRIPT), network=pc.Network.TESTNET)),
+        "source_file": "validators/project.py",
+        "source_hash": "00" * 32,
+        "compilation_params": ["ab" * 28],
+        "registry_contract_name": "project",
+        "version": 1,
+        "network": "testnet",
+        "wallet_id": "core",
+        "compiled_at": compiled_at,
+    }
+
+
+def _projections(contracts) -> list:
+    return [projection for _, _, projection in contracts.reads]
+
+
+@pytest.fixture(autouse=True)
+def uninitialized_beanie(monkeypatch):
+    # Contracts are read through the fake tenant database; Beanie itself is never initialized
+    monkeypatch.setattr(ContractMongo, "get_pymongo_collection", classmethod(lambda cls: None))
+
+
+@pytest.fixture
+def artifact_cache(monkeypatch):
+    cache = ContractArtifactCache()
+    monkeypatch.setattr("api.services.contract_service_mongo.get_contract_artifact_cache", lambda: cache)
+    return cache
+
+
+@pytest.mark.unit
+class TestContractArtifactCache:
+    """Tests for ContractArtifactCache and its use in MongoContractService"""
+
+    async def test_contract_parsed_once_then_only_lifecycle_refreshed(self, artifact_cache):
+        database = FakeDatabase("tenant_a")
+        contracts = database.get_collection("contracts")
+        contracts.docs[POLICY_ID] = _contract_doc()
+        service = MongoContractService(database=database)
+
+        first = await service._get_artifact(POLICY_ID)
+        contracts.docs[POLICY_ID].update(is_active=False, storage_type="reference_script", reference_utxo="aa:0")
+        second = await service._get_artifact(POLICY_ID)
+        latest = await service._find_latest_artifact({"registry_contract_name": "project"})
+
+        assert _projections(contracts) == [None, LIFECYCLE_PROJECTION, LIFECYCLE_PROJECTION]
+        assert second.script is first.script
+        assert second.script_hash == pc.plutus_script_hash(SCRIPT)
+        assert second.address("testnet") == pc.Address(pc.plutus_script_hash(SCRIPT), network=pc.Network.TESTNET)
+        assert (first.contract.is_active, first.contract.storage_type) == (True, "local")
+        assert (second.contract.is_active, second.contract.reference_utxo) == (False, "aa:0")
+        assert latest.contract.compilation_params == ["ab" * 28]
+        assert latest.contract.storage_type == "reference_script"
+
+        # Tenants are isolated; replaced or deleted contracts are loaded again
+        other = FakeDatabase("tenant_b")
+        other.get_collection("contracts").docs[POLICY_ID] = _contract_doc()
+        await MongoContractService(database=other)._get_artifact(POLICY_ID)
+        assert _projections(other.get_collection("contracts")) == [None]
+        service._invalidate_artifact(POLICY_ID)
+        await service._get_artifact(POLICY_ID)
+        assert _projections(contracts)[-1] is None
+        del contracts.docs[POLICY_ID]
+        assert await service._get_artifact(POLICY_ID) is None
+        assert artifact_cache.get("tenant_a", POLICY_ID) is None
+
+    async def test_latest_artifact_is_the_newest_compiled(self, artifact_cache):
+        database = FakeDatabase("tenant_a")
+        contracts = database.get_collection("contracts")
+        contracts.docs["older"] = _contract_doc("older", compiled_at=datetime(2025, 1, 1))
+        contracts.docs[POLICY_ID] = _contract_doc(compiled_at=datetime(2025, 3, 1))
+        contracts.docs["newer"] = _contract_doc("newer", compiled_at=datetime(2025, 2, 1))
+        contracts.docs["other"] = {**_contract_doc("other", datetime(2025, 4, 1)), "registry_contract_name": "other"}
+        service = MongoContractService(database=database)
+
+        latest = await service._find_latest_artifact({"registry_contract_name": "project"})
+
+        assert latest.contract.policy_id == POLICY_ID
+        assert latest.contract.compiled_at == datetime(2025, 3, 1)
+        assert await service._find_latest_artifact({"registry_contract_name": "missing"}) is None
+
+    async def test_warm_caches_every_tenant_contract(self):
+        cache = ContractArtifactCache(max_entries=1)
+        contracts = FakeDatabase("tenant_a").get_collection("contracts")
+        contracts.docs[POLICY_ID] = _contract_doc()
+        contracts.docs["broken"] = {"_id": "broken", "name": "broken"}
+
+        assert await cache.warm("tenant_a", contracts) == 1
+        assert cache.get("tenant_a", POLICY_ID).contract.name == "project"
+        assert cache.stats.snapshot() == {"hits": 1, "misses": 0, "invalidations": 0, "warmed": 1}
+
+        cache.put("tenant_b", cache.get("tenant_a", POLICY_ID).contract)
+        assert cache.get("tenant_a", POLICY_ID) is None
@@ -0,0 +1,124 @@
+"""
+Contract Enrichment Tests
+
+Batched on-chain status lookup for contract listings.
+"""
+
+import asyncio
+from datetime import datetime
+
+import pycardano as pc
+import pytest
+
+from api.database.models import ContractMongo
+from api.services.contract_service_mongo import MongoContractService
+from api.tests.mocks import FakeDatabase
+from cardano_offchain.chain_context import CardanoChainContext
+from cardano_offchain.chain_provider import StubChainProvider
+
+
+ADDRESS = "addr_test1vrm9x2zsux7va6w892g38tvchnzahvcd9tykqf3ygnmwtaqyfg52x"
+SLOW_ADDRESS = "addr_test1vz09v9yfxguvlp0zsnrpa3tdtm7el8xufp3m5lsm7qxzclgmzkket"
+OLD_ADDRESS = str(pc.Address(pc.VerificationKeyHash(bytes(28)), network=pc.Network.TESTNET))
+
+
+def _contract(policy_id: str, registry_name: str, contract_type: str, address=None, params=None) -> ContractMongo:
+    return ContractMongo.model_construct(
+        policy_id=policy_id,
+        name=registry_name,
+        contract_type=contract_type,
+        registry_contract_name=registry_name,
+        testnet_addr=address,
+        compilation_params=params,
+        network="testnet",
+        compiled_at=datetime(2025, 1, 1),
+    )
+
+
+def _stored(policy_id: str, address: str, params: list[str], compiled_at: datetime) -> dict:
+    """Contracts collection document for a project spending validator"""
+    return {
+        "_id": policy_id,
+        "name": "project",
+        "contract_type": "spending",
+        "cbor_hex": "00",
+        "testnet_addr": address,
+        "source_file": "validators/project.py",
+        "source_hash": "00" * 32,
+        "compilation_params": params,
+        "registry_contract_name": "project",
+        "version": 1,
+        "network": "testnet",
+        "wallet_id": "core",
+        "compiled_at": compiled_at,
+    }
+
+
+@pytest.fixture(autouse=True)
+def uninitialized_beanie(monkeypatch):
+    # Contracts are read through the fake tenant database; Beanie itself is never initialized
+    monkeypatch.setattr(ContractMongo, "get_pymongo_collection", classmethod(lambda cls: None))
+
+
+class SlowStubChainProvider(StubChainProvider):
+    """Stub provider that counts queries and never answers for SLOW_ADDRESS"""
+
+    def __init__(self):
+        super().__init__()
+        self.queried = []
+
+    async def utxos(self, address):
+        self.queried.append(str(address))
+        if str(address) == SLOW_ADDRESS:
+            await asyncio.sleep(60)
+        return await super().utxos(address)
+
+
+@pytest.mark.unit
+class TestEnrichContractStatus:
+    """Tests for MongoContractService.enrich_contract_status"""
+
+    async def test_batched_enrichment_with_deadline(self):
+        provider = SlowStubChainProvider()
+        provider.add_utxo(
+            pc.UTxO(
+                pc.TransactionInput.from_primitive(["a" * 64, 0]),
+                pc.TransactionOutput(
+                    pc.Address.from_primitive(ADDRESS),
+                    pc.Value(2_000_000, pc.MultiAsset.from_primitive({bytes.fromhex("b" * 56): {b"PROTO": 1}})),
+                ),
+            )
+        )
+        database = FakeDatabase()
+        stored = database.get_collection("contracts")
+        # m3 was recompiled into a new project validator; the latest compilation wins
+        stored.docs["p-old"] = _stored("p-old", OLD_ADDRESS, ["m3"], datetime(2025, 1, 1))
+        stored.docs["p-new"] = _stored("p-new", ADDRESS, ["m3", "x"], datetime(2025, 2, 1))
+        stored.docs["p-m4"] = _stored("p-m4", OLD_ADDRESS, ["x", "m4"], datetime(2025, 3, 1))
+        contracts = [
+            _contract("m1", "protocol_nfts", "minting"),
+            _contract("s1", "protocol", "spending", ADDRESS, ["m1"]),
+            _contract("s1-copy", "protocol", "spending", ADDRESS, ["m1"]),
+            _contract("s2", "project", "spending", SLOW_ADDRESS, ["m2"]),
+            _contract("s3", "project", "spending"),
+            _contract("m3", "project_nfts", "minting"),
+            _contract("m4", "project_nfts", "minting"),
+        ]
+
+        enrichment = await MongoContractService(database=database).enrich_contract_status(
+            contracts, CardanoChainContext("testnet", provider=provider), deadline_seconds=0.2
+        )
+
+        # Each distinct address is queried once
+        assert sorted(provider.queried) == sorted([ADDRESS, SLOW_ADDRESS])
+        # Unlinked minting policies are resolved in a single $in query
+        assert len(stored.reads) == 1
+        assert stored.reads[0][1]["compilation_params.0"] == {"$in": ["m3", "m4"]}
+
+        assert enrichment["s1"] == {"has_minted_tokens": True, "balance_lovelace": 2_000_000, "onchain_status": "ok"}
+        assert enrichment["s1-copy"] == enrichment["s1"]
+        assert enrichment["m1"] == {"has_minted_tokens": True, "balance_lovelace": None, "onchain_status": "ok"}
+        assert enrichment["s2"]["onchain_status"] == "timeout"
+        assert enrichment["s3"]["onchain_status"] == "no_address"
+        assert enrichment["m3"] == enrichment["m1"]
+        assert enrichment["m4"]["onchain_status"] == "unlinked"
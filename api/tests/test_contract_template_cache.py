@@ -0,0 +1,79 @@
+"""
+Contract Template Cache Tests
+
+Parameterized scripts produced from cached templates must be byte-identical
+to a full OpShin build.
+"""
+
+import pathlib
+
+import pytest
+from opshin.builder import PlutusContract, build
+from opshin.prelude import TxId, TxOutRef
+
+from api.services.contract_template_cache import ContractTemplateCache
+
+
+CONTRACTS_DIR = pathlib.Path(__file__).parent.parent.parent / "src" / "terrasacha_contracts"
+PROTOCOL_NFTS = CONTRACTS_DIR / "minting_policies" / "protocol_nfts.py"
+GREY = CONTRACTS_DIR / "minting_policies" / "grey.py"
+
+
+@pytest.mark.unit
+@pytest.mark.contracts
+class TestContractTemplateCache:
+    """Tests for ContractTemplateCache"""
+
+    def test_oref_parameter_matches_build(self, tmp_path):
+        """TxOutRef-parameterized minting policy matches build()"""
+        cache = ContractTemplateCache(tmp_path)
+        oref = TxOutRef(id=TxId(bytes.fromhex("a" * 64)), idx=3)
+
+        cached = PlutusContract(cache.build(PROTOCOL_NFTS, oref))
+        expected = PlutusContract(build(str(PROTOCOL_NFTS), oref))
+
+        assert cached.cbor == expected.cbor
+        assert cached.policy_id == expected.policy_id
+        assert str(cached.testnet_addr) == str(expected.testnet_addr)
+
+    def test_template_persisted_and_reused(self, tmp_path):
+        """A fresh cache on the same directory reuses the persisted template"""
+        policy_id = bytes.fromhex("b" * 56)
+        first = ContractTemplateCache(tmp_path).build(GREY, policy_id)
+
+        persisted = list(tmp_path.glob("*.cbor"))
+        assert len(persisted) == 1
+
+        second_cache = ContractTemplateCache(tmp_path)
+        assert second_cache.build(GREY, policy_id) == first
+        assert first == build(str(GREY), policy_id)
+
+    def test_different_parameters_share_template(self, tmp_path):
+        """Different parameters yield different scripts from one template"""
+        cache = ContractTemplateCache(tmp_path)
+        a = cache.build(GREY, bytes.fromhex("c" * 56))
+        b = cache.build(GREY, bytes.fromhex("d" * 56))
+
+        assert a != b
+        assert len(list(tmp_path.glob("*.cbor"))) == 1
+
+    def test_package_change_invalidates_template(self, tmp_path):
+        """Editing an imported package module yields a new template key on the next start"""
+        package_dir = tmp_path / "package"
+        package_dir.mkdir()
+        helper = package_dir / "util.py"
+        helper.write_text("X = 1\n")
+        cache = ContractTemplateCache(tmp_path / "templates", package_dir=package_dir)
+        source = GREY.read_text()
+
+        cache.get_template(source, str(GREY))
+        cache.get_template(source, str(GREY))
+        assert len(list((tmp_path / "templates").glob("*.cbor"))) == 1
+
+        helper.write_text("X = 2\n")
+        cache.get_template(source, str(GREY))
+        assert len(list((tmp_path / "templates").glob("*.cbor"))) == 1
+
+        restarted = ContractTemplateCache(tmp_path / "templates", package_dir=package_dir)
+        restarted.get_template(source, str(GREY))
+        assert len(list((tmp_path / "templates").glob("*.cbor"))) == 2
@@ -0,0 +1,94 @@
+"""
+Crypto Executor Tests
+
+Concurrency cap, queue-wait metrics and fast-fail when saturated.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from api.services.crypto_executor import CryptoExecutor, CryptoQueueFullError
+
+
+@pytest.fixture
+def executor():
+    executor = CryptoExecutor(max_concurrency=2, max_queue_depth=1)
+    yield executor
+    executor.shutdown()
+
+
+@pytest.mark.unit
+class TestCryptoExecutor:
+    """Tests for CryptoExecutor"""
+
+    async def test_concurrency_cap_and_queue_wait(self, executor):
+        running = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def work(value):
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.05)
+            with lock:
+                running -= 1
+            return value * 2
+
+        results = await asyncio.gather(*(executor.run(work, i) for i in range(3)))
+
+        assert results == [0, 2, 4]
+        assert peak == 2
+        # The third job waited for a free slot
+        assert executor.metrics.queue_wait_max_seconds >= 0.04
+        assert executor.metrics.jobs_completed == 3
+        assert executor.pending_jobs == 0
+
+    async def test_saturated_queue_fails_fast(self, executor):
+        release = threading.Event()
+        jobs = [asyncio.ensure_future(executor.run(release.wait, 5)) for _ in range(3)]
+        await asyncio.sleep(0.01)
+
+        with pytest.raises(CryptoQueueFullError) as exc_info:
+            await executor.run(len, "x")
+        assert exc_info.value.retry_after >= 1
+        assert executor.metrics.jobs_rejected == 1
+
+        release.set()
+        await asyncio.gather(*jobs)
+
+    async def test_errors_propagate(self, executor):
+        def fail():
+            raise ValueError("bad password")
+
+        with pytest.raises(ValueError):
+            await executor.run(fail)
+        assert executor.metrics.jobs_failed == 1
+
+    async def test_cancelled_caller_keeps_slot_until_worker_returns(self, executor):
+        started = threading.Event()
+        release = threading.Event()
+
+        def work():
+            started.set()
+            release.wait(5)
+
+        job = asyncio.ensure_future(executor.run(work))
+        await asyncio.to_thread(started.wait, 5)
+        job.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await job
+
+        # The worker thread is still busy, so its slot still counts against the limit
+        assert executor.pending_jobs == 1
+        release.set()
+        for _ in range(100):
+            if executor.pending_jobs == 0:
+                break
+            await asyncio.sleep(0.01)
+        assert executor.pending_jobs == 0
+        assert executor.metrics.jobs_completed == 1
@@ -0,0 +1,94 @@
+"""
+Reference Script Tests
+
+Contract transaction builders attach deployed reference scripts through
+reference inputs and fall back to inline scripts when none is available.
+"""
+
+from datetime import datetime
+
+import pycardano as pc
+import pytest
+
+from api.database.models import ContractMongo
+from api.services.confirmed_tx_cache import get_confirmed_tx_cache
+from api.services.contract_artifact_cache import ContractArtifact
+from api.services.contract_service_mongo import MongoContractService
+from cardano_offchain.chain_context import CardanoChainContext
+from cardano_offchain.emulator import EmulatedChainContext, EmulatorChainProvider
+
+
+SCRIPT = pc.PlutusV2Script(bytes.fromhex("4e4d01000033222220051200120011"))
+
+
+def _artifact(reference_utxo=None, storage_type="reference_script") -> ContractArtifact:
+    return ContractArtifact.from_contract(
+        ContractMongo.model_construct(
+            policy_id=pc.plutus_script_hash(SCRIPT).payload.hex(),
+            name="project",
+            contract_type="spending",
+            cbor_hex=SCRIPT.hex(),
+            storage_type=storage_type,
+            reference_utxo=reference_utxo,
+            network="testnet",
+            compiled_at=datetime(2025, 1, 1),
+        )
+    )
+
+
+def _send(chain: EmulatedChainContext, signing_key, address, output: pc.TransactionOutput) -> str:
+    builder = pc.TransactionBuilder(chain)
+    builder.add_input_address(address)
+    builder.add_output(output)
+    tx = builder.build_and_sign([signing_key], change_address=address)
+    chain.submit(tx)
+    chain.advance_slots(20)
+    return tx.id.payload.hex()
+
+
+@pytest.mark.unit
+class TestReferenceScripts:
+    """Tests for MongoContractService._script_source and _reference_input_index"""
+
+    async def test_deployed_reference_script_used_until_spent(self):
+        chain = EmulatedChainContext()
+        chain_context = CardanoChainContext("testnet", provider=EmulatorChainProvider(chain))
+        service = MongoContractService()
+        signing_key = pc.PaymentSigningKey.generate()
+        address = pc.Address(signing_key.to_verification_key().hash(), network=pc.Network.TESTNET)
+        chain.fund(address, 100_000_000)
+        deploy_hash = _send(chain, signing_key, address, pc.TransactionOutput(address, 20_000_000, script=SCRIPT))
+
+        source = await service._script_source(_artifact(f"{deploy_hash}:0"), chain_context)
+
+        assert isinstance(source, pc.UTxO)
+        assert source.input == pc.TransactionInput.from_primitive([deploy_hash, 0])
+        assert source.output.script == SCRIPT
+        # The deployment outputs are served from the confirmed tx cache on later builds
+        hits = get_confirmed_tx_cache().stats.memory_hits
+        assert (await service._script_source(_artifact(f"{deploy_hash}:0"), chain_context)).input == source.input
+        assert get_confirmed_tx_cache().stats.memory_hits == hits + 1
+        # Not deployed, unknown or pointing at an output without the script: inline
+        assert await service._script_source(_artifact(f"{deploy_hash}:0", "local"), chain_context) == SCRIPT
+        assert await service._script_source(_artifact(f"{'0' * 64}:0"), chain_context) == SCRIPT
+        assert await service._script_source(_artifact(f"{deploy_hash}:1"), chain_context) == SCRIPT
+
+        # Spent reference UTXO: inline again
+        builder = pc.TransactionBuilder(chain)
+        builder.add_input(source)
+        tx = builder.build_and_sign([signing_key], change_address=address)
+        chain.submit(tx)
+        chain.advance_slots(20)
+        assert await service._script_source(_artifact(f"{deploy_hash}:0"), chain_context) == SCRIPT
+
+    def test_reference_input_index_follows_ledger_order(self):
+        def utxo(tx_id: str, index: int = 0) -> pc.UTxO:
+            address = pc.Address(pc.ScriptHash(bytes(28)), network=pc.Network.TESTNET)
+            return pc.UTxO(pc.TransactionInput.from_primitive([tx_id, index]), pc.TransactionOutput(address, 2_000_000))
+
+        data = utxo("22" * 32)
+
+        assert MongoContractService._reference_input_index(data, SCRIPT) == 0
+        assert MongoContractService._reference_input_index(data, utxo("33" * 32), SCRIPT) == 0
+        assert MongoContractService._reference_input_index(data, utxo("11" * 32), utxo("33" * 32)) == 1
+        assert MongoContractService._reference_input_index(data, utxo("22" * 32, 1), utxo("11" * 32)) == 1
@@ -0,0 +1,61 @@
+"""
+Session Manager Tests
+
+Wallet index, expiry heap and per-shard LRU of the in-memory session store.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from api.services.session_manager import SessionManager
+
+
+FUTURE = datetime.now(timezone.utc) + timedelta(hours=1)
+PAST = datetime.now(timezone.utc) - timedelta(seconds=1)
+
+
+@pytest.mark.unit
+class TestSessionManager:
+    """Tests for SessionManager"""
+
+    def test_remove_wallet_sessions_uses_index(self):
+        manager = SessionManager(max_sessions=100)
+        wallet = object()
+        for i in range(3):
+            manager.store_session(f"a-{i}", wallet, FUTURE, wallet_id="wallet-a")
+        manager.store_session("b-0", wallet, FUTURE, wallet_id="wallet-b")
+
+        assert manager.remove_wallet_sessions("wallet-a") == 3
+        assert manager.get_session("a-0") is None
+        assert manager.get_session("b-0") is wallet
+        assert manager.remove_wallet_sessions("wallet-a") == 0
+        assert manager.get_session_count() == 1
+
+    def test_cleanup_expired_pops_only_due_sessions(self):
+        manager = SessionManager(max_sessions=100)
+        wallet = object()
+        manager.store_session("expired", wallet, PAST, wallet_id="wallet-a")
+        manager.store_session("live", wallet, FUTURE, wallet_id="wallet-a")
+        # Re-stored with a later expiry: its old heap entry must not evict it
+        manager.store_session("refreshed", wallet, PAST)
+        manager.store_session("refreshed", wallet, FUTURE)
+
+        assert manager.cleanup_expired() == 1
+        assert manager.session_exists("live")
+        assert manager.session_exists("refreshed")
+        assert not manager.session_exists("expired")
+        # The expired session was also dropped from the wallet index
+        assert manager.remove_wallet_sessions("wallet-a") == 1
+
+    def test_lru_eviction_bounds_size(self):
+        manager = SessionManager(max_sessions=8, shards=2)
+        for i in range(50):
+            manager.store_session(f"jti-{i}", object(), FUTURE, wallet_id="wallet-a")
+
+        assert manager.get_session_count() <= 8
+        assert manager.get_session("jti-49") is not None
+        # Evicted sessions were dropped from the wallet index as well
+        stored = manager.get_session_count()
+        assert manager.remove_wallet_sessions("wallet-a") == stored
+        assert manager.get_session_count() == 0
@@ -0,0 +1,140 @@
+"""
+Session Signing Tests
+
+Signing built transactions with the unlocked session wallet: the witness
+must verify against the original body bytes and match what the password
+flow produces for the same wallet. Batches are persisted only once every
+transaction is witnessed.
+"""
+
+import hashlib
+
+import pycardano as pc
+import pytest
+from nacl.signing import VerifyKey
+
+from api.database.models import TransactionMongo
+from api.enums import TransactionStatus
+from api.services.transaction_service_mongo import (
+    InvalidTransactionStateError,
+    MongoTransactionService,
+    _prepare_tx_dict_for_validation,
+)
+from api.tests.mocks import FakeDatabase
+from cardano_offchain.wallet import CardanoWallet
+
+
+MNEMONIC = pc.HDWallet.generate_mnemonic()
+
+
+def _built_transaction(wallet: CardanoWallet, fee: int = 170000) -> TransactionMongo:
+    body = pc.TransactionBody(
+        inputs=[pc.TransactionInput(pc.TransactionId(bytes(32)), 0)],
+        outputs=[pc.TransactionOutput(wallet.enterprise_address, 2_000_000)],
+        fee=fee,
+    )
+    return TransactionMongo.model_construct(
+        tx_hash=body.hash().hex(),
+        wallet_id="wallet-a",
+        status=TransactionStatus.BUILT.value,
+        operation="send_ada",
+        unsigned_cbor=body.to_cbor_hex(),
+        witness_cbor=None,
+        tx_metadata={},
+    )
+
+
+def _transactions_database(transactions) -> FakeDatabase:
+    """Tenant database holding the transactions as the service stores them"""
+    database = FakeDatabase()
+    collection = database.get_collection("transactions")
+    for tx in transactions:
+        collection.docs[tx.tx_hash] = MongoTransactionService._transaction_document(tx)
+    return database
+
+
+@pytest.fixture
+def uninitialized_beanie(monkeypatch):
+    # Transactions are read through the fake tenant database; Beanie itself is never initialized
+    monkeypatch.setattr(TransactionMongo, "get_pymongo_collection", classmethod(lambda cls: None))
+
+
+@pytest.mark.unit
+class TestSessionSigning:
+    """Tests for MongoTransactionService._apply_signature"""
+
+    def test_session_wallet_signs_original_body(self):
+        wallet = CardanoWallet(MNEMONIC)
+        transaction = _built_transaction(wallet)
+
+        MongoTransactionService()._apply_signature(transaction, wallet)
+
+        assert transaction.status == TransactionStatus.SIGNED.value
+        assert transaction.fee_lovelace == 170000
+        signed = pc.Transaction.from_cbor(transaction.signed_cbor)
+        (witness,) = signed.transaction_witness_set.vkey_witnesses
+        body_hash = hashlib.blake2b(bytes.fromhex(transaction.unsigned_cbor), digest_size=32).digest()
+        # Raises BadSignatureError if the witness doesn't sign the original body
+        VerifyKey(witness.vkey.payload).verify(body_hash, witness.signature)
+        # Body bytes are kept as built, so the tx id doesn't change
+        assert signed.id.payload.hex() == transaction.tx_hash
+
+    def test_matches_freshly_derived_wallet(self):
+        session_wallet = CardanoWallet(MNEMONIC)
+        from_session = _built_transaction(session_wallet)
+        from_password = _built_transaction(session_wallet)
+
+        service = MongoTransactionService()
+        service._apply_signature(from_session, session_wallet)
+        # The password flow re-derives the wallet from the mnemonic
+        service._apply_signature(from_password, CardanoWallet(MNEMONIC))
+
+        assert from_session.signed_cbor == from_password.signed_cbor
+
+    @pytest.mark.usefixtures("uninitialized_beanie")
+    async def test_batch_is_saved_in_one_write_after_signing(self):
+        wallet = CardanoWallet(MNEMONIC)
+        first, second = _built_transaction(wallet, fee=170000), _built_transaction(wallet, fee=180000)
+        database = _transactions_database([first, second])
+        transactions = database.get_collection("transactions")
+        service = MongoTransactionService(database=database)
+
+        signed = await service.sign_transactions_with_session([second.tx_hash, first.tx_hash], "wallet-a", wallet)
+
+        assert [tx.tx_hash for tx in signed] == [second.tx_hash, first.tx_hash]
+        assert len(transactions.bulk_writes) == 1
+        stored = TransactionMongo.model_validate(
+            _prepare_tx_dict_for_validation(dict(transactions.docs[first.tx_hash]))
+        )
+        assert stored.status == TransactionStatus.SIGNED.value
+        assert stored.signed_cbor == signed[1].signed_cbor
+
+    @pytest.mark.usefixtures("uninitialized_beanie")
+    async def test_failed_signature_leaves_batch_unsaved(self):
+        wallet = CardanoWallet(MNEMONIC)
+        good, broken = _built_transaction(wallet, fee=170000), _built_transaction(wallet, fee=180000)
+        broken.unsigned_cbor = "ff"
+        database = _transactions_database([good, broken])
+        transactions = database.get_collection("transactions")
+        service = MongoTransactionService(database=database)
+
+        with pytest.raises(pc.exception.DeserializeException):
+            await service.sign_transactions_with_session([good.tx_hash, broken.tx_hash], "wallet-a", wallet)
+
+        assert transactions.bulk_writes == []
+        assert transactions.docs[good.tx_hash]["status"] == TransactionStatus.BUILT.value
+
+    @pytest.mark.usefixtures("uninitialized_beanie")
+    async def test_batch_without_unsigned_cbor_is_rejected_before_signing(self):
+        wallet = CardanoWallet(MNEMONIC)
+        good, empty = _built_transaction(wallet, fee=170000), _built_transaction(wallet, fee=180000)
+        empty.unsigned_cbor = None
+        database = _transactions_database([good, empty])
+        transactions = database.get_collection("transactions")
+        service = MongoTransactionService(database=database)
+
+        with pytest.raises(InvalidTransactionStateError, match=empty.tx_hash):
+            await service.sign_transactions_with_session([good.tx_hash, empty.tx_hash], "wallet-a", wallet)
+
+        assert transactions.bulk_writes == []
+        assert transactions.docs[good.tx_hash]["status"] == TransactionStatus.BUILT.value
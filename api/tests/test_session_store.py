@@ -0,0 +1,141 @@
+"""
+Session Store Tests
+
+Shared (MongoDB) session backend: cross-worker resolution through the L1,
+encryption under the server key, tenant scoping and cross-worker revocation
+through the shared revocation revision.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pycardano as pc
+import pytest
+from cryptography.fernet import Fernet
+
+from api.config import Settings
+from api.database.tenant_context import clear_current_tenant, set_current_tenant
+from api.services.session_manager import SessionManager
+from api.services.session_store import COLLECTION_NAME, MongoSessionStore
+from api.services.session_validation_cache import SessionRevocations
+from api.tests.mocks import FakeDatabase
+from api.utils.session_encryption import decrypt_session_material
+from cardano_offchain.wallet import CardanoWallet
+
+
+MNEMONIC = pc.HDWallet.generate_mnemonic()
+EXPIRES = datetime.now(timezone.utc) + timedelta(hours=1)
+SERVER_KEY = Fernet.generate_key().decode()
+
+
+@pytest.mark.unit
+class TestMongoSessionStore:
+    """Tests for MongoSessionStore"""
+
+    async def test_session_resolves_on_another_worker(self):
+        shared = FakeDatabase()
+        worker_a = MongoSessionStore(SERVER_KEY, SessionManager(), database=shared)
+        worker_b = MongoSessionStore(SERVER_KEY, SessionManager(), database=shared)
+        wallet = CardanoWallet(MNEMONIC)
+
+        await worker_a.store("jti-1", wallet, EXPIRES, wallet_id="wallet-a")
+        # Only the account-level key is stored, and never in clear
+        doc = shared.get_collection(COLLECTION_NAME).docs["jti-1"]
+        assert decrypt_session_material(doc["material"], SERVER_KEY) == wallet.export_account_key()
+        assert wallet.export_account_key().hex() not in str(doc)
+
+        restored = await worker_b.get("jti-1")
+        assert restored.enterprise_address == wallet.enterprise_address
+        assert restored.get_signing_key(3).to_cbor_hex() == wallet.get_signing_key(3).to_cbor_hex()
+        assert restored.wallet is None  # no root key on the restoring worker
+        # Served from worker B's L1 from now on
+        assert worker_b.l1.get_session("jti-1") is restored
+
+        # A worker with a different server key can't use the material
+        other = MongoSessionStore(Fernet.generate_key().decode(), SessionManager(), database=shared)
+        assert await other.get("jti-1") is None
+
+    async def test_remove_wallet_clears_shared_and_local(self):
+        shared = FakeDatabase()
+        store = MongoSessionStore(SERVER_KEY, SessionManager(), database=shared)
+        wallet = CardanoWallet(MNEMONIC)
+        await store.store("jti-1", wallet, EXPIRES, wallet_id="wallet-a")
+        await store.store("jti-2", wallet, EXPIRES, wallet_id="wallet-a")
+
+        assert await store.remove_wallet("wallet-a") == 2
+        assert await store.get("jti-1") is None
+        assert store.l1.get_session_count() == 0
+
+    async def test_l1_hits_skip_the_shared_collection_within_ttl(self):
+        shared = FakeDatabase()
+        store = MongoSessionStore(SERVER_KEY, SessionManager(), database=shared, confirm_ttl_seconds=60)
+        await store.store("jti-1", CardanoWallet(MNEMONIC), EXPIRES, wallet_id="wallet-a")
+
+        for _ in range(5):
+            assert await store.get("jti-1") is not None
+        assert shared.get_collection(COLLECTION_NAME).reads == []
+
+    async def test_revocation_on_another_worker_drops_l1_copy(self):
+        shared = FakeDatabase()
+        admin = FakeDatabase()  # holds the revocation revisions
+        revocations_a = SessionRevocations(admin, poll_seconds=0)
+        revocations_b = SessionRevocations(admin, poll_seconds=0)
+        worker_a = MongoSessionStore(SERVER_KEY, SessionManager(), database=shared, revocations=revocations_a)
+        worker_b = MongoSessionStore(
+            SERVER_KEY, SessionManager(), database=shared, confirm_ttl_seconds=60, revocations=revocations_b
+        )
+        await worker_a.store("jti-1", CardanoWallet(MNEMONIC), EXPIRES, wallet_id="wallet-a")
+        assert await worker_b.get("jti-1") is not None
+        reads = len(shared.get_collection(COLLECTION_NAME).reads)
+
+        # Without a revocation signal worker B keeps trusting its L1 copy
+        assert await worker_b.get("jti-1") is not None
+        assert len(shared.get_collection(COLLECTION_NAME).reads) == reads
+
+        # Revoked on worker A: worker B re-checks as soon as it sees the new revision
+        assert await worker_a.remove("jti-1")
+        await revocations_a.bump(None)
+        assert await worker_b.get("jti-1") is None
+        assert worker_b.l1.get_session("jti-1") is None
+        assert not await worker_b.exists("jti-1")
+
+    async def test_remove_is_scoped_to_the_tenant(self):
+        shared = FakeDatabase()
+        store = MongoSessionStore(SERVER_KEY, SessionManager(), database=shared)
+        try:
+            set_current_tenant("tenant-a")
+            await store.store("jti-1", CardanoWallet(MNEMONIC), EXPIRES, wallet_id="wallet-a")
+
+            set_current_tenant("tenant-b")
+            await store.remove("jti-1")
+            assert "jti-1" in shared.get_collection(COLLECTION_NAME).docs
+        finally:
+            clear_current_tenant()
+
+    async def test_session_resolves_only_for_its_tenant(self):
+        shared = FakeDatabase()
+        worker_a = MongoSessionStore(SERVER_KEY, SessionManager(), database=shared)
+        worker_b = MongoSessionStore(SERVER_KEY, SessionManager(), database=shared)
+        try:
+            set_current_tenant("tenant-a")
+            await worker_a.store("jti-1", CardanoWallet(MNEMONIC), EXPIRES, wallet_id="wallet-a")
+
+            set_current_tenant("tenant-b")
+            assert await worker_b.get("jti-1") is None
+            assert await worker_a.get("jti-1") is None
+            assert not await worker_b.exists("jti-1")
+
+            set_current_tenant("tenant-a")
+            assert await worker_b.get("jti-1") is not None
+        finally:
+            clear_current_tenant()
+
+    def test_requires_a_fernet_server_key(self):
+        with pytest.raises(ValueError):
+            MongoSessionStore("", SessionManager())
+        # A passphrase is not hashed into a key
+        with pytest.raises(ValueError, match="Fernet key"):
+            MongoSessionStore("server-secret", SessionManager())
+        # Checked when the settings load, before any wallet is unlocked
+        with pytest.raises(ValueError, match="Fernet key"):
+            Settings(session_backend="mongo", session_encryption_key="server-secret")
+        assert Settings(session_backend="mongo", session_encryption_key=SERVER_KEY).session_encryption_key == SERVER_KEY
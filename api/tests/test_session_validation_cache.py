@@ -0,0 +1,127 @@
+"""
+Session Validation Cache Tests
+
+TTL, revocation push from SessionManager, cross-worker revocation revisions
+and write-behind timestamp flushing.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from api.services.session_manager import SessionManager
+from api.services.session_validation_cache import (
+    REVOCATIONS_COLLECTION_NAME,
+    LastUsedBuffer,
+    SessionRevocations,
+    SessionValidationCache,
+    get_session_validation_cache,
+)
+from api.tests.mocks import FakeCollection, FakeDatabase
+
+
+EXPIRES = datetime(2030, 1, 1)
+
+
+@pytest.mark.unit
+class TestSessionValidationCache:
+    """Tests for SessionValidationCache and LastUsedBuffer"""
+
+    def test_hit_ttl_and_wallet_mismatch(self):
+        cache = SessionValidationCache(ttl_seconds=60)
+        cache.put("jti-1", "wallet-a", "acme", "session-1", EXPIRES)
+
+        assert cache.get("jti-1", "wallet-a", "acme").session_id == "session-1"
+        assert cache.get("jti-1", "wallet-b", "acme") is None
+
+        cache.ttl_seconds = 0
+        assert cache.get("jti-1", "wallet-a", "acme") is None
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 2
+
+    def test_validation_is_scoped_to_the_tenant(self):
+        cache = SessionValidationCache(ttl_seconds=60)
+        cache.put("jti-1", "wallet-a", "acme", "session-1", EXPIRES)
+
+        # Validated in acme's database only: other tenants must check their own
+        assert cache.get("jti-1", "wallet-a", "globex") is None
+        assert cache.get("jti-1", "wallet-a", None) is None
+        cache.put("jti-1", "wallet-a", "globex", "session-9", EXPIRES)
+        assert cache.get("jti-1", "wallet-a", "acme").session_id == "session-1"
+        assert cache.get("jti-1", "wallet-a", "globex").session_id == "session-9"
+
+        cache.invalidate("jti-1")
+        assert cache.get("jti-1", "wallet-a", "acme") is None
+        assert cache.get("jti-1", "wallet-a", "globex") is None
+
+    def test_session_manager_pushes_revocations(self):
+        cache = get_session_validation_cache()
+        cache.put("jti-revoked", "wallet-a", "acme", "session-1", EXPIRES)
+        cache.put("jti-other", "wallet-a", "acme", "session-2", EXPIRES)
+
+        manager = SessionManager()
+        manager.remove_session("jti-revoked")
+        assert cache.get("jti-revoked", "wallet-a", "acme") is None
+        assert cache.get("jti-other", "wallet-a", "acme") is not None
+
+        manager.clear_all()
+        assert cache.get("jti-other", "wallet-a", "acme") is None
+
+    async def test_revocation_on_another_worker_applies_within_poll_interval(self):
+        database = FakeDatabase("terrasacha_admin")
+        revisions = database.get_collection(REVOCATIONS_COLLECTION_NAME)
+        # Two workers: separate caches and revision trackers over one admin database
+        worker_a, worker_b = (
+            SessionRevocations(database, poll_seconds=60),
+            SessionRevocations(database, poll_seconds=60),
+        )
+        cache_b = SessionValidationCache(ttl_seconds=60)
+
+        revision = await worker_b.current("acme")
+        cache_b.put("jti-1", "wallet-a", "acme", "session-1", EXPIRES, revision)
+        assert cache_b.get("jti-1", "wallet-a", "acme", await worker_b.current("acme")) is not None
+        assert len(revisions.reads) == 1  # revision reused within the poll interval
+
+        await worker_a.bump("acme")
+        assert await worker_a.current("acme") == 1
+        # Worker B trusts its cached validation until it re-reads the revision
+        assert cache_b.get("jti-1", "wallet-a", "acme", await worker_b.current("acme")) is not None
+        worker_b.poll_seconds = 0
+        assert await worker_b.current("acme") == 1
+        assert cache_b.get("jti-1", "wallet-a", "acme", await worker_b.current("acme")) is None
+
+        # Other tenants are unaffected
+        assert await worker_b.current("globex") == 0
+
+    async def test_revisions_are_process_local_without_database(self):
+        revocations = SessionRevocations()
+        assert await revocations.current("acme") == 0
+        assert await revocations.bump("acme") == 1
+        assert await revocations.current("acme") == 1
+        assert await revocations.current(None) == 0
+
+    async def test_last_used_flush_batches_per_tenant(self, monkeypatch):
+        collections = {"acme": FakeCollection(), "globex": FakeCollection()}
+        buffer = LastUsedBuffer()
+
+        async def get_collection(tenant_id):
+            return collections[tenant_id]
+
+        monkeypatch.setattr(buffer, "_get_collection", get_collection)
+
+        first = datetime(2025, 1, 1, 12, 0)
+        for i in range(5):
+            buffer.touch("jti-1", "acme", first + timedelta(seconds=i))
+        buffer.touch("jti-2", "acme", first)
+        buffer.touch("jti-3", "globex", first)
+
+        assert buffer.pending == 3
+        assert await buffer.flush() == 3
+        assert buffer.pending == 0
+
+        acme_ops = collections["acme"].bulk_writes[0]
+        assert len(collections["acme"].bulk_writes) == 1
+        assert len(acme_ops) == 2
+        assert acme_ops[0]._doc == {"$max": {"last_used_at": first + timedelta(seconds=4)}}
+        assert len(collections["globex"].bulk_writes[0]) == 1
+        assert await buffer.flush() == 0
@@ -0,0 +1,144 @@
+"""
+UTxO Cache Tests
+
+TTL expiry, hit/miss counting, submit invalidation and tenant limits.
+"""
+
+import asyncio
+
+import pycardano as pc
+import pytest
+
+from api.services.utxo_cache import CachedChainProvider, UtxoCache
+from cardano_offchain.chain_provider import StubChainProvider
+
+
+ADDRESS = "addr_test1vrm9x2zsux7va6w892g38tvchnzahvcd9tykqf3ygnmwtaqyfg52x"
+OTHER = "addr_test1vz09v9yfxguvlp0zsnrpa3tdtm7el8xufp3m5lsm7qxzclgmzkket"
+
+
+def _utxo(address: str, index: int, lovelace: int = 2_000_000) -> pc.UTxO:
+    return pc.UTxO(
+        pc.TransactionInput.from_primitive(["a" * 64, index]),
+        pc.TransactionOutput(pc.Address.from_primitive(address), lovelace),
+    )
+
+
+def _tx(inputs: list[pc.TransactionInput], outputs: list[pc.TransactionOutput]) -> pc.Transaction:
+    body = pc.TransactionBody(inputs=inputs, outputs=outputs, fee=200_000)
+    return pc.Transaction(body, pc.TransactionWitnessSet())
+
+
+class CountingProvider(StubChainProvider):
+    """Stub provider that counts UTxO queries"""
+
+    def __init__(self):
+        super().__init__()
+        self.utxo_calls = 0
+
+    async def utxos(self, address):
+        self.utxo_calls += 1
+        await asyncio.sleep(0)
+        return await super().utxos(address)
+
+
+@pytest.fixture
+def provider():
+    provider = CountingProvider()
+    provider.add_utxo(_utxo(ADDRESS, 0))
+    provider.add_utxo(_utxo(OTHER, 1))
+    return provider
+
+
+@pytest.mark.unit
+class TestUtxoCache:
+    """Tests for UtxoCache and CachedChainProvider"""
+
+    async def test_hits_and_concurrent_misses(self, provider):
+        cached = CachedChainProvider(provider, UtxoCache(ttl_seconds=60))
+
+        results = await asyncio.gather(*(cached.utxos(ADDRESS) for _ in range(3)))
+        await cached.address_utxos(ADDRESS)
+
+        assert all(len(r) == 1 for r in results)
+        assert provider.utxo_calls == 1
+        assert cached.cache.stats.hits == 1
+        assert cached.cache.stats.misses == 3
+
+    async def test_ttl_expiry(self, provider):
+        cached = CachedChainProvider(provider, UtxoCache(ttl_seconds=0))
+
+        await cached.utxos(ADDRESS)
+        await cached.utxos(ADDRESS)
+
+        assert provider.utxo_calls == 2
+
+    async def test_submit_invalidates_spent_and_paid_addresses(self, provider):
+        cache = UtxoCache(ttl_seconds=60)
+        cached = CachedChainProvider(provider, cache)
+        await cached.utxos(ADDRESS)
+        await cached.utxos(OTHER)
+
+        # Spend ADDRESS's UTxO and pay only back to ADDRESS: OTHER stays cached
+        spent = cache.get(ADDRESS)[0]
+        tx = _tx([spent.input], [pc.TransactionOutput(pc.Address.from_primitive(ADDRESS), 1_500_000)])
+        await cached.submit_tx(tx.to_cbor())
+
+        assert provider.submitted
+        assert cache.get(ADDRESS) is None
+        assert cache.get(OTHER) is not None
+        assert cache.stats.invalidations == 1
+
+        # Paying to OTHER invalidates it as a receiving address
+        tx = _tx(
+            [pc.TransactionInput.from_primitive(["d" * 64, 0])],
+            [pc.TransactionOutput(pc.Address.from_primitive(OTHER), 1_500_000)],
+        )
+        await cached.submit_tx(tx.to_cbor())
+        assert cache.get(OTHER) is None
+
+    def test_tenant_limit_evicts_least_recently_used(self):
+        one = [_utxo(ADDRESS, 0)]
+        size = UtxoCache._estimate_size(one)
+        cache = UtxoCache(ttl_seconds=60, tenant_max_bytes=size + 1)
+
+        cache.put(ADDRESS, one, tenant="a")
+        cache.put(OTHER, [_utxo(OTHER, 1)], tenant="b")
+        cache.put("addr_test1third", [_utxo(ADDRESS, 2)], tenant="a")
+
+        assert cache.get(ADDRESS) is None
+        assert cache.get("addr_test1third") is not None
+        assert cache.get(OTHER) is not None
+        assert cache.stats.evictions == 1
+        # Stats expose aggregates only, never tenant IDs
+        snapshot = cache.stats.snapshot()
+        assert snapshot["tenant_count"] == 2
+        assert snapshot["cached_bytes"] == sum(cache.stats.tenant_bytes.values())
+        assert "tenant_bytes" not in snapshot
+
+    async def test_invalidation_during_load_skips_caching_and_keeps_no_state(self, provider):
+        cache = UtxoCache(ttl_seconds=60)
+        cached = CachedChainProvider(provider, cache)
+
+        load = asyncio.ensure_future(cached.utxos(ADDRESS))
+        await asyncio.sleep(0)
+        cache.invalidate(ADDRESS)
+        assert len(await load) == 1
+        assert cache.get(ADDRESS) is None
+
+        # A submit spending from an address whose first load is in flight
+        # can't be traced to it through cached entries; the load is dropped
+        load = asyncio.ensure_future(cached.utxos(OTHER))
+        await asyncio.sleep(0)
+        tx = _tx(
+            [pc.TransactionInput.from_primitive(["a" * 64, 1])],
+            [pc.TransactionOutput(pc.Address.from_primitive(ADDRESS), 1_500_000)],
+        )
+        await cached.submit_tx(tx.to_cbor())
+        assert len(await load) == 1
+        assert cache.get(OTHER) is None
+
+        # Invalidating addresses with no load in flight leaves nothing behind
+        for index in range(100):
+            cache.invalidate(f"addr_test1unseen{index}")
+        assert not cache._invalidated_loads and not cache._loading
@@ -0,0 +1,109 @@
+"""
+UTxO Reservation Ledger Tests
+
+Leases keep concurrent builds off each other's inputs; outputs of our own
+submitted transactions are spendable before they confirm.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pycardano as pc
+import pytest
+
+from api.services.utxo_reservations import UtxoReservationConflictError, UtxoReservationLedger, utxo_ref
+from api.tests.mocks import FakeDatabase
+
+
+WALLET = pc.Address(pc.VerificationKeyHash(bytes.fromhex("11" * 28)), network=pc.Network.TESTNET)
+OTHER = pc.Address(pc.VerificationKeyHash(bytes.fromhex("22" * 28)), network=pc.Network.TESTNET)
+
+
+def _utxo(index: int, lovelace: int = 5_000_000) -> pc.UTxO:
+    tx_id = pc.TransactionId(index.to_bytes(32, "big"))
+    return pc.UTxO(pc.TransactionInput(tx_id, 0), pc.TransactionOutput(WALLET, pc.Value(lovelace)))
+
+
+@pytest.mark.unit
+class TestUtxoReservationLedger:
+    """Tests for UtxoReservationLedger"""
+
+    async def test_leases_block_concurrent_builds_until_released(self):
+        ledger = UtxoReservationLedger(FakeDatabase())
+        a, b, c = (utxo_ref(_utxo(i)) for i in range(3))
+
+        await ledger.reserve("tx1", [a, b], wallet_id="w")
+        await ledger.reserve("tx1", [a, b], wallet_id="w")  # renewing our own lease is fine
+        with pytest.raises(UtxoReservationConflictError) as conflict:
+            await ledger.reserve("tx2", [b, c])
+        assert conflict.value.refs == [b]
+        assert await ledger.leased_refs([a, b, c]) == {a, b}  # tx2 kept nothing
+
+        # An expired lease can be taken over
+        past = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(seconds=1)
+        ledger.database.get_collection("utxo_reservations").docs[a]["expires_at"] = past
+        await ledger.reserve("tx2", [a, c])
+        assert await ledger.release("tx1") == 1
+        assert await ledger.leased_refs([a, b, c]) == {a, c}
+        assert await ledger.release_many(["tx2"]) == 2
+
+    async def test_available_utxos_chain_pending_outputs(self):
+        database = FakeDatabase()
+        ledger = UtxoReservationLedger(database)
+        spent, free = _utxo(1), _utxo(2)
+
+        # Our submitted tx spends `spent`, pays OTHER and returns change to WALLET
+        body = pc.TransactionBody(
+            inputs=[spent.input],
+            outputs=[pc.TransactionOutput(OTHER, 2_000_000), pc.TransactionOutput(WALLET, 2_800_000)],
+            fee=200_000,
+        )
+        pending_hash = body.hash().hex()
+        database.get_collection("transactions").docs[pending_hash] = {
+            "_id": pending_hash,
+            "status": "SUBMITTED",
+            "network": "testnet",
+            "outputs": [{"address": str(OTHER)}, {"address": str(WALLET)}],
+            "signed_cbor": pc.Transaction(body, pc.TransactionWitnessSet()).to_cbor_hex(),
+        }
+        await ledger.reserve_transaction(body, pending_hash)
+
+        available = await ledger.available_utxos(str(WALLET), [spent, free], "testnet")
+
+        assert [utxo_ref(u) for u in available] == [utxo_ref(free), f"{pending_hash}:1"]
+        assert available[1].output.amount.coin == 2_800_000
+        assert await ledger.available_utxos(str(WALLET), [spent, free], "mainnet") == [free]
+        # Script builds keep to on-chain UTxOs; the spent input stays leased
+        assert await ledger.available_utxos(str(WALLET), [spent, free], "testnet", chain_pending=False) == [free]
+
+    async def test_confirmed_child_keeps_lease_on_pending_parent_output(self):
+        database = FakeDatabase()
+        ledger = UtxoReservationLedger(database)
+        transactions = database.get_collection("transactions")
+        funding, free = _utxo(1), _utxo(2)
+
+        def submit(inputs: list[pc.TransactionInput]) -> str:
+            body = pc.TransactionBody(inputs=inputs, outputs=[pc.TransactionOutput(WALLET, 4_800_000)], fee=200_000)
+            tx_hash = body.hash().hex()
+            transactions.docs[tx_hash] = {
+                "_id": tx_hash,
+                "status": "SUBMITTED",
+                "network": "testnet",
+                "outputs": [{"address": str(WALLET)}],
+                "signed_cbor": pc.Transaction(body, pc.TransactionWitnessSet()).to_cbor_hex(),
+            }
+            return tx_hash
+
+        # Parent P is submitted; child C spends P#0 and an on-chain UTxO
+        parent = submit([funding.input])
+        await ledger.reserve(parent, [utxo_ref(funding)])
+        child = submit([pc.TransactionInput.from_primitive([parent, 0]), free.input])
+        await ledger.reserve(child, [f"{parent}:0", utxo_ref(free)])
+
+        # C confirms while P is still SUBMITTED: only the on-chain input's lease goes
+        transactions.docs[child]["status"] = "CONFIRMED"
+        assert await ledger.release_confirmed([child]) == 1
+        assert await ledger.leased_refs([f"{parent}:0", utxo_ref(free)]) == {f"{parent}:0"}
+        # The chain now lists C#0; P#0 is spent and must not be offered
+        child_output = pc.UTxO(pc.TransactionInput.from_primitive([child, 0]), pc.TransactionOutput(WALLET, 4_800_000))
+        available = await ledger.available_utxos(str(WALLET), [child_output], "testnet")
+        assert [utxo_ref(u) for u in available] == [f"{child}:0"]
@@ -0,0 +1,94 @@
+"""
+Wallet Balance Tests
+
+Concurrent multi-asset balance aggregation across wallet addresses.
+"""
+
+import asyncio
+
+import pycardano as pc
+import pytest
+
+from api.services.chain_enrichment import EnrichmentEngine
+from api.services.wallet_balances import fetch_address_balances, fetch_address_utxos, total_balance
+from api.services.wallet_service_mongo import MongoWalletService
+from cardano_offchain.chain_provider import ChainProviderError, StubChainProvider
+from cardano_offchain.wallet import CardanoWallet
+
+
+POLICY = pc.ScriptHash(bytes.fromhex("ab" * 28))
+UNIT = "ab" * 28 + b"GREY".hex()
+
+
+def _utxo(address: pc.Address, index: int, lovelace: int, tokens: int = 0) -> pc.UTxO:
+    amount = pc.Value(lovelace)
+    if tokens:
+        amount = pc.Value(lovelace, pc.MultiAsset({POLICY: pc.Asset({pc.AssetName(b"GREY"): tokens})}))
+    return pc.UTxO(pc.TransactionInput(pc.TransactionId(bytes([index]) * 32), 0), pc.TransactionOutput(address, amount))
+
+
+class SlowStubChainProvider(StubChainProvider):
+    """Stub provider that tracks concurrent address queries"""
+
+    def __init__(self):
+        super().__init__()
+        self.in_flight = 0
+        self.peak = 0
+
+    async def address(self, address: str) -> dict:
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        if address == "addr_broken":
+            raise ChainProviderError("Internal error", status_code=500)
+        return await super().address(address)
+
+
+@pytest.mark.unit
+class TestWalletBalances:
+    """Tests for the wallet balance engine"""
+
+    async def test_counts_every_asset_concurrently(self):
+        wallet = CardanoWallet(pc.HDWallet.generate_mnemonic())
+        wallet.generate_addresses(3)
+        provider = SlowStubChainProvider()
+        provider.add_utxo(_utxo(wallet.enterprise_address, 1, 2_000_000, tokens=5))
+        provider.add_utxo(_utxo(wallet.enterprise_address, 2, 3_000_000))
+        provider.add_utxo(_utxo(wallet.addresses[2]["enterprise_address"], 3, 1_500_000, tokens=7))
+        unused = str(wallet.addresses[1]["enterprise_address"])
+
+        addresses = [str(wallet.enterprise_address), unused, str(wallet.addresses[2]["enterprise_address"])]
+        balances = await fetch_address_balances(provider, addresses, engine=EnrichmentEngine(max_concurrency=8))
+
+        assert [b.lovelace for b in balances] == [5_000_000, 0, 1_500_000]
+        assert balances[0].assets == {UNIT: 5}
+        assert balances[1].error is None  # unused address is a zero balance, not a failure
+        assert total_balance(balances) == (6_500_000, {UNIT: 12})
+        assert provider.peak == 3
+
+    async def test_failed_address_does_not_fail_batch(self):
+        provider = SlowStubChainProvider()
+        address = str(CardanoWallet(pc.HDWallet.generate_mnemonic()).enterprise_address)
+        provider.add_utxo(_utxo(pc.Address.from_primitive(address), 1, 1_000_000))
+
+        balances = await fetch_address_balances(provider, [address, "addr_broken"], engine=EnrichmentEngine())
+
+        assert balances[0].lovelace == 1_000_000
+        assert balances[1].lovelace == 0
+        assert "Internal error" in balances[1].error
+        utxos = await fetch_address_utxos(provider, [address], engine=EnrichmentEngine())
+        assert len(utxos[0][1]) == 1
+
+    async def test_service_balance_includes_tokens(self):
+        wallet = CardanoWallet(pc.HDWallet.generate_mnemonic())
+        provider = StubChainProvider()
+        provider.add_utxo(_utxo(wallet.enterprise_address, 1, 2_000_000, tokens=3))
+        provider.add_utxo(_utxo(wallet.get_address(2), 2, 1_000_000, tokens=4))
+
+        balance = await MongoWalletService().get_wallet_balance(wallet, provider, limit_addresses=2)
+
+        assert balance["total_balance"] == 3_000_000
+        assert balance["total_assets"] == {UNIT: 7}
+        assert [entry["index"] for entry in balance["derived_addresses"]] == [1, 2]
+        assert balance["derived_addresses"][0]["assets"] == {UNIT: 4}
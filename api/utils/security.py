@@ -80,36 +80,66 @@ async def get_api_key_and_tenant(
     if api_key_header == settings.admin_api_key:
         return (api_key_header, "admin")
 
-    # MongoDB lookup for tenant API keys
-    from api.database.models import ApiKey
-    from api.database.multi_tenant_manager import get_multi_tenant_db_manager
+    import time
+    from datetime import datetime, timezone
 
-    db_manager = get_multi_tenant_db_manager()
-    if not db_manager._initialized:
-        await db_manager.initialize()
+    from api.services.api_key_cache import get_api_key_cache, get_api_key_last_used_buffer, get_api_key_revocations
 
     api_key_hash = hash_api_key(api_key_header)
-    api_key_record = await ApiKey.find_one(ApiKey.api_key_hash == api_key_hash)
-
-    if api_key_record and api_key_record.is_active:
-        # Check expiration
-        if api_key_record.expires_at:
-            from datetime import datetime
-            if datetime.utcnow() > api_key_record.expires_at:
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="API Key expired"
-                )
-
-        # Update last used timestamp
-        from datetime import datetime
-        api_key_record.last_used_at = datetime.utcnow()
-        await api_key_record.save()
-
-        return (api_key_header, api_key_record.tenant_id)
-
-    # No fallbacks - reject invalid keys
-    raise HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Invalid or inactive API Key"
-    )
+    cache = get_api_key_cache()
+    revocations = get_api_key_revocations()
+
+    # Recently rejected keys fail without touching the admin database
+    if cache.is_rejected(api_key_hash):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or inactive API Key"
+        )
+
+    resolved = cache.get(api_key_hash)
+    if resolved is not None and resolved.revision != await revocations.current(resolved.tenant_id):
+        # The tenant revoked or deleted a key (possibly on another worker) since the lookup
+        cache.invalidate(resolved.tenant_id, resolved.api_key_prefix)
+        resolved = None
+
+    if resolved is None:
+        # MongoDB lookup for tenant API keys
+        from api.database.models import ApiKey
+        from api.database.multi_tenant_manager import get_multi_tenant_db_manager
+
+        db_manager = get_multi_tenant_db_manager()
+        if not db_manager._initialized:
+            await db_manager.initialize()
+
+        lookup_started = time.monotonic()
+        api_key_record = await ApiKey.find_one(ApiKey.api_key_hash == api_key_hash)
+
+        if not api_key_record or not api_key_record.is_active:
+            # No fallbacks - reject invalid keys
+            cache.put_rejected(api_key_hash)
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid or inactive API Key"
+            )
+
+        resolved = cache.put(
+            api_key_hash,
+            key_id=api_key_record.id,
+            tenant_id=api_key_record.tenant_id,
+            api_key_prefix=api_key_record.api_key_prefix,
+            expires_at=api_key_record.expires_at,
+            revision=revocations.known_before(api_key_record.tenant_id, lookup_started),
+        )
+
+    # Check expiration
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    if resolved.expires_at and now > resolved.expires_at:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="API Key expired"
+        )
+
+    # Update last used timestamp (written behind in batches)
+    get_api_key_last_used_buffer().touch(resolved.key_id, None, now)
+
+    return (api_key_header, resolved.tenant_id)
@@ -16,7 +16,7 @@ import base64
 import hashlib
 import secrets
 
-from cryptography.fernet import Fernet
+from cryptography.fernet import Fernet, InvalidToken
 
 
 def generate_session_key() -> str:
@@ -182,3 +182,81 @@ def decrypt_password_from_session(encrypted_password: str, session_key: str) ->
         if "Invalid" in str(e) or "token" in str(e).lower():
             raise ValueError("Invalid session key or corrupted data") from e
         raise
+
+
+def _server_cipher(server_key: str) -> Fernet:
+    """
+    Fernet cipher for the server's session key.
+
+    The key is used as-is, so it must be a Fernet key (32 random bytes,
+    URL-safe base64), not a passphrase.
+
+    Raises:
+        ValueError: If server_key is not a valid Fernet key
+    """
+    try:
+        return Fernet(server_key)
+    except (ValueError, TypeError) as e:
+        raise ValueError(
+            "Server session key must be a Fernet key; generate one with "
+            'python -c "from cryptography.fernet import Fernet; print(Fernet.generate_key().decode())"'
+        ) from e
+
+
+def validate_server_session_key(server_key: str) -> str:
+    """
+    Check that the server's session key is a usable Fernet key.
+
+    Args:
+        server_key: Server-side session key (settings.session_encryption_key)
+
+    Returns:
+        The key, unchanged
+
+    Raises:
+        ValueError: If server_key is not a valid Fernet key
+    """
+    _server_cipher(server_key)
+    return server_key
+
+
+def encrypt_session_material(material: bytes, server_key: str) -> str:
+    """
+    Encrypt unlocked-wallet key material under the server's session key.
+
+    Used by the shared session store so worker processes can restore a
+    session unlocked on another worker. Unlike the functions above, the key
+    is a server secret (settings.session_encryption_key), not a client one.
+
+    Args:
+        material: Raw key material (e.g. CardanoWallet.export_account_key())
+        server_key: Server-side Fernet key
+
+    Returns:
+        Fernet token (base64 text)
+
+    Raises:
+        ValueError: If server_key is not a valid Fernet key
+    """
+    return _server_cipher(server_key).encrypt(material).decode("utf-8")
+
+
+def decrypt_session_material(token: str, server_key: str) -> bytes:
+    """
+    Decrypt key material encrypted with encrypt_session_material().
+
+    Args:
+        token: Fernet token from encrypt_session_material()
+        server_key: Server-side Fernet key
+
+    Returns:
+        Raw key material
+
+    Raises:
+        ValueError: If server_key is not a valid Fernet key or the token is invalid
+    """
+    cipher = _server_cipher(server_key)
+    try:
+        return cipher.decrypt(token.encode("utf-8"))
+    except InvalidToken as e:
+        raise ValueError("Invalid server session key or corrupted session material") from e
@@ -6,7 +6,9 @@ Contains pure business logic for wallet management, transactions, and contracts.
 """
 
 from .chain_context import CardanoChainContext
+from .chain_provider import BlockfrostChainProvider, ChainProvider, ChainProviderError, StubChainProvider
 from .contracts import ContractManager
+from .emulator import EmulatedChainContext, EmulatorChainProvider
 from .tokens import TokenOperations
 from .transactions import CardanoTransactions
 from .wallet import CardanoWallet, WalletManager
@@ -16,6 +18,12 @@ __all__ = [
     "CardanoWallet",
     "WalletManager",
     "CardanoChainContext",
+    "ChainProvider",
+    "ChainProviderError",
+    "BlockfrostChainProvider",
+    "StubChainProvider",
+    "EmulatedChainContext",
+    "EmulatorChainProvider",
     "CardanoTransactions",
     "ContractManager",
     "TokenOperations",
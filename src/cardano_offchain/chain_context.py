@@ -5,23 +5,40 @@ Pure chain context functionality without console dependencies.
 Handles network configuration and blockchain connection setup.
 """
 
+import asyncio
+
 import pycardano as pc
 from blockfrost import ApiUrls, BlockFrostApi
 
+from .chain_provider import BlockfrostChainProvider, ChainProvider
+from .emulator import EmulatorChainProvider, get_emulator
+
 
 class CardanoChainContext:
     """Manages Cardano chain context and network configuration"""
 
-    def __init__(self, network: str = "testnet", blockfrost_api_key: str | None = None):
+    def __init__(
+        self,
+        network: str = "testnet",
+        blockfrost_api_key: str | None = None,
+        provider: ChainProvider | None = None,
+        backend: str = "blockfrost",
+    ):
         """
         Initialize chain context
 
         Args:
             network: Network type ("testnet" or "mainnet")
             blockfrost_api_key: BlockFrost API key for chain queries
+            provider: Async chain provider (defaults to Blockfrost when a key is given)
+            backend: "blockfrost" or "emulator" (shared in-memory ledger for the
+                network, no API key or network access needed)
         """
+        if backend not in ("blockfrost", "emulator"):
+            raise ValueError(f"Unknown chain backend: {backend}")
         self.network = network
         self.blockfrost_api_key = blockfrost_api_key
+        self.backend = backend
 
         # Set network configuration
         # Support both legacy "testnet" (maps to preview) and explicit preview/preprod
@@ -43,8 +60,22 @@ class CardanoChainContext:
         if blockfrost_api_key:
             self.api = BlockFrostApi(project_id=blockfrost_api_key, base_url=self.base_url)
 
-        # Initialize chain context
-        self.context = self._get_chain_context()
+        # Async provider used by the API (pooled keep-alive HTTP)
+        self.provider = provider
+        if self.provider is None and backend == "emulator":
+            self.provider = EmulatorChainProvider(get_emulator(network))
+        elif self.provider is None and blockfrost_api_key:
+            self.provider = BlockfrostChainProvider(self.base_url, blockfrost_api_key)
+
+        # PyCardano chain context is created on first use (its constructor queries the chain)
+        self._context: pc.ChainContext | None = None
+
+    @property
+    def context(self) -> pc.ChainContext:
+        """PyCardano chain context used by TransactionBuilder"""
+        if self._context is None:
+            self._context = self._get_chain_context()
+        return self._context
 
     def _get_chain_context(self) -> pc.ChainContext:
         """
@@ -53,6 +84,9 @@ class CardanoChainContext:
         Returns:
             PyCardano chain context for transaction operations
         """
+        if self.backend == "emulator":
+            return get_emulator(self.network)
+
         if not self.blockfrost_api_key:
             raise ValueError("BlockFrost API key required for chain context")
 
@@ -62,6 +96,29 @@ class CardanoChainContext:
         """Get the chain context"""
         return self.context
 
+    async def prepare_context(self) -> pc.ChainContext:
+        """
+        Chain context with its protocol parameters loaded, for use inside coroutines
+
+        Creating a BlockFrostChainContext and refreshing its parameters at an
+        epoch boundary are blocking HTTP calls; they run in a worker thread so
+        the event loop keeps serving. Later protocol_param reads in the same
+        epoch are served from the context's own cache.
+        """
+
+        def load() -> pc.ChainContext:
+            context = self.context
+            context.protocol_param  # noqa: B018 - fetched and cached by the context
+            return context
+
+        return await asyncio.to_thread(load)
+
+    def get_provider(self) -> ChainProvider:
+        """Get the async chain provider"""
+        if not self.provider:
+            raise ValueError("Chain provider not initialized")
+        return self.provider
+
     def get_api(self) -> BlockFrostApi:
         """Get the BlockFrost API instance"""
         if not self.api:
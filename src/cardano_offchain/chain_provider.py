@@ -0,0 +1,454 @@
+"""
+Async Chain Providers
+
+Non-blocking chain-query layer for the API. Every query is a coroutine so API
+handlers never block the event loop on Blockfrost round-trips.
+
+- ChainProvider: abstract interface (UTxOs, tx lookup, submit, protocol params, assets)
+- BlockfrostChainProvider: Blockfrost REST backend on a pooled keep-alive httpx client
+- StubChainProvider: in-memory backend for offline tests
+- EmulatorChainProvider (emulator module): backend over a full in-memory ledger
+"""
+
+import asyncio
+from abc import ABC, abstractmethod
+from typing import Any, TypeVar, cast
+
+import cbor2
+import httpx
+import pycardano as pc
+from pycardano.hash import SCRIPT_HASH_SIZE
+from pycardano.serialization import default_encoder
+
+
+T = TypeVar("T")
+
+
+class ChainProviderError(Exception):
+    """Raised when a chain provider request fails"""
+
+    def __init__(self, message: str, status_code: int | None = None, retry_after: float | None = None):
+        self.status_code = status_code
+        self.retry_after = retry_after
+        super().__init__(f"{status_code}: {message}" if status_code else message)
+
+    @property
+    def not_found(self) -> bool:
+        """Whether the error is a 404 (resource has no on-chain history)"""
+        return self.status_code == 404
+
+    @property
+    def rate_limited(self) -> bool:
+        """Whether the backend rejected the request for exceeding its rate limit"""
+        return self.status_code == 429
+
+
+def value_from_amounts(amounts: list[dict]) -> pc.Value:
+    """
+    Convert a Blockfrost amount list into a pycardano Value.
+
+    Args:
+        amounts: List of {"unit": "lovelace" | policy_id+asset_name_hex, "quantity": str}
+    """
+    lovelace = 0
+    multi_asset = pc.MultiAsset()
+    for item in amounts:
+        if item["unit"] == "lovelace":
+            lovelace = int(item["quantity"])
+            continue
+        unit = bytes.fromhex(item["unit"])
+        policy_id = pc.ScriptHash(unit[:SCRIPT_HASH_SIZE])
+        asset_name = pc.AssetName(unit[SCRIPT_HASH_SIZE:])
+        if policy_id not in multi_asset:
+            multi_asset[policy_id] = pc.Asset()
+        multi_asset[policy_id][asset_name] = int(item["quantity"])
+    return pc.Value(lovelace, multi_asset)
+
+
+def amounts_from_value(value: pc.Value) -> list[dict]:
+    """Convert a pycardano Value into a Blockfrost amount list"""
+    amounts = [{"unit": "lovelace", "quantity": str(value.coin)}]
+    for policy_id, assets in value.multi_asset.items():
+        for asset_name, quantity in assets.items():
+            amounts.append({"unit": policy_id.payload.hex() + asset_name.payload.hex(), "quantity": str(quantity)})
+    return amounts
+
+
+def utxo_from_json(result: dict, address: str, script: pc.ScriptType | None = None) -> pc.UTxO:
+    """
+    Convert a Blockfrost address UTxO into a pycardano UTxO.
+
+    Mirrors pycardano's BlockFrostChainContext so scripts built from either
+    source are identical.
+    """
+    tx_in = pc.TransactionInput.from_primitive([result["tx_hash"], result["output_index"]])
+    inline_datum = result.get("inline_datum")
+    datum_hash = (
+        pc.DatumHash.from_primitive(result["data_hash"]) if result.get("data_hash") and inline_datum is None else None
+    )
+    datum = pc.RawCBOR(bytes.fromhex(inline_datum)) if inline_datum is not None else None
+    tx_out = pc.TransactionOutput(
+        pc.Address.from_primitive(address),
+        amount=value_from_amounts(result["amount"]),
+        datum_hash=datum_hash,
+        datum=datum,
+        script=script,
+    )
+    return pc.UTxO(tx_in, tx_out)
+
+
+def utxo_to_json(utxo: pc.UTxO) -> dict:
+    """Convert a pycardano UTxO into the Blockfrost address UTxO shape"""
+    output = utxo.output
+    datum = output.datum
+    inline_datum = None
+    if isinstance(datum, pc.RawCBOR):
+        inline_datum = datum.cbor.hex()
+    elif isinstance(datum, pc.CBORSerializable):
+        inline_datum = datum.to_cbor_hex()
+    elif datum is not None:
+        inline_datum = cbor2.dumps(datum, default=default_encoder).hex()
+    return {
+        "address": str(output.address),
+        "tx_hash": utxo.input.transaction_id.payload.hex(),
+        "output_index": utxo.input.index,
+        "amount": amounts_from_value(output.amount),
+        "data_hash": output.datum_hash.payload.hex() if output.datum_hash else None,
+        "inline_datum": inline_datum,
+        "reference_script_hash": pc.script_hash(output.script).payload.hex() if output.script else None,
+    }
+
+
+class ChainProvider(ABC):
+    """Async interface for chain queries used by API services"""
+
+    @abstractmethod
+    async def address_utxos(self, address: str) -> list[dict]:
+        """All UTxOs at an address, Blockfrost JSON shape ([] if the address is unused)"""
+
+    @abstractmethod
+    async def utxos(self, address: str | pc.Address) -> list[pc.UTxO]:
+        """All UTxOs at an address as pycardano UTxOs"""
+
+    @abstractmethod
+    async def address(self, address: str) -> dict:
+        """Address summary including total "amount" list"""
+
+    @abstractmethod
+    async def address_transactions(
+        self,
+        address: str,
+        count: int = 100,
+        page: int = 1,
+        order: str = "desc",
+        from_block: str | None = None,
+        to_block: str | None = None,
+    ) -> list[dict]:
+        """Transactions touching an address, optionally bounded by block height"""
+
+    @abstractmethod
+    async def transaction(self, tx_hash: str) -> dict:
+        """Transaction details (raises ChainProviderError 404 if unknown)"""
+
+    @abstractmethod
+    async def transaction_utxos(self, tx_hash: str) -> dict:
+        """Transaction inputs and outputs"""
+
+    @abstractmethod
+    async def transaction_metadata(self, tx_hash: str) -> list[dict]:
+        """Transaction metadata entries"""
+
+    @abstractmethod
+    async def submit_tx(self, cbor: bytes | str) -> str:
+        """Submit a signed transaction, returns its hash"""
+
+    @abstractmethod
+    async def protocol_params(self) -> dict:
+        """Latest epoch protocol parameters"""
+
+    @abstractmethod
+    async def block_latest(self) -> dict:
+        """Latest block"""
+
+    @abstractmethod
+    async def asset(self, asset_id: str) -> dict:
+        """Native asset details"""
+
+    @abstractmethod
+    async def assets_policy(self, policy_id: str, count: int = 100, page: int = 1, order: str = "asc") -> list[dict]:
+        """Assets minted under a policy"""
+
+    async def close(self) -> None:  # noqa: B027 - optional hook, no-op by default
+        """Release network resources"""
+
+
+class BlockfrostChainProvider(ChainProvider):
+    """Blockfrost REST provider on a pooled keep-alive HTTP client"""
+
+    PAGE_SIZE = 100
+
+    def __init__(
+        self,
+        base_url: str,
+        project_id: str,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        timeout: float = 30.0,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
+        """
+        Initialize the provider.
+
+        Args:
+            base_url: Blockfrost base URL (blockfrost.ApiUrls value, without /v0)
+            project_id: Blockfrost project ID
+            max_connections: Connection pool size
+            max_keepalive_connections: Idle connections kept open for reuse
+            timeout: Per-request timeout in seconds
+            transport: Optional httpx transport (e.g. httpx.MockTransport in tests)
+        """
+        self.base_url = f"{base_url.rstrip('/')}/v0"
+        self.project_id = project_id
+        self._limits = httpx.Limits(
+            max_connections=max_connections, max_keepalive_connections=max_keepalive_connections
+        )
+        self._timeout = httpx.Timeout(timeout)
+        self._transport = transport
+        self._client: httpx.AsyncClient | None = None
+        self._scripts: dict[str, pc.ScriptType] = {}
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers={"project_id": self.project_id},
+                limits=self._limits,
+                timeout=self._timeout,
+                transport=self._transport,
+            )
+        return self._client
+
+    async def _request(self, method: str, path: str, **kwargs: Any) -> Any:
+        try:
+            response = await self._get_client().request(method, path, **kwargs)
+        except httpx.HTTPError as e:
+            raise ChainProviderError(f"Blockfrost request {path} failed: {e}") from e
+        if response.status_code >= 400:
+            try:
+                message = response.json().get("message", response.text)
+            except ValueError:
+                message = response.text
+            retry_after = response.headers.get("Retry-After")
+            raise ChainProviderError(
+                message,
+                status_code=response.status_code,
+                retry_after=float(retry_after) if retry_after and retry_after.isdigit() else None,
+            )
+        return response.json()
+
+    async def _get(self, path: str, **params: Any) -> Any:
+        return await self._request("GET", path, params=params or None)
+
+    async def _get_all_pages(self, path: str) -> list[dict]:
+        results: list[dict] = []
+        page = 1
+        while True:
+            batch = await self._get(path, count=self.PAGE_SIZE, page=page)
+            results.extend(batch)
+            if len(batch) < self.PAGE_SIZE:
+                return results
+            page += 1
+
+    async def _script(self, script_hash: str) -> pc.ScriptType:
+        if script_hash in self._scripts:
+            return self._scripts[script_hash]
+        info = await self._get(f"/scripts/{script_hash}")
+        script_type = info["type"]
+        script: pc.ScriptType
+        if script_type.lower().startswith("plutusv"):
+            cbor = bytes.fromhex((await self._get(f"/scripts/{script_hash}/cbor"))["cbor"])
+            script = pc.PlutusScript.from_version(int(script_type[-1]), cbor)
+            if pc.script_hash(script).payload.hex() != script_hash:
+                script = script.__class__(cbor2.loads(script))
+        else:
+            script_json = (await self._get(f"/scripts/{script_hash}/json"))["json"]
+            script = pc.NativeScript.from_dict(script_json)
+        self._scripts[script_hash] = script
+        return script
+
+    async def address_utxos(self, address: str) -> list[dict]:
+        try:
+            return await self._get_all_pages(f"/addresses/{address}/utxos")
+        except ChainProviderError as e:
+            if e.not_found:
+                return []
+            raise
+
+    async def utxos(self, address: str | pc.Address) -> list[pc.UTxO]:
+        address = str(address)
+        results = await self.address_utxos(address)
+        script_hashes = {r["reference_script_hash"] for r in results if r.get("reference_script_hash")}
+        scripts = dict(zip(script_hashes, await asyncio.gather(*(self._script(h) for h in script_hashes)), strict=True))
+        return [
+            utxo_from_json(
+                r, address, scripts.get(r["reference_script_hash"]) if r.get("reference_script_hash") else None
+            )
+            for r in results
+        ]
+
+    async def address(self, address: str) -> dict:
+        return cast(dict, await self._get(f"/addresses/{address}"))
+
+    async def address_transactions(
+        self,
+        address: str,
+        count: int = 100,
+        page: int = 1,
+        order: str = "desc",
+        from_block: str | None = None,
+        to_block: str | None = None,
+    ) -> list[dict]:
+        params: dict[str, Any] = {"count": count, "page": page, "order": order}
+        if from_block is not None:
+            params["from"] = from_block
+        if to_block is not None:
+            params["to"] = to_block
+        return cast(list[dict], await self._get(f"/addresses/{address}/transactions", **params))
+
+    async def transaction(self, tx_hash: str) -> dict:
+        return cast(dict, await self._get(f"/txs/{tx_hash}"))
+
+    async def transaction_utxos(self, tx_hash: str) -> dict:
+        return cast(dict, await self._get(f"/txs/{tx_hash}/utxos"))
+
+    async def transaction_metadata(self, tx_hash: str) -> list[dict]:
+        return cast(list[dict], await self._get(f"/txs/{tx_hash}/metadata"))
+
+    async def submit_tx(self, cbor: bytes | str) -> str:
+        data = bytes.fromhex(cbor) if isinstance(cbor, str) else cbor
+        tx_hash = await self._request("POST", "/tx/submit", content=data, headers={"Content-Type": "application/cbor"})
+        return cast(str, tx_hash)
+
+    async def protocol_params(self) -> dict:
+        return cast(dict, await self._get("/epochs/latest/parameters"))
+
+    async def block_latest(self) -> dict:
+        return cast(dict, await self._get("/blocks/latest"))
+
+    async def asset(self, asset_id: str) -> dict:
+        return cast(dict, await self._get(f"/assets/{asset_id}"))
+
+    async def assets_policy(self, policy_id: str, count: int = 100, page: int = 1, order: str = "asc") -> list[dict]:
+        return cast(list[dict], await self._get(f"/assets/policy/{policy_id}", count=count, page=page, order=order))
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+class StubChainProvider(ChainProvider):
+    """
+    In-memory provider for offline tests.
+
+    Seed it with add_utxo / add_transaction / add_asset; submitted transactions
+    are recorded in `submitted`.
+    """
+
+    def __init__(self, protocol_params: dict | None = None, block: dict | None = None):
+        self._utxos: dict[str, list[pc.UTxO]] = {}
+        self._transactions: dict[str, dict] = {}
+        self._transaction_utxos: dict[str, dict] = {}
+        self._metadata: dict[str, list[dict]] = {}
+        self._assets: dict[str, dict] = {}
+        self._protocol_params = protocol_params or {}
+        self._block = block or {"height": 0, "slot": 0, "hash": "00" * 32}
+        self.submitted: list[bytes] = []
+
+    def add_utxo(self, utxo: pc.UTxO) -> None:
+        self._utxos.setdefault(str(utxo.output.address), []).append(utxo)
+
+    def add_transaction(
+        self, tx_hash: str, details: dict, utxos: dict | None = None, metadata: list[dict] | None = None
+    ) -> None:
+        self._transactions[tx_hash] = {"hash": tx_hash, **details}
+        self._transaction_utxos[tx_hash] = utxos or {"hash": tx_hash, "inputs": [], "outputs": []}
+        self._metadata[tx_hash] = metadata or []
+
+    def add_asset(self, asset: dict) -> None:
+        self._assets[asset["asset"]] = asset
+
+    def set_block(self, block: dict) -> None:
+        self._block = block
+
+    async def address_utxos(self, address: str) -> list[dict]:
+        return [utxo_to_json(u) for u in self._utxos.get(str(address), [])]
+
+    async def utxos(self, address: str | pc.Address) -> list[pc.UTxO]:
+        return list(self._utxos.get(str(address), []))
+
+    async def address(self, address: str) -> dict:
+        utxos = self._utxos.get(str(address))
+        if utxos is None:
+            raise ChainProviderError("The requested component has not been found.", status_code=404)
+        total = pc.Value(0)
+        for u in utxos:
+            total += u.output.amount
+        return {"address": str(address), "amount": amounts_from_value(total)}
+
+    async def address_transactions(
+        self,
+        address: str,
+        count: int = 100,
+        page: int = 1,
+        order: str = "desc",
+        from_block: str | None = None,
+        to_block: str | None = None,
+    ) -> list[dict]:
+        hashes = [
+            h
+            for h, u in self._transaction_utxos.items()
+            if any(o.get("address") == address for o in u.get("inputs", []) + u.get("outputs", []))
+        ]
+        if order == "desc":
+            hashes.reverse()
+        start = (page - 1) * count
+        return [{"tx_hash": h} for h in hashes[start : start + count]]
+
+    def _lookup(self, table: dict[str, T], key: str) -> T:
+        if key not in table:
+            raise ChainProviderError("The requested component has not been found.", status_code=404)
+        return table[key]
+
+    async def transaction(self, tx_hash: str) -> dict:
+        return self._lookup(self._transactions, tx_hash)
+
+    async def transaction_utxos(self, tx_hash: str) -> dict:
+        return self._lookup(self._transaction_utxos, tx_hash)
+
+    async def transaction_metadata(self, tx_hash: str) -> list[dict]:
+        return self._lookup(self._metadata, tx_hash)
+
+    async def submit_tx(self, cbor: bytes | str) -> str:
+        data = bytes.fromhex(cbor) if isinstance(cbor, str) else cbor
+        self.submitted.append(data)
+        tx = pc.Transaction.from_cbor(data)
+        return cast(str, tx.id.payload.hex())
+
+    async def protocol_params(self) -> dict:
+        return self._protocol_params
+
+    async def block_latest(self) -> dict:
+        return self._block
+
+    async def asset(self, asset_id: str) -> dict:
+        return self._lookup(self._assets, asset_id)
+
+    async def assets_policy(self, policy_id: str, count: int = 100, page: int = 1, order: str = "asc") -> list[dict]:
+        assets = [
+            {"asset": a["asset"], "quantity": a.get("quantity", "0")}
+            for asset_id, a in sorted(self._assets.items(), reverse=order == "desc")
+            if asset_id.startswith(policy_id)
+        ]
+        start = (page - 1) * count
+        return assets[start : start + count]
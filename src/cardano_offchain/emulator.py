@@ -0,0 +1,837 @@
+"""
+In-Memory Ledger Emulator
+
+Offline replacement for BlockFrostChainContext, for load tests and benchmarks
+of the contract flows without network access or Blockfrost quota.
+
+- EmulatedChainContext: pycardano ChainContext over an in-memory UTxO set.
+  Submitted transactions are validated (inputs, value preservation, fee,
+  signatures, validity interval, Plutus scripts) and applied at once;
+  advance_slots() closes the current block so they count as confirmed.
+- EmulatorChainProvider: async ChainProvider view of an emulator for the API
+
+Plutus scripts are PlutusV2 (as built by OpShin here) and run on the uplc
+CEK machine against a V2 ScriptContext built from the transaction.
+"""
+
+import functools
+import hashlib
+import threading
+from collections.abc import Iterable
+from copy import deepcopy
+from dataclasses import dataclass, field
+from fractions import Fraction
+
+import cbor2
+import pycardano as pc
+from nacl.exceptions import BadSignatureError
+from nacl.signing import VerifyKey
+from opshin.ledger import api_v2
+from uplc import ast as uplc_ast
+from uplc import tools as uplc_tools
+from uplc.ast import BuiltInFun
+from uplc.cost_model import (
+    Budget,
+    BuiltinCostModel,
+    ConstAboveDiagonal,
+    ConstantCost,
+    LinearCost,
+    MultipliedSizes,
+    default_builtin_cost_model_plutus_v2,
+    default_cek_machine_cost_model_plutus_v2,
+)
+
+from .chain_provider import ChainProvider, ChainProviderError, amounts_from_value, utxo_to_json
+
+
+# Mainnet (Conway) parameters; cost models are omitted as scripts run on uplc's
+# own PlutusV2 cost model
+DEFAULT_PROTOCOL_PARAMS = pc.ProtocolParameters(
+    min_fee_constant=155381,
+    min_fee_coefficient=44,
+    max_block_size=90112,
+    max_tx_size=16384,
+    max_block_header_size=1100,
+    key_deposit=2_000_000,
+    pool_deposit=500_000_000,
+    pool_influence=Fraction(3, 10),
+    monetary_expansion=Fraction(3, 1000),
+    treasury_expansion=Fraction(1, 5),
+    decentralization_param=Fraction(0),
+    extra_entropy="",
+    protocol_major_version=9,
+    protocol_minor_version=0,
+    min_utxo=1_000_000,
+    min_pool_cost=170_000_000,
+    price_mem=Fraction(577, 10000),
+    price_step=Fraction(721, 10000000),
+    max_tx_ex_mem=14_000_000,
+    max_tx_ex_steps=10_000_000_000,
+    max_block_ex_mem=62_000_000,
+    max_block_ex_steps=20_000_000_000,
+    max_val_size=5000,
+    collateral_percent=150,
+    max_collateral_inputs=3,
+    coins_per_utxo_word=34482,
+    coins_per_utxo_byte=4310,
+    cost_models={},
+)
+
+# Preview testnet genesis (1 second slots)
+DEFAULT_GENESIS_PARAMS = pc.GenesisParameters(
+    active_slots_coefficient=Fraction(1, 20),
+    update_quorum=5,
+    max_lovelace_supply=45_000_000_000_000_000,
+    network_magic=2,
+    epoch_length=86400,
+    system_start=1666656000,
+    slots_per_kes_period=129600,
+    slot_length=1,
+    max_kes_evolutions=62,
+    security_param=432,
+)
+
+
+# uplc derives its PlutusV2 model from the PlutusV3 base, whose quadratic
+# division costs have no PlutusV2 parameters and default to 30e9 steps; the
+# ledger's PlutusV2 model prices them by multiplied argument sizes instead
+_V2_DIVISION_CPU = ConstAboveDiagonal(MultipliedSizes(LinearCost(intercept=453240, slope=220)), ConstantCost(196500))
+
+
+@functools.cache
+def plutus_v2_builtin_cost_model() -> BuiltinCostModel:
+    """uplc's PlutusV2 builtin cost model with the ledger's division costs"""
+    model = deepcopy(default_builtin_cost_model_plutus_v2())
+    division = (
+        BuiltInFun.DivideInteger,
+        BuiltInFun.QuotientInteger,
+        BuiltInFun.RemainderInteger,
+        BuiltInFun.ModInteger,
+    )
+    for fun in division:
+        model.cpu[fun] = _V2_DIVISION_CPU
+    return model
+
+
+class EmulatorError(Exception):
+    """Raised when the emulator rejects a transaction"""
+
+    pass
+
+
+@dataclass
+class EmulatedTransaction:
+    """A transaction applied to the emulated ledger"""
+
+    tx: pc.Transaction
+    tx_hash: str
+    size: int
+    spent: list[pc.UTxO]
+    submitted_slot: int
+    block_height: int | None = None  # set when advance_slots() closes its block
+    slot: int | None = None
+    block_time: int | None = None
+    index: int = 0
+    ex_units: dict[str, pc.ExecutionUnits] = field(default_factory=dict)
+
+
+def _ref(tx_input: pc.TransactionInput) -> tuple[bytes, int]:
+    # Hashing pycardano objects CBOR-encodes them; key the ledger by plain tuples
+    return tx_input.transaction_id.payload, tx_input.index
+
+
+def _value_to_dict(value: pc.Value | int) -> dict[bytes, dict[bytes, int]]:
+    """Value as a Plutus Value map (ADA under b"" first, then policies in ledger order)"""
+    if isinstance(value, int):
+        value = pc.Value(value)
+    result = {b"": {b"": value.coin}}
+    for policy_id in sorted(value.multi_asset.keys(), key=lambda p: p.payload):
+        assets = value.multi_asset[policy_id]
+        result[policy_id.payload] = {name.payload: assets[name] for name in sorted(assets, key=lambda n: n.payload)}
+    return result
+
+
+def _credential(part: pc.VerificationKeyHash | pc.ScriptHash) -> api_v2.PubKeyCredential | api_v2.ScriptCredential:
+    if isinstance(part, pc.ScriptHash):
+        return api_v2.ScriptCredential(part.payload)
+    return api_v2.PubKeyCredential(part.payload)
+
+
+def _address(address: pc.Address) -> api_v2.Address:
+    staking = address.staking_part
+    if staking is None:
+        staking_credential = api_v2.NoStakingCredential()
+    elif isinstance(staking, pc.PointerAddress):
+        staking_credential = api_v2.SomeStakingCredential(
+            api_v2.StakingPtr(staking.slot, staking.tx_index, staking.cert_index)
+        )
+    else:
+        staking_credential = api_v2.SomeStakingCredential(api_v2.StakingHash(_credential(staking)))
+    return api_v2.Address(_credential(address.payment_part), staking_credential)
+
+
+def _tx_out(output: pc.TransactionOutput) -> api_v2.TxOut:
+    if output.datum_hash is not None:
+        datum = api_v2.SomeOutputDatumHash(output.datum_hash.payload)
+    elif output.datum is not None:
+        datum = api_v2.SomeOutputDatum(output.datum)
+    else:
+        datum = api_v2.NoOutputDatum()
+    script = api_v2.SomeScriptHash(pc.script_hash(output.script).payload) if output.script else api_v2.NoScriptHash()
+    return api_v2.TxOut(_address(output.address), _value_to_dict(output.amount), datum, script)
+
+
+def _out_ref(tx_input: pc.TransactionInput) -> api_v2.TxOutRef:
+    return api_v2.TxOutRef(api_v2.TxId(tx_input.transaction_id.payload), tx_input.index)
+
+
+def _redeemers(witness: pc.TransactionWitnessSet) -> list[pc.Redeemer]:
+    """Redeemers of a witness set (list or Conway map encoding)"""
+    redeemer = witness.redeemer
+    if not redeemer:
+        return []
+    if not isinstance(redeemer, pc.RedeemerMap):
+        return list(redeemer)
+    redeemers = []
+    for key, value in redeemer.items():
+        entry = pc.Redeemer(value.data, value.ex_units)
+        entry.tag, entry.index = key.tag, key.index
+        redeemers.append(entry)
+    return redeemers
+
+
+def _to_uplc(data: pc.Datum) -> uplc_ast.PlutusData:
+    if isinstance(data, pc.RawCBOR):
+        return uplc_ast.data_from_cbor(data.cbor)
+    if isinstance(data, pc.CBORSerializable):
+        return uplc_ast.data_from_cbor(data.to_cbor())
+    return uplc_ast.data_from_cbor(cbor2.dumps(data, default=pc.serialization.default_encoder))
+
+
+class EmulatedChainContext(pc.ChainContext):
+    """
+    In-memory Cardano ledger exposing pycardano's ChainContext interface.
+
+    Fund addresses with fund(), build and submit transactions as against a
+    live chain, and call advance_slots() to move time forward and close the
+    block holding the submitted transactions. Thread-safe.
+    """
+
+    def __init__(
+        self,
+        network: pc.Network = pc.Network.TESTNET,
+        protocol_param: pc.ProtocolParameters | None = None,
+        genesis_param: pc.GenesisParameters | None = None,
+        evaluate_scripts: bool = True,
+        validate_signatures: bool = True,
+    ):
+        """
+        Initialize an empty ledger at slot 0.
+
+        Args:
+            network: Network of the addresses in use
+            protocol_param: Protocol parameters (default: DEFAULT_PROTOCOL_PARAMS)
+            genesis_param: Genesis parameters for slot/time conversion (default: preview)
+            evaluate_scripts: Run Plutus scripts; when False, evaluate_tx reports an
+                equal share of the per-transaction budget and submission skips phase 2
+            validate_signatures: Check vkey witnesses against required signers
+        """
+        self._network = network
+        self._protocol_param = protocol_param or DEFAULT_PROTOCOL_PARAMS
+        self._genesis_param = genesis_param or DEFAULT_GENESIS_PARAMS
+        self.evaluate_scripts = evaluate_scripts
+        self.validate_signatures = validate_signatures
+
+        self._lock = threading.RLock()
+        self._ledger: dict[tuple[bytes, int], pc.UTxO] = {}
+        self._by_address: dict[str, dict[tuple[bytes, int], pc.UTxO]] = {}
+        self._transactions: dict[str, EmulatedTransaction] = {}
+        self._address_transactions: dict[str, list[str]] = {}
+        self._open_block: list[str] = []  # submitted since the last advance_slots()
+        self._assets: dict[str, int] = {}  # unit -> circulating quantity
+        self._asset_mints: dict[str, str] = {}  # unit -> first mint tx hash
+        self._spent_by: dict[tuple[bytes, int], str] = {}  # spent output -> spending tx hash
+        self._programs: dict[bytes, uplc_ast.Program] = {}
+        self._slot = 0
+        self._block_height = 0
+        self._genesis_count = 0
+
+    # ------------------------------------------------------------------
+    # ChainContext interface
+    # ------------------------------------------------------------------
+
+    @property
+    def protocol_param(self) -> pc.ProtocolParameters:
+        return self._protocol_param
+
+    @property
+    def genesis_param(self) -> pc.GenesisParameters:
+        return self._genesis_param
+
+    @property
+    def network(self) -> pc.Network:
+        return self._network
+
+    @property
+    def epoch(self) -> int:
+        return int(self._slot // self._genesis_param.epoch_length)
+
+    @property
+    def last_block_slot(self) -> int:
+        return self._slot
+
+    @property
+    def block_height(self) -> int:
+        """Height of the last closed block"""
+        return self._block_height
+
+    def _utxos(self, address: str) -> list[pc.UTxO]:
+        with self._lock:
+            return list(self._by_address.get(address, {}).values())
+
+    def submit_tx_cbor(self, cbor: bytes | str) -> str:
+        data = bytes.fromhex(cbor) if isinstance(cbor, str) else cbor
+        return self.submit(pc.Transaction.from_cbor(data), size=len(data))
+
+    def evaluate_tx(self, tx: pc.Transaction) -> dict[str, pc.ExecutionUnits]:
+        with self._lock:
+            return self._evaluate(tx)
+
+    def evaluate_tx_cbor(self, cbor: bytes | str) -> dict[str, pc.ExecutionUnits]:
+        data = bytes.fromhex(cbor) if isinstance(cbor, str) else cbor
+        return self.evaluate_tx(pc.Transaction.from_cbor(data))
+
+    # ------------------------------------------------------------------
+    # Ledger control
+    # ------------------------------------------------------------------
+
+    def fund(
+        self,
+        address: pc.Address | str,
+        amount: pc.Value | int,
+        datum: pc.Datum | None = None,
+        script: pc.ScriptType | None = None,
+    ) -> pc.UTxO:
+        """Create a UTxO out of thin air (genesis funds, pre-deployed scripts)"""
+        with self._lock:
+            self._genesis_count += 1
+            tx_id = pc.TransactionId(
+                hashlib.blake2b(f"genesis:{self._genesis_count}".encode(), digest_size=32).digest()
+            )
+            output = pc.TransactionOutput(
+                pc.Address.from_primitive(str(address)),
+                pc.Value(amount) if isinstance(amount, int) else amount,
+                datum=datum,
+                script=script,
+            )
+            utxo = pc.UTxO(pc.TransactionInput(tx_id, 0), output)
+            self._add_utxo(utxo)
+            return utxo
+
+    def advance_slots(self, slots: int = 1) -> int:
+        """
+        Move time forward and close the current block.
+
+        Transactions submitted since the previous call get a block height and
+        time (they are "confirmed" for chain providers). Returns the new slot.
+        """
+        if slots < 1:
+            raise ValueError("slots must be positive")
+        with self._lock:
+            self._slot += slots
+            self._block_height += 1
+            block_time = self.slot_to_posix(self._slot) // 1000
+            for index, tx_hash in enumerate(self._open_block):
+                record = self._transactions[tx_hash]
+                record.block_height = self._block_height
+                record.slot = self._slot
+                record.block_time = block_time
+                record.index = index
+            self._open_block = []
+            return self._slot
+
+    def slot_to_posix(self, slot: int) -> int:
+        """POSIX time in milliseconds at the start of a slot"""
+        genesis = self._genesis_param
+        return int((genesis.system_start + slot * genesis.slot_length) * 1000)
+
+    def get_utxo(self, tx_input: pc.TransactionInput) -> pc.UTxO | None:
+        """The unspent output at a reference, if any"""
+        return self._ledger.get(_ref(tx_input))
+
+    def spent_by(self, tx_input: pc.TransactionInput) -> str | None:
+        """Hash of the transaction that spent an output, None while unspent"""
+        return self._spent_by.get(_ref(tx_input))
+
+    def get_transaction(self, tx_hash: str) -> EmulatedTransaction | None:
+        """A submitted transaction (confirmed once its block_height is set)"""
+        return self._transactions.get(tx_hash)
+
+    def address_transactions(self, address: str) -> list[EmulatedTransaction]:
+        """Confirmed transactions spending from or paying to an address, oldest first"""
+        with self._lock:
+            records = [self._transactions[h] for h in self._address_transactions.get(address, [])]
+            return [record for record in records if record.block_height is not None]
+
+    def has_address(self, address: str) -> bool:
+        """Whether the address ever held a UTxO"""
+        return address in self._by_address
+
+    def asset_quantity(self, unit: str) -> int | None:
+        """Circulating quantity of an asset (policy_id + asset_name hex), None if never minted"""
+        return self._assets.get(unit)
+
+    def asset_mint_tx(self, unit: str) -> str | None:
+        return self._asset_mints.get(unit)
+
+    def assets(self) -> dict[str, int]:
+        """Circulating quantity of every asset ever minted"""
+        with self._lock:
+            return dict(self._assets)
+
+    # ------------------------------------------------------------------
+    # Submission
+    # ------------------------------------------------------------------
+
+    def submit(self, tx: pc.Transaction, size: int | None = None) -> str:
+        """
+        Validate a transaction against the ledger and apply it.
+
+        Args:
+            tx: Signed transaction
+            size: Serialized size in bytes (computed when not given)
+
+        Returns:
+            Transaction hash (hex)
+
+        Raises:
+            EmulatorError: The ledger rejects the transaction
+        """
+        size = size if size is not None else len(tx.to_cbor())
+        body = tx.transaction_body
+        tx_hash: str = body.hash().hex()
+        with self._lock:
+            if tx_hash in self._transactions:
+                raise EmulatorError(f"Transaction {tx_hash} already submitted")
+            spent = self._validate_phase_one(tx, size)
+            ex_units = {}
+            if self.evaluate_scripts and _redeemers(tx.transaction_witness_set):
+                ex_units = self._validate_phase_two(tx)
+
+            for utxo in spent:
+                self._remove_utxo(utxo)
+                self._spent_by[_ref(utxo.input)] = tx_hash
+            tx_id = pc.TransactionId(bytes.fromhex(tx_hash))
+            for index, output in enumerate(body.outputs):
+                self._add_utxo(pc.UTxO(pc.TransactionInput(tx_id, index), output))
+            if body.mint:
+                for policy_id, assets in body.mint.items():
+                    for name, quantity in assets.items():
+                        unit = policy_id.payload.hex() + name.payload.hex()
+                        self._assets[unit] = self._assets.get(unit, 0) + quantity
+                        self._asset_mints.setdefault(unit, tx_hash)
+
+            self._transactions[tx_hash] = EmulatedTransaction(
+                tx=tx, tx_hash=tx_hash, size=size, spent=spent, submitted_slot=self._slot, ex_units=ex_units
+            )
+            self._open_block.append(tx_hash)
+            addresses = {str(u.output.address) for u in spent} | {str(o.address) for o in body.outputs}
+            for address in addresses:
+                self._address_transactions.setdefault(address, []).append(tx_hash)
+        return tx_hash
+
+    def _add_utxo(self, utxo: pc.UTxO) -> None:
+        ref = _ref(utxo.input)
+        self._ledger[ref] = utxo
+        self._by_address.setdefault(str(utxo.output.address), {})[ref] = utxo
+
+    def _remove_utxo(self, utxo: pc.UTxO) -> None:
+        ref = _ref(utxo.input)
+        del self._ledger[ref]
+        self._by_address[str(utxo.output.address)].pop(ref, None)
+
+    def _resolve(self, inputs: Iterable[pc.TransactionInput] | None, kind: str) -> list[pc.UTxO]:
+        resolved = []
+        for tx_input in inputs or []:
+            utxo = self._ledger.get(_ref(tx_input))
+            if utxo is None:
+                raise EmulatorError(
+                    f"{kind} {tx_input.transaction_id.payload.hex()}#{tx_input.index} is not in the UTxO set"
+                )
+            resolved.append(utxo)
+        return resolved
+
+    def _validate_phase_one(self, tx: pc.Transaction, size: int) -> list[pc.UTxO]:
+        """Structural checks; returns the spent UTxOs"""
+        body = tx.transaction_body
+        params = self._protocol_param
+
+        if size > params.max_tx_size:
+            raise EmulatorError(f"Transaction size {size} exceeds max {params.max_tx_size}")
+        if body.validity_start is not None and self._slot < body.validity_start:
+            raise EmulatorError(f"Transaction not valid before slot {body.validity_start} (current {self._slot})")
+        if body.ttl is not None and self._slot >= body.ttl:
+            raise EmulatorError(f"Transaction expired at slot {body.ttl} (current {self._slot})")
+
+        spent = self._resolve(body.inputs, "Input")
+        self._resolve(body.reference_inputs, "Reference input")
+        self._resolve(body.collateral, "Collateral input")
+
+        # Value preservation (inputs + mint = outputs + fee)
+        balance: dict[tuple[bytes, bytes], int] = {}
+
+        def add(value: pc.Value, sign: int) -> None:
+            balance[(b"", b"")] = balance.get((b"", b""), 0) + sign * value.coin
+            for policy_id, assets in value.multi_asset.items():
+                for name, quantity in assets.items():
+                    key = (policy_id.payload, name.payload)
+                    balance[key] = balance.get(key, 0) + sign * quantity
+
+        for utxo in spent:
+            add(utxo.output.amount, 1)
+        if body.mint:
+            add(pc.Value(0, body.mint), 1)
+        for output in body.outputs:
+            add(output.amount, -1)
+        add(pc.Value(body.fee), -1)
+        unbalanced = {key: quantity for key, quantity in balance.items() if quantity}
+        if unbalanced:
+            raise EmulatorError(f"Value not preserved (inputs + mint - outputs - fee): {unbalanced}")
+
+        for index, output in enumerate(body.outputs):
+            coin = output.amount.coin
+            if coin == 0 or coin < pc.min_lovelace(self, output=output):
+                raise EmulatorError(f"Output {index} holds less than its min lovelace")
+
+        redeemers = _redeemers(tx.transaction_witness_set)
+        steps = sum(r.ex_units.steps for r in redeemers if r.ex_units)
+        mem = sum(r.ex_units.mem for r in redeemers if r.ex_units)
+        if steps > params.max_tx_ex_steps or mem > params.max_tx_ex_mem:
+            raise EmulatorError(f"Execution units ({mem} mem, {steps} steps) exceed the per-transaction maximum")
+        min_fee = pc.fee(self, size, steps, mem)
+        if body.fee < min_fee:
+            raise EmulatorError(f"Fee {body.fee} below minimum {min_fee}")
+
+        if self.validate_signatures:
+            self._validate_signatures(tx, spent)
+        return spent
+
+    def _validate_signatures(self, tx: pc.Transaction, spent: list[pc.UTxO]) -> None:
+        body = tx.transaction_body
+        body_hash = body.hash()
+        signed = set()
+        for witness in tx.transaction_witness_set.vkey_witnesses or []:
+            vkey = witness.vkey
+            try:
+                VerifyKey(vkey.payload[:32]).verify(body_hash, witness.signature)
+            except BadSignatureError as e:
+                raise EmulatorError(f"Invalid signature by {vkey.hash().payload.hex()}") from e
+            signed.add(vkey.hash().payload)
+
+        required = {signer.payload for signer in body.required_signers or []}
+        for utxo in spent + self._resolve(body.collateral, "Collateral input"):
+            payment = utxo.output.address.payment_part
+            if isinstance(payment, pc.VerificationKeyHash):
+                required.add(payment.payload)
+        missing = required - signed
+        if missing:
+            raise EmulatorError(f"Missing signatures from {', '.join(sorted(m.hex() for m in missing))}")
+
+    def _validate_phase_two(self, tx: pc.Transaction) -> dict[str, pc.ExecutionUnits]:
+        """Run the scripts; the budget each redeemer declares must cover its cost"""
+        ex_units = self._evaluate(tx)
+        for redeemer in _redeemers(tx.transaction_witness_set):
+            key = f"{redeemer.tag.name.lower()}:{redeemer.index}"
+            used = ex_units[key]
+            declared = redeemer.ex_units
+            if declared is None or declared.mem < used.mem or declared.steps < used.steps:
+                raise EmulatorError(
+                    f"Redeemer {key} declares {declared} but the script needs {used.mem} mem, {used.steps} steps"
+                )
+        return ex_units
+
+    # ------------------------------------------------------------------
+    # Plutus evaluation
+    # ------------------------------------------------------------------
+
+    def _evaluate(self, tx: pc.Transaction) -> dict[str, pc.ExecutionUnits]:
+        body = tx.transaction_body
+        witness = tx.transaction_witness_set
+        redeemers = _redeemers(witness)
+        if not redeemers:
+            return {}
+        params = self._protocol_param
+        if not self.evaluate_scripts:
+            share = len(redeemers)
+            return {
+                f"{r.tag.name.lower()}:{r.index}": pc.ExecutionUnits(
+                    params.max_tx_ex_mem // share, params.max_tx_ex_steps // share
+                )
+                for r in redeemers
+            }
+
+        inputs = sorted(body.inputs, key=_ref)
+        spent = self._resolve(inputs, "Input")
+        reference = self._resolve(sorted(body.reference_inputs or [], key=_ref), "Reference input")
+
+        scripts: dict[bytes, pc.ScriptType] = {}
+        for witness_scripts in (witness.plutus_v1_script, witness.plutus_v2_script, witness.plutus_v3_script):
+            for script in witness_scripts or []:
+                scripts[pc.script_hash(script).payload] = script
+        for utxo in spent + reference:
+            if utxo.output.script is not None:
+                scripts[pc.script_hash(utxo.output.script).payload] = utxo.output.script
+        datums = {pc.datum_hash(d).payload: d for d in witness.plutus_data or []}
+        policies = sorted((body.mint or {}).keys(), key=lambda p: p.payload)
+
+        # Script purposes, in ledger order (minting before spending)
+        purposes = {}
+        for redeemer in redeemers:
+            key = f"{redeemer.tag.name.lower()}:{redeemer.index}"
+            if redeemer.tag == pc.RedeemerTag.SPEND and redeemer.index < len(inputs):
+                purposes[key] = api_v2.Spending(_out_ref(inputs[redeemer.index]))
+            elif redeemer.tag == pc.RedeemerTag.MINT and redeemer.index < len(policies):
+                purposes[key] = api_v2.Minting(policies[redeemer.index].payload)
+            else:
+                raise EmulatorError(f"Redeemer {key} points at no {redeemer.tag.name.lower()} purpose")
+
+        tx_info = api_v2.TxInfo(
+            inputs=[api_v2.TxInInfo(_out_ref(u.input), _tx_out(u.output)) for u in spent],
+            reference_inputs=[api_v2.TxInInfo(_out_ref(u.input), _tx_out(u.output)) for u in reference],
+            outputs=[_tx_out(o) for o in body.outputs],
+            fee=_value_to_dict(body.fee),
+            mint=_value_to_dict(pc.Value(0, body.mint or pc.MultiAsset())),
+            dcert=[],
+            wdrl={},
+            valid_range=self._valid_range(body),
+            signatories=sorted(signer.payload for signer in body.required_signers or []),
+            redeemers={
+                purposes[f"{r.tag.name.lower()}:{r.index}"]: r.data
+                for r in sorted(redeemers, key=lambda r: (r.tag.value, r.index))
+            },
+            data=dict(sorted(datums.items())),
+            id=api_v2.TxId(body.hash()),
+        )
+        tx_info_data = _to_uplc(tx_info)
+
+        results = {}
+        for redeemer in redeemers:
+            key = f"{redeemer.tag.name.lower()}:{redeemer.index}"
+            purpose = purposes[key]
+            args = []
+            if redeemer.tag == pc.RedeemerTag.SPEND:
+                output = spent[redeemer.index].output
+                script_hash = output.address.payment_part
+                if not isinstance(script_hash, pc.ScriptHash):
+                    raise EmulatorError(f"Redeemer {key} spends a key-locked input")
+                if output.datum is not None:
+                    args.append(_to_uplc(output.datum))
+                elif output.datum_hash is not None and output.datum_hash.payload in datums:
+                    args.append(_to_uplc(datums[output.datum_hash.payload]))
+                else:
+                    raise EmulatorError(f"Redeemer {key}: datum of the spent output not found")
+                script_hash = script_hash.payload
+            else:
+                script_hash = purpose.policy_id
+
+            script = scripts.get(script_hash)
+            if script is None:
+                raise EmulatorError(f"Redeemer {key}: script {script_hash.hex()} not provided")
+            if not isinstance(script, pc.PlutusV2Script):
+                raise EmulatorError(f"Redeemer {key}: only PlutusV2 scripts are supported")
+
+            args.append(_to_uplc(redeemer.data))
+            context = uplc_ast.PlutusConstr(0, [tx_info_data, _to_uplc(purpose)])
+            args.append(context)
+
+            result = uplc_tools.eval(
+                self._program(script),
+                *args,
+                budget=Budget(params.max_tx_ex_steps, params.max_tx_ex_mem),
+                cek_machine_cost_model=default_cek_machine_cost_model_plutus_v2(),
+                builtin_cost_model=plutus_v2_builtin_cost_model(),
+            )
+            if isinstance(result.result, Exception):
+                logs = "; ".join(result.logs)
+                raise EmulatorError(f"Redeemer {key} failed: {result.result!r}" + (f" ({logs})" if logs else ""))
+            results[key] = pc.ExecutionUnits(result.cost.memory, result.cost.cpu)
+        return results
+
+    def _program(self, script: pc.PlutusV2Script) -> uplc_ast.Program:
+        program = self._programs.get(bytes(script))
+        if program is None:
+            program = self._programs[bytes(script)] = uplc_tools.unflatten(bytes(script))
+        return program
+
+    def _valid_range(self, body: pc.TransactionBody) -> api_v2.POSIXTimeRange:
+        if body.validity_start is not None:
+            lower = api_v2.LowerBoundPOSIXTime(
+                api_v2.FinitePOSIXTime(self.slot_to_posix(body.validity_start)), api_v2.TrueData()
+            )
+        else:
+            lower = api_v2.LowerBoundPOSIXTime(api_v2.NegInfPOSIXTime(), api_v2.TrueData())
+        if body.ttl is not None:
+            upper = api_v2.UpperBoundPOSIXTime(api_v2.FinitePOSIXTime(self.slot_to_posix(body.ttl)), api_v2.FalseData())
+        else:
+            upper = api_v2.UpperBoundPOSIXTime(api_v2.PosInfPOSIXTime(), api_v2.TrueData())
+        return api_v2.POSIXTimeRange(lower, upper)
+
+
+class EmulatorChainProvider(ChainProvider):
+    """
+    Async chain provider answering from an EmulatedChainContext.
+
+    Payloads follow the Blockfrost shapes BlockfrostChainProvider returns, so
+    API services run unchanged against the emulator.
+    """
+
+    def __init__(self, emulator: EmulatedChainContext):
+        self.emulator = emulator
+
+    def _confirmed(self, tx_hash: str) -> EmulatedTransaction:
+        record = self.emulator.get_transaction(tx_hash)
+        if record is None or record.block_height is None:
+            raise ChainProviderError("The requested component has not been found.", status_code=404)
+        return record
+
+    async def address_utxos(self, address: str) -> list[dict]:
+        return [utxo_to_json(u) for u in self.emulator.utxos(address)]
+
+    async def utxos(self, address: str | pc.Address) -> list[pc.UTxO]:
+        return list(self.emulator.utxos(address))
+
+    async def address(self, address: str) -> dict:
+        if not self.emulator.has_address(str(address)):
+            raise ChainProviderError("The requested component has not been found.", status_code=404)
+        total = pc.Value(0)
+        for utxo in self.emulator.utxos(address):
+            total += utxo.output.amount
+        return {"address": str(address), "amount": amounts_from_value(total)}
+
+    async def address_transactions(
+        self,
+        address: str,
+        count: int = 100,
+        page: int = 1,
+        order: str = "desc",
+        from_block: str | None = None,
+        to_block: str | None = None,
+    ) -> list[dict]:
+        records = self.emulator.address_transactions(str(address))
+        if from_block is not None:
+            records = [r for r in records if r.block_height is not None and r.block_height >= int(from_block)]
+        if to_block is not None:
+            records = [r for r in records if r.block_height is not None and r.block_height <= int(to_block)]
+        if order == "desc":
+            records.reverse()
+        start = (page - 1) * count
+        return [
+            {"tx_hash": r.tx_hash, "tx_index": r.index, "block_height": r.block_height, "block_time": r.block_time}
+            for r in records[start : start + count]
+        ]
+
+    async def transaction(self, tx_hash: str) -> dict:
+        record = self._confirmed(tx_hash)
+        body = record.tx.transaction_body
+        output_amount = pc.Value(0)
+        for output in body.outputs:
+            output_amount += output.amount
+        return {
+            "hash": tx_hash,
+            "block": f"{record.block_height:064x}",
+            "block_height": record.block_height,
+            "block_time": record.block_time,
+            "slot": record.slot,
+            "index": record.index,
+            "output_amount": amounts_from_value(output_amount),
+            "fees": str(body.fee),
+            "deposit": "0",
+            "size": record.size,
+            "invalid_before": str(body.validity_start) if body.validity_start is not None else None,
+            "invalid_hereafter": str(body.ttl) if body.ttl is not None else None,
+            "utxo_count": len(record.spent) + len(body.outputs),
+            "redeemer_count": len(_redeemers(record.tx.transaction_witness_set)),
+            "valid_contract": True,
+        }
+
+    async def transaction_utxos(self, tx_hash: str) -> dict:
+        record = self._confirmed(tx_hash)
+        outputs = []
+        for index, output in enumerate(record.tx.transaction_body.outputs):
+            tx_input = pc.TransactionInput.from_primitive([tx_hash, index])
+            utxo = utxo_to_json(pc.UTxO(tx_input, output))
+            utxo["consumed_by_tx"] = self.emulator.spent_by(tx_input)
+            outputs.append({k: v for k, v in utxo.items() if k != "tx_hash"})
+        return {"hash": tx_hash, "inputs": [utxo_to_json(u) for u in record.spent], "outputs": outputs}
+
+    async def transaction_metadata(self, tx_hash: str) -> list[dict]:
+        record = self._confirmed(tx_hash)
+        auxiliary_data = record.tx.auxiliary_data
+        metadata = auxiliary_data.data if auxiliary_data is not None else None
+        if isinstance(metadata, pc.AlonzoMetadata):
+            metadata = metadata.metadata
+        if not metadata:
+            return []
+        return [{"label": str(label), "json_metadata": value} for label, value in metadata.items()]
+
+    async def submit_tx(self, cbor: bytes | str) -> str:
+        try:
+            return self.emulator.submit_tx_cbor(cbor)
+        except EmulatorError as e:
+            raise ChainProviderError(str(e), status_code=400) from e
+
+    async def protocol_params(self) -> dict:
+        params = self.emulator.protocol_param
+        return {
+            "min_fee_a": params.min_fee_coefficient,
+            "min_fee_b": params.min_fee_constant,
+            "max_tx_size": params.max_tx_size,
+            "coins_per_utxo_size": str(params.coins_per_utxo_byte),
+            "max_val_size": str(params.max_val_size),
+            "collateral_percent": params.collateral_percent,
+            "max_collateral_inputs": params.max_collateral_inputs,
+        }
+
+    async def block_latest(self) -> dict:
+        height = self.emulator.block_height
+        slot = self.emulator.last_block_slot
+        return {
+            "height": height,
+            "slot": slot,
+            "hash": f"{height:064x}",
+            "time": self.emulator.slot_to_posix(slot) // 1000,
+        }
+
+    async def asset(self, asset_id: str) -> dict:
+        quantity = self.emulator.asset_quantity(asset_id)
+        if quantity is None:
+            raise ChainProviderError("The requested component has not been found.", status_code=404)
+        return {
+            "asset": asset_id,
+            "policy_id": asset_id[:56],
+            "asset_name": asset_id[56:] or None,
+            "quantity": str(quantity),
+            "initial_mint_tx_hash": self.emulator.asset_mint_tx(asset_id),
+        }
+
+    async def assets_policy(self, policy_id: str, count: int = 100, page: int = 1, order: str = "asc") -> list[dict]:
+        assets = [
+            {"asset": unit, "quantity": str(quantity)}
+            for unit, quantity in sorted(self.emulator.assets().items(), reverse=order == "desc")
+            if unit.startswith(policy_id)
+        ]
+        start = (page - 1) * count
+        return assets[start : start + count]
+
+
+# Shared ledgers, one per network, so every CardanoChainContext configured
+# with the emulator backend sees the same chain
+_emulators: dict[str, EmulatedChainContext] = {}
+
+
+def get_emulator(network: str = "testnet") -> EmulatedChainContext:
+    """Get or create the process-wide emulated ledger for a network"""
+    if network not in _emulators:
+        cardano_network = pc.Network.MAINNET if network == "mainnet" else pc.Network.TESTNET
+        _emulators[network] = EmulatedChainContext(network=cardano_network)
+    return _emulators[network]
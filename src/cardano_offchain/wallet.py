@@ -6,12 +6,26 @@ Handles wallet creation, address generation, and key management.
 """
 
 import os
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 import pycardano as pc
 from blockfrost import ApiError, BlockFrostApi
 
 
+# Account extended private key (64) + public key (32) + chain code (32)
+ACCOUNT_KEY_LENGTH = 128
+
+# CIP-1852 account path and the soft chain indices below it
+ACCOUNT_PATH = "1852'/1815'/0'"
+EXTERNAL_CHAIN = 0
+STAKING_CHAIN = 2
+
+# Concurrent address queries in check_balances
+BALANCE_QUERY_WORKERS = 8
+
+
 class CardanoWallet:
     """Manages Cardano wallet operations without console dependencies"""
 
@@ -23,28 +37,74 @@ class CardanoWallet:
             wallet_mnemonic: BIP39 mnemonic phrase
             network: Network type ("testnet" or "mainnet")
         """
+        hdwallet = pc.crypto.bip32.HDWallet.from_mnemonic(wallet_mnemonic)
+        # Root key; None for wallets restored from account key material
+        self.wallet: pc.crypto.bip32.HDWallet | None = hdwallet
+        self._initialize(hdwallet.derive_from_path(f"m/{ACCOUNT_PATH}"), network)
+
+    @classmethod
+    def from_account_key(cls, account_key: bytes, network: str = "testnet") -> "CardanoWallet":
+        """
+        Restore a signing wallet from the key material returned by export_account_key()
+
+        The restored wallet has no root key (wallet is None): it derives and signs
+        for every address of the account, but nothing outside it.
+
+        Args:
+            account_key: Account extended private key, public key and chain code (128 bytes)
+            network: Network type ("testnet" or "mainnet")
+        """
+        if len(account_key) != ACCOUNT_KEY_LENGTH:
+            raise ValueError(f"Account key must be {ACCOUNT_KEY_LENGTH} bytes, got {len(account_key)}")
+        account = pc.crypto.bip32.HDWallet(
+            xprivate_key=account_key[:64],
+            public_key=account_key[64:96],
+            chain_code=account_key[96:],
+            path=f"m/{ACCOUNT_PATH}",
+        )
+        wallet = cls.__new__(cls)
+        wallet.wallet = None
+        wallet._initialize(account, network)
+        return wallet
+
+    def export_account_key(self) -> bytes:
+        """
+        Account-level key material (extended private key, public key, chain code)
+
+        Enough to sign for any address of the account, but not to recover the
+        root key or other accounts; still only persist it encrypted.
+        """
+        account_key: bytes = (
+            self._account_key.xprivate_key + self._account_key.public_key + self._account_key.chain_code
+        )
+        return account_key
+
+    def _initialize(self, account_key: pc.crypto.bip32.HDWallet, network: str) -> None:
         self.network = network
         self.cardano_network = pc.Network.TESTNET if network == "testnet" else pc.Network.MAINNET
 
-        # Initialize wallet
-        self.wallet = pc.crypto.bip32.HDWallet.from_mnemonic(wallet_mnemonic)
+        # Cache the account and chain-level keys: every further address is a
+        # single soft derivation instead of a walk of the hardened path from the root
+        self._account_key = account_key
+        self._external_chain_key = self._account_key.derive(EXTERNAL_CHAIN)
+        self._staking_chain_key = self._account_key.derive(STAKING_CHAIN)
 
         # Derive main keys
-        self.payment_key = self.wallet.derive_from_path("m/1852'/1815'/0'/0/0")
-        self.staking_key = self.wallet.derive_from_path("m/1852'/1815'/0'/2/0")
+        self.payment_key = self._external_chain_key.derive(0)
+        self.staking_key = self._staking_chain_key.derive(0)
 
         # Get signing keys
         self.payment_skey = pc.ExtendedSigningKey.from_hdwallet(self.payment_key)
         self.staking_skey = pc.ExtendedSigningKey.from_hdwallet(self.staking_key)
+        self._staking_key_hash = self.staking_skey.to_verification_key().hash()
 
         # Create main addresses
-        self.enterprise_address = pc.Address(
-            payment_part=self.payment_skey.to_verification_key().hash(), network=self.cardano_network
-        )
+        payment_key_hash = self.payment_skey.to_verification_key().hash()
+        self.enterprise_address = pc.Address(payment_part=payment_key_hash, network=self.cardano_network)
 
         self.staking_address = pc.Address(
-            payment_part=self.payment_skey.to_verification_key().hash(),
-            staking_part=self.staking_skey.to_verification_key().hash(),
+            payment_part=payment_key_hash,
+            staking_part=self._staking_key_hash,
             network=self.cardano_network,
         )
 
@@ -52,6 +112,41 @@ class CardanoWallet:
         self.addresses: list[dict[str, Any]] = []
         self.signing_keys: list[pc.ExtendedSigningKey] = []
 
+        # Address bytes -> derivation index (public data only), kept for the
+        # lifetime of the wallet so lookups never re-derive keys. Lookups may
+        # index further than self.addresses without generating those addresses.
+        self._address_index: dict[bytes, int] = {
+            self.enterprise_address.to_primitive(): 0,
+            self.staking_address.to_primitive(): 0,
+        }
+        self._indexed_through = 0
+
+    def _derive_payment_address(self, index: int) -> tuple[pc.ExtendedSigningKey, pc.Address, pc.Address]:
+        """Payment signing key, enterprise address and staking address at a derivation index"""
+        # One soft derivation from the cached chain key
+        payment_skey = pc.ExtendedSigningKey.from_hdwallet(self._external_chain_key.derive(index))
+        payment_key_hash = payment_skey.to_verification_key().hash()
+
+        # Enterprise address (payment only)
+        enterprise_addr = pc.Address(payment_part=payment_key_hash, network=self.cardano_network)
+
+        # Staking enabled address
+        staking_addr = pc.Address(
+            payment_part=payment_key_hash,
+            staking_part=self._staking_key_hash,
+            network=self.cardano_network,
+        )
+        return payment_skey, enterprise_addr, staking_addr
+
+    def _index_addresses(self, max_index: int) -> None:
+        """Record addresses up to a derivation index in the lookup table only"""
+        # Generated addresses are indexed already
+        for i in range(max(self._indexed_through, len(self.addresses) - 1) + 1, max_index + 1):
+            _, enterprise_addr, staking_addr = self._derive_payment_address(i)
+            self._address_index.setdefault(enterprise_addr.to_primitive(), i)
+            self._address_index.setdefault(staking_addr.to_primitive(), i)
+        self._indexed_through = max(self._indexed_through, max_index)
+
     def generate_addresses(self, count: int) -> list[dict[str, Any]]:
         """
         Generate multiple addresses for the wallet
@@ -65,22 +160,8 @@ class CardanoWallet:
         generated_addresses = []
 
         for i in range(len(self.addresses), len(self.addresses) + count):
-            # Payment addresses
-            payment_derivation = f"m/1852'/1815'/0'/0/{i}"
-            payment_key = self.wallet.derive_from_path(payment_derivation)
-            payment_skey = pc.ExtendedSigningKey.from_hdwallet(payment_key)
-
-            # Enterprise address (payment only)
-            enterprise_addr = pc.Address(
-                payment_part=payment_skey.to_verification_key().hash(), network=self.cardano_network
-            )
-
-            # Staking enabled address
-            staking_addr = pc.Address(
-                payment_part=payment_skey.to_verification_key().hash(),
-                staking_part=self.staking_skey.to_verification_key().hash(),
-                network=self.cardano_network,
-            )
+            payment_derivation = f"m/{ACCOUNT_PATH}/{EXTERNAL_CHAIN}/{i}"
+            payment_skey, enterprise_addr, staking_addr = self._derive_payment_address(i)
 
             addr_info = {
                 "index": i,
@@ -93,10 +174,72 @@ class CardanoWallet:
 
             self.addresses.append(addr_info)
             self.signing_keys.append(payment_skey)
+            self._address_index.setdefault(enterprise_addr.to_primitive(), i)
+            self._address_index.setdefault(staking_addr.to_primitive(), i)
             generated_addresses.append(addr_info)
 
         return generated_addresses
 
+    def derive_addresses(self, count: int) -> list[tuple[int, pc.Address, pc.Address]]:
+        """
+        Derive enterprise and staking addresses without storing them
+
+        Unlike generate_addresses, self.addresses and the signing keys are left
+        untouched, so a shared wallet can be inspected without side effects.
+
+        Args:
+            count: Number of derivation indices, starting at 0
+
+        Returns:
+            (index, enterprise address, staking address) per derivation index
+        """
+        derived = []
+        for i in range(count):
+            if i < len(self.addresses):
+                addr_info = self.addresses[i]
+                derived.append((i, addr_info["enterprise_address"], addr_info["staking_address"]))
+            else:
+                _, enterprise_addr, staking_addr = self._derive_payment_address(i)
+                derived.append((i, enterprise_addr, staking_addr))
+        return derived
+
+    def ensure_addresses(self, max_index: int) -> None:
+        """
+        Make sure addresses up to a derivation index have been generated
+
+        Args:
+            max_index: Highest derivation index that must be available
+        """
+        missing = max_index + 1 - len(self.addresses)
+        if missing > 0:
+            self.generate_addresses(missing)
+
+    def find_wallet_indices_by_addresses(
+        self, target_addresses: Iterable[pc.Address | str], max_search: int = 20
+    ) -> list[int | None]:
+        """
+        Find the wallet indices of many addresses at once
+
+        Addresses up to max_search are derived once and kept in the wallet's
+        address lookup table, so repeated scans only cost a dictionary lookup
+        each. The wallet's generated addresses (self.addresses) are not extended.
+
+        Args:
+            target_addresses: Addresses (objects or bech32 strings) to look up
+            max_search: Highest derivation index to search
+
+        Returns:
+            Wallet index of each address, in input order (None if not found)
+        """
+        self._index_addresses(max_search)
+
+        indices: list[int | None] = []
+        for target in target_addresses:
+            address = pc.Address.from_primitive(target) if isinstance(target, str) else target
+            index = self._address_index.get(address.to_primitive())
+            indices.append(index if index is not None and index <= max_search else None)
+        return indices
+
     def get_wallet_info(self) -> dict[str, Any]:
         """
         Get comprehensive wallet information
@@ -122,6 +265,9 @@ class CardanoWallet:
         """
         Check balances for wallet addresses
 
+        Address totals (lovelace and native assets) are read from the address
+        summary endpoint, one request per address, queried concurrently.
+
         Args:
             api: BlockFrost API instance for balance queries
             limit_addresses: Number of derived addresses to check
@@ -129,51 +275,50 @@ class CardanoWallet:
         Returns:
             Dictionary containing balance information
         """
+        derived = self.addresses[:limit_addresses]
+        addresses = [str(self.enterprise_address)] + [str(addr_info["enterprise_address"]) for addr_info in derived]
+
+        def address_totals(address: str) -> tuple[int, dict[str, int]]:
+            try:
+                amounts = api.address(address).amount
+            except ApiError as e:
+                if e.status_code == 404:
+                    # Address has no on-chain history yet
+                    return 0, {}
+                raise
+            lovelace = 0
+            assets: dict[str, int] = {}
+            for amount in amounts:
+                if amount.unit == "lovelace":
+                    lovelace += int(amount.quantity)
+                else:
+                    assets[amount.unit] = assets.get(amount.unit, 0) + int(amount.quantity)
+            return lovelace, assets
+
+        try:
+            with ThreadPoolExecutor(max_workers=BALANCE_QUERY_WORKERS) as pool:
+                totals = list(pool.map(address_totals, addresses))
+        except ApiError as e:
+            raise Exception(f"Error checking balances: {e}") from e
+
+        (enterprise_balance, total_assets), derived_totals = totals[0], totals[1:]
+        total_assets = dict(total_assets)
         balances: dict[str, Any] = {
             "main_addresses": {
-                "enterprise": {"address": str(self.enterprise_address), "balance": 0},
+                "enterprise": {"address": addresses[0], "balance": enterprise_balance},
                 "staking": {"address": str(self.staking_address), "balance": 0},
             },
             "derived_addresses": [],
-            "total_balance": 0,
+            "total_balance": enterprise_balance,
+            "total_assets": total_assets,
         }
 
-        try:
-            # Check main enterprise address
-            enterprise_utxos = api.address_utxos(str(self.enterprise_address))
-            enterprise_balance = sum(
-                int(utxo.amount[0].quantity) for utxo in enterprise_utxos if utxo.amount[0].unit == "lovelace"
-            )
-            balances["main_addresses"]["enterprise"]["balance"] = enterprise_balance
-
-            # Check derived addresses
-            for addr_info in self.addresses[:limit_addresses]:
-                try:
-                    utxos = api.address_utxos(str(addr_info["enterprise_address"]))
-                    balance = sum(int(utxo.amount[0].quantity) for utxo in utxos if utxo.amount[0].unit == "lovelace")
-                    addr_info["balance"] = balance
-
-                    balances["derived_addresses"].append(
-                        {
-                            "index": addr_info["index"],
-                            "address": str(addr_info["enterprise_address"]),
-                            "balance": balance,
-                        }
-                    )
-
-                except ApiError:
-                    # Address might not exist on chain yet
-                    balances["derived_addresses"].append(
-                        {"index": addr_info["index"], "address": str(addr_info["enterprise_address"]), "balance": 0}
-                    )
-
-            # Calculate total
-            balances["total_balance"] = enterprise_balance + sum(
-                addr["balance"] for addr in balances["derived_addresses"]
-            )
-
-        except ApiError as e:
-            raise Exception(f"Error checking balances: {e}") from e
+        for addr_info, address, (balance, assets) in zip(derived, addresses[1:], derived_totals, strict=True):
+            addr_info["balance"] = balance
+            balances["derived_addresses"].append({"index": addr_info["index"], "address": address, "balance": balance})
+            balances["total_balance"] += balance
+            for unit, quantity in assets.items():
+                total_assets[unit] = total_assets.get(unit, 0) + quantity
 
         return balances
 
@@ -212,45 +357,7 @@ class CardanoWallet:
         Returns:
             Wallet index if found, None otherwise
         """
-        target_primitive = target_address.to_primitive()
-
-        # Check main addresses first (index 0)
-        if self.enterprise_address.to_primitive() == target_primitive:
-            return 0
-        if self.staking_address.to_primitive() == target_primitive:
-            return 0
-
-        # Search through generated addresses by actually generating them and comparing
-        # Use the exact same logic as generate_addresses method
-        for i in range(1, max_search + 1):
-            try:
-                # Use the exact same derivation logic as generate_addresses
-                payment_derivation = f"m/1852'/1815'/0'/0/{i}"
-                payment_key = self.wallet.derive_from_path(payment_derivation)
-                payment_skey = pc.ExtendedSigningKey.from_hdwallet(payment_key)
-
-                # Create enterprise address (payment only)
-                enterprise_addr = pc.Address(
-                    payment_part=payment_skey.to_verification_key().hash(), network=self.cardano_network
-                )
-
-                # Create staking address (payment + staking)
-                staking_addr = pc.Address(
-                    payment_part=payment_skey.to_verification_key().hash(),
-                    staking_part=self.staking_skey.to_verification_key().hash(),
-                    network=self.cardano_network,
-                )
-
-                if (
-                    enterprise_addr.to_primitive() == target_primitive
-                    or staking_addr.to_primitive() == target_primitive
-                ):
-                    return i
-
-            except Exception:
-                # Skip this index if derivation fails
-                continue
-        return None
+        return self.find_wallet_indices_by_addresses([target_address], max_search)[0]
 
     def get_signing_key(self, index: int = 0) -> pc.ExtendedSigningKey:
         """
@@ -0,0 +1,86 @@
+from opshin.prelude import *
+
+from terrasacha_contracts.util import *
+
+
+################################################
+# Low-budget helpers
+#
+# Drop-in replacements for the util.py helpers that run on every spend.
+# OpShin compiles a for loop to a full fold (a return inside it does not stop
+# the iteration), so these avoid building intermediate lists and repeated
+# lookups. Savings are measured in tests/budgets.py.
+################################################
+def count_inputs_at_address(address: Address, inputs: List[TxInInfo]) -> int:
+    """Number of inputs spent from the address (counted in place, no intermediate list)"""
+    count = 0
+    for txi in inputs:
+        if txi.resolved.address == address:
+            count += 1
+    return count
+
+
+def count_outputs_to_address(address: Address, outputs: List[TxOut]) -> int:
+    """Number of outputs paying the address (counted in place, no intermediate list)"""
+    count = 0
+    for output in outputs:
+        if output.address == address:
+            count += 1
+    return count
+
+
+def resolve_own_input(tx_info: TxInfo, input_index: int, purpose: Spending) -> TxOut:
+    """
+    Resolve the input being validated, referenced by the redeemer.
+    Checks it is the spent UTxO and the only input from its address in a single pass over the inputs.
+    """
+    own_input = tx_info.inputs[input_index]
+    assert own_input.out_ref == purpose.tx_out_ref, "Referenced wrong input"
+    own_txout = own_input.resolved
+    assert count_inputs_at_address(own_txout.address, tx_info.inputs) == 1, (
+        "More than one input from the contract address"
+    )
+    return own_txout
+
+
+def resolve_own_output(own_txout: TxOut, tx_info: TxInfo, output_index: int) -> TxOut:
+    """
+    Resolve the continuing output referenced by the redeemer.
+    Checks it stays at the input's address and is the only output paying that address.
+    """
+    outputs = tx_info.outputs
+    next_state_output = outputs[output_index]
+    assert next_state_output.address == own_txout.address, "Moved funds to different address"
+    assert count_outputs_to_address(next_state_output.address, outputs) == 1, (
+        "More than one output to the contract address"
+    )
+    return next_state_output
+
+
+def holds_policy(policy_id: PolicyId, tx_out: TxOut) -> bool:
+    """Whether the output holds a positive amount of any token under the policy"""
+    present = False
+    for amount in tx_out.value.get(policy_id, {b"": 0}).values():
+        if amount > 0:
+            present = True
+    return present
+
+
+def first_token(tx_out: TxOut) -> Token:
+    """
+    The first native token of an output (its state NFT).
+    Walks the value's (policy, tokens) pairs directly instead of looking each policy up again.
+    """
+    found = False
+    result_policy = b""
+    result_token = b""
+    for policy in tx_out.value.items():
+        if policy[0] != b"" and not found:
+            for token_name in policy[1].keys():
+                if not found:
+                    result_policy = policy[0]
+                    result_token = token_name
+                    found = True
+
+    assert found, "Token not found in transaction input"
+    return Token(result_policy, result_token)
@@ -1,6 +1,7 @@
 #!opshin
 from opshin.prelude import *
 
+from terrasacha_contracts.fast_util import *
 from terrasacha_contracts.util import *
 
 
@@ -133,11 +134,11 @@ def validator(project_id: PolicyId, redeemer: Union[MintGrey, BurnGrey], context
         assert isinstance(project_datum, SomeOutputDatum), "Project input must have a datum"
         project_input_datum_value: DatumProject = project_datum.datum
         
-        assert check_token_present(project_id, project_reference_input), "Project input must have the project token"
+        assert holds_policy(project_id, project_reference_input), "Project input must have the project token"
 
         validate_mint_operation(project_input_datum_value, own_policy_id, our_minted)
 
-        project_output = resolve_linear_output(project_reference_input, tx_info, redeemer.project_output_index)
+        project_output = resolve_own_output(project_reference_input, tx_info, redeemer.project_output_index)
 
         project_output_datum = project_output.datum
         assert isinstance(project_output_datum, SomeOutputDatum), "Project output must have a datum"
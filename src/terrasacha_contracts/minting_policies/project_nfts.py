@@ -1,6 +1,7 @@
 #!opshin
 from opshin.prelude import *
 
+from terrasacha_contracts.fast_util import *
 from terrasacha_contracts.util import *
 
 
@@ -48,11 +49,11 @@ def validator(
     assert len(our_minted) == 2, "Must mint or burn exactly 2 tokens"
 
     protocol_reference_input = tx_info.reference_inputs[redeemer.protocol_input_index].resolved
-    protocol_token = extract_token_from_input(protocol_reference_input)
+    protocol_token = first_token(protocol_reference_input)
 
     assert protocol_token.policy_id == protocol_policy_id, "Wrong protocol token policy ID"
 
-    assert check_token_present(protocol_token.policy_id, protocol_reference_input), (
+    assert holds_policy(protocol_token.policy_id, protocol_reference_input), (
         "Protocol reference input must have the protocol token"
     )
 
@@ -1,5 +1,6 @@
 from opshin.prelude import *
 
+from terrasacha_contracts.fast_util import *
 from terrasacha_contracts.util import *
 
 
@@ -26,7 +27,7 @@ def get_protocol_fee_from_reference(tx_info: TxInfo, protocol_ref_index: int, pr
     protocol_input = tx_info.reference_inputs[protocol_ref_index].resolved
 
     # Validate protocol NFT is present
-    assert check_token_present(protocol_nft_policy_id, protocol_input), (
+    assert holds_policy(protocol_nft_policy_id, protocol_input), (
         "Protocol reference input must contain protocol NFT"
     )
 
@@ -104,8 +105,8 @@ def validator(
     tx_info = context.tx_info
     purpose = get_spending_purpose(context)
 
-    investor_input = resolve_linear_input(tx_info, redeemer.investor_input_index, purpose)
-    assert check_token_present(grey_token_policy_id, investor_input), "Investor input must contain grey token"
+    investor_input = resolve_own_input(tx_info, redeemer.investor_input_index, purpose)
+    assert holds_policy(grey_token_policy_id, investor_input), "Investor input must contain grey token"
 
     if isinstance(redeemer, BuyGrey):
         # Validate purchase amount
@@ -134,7 +135,7 @@ def validator(
         # If there are remaining tokens, validate contract continuation
         remaining_tokens = datum.grey_token_amount - redeemer.amount
         if remaining_tokens > 0:
-            investor_output = resolve_linear_output(investor_input, tx_info, redeemer.investor_output_index)
+            investor_output = resolve_own_output(investor_input, tx_info, redeemer.investor_output_index)
 
             # Validate remaining tokens are in output
             output_tokens = investor_output.value.get(grey_token_policy_id, {b"": 0}).get(grey_token_name, 0)
@@ -173,7 +174,7 @@ def validator(
         assert redeemer.new_price_per_token.precision >= 0, "Precision must be non-negative"
 
         # Validate contract continuation
-        investor_output = resolve_linear_output(investor_input, tx_info, redeemer.investor_output_index)
+        investor_output = resolve_own_output(investor_input, tx_info, redeemer.investor_output_index)
 
         assert investor_output.address == investor_input.address, "Output must return to contract"
 
@@ -1,5 +1,6 @@
 from opshin.prelude import *
 
+from terrasacha_contracts.fast_util import *
 from terrasacha_contracts.util import *
 
 
@@ -126,46 +127,47 @@ def validate_datum_update(old_datum: DatumProject, new_datum: DatumProject) -> N
         assert len(old_datum.stakeholders) == len(new_datum.stakeholders), (
             "Stakeholders count cannot change after project lock (state >= 1)"
         )
-        for i in range(len(old_datum.stakeholders)):
-            old_stakeholder = old_datum.stakeholders[i]
-            new_stakeholder = new_datum.stakeholders[i]
-            assert old_stakeholder.stakeholder == new_stakeholder.stakeholder, (
-                "Stakeholder identity cannot change after project lock (state >= 1)"
-            )
-            assert old_stakeholder.participation == new_stakeholder.participation, (
-                "Stakeholder participation cannot change after project lock (state >= 1)"
-            )
-            # Between states 1 and 2, it is possible to update pkh in state 1
-            # Claim status must remain always constant under this action
-            assert old_stakeholder.claimed == new_stakeholder.claimed, (
-                "Stakeholder claimed status cannot change after project lock (state >= 1)"
-            )
+        # Field-wise list comparisons are linear; indexing both lists per stakeholder is quadratic
+        assert [s.stakeholder for s in old_datum.stakeholders] == [s.stakeholder for s in new_datum.stakeholders], (
+            "Stakeholder identity cannot change after project lock (state >= 1)"
+        )
+        assert [s.participation for s in old_datum.stakeholders] == [
+            s.participation for s in new_datum.stakeholders
+        ], "Stakeholder participation cannot change after project lock (state >= 1)"
+        # Between states 1 and 2, it is possible to update pkh in state 1
+        # Claim status must remain always constant under this action
+        assert [s.claimed for s in old_datum.stakeholders] == [s.claimed for s in new_datum.stakeholders], (
+            "Stakeholder claimed status cannot change after project lock (state >= 1)"
+        )
 
         # All certification data must be identical
         assert len(old_datum.certifications) == len(new_datum.certifications), (
             "Certifications count cannot change after project lock (state >= 1)"
         )
-        for i in range(len(old_datum.certifications)):
-            old_cert = old_datum.certifications[i]
-            new_cert = new_datum.certifications[i]
-            assert old_cert.certification_date == new_cert.certification_date, (
-                "Certification date cannot change after project lock (state >= 1)"
-            )
-            assert old_cert.quantity == new_cert.quantity, (
-                "Certification quantity cannot change after project lock (state >= 1)"
-            )
-            if old_datum.params.project_state == 1:
-                # In state 1, real values must remain empty
+        assert [c.certification_date for c in old_datum.certifications] == [
+            c.certification_date for c in new_datum.certifications
+        ], "Certification date cannot change after project lock (state >= 1)"
+        assert [c.quantity for c in old_datum.certifications] == [c.quantity for c in new_datum.certifications], (
+            "Certification quantity cannot change after project lock (state >= 1)"
+        )
+        if old_datum.params.project_state == 1:
+            # In state 1, real values must remain empty
+            for new_cert in new_datum.certifications:
                 assert new_cert.real_certification_date == 0, "Real certification date must be empty in project state 1"
                 assert new_cert.real_quantity == 0, "Real certification quantity must be empty in project state 1"
-            elif old_datum.params.project_state == 2:
-                # In state 2, real values can be updated (after verification)
+        elif old_datum.params.project_state == 2:
+            # In state 2, real values can be updated (after verification)
+            # Only the old list is indexed (pairwise checks have no linear form in OpShin)
+            i = 0
+            for new_cert in new_datum.certifications:
+                old_cert = old_datum.certifications[i]
                 assert old_cert.real_certification_date <= new_cert.real_certification_date, (
                     "Real certification date can only move forward in project state 2"
                 )
                 assert old_cert.real_quantity <= new_cert.real_quantity, (
                     "Real certification quantity can only move forward in project state 2"
                 )
+                i += 1
 
     else:
         ##################################################################################################
@@ -209,26 +211,17 @@ def validator(
 ) -> None:
     tx_info = context.tx_info
     purpose = get_spending_purpose(context)
-    project_input = resolve_linear_input(tx_info, redeemer.project_input_index, purpose)
-    project_token = extract_token_from_input(project_input)
+    project_input = resolve_own_input(tx_info, redeemer.project_input_index, purpose)
+    project_token = first_token(project_input)
 
     assert project_token.policy_id == token_policy_id, "Wrong token policy ID"
 
-    for txi in tx_info.inputs:
-        if txi.out_ref == purpose.tx_out_ref:
-            own_txout = txi.resolved
-            own_address = own_txout.address
-
-    assert only_one_input_from_address(own_address, tx_info.inputs) == 1, (
-        "More than one input from the contract address"
-    )
-
     if isinstance(redeemer, UpdateProject):
-        project_output = resolve_linear_output(project_input, tx_info, redeemer.project_output_index)
+        project_output = resolve_own_output(project_input, tx_info, redeemer.project_output_index)
 
         user_input = tx_info.inputs[redeemer.user_input_index].resolved
 
-        assert check_token_present(project_token.policy_id, user_input), "User does not have required token"
+        assert holds_policy(project_token.policy_id, user_input), "User does not have required token"
 
         validate_nft_continues(project_output, project_token)
 
@@ -242,7 +235,7 @@ def validator(
         # State validation is handled by the grey minting policy
 
         # Resolve input/output UTXOs
-        project_output = resolve_linear_output(project_input, tx_info, redeemer.project_output_index)
+        project_output = resolve_own_output(project_input, tx_info, redeemer.project_output_index)
         # Validate NFT continues
         validate_nft_continues(project_output, project_token)
 
@@ -259,6 +252,6 @@ def validator(
     elif isinstance(redeemer, EndProject):
         user_input = tx_info.inputs[redeemer.user_input_index].resolved
 
-        assert check_token_present(project_token.policy_id, user_input), "User does not have required token"
+        assert holds_policy(project_token.policy_id, user_input), "User does not have required token"
     else:
         assert False, "Invalid redeemer type"
@@ -1,5 +1,6 @@
 from opshin.prelude import *
 
+from terrasacha_contracts.fast_util import *
 from terrasacha_contracts.util import *
 
 
@@ -42,26 +43,17 @@ def validate_datum_update(new_datum: DatumProtocol) -> None:
 def validator(token_policy_id: PolicyId, _: DatumProtocol, redeemer: RedeemerProtocol, context: ScriptContext) -> None:
     tx_info = context.tx_info
     purpose = get_spending_purpose(context)
-    protocol_input = resolve_linear_input(tx_info, redeemer.protocol_input_index, purpose)
-    protocol_token = extract_token_from_input(protocol_input)
+    protocol_input = resolve_own_input(tx_info, redeemer.protocol_input_index, purpose)
+    protocol_token = first_token(protocol_input)
     user_input = tx_info.inputs[redeemer.user_input_index].resolved
 
     # Primarly to validate that the user is giving the right input index to interact with the contract
     assert protocol_token.policy_id == token_policy_id, "Wrong token policy ID"
 
-    assert check_token_present(protocol_token.policy_id, user_input), "User does not have required token"
-
-    for txi in tx_info.inputs:
-        if txi.out_ref == purpose.tx_out_ref:
-            own_txout = txi.resolved
-            own_address = own_txout.address
-
-    assert only_one_input_from_address(own_address, tx_info.inputs) == 1, (
-        "More than one input from the contract address"
-    )
+    assert holds_policy(protocol_token.policy_id, user_input), "User does not have required token"
 
     if isinstance(redeemer, UpdateProtocol):
-        protocol_output = resolve_linear_output(protocol_input, tx_info, redeemer.protocol_output_index)
+        protocol_output = resolve_own_output(protocol_input, tx_info, redeemer.protocol_output_index)
 
         validate_nft_continues(protocol_output, protocol_token)
 
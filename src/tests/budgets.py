@@ -0,0 +1,447 @@
+"""
+Contract Budget Harness
+
+Compiles every validator and minting policy, evaluates it on synthetic
+ScriptContexts of growing size (stakeholders, certifications, inputs,
+outputs) and records execution units, script size and the fee the script
+adds to a transaction. test_contract_budgets.py compares each measurement
+with the stored baseline in contract_budgets.json, and the low-budget
+helpers in terrasacha_contracts.fast_util with the util.py ones they replace.
+
+Print the scaling table, or regenerate the baseline after an intended change:
+    cd src && python -m tests.budgets
+    cd src && python -m tests.budgets --update
+"""
+
+import argparse
+import json
+import math
+import sys
+import tempfile
+from collections.abc import Callable
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from functools import cache
+from pathlib import Path
+
+from opshin.builder import build
+from opshin.ledger.api_v2 import (
+    Address,
+    FinitePOSIXTime,
+    LowerBoundPOSIXTime,
+    Minting,
+    NoOutputDatum,
+    NoScriptHash,
+    NoStakingCredential,
+    POSIXTimeRange,
+    PubKeyCredential,
+    ScriptContext,
+    ScriptCredential,
+    SomeOutputDatum,
+    Spending,
+    TxId,
+    TxInfo,
+    TxInInfo,
+    TxOut,
+    TxOutRef,
+    UpperBoundPOSIXTime,
+)
+from opshin.prelude import FalseData, TrueData
+from uplc import ast as uplc_ast
+from uplc import tools as uplc_tools
+from uplc.cost_model import Budget, default_cek_machine_cost_model_plutus_v2
+
+from cardano_offchain.emulator import DEFAULT_PROTOCOL_PARAMS, plutus_v2_builtin_cost_model
+from terrasacha_contracts.minting_policies.grey import MintGrey
+from terrasacha_contracts.util import (
+    BuyGrey,
+    Certification,
+    DatumInvestor,
+    DatumProject,
+    DatumProjectParams,
+    DatumProtocol,
+    PriceWithPrecision,
+    StakeHolderParticipation,
+    TokenProject,
+    UpdateProject,
+    UpdateProtocol,
+)
+from terrasacha_contracts.validators.investor import USDA_POLICY_ID
+
+
+CONTRACTS_DIR = Path(__file__).parent.parent / "terrasacha_contracts"
+BASELINE_FILE = Path(__file__).parent / "contract_budgets.json"
+
+# Sizes each scenario is measured at
+SIZES = (1, 10, 50)
+
+# Relative growth over the baseline tolerated before a measurement counts as a regression
+TOLERANCE = 0.02
+
+NFT_POLICY = bytes.fromhex("d1" * 28)
+GREY_POLICY = bytes.fromhex("d2" * 28)
+PROTOCOL_POLICY = bytes.fromhex("d3" * 28)
+SCRIPT_HASH = bytes.fromhex("5c" * 28)
+GREY_TOKEN = b"GREY"
+SUPPLY_PER_STAKEHOLDER = 1_000
+
+
+@dataclass(frozen=True)
+class ContractBudget:
+    """Cost of one script execution"""
+
+    cpu: int
+    mem: int
+    script_size: int
+    fee: int  # execution units priced by the protocol plus the inline script bytes
+
+    @property
+    def exceeds_tx_limit(self) -> bool:
+        """The execution alone does not fit in a transaction"""
+        params = DEFAULT_PROTOCOL_PARAMS
+        return self.cpu > params.max_tx_ex_steps or self.mem > params.max_tx_ex_mem
+
+    def regressions(self, baseline: "ContractBudget", tolerance: float = TOLERANCE) -> list[str]:
+        """Fields exceeding the baseline by more than `tolerance`"""
+        return [
+            f"{name} {getattr(baseline, name)} -> {getattr(self, name)}"
+            for name in ("cpu", "mem", "script_size", "fee")
+            if getattr(self, name) > getattr(baseline, name) * (1 + tolerance)
+        ]
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """A contract call whose context grows with n"""
+
+    contract: str  # path below terrasacha_contracts
+    params: tuple  # compile-time parameters
+    build_args: Callable[[int], list]  # n -> [datum,] redeemer, script context
+
+
+################################################
+# Measurement
+################################################
+
+
+@contextmanager
+def _deep_recursion(limit: int = 4000):
+    """Compiling and evaluating the project validator needs a deeper stack"""
+    old_limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(max(old_limit, limit))
+    try:
+        yield
+    finally:
+        sys.setrecursionlimit(old_limit)
+
+
+@cache
+def compile_contract(contract: str, params: tuple) -> bytes:
+    """Compile a contract with its parameters applied (flat-encoded UPLC)"""
+    with _deep_recursion():
+        return bytes(build(str(CONTRACTS_DIR / contract), *params))
+
+
+@cache
+def _program(script: bytes) -> uplc_ast.Program:
+    return uplc_tools.unflatten(script)
+
+
+def evaluate(script: bytes, args: list, label: str) -> ContractBudget:
+    """
+    Run a compiled script on PlutusData arguments.
+
+    Raises:
+        AssertionError: The script failed (the synthetic context must validate)
+    """
+    params = DEFAULT_PROTOCOL_PARAMS
+    with _deep_recursion():
+        # Evaluated past the per-transaction limit so scaling stays visible; see exceeds_tx_limit
+        result = uplc_tools.eval(
+            _program(script),
+            *[uplc_ast.data_from_cbor(arg.to_cbor()) for arg in args],
+            budget=Budget(100 * params.max_tx_ex_steps, 100 * params.max_tx_ex_mem),
+            cek_machine_cost_model=default_cek_machine_cost_model_plutus_v2(),
+            builtin_cost_model=plutus_v2_builtin_cost_model(),
+        )
+    assert not isinstance(result.result, Exception), f"{label} failed: {result.result!r}"
+
+    cpu, mem = result.cost.cpu, result.cost.memory
+    fee = math.ceil(params.price_mem * mem + params.price_step * cpu) + params.min_fee_coefficient * len(script)
+    return ContractBudget(cpu=cpu, mem=mem, script_size=len(script), fee=fee)
+
+
+def measure(scenario: Scenario, n: int) -> ContractBudget:
+    """Evaluate a scenario at size n"""
+    script = compile_contract(scenario.contract, scenario.params)
+    return evaluate(script, scenario.build_args(n), f"{scenario.contract} at n={n}")
+
+
+def measure_all() -> dict[str, ContractBudget]:
+    """Every scenario at every size, keyed "scenario/n" """
+    return {f"{name}/{n}": measure(scenario, n) for name, scenario in SCENARIOS.items() for n in SIZES}
+
+
+def load_baseline() -> dict[str, ContractBudget]:
+    if not BASELINE_FILE.exists():
+        return {}
+    return {key: ContractBudget(**value) for key, value in json.loads(BASELINE_FILE.read_text()).items()}
+
+
+def write_baseline(budgets: dict[str, ContractBudget]) -> None:
+    BASELINE_FILE.write_text(json.dumps({key: asdict(b) for key, b in budgets.items()}, indent=2) + "\n")
+
+
+################################################
+# Synthetic contexts
+################################################
+
+
+def _tx_id(i: int) -> TxId:
+    return TxId(i.to_bytes(32, "big"))
+
+
+def _pkh(i: int) -> bytes:
+    return i.to_bytes(28, "big")
+
+
+def _wallet(i: int) -> Address:
+    return Address(PubKeyCredential(_pkh(i)), NoStakingCredential())
+
+
+SCRIPT_ADDRESS = Address(ScriptCredential(SCRIPT_HASH), NoStakingCredential())
+
+
+def _out(address: Address, value: dict, datum=None) -> TxOut:
+    datum = NoOutputDatum() if datum is None else SomeOutputDatum(datum)
+    return TxOut(address, {b"": 2_000_000, **value}, datum, NoScriptHash())
+
+
+def _wallet_inputs(count: int, start: int = 100) -> list[TxInInfo]:
+    return [TxInInfo(TxOutRef(_tx_id(start + i), 0), _out(_wallet(start + i), {})) for i in range(count)]
+
+
+def _tx_info(
+    inputs: list[TxInInfo],
+    outputs: list[TxOut],
+    mint: dict | None = None,
+    signatories: list[bytes] | None = None,
+    reference_inputs: list[TxInInfo] | None = None,
+) -> TxInfo:
+    return TxInfo(
+        inputs=inputs,
+        reference_inputs=reference_inputs or [],
+        outputs=outputs,
+        fee={b"": 200_000},
+        mint=mint or {},
+        dcert=[],
+        wdrl={},
+        valid_range=POSIXTimeRange(
+            LowerBoundPOSIXTime(FinitePOSIXTime(1_672_531_200_000), TrueData()),
+            UpperBoundPOSIXTime(FinitePOSIXTime(1_672_534_800_000), TrueData()),
+        ),
+        signatories=signatories or [],
+        redeemers={},
+        data={},
+        id=_tx_id(1),
+    )
+
+
+def _project_datum(n: int, state: int, real_quantity: int = 0) -> DatumProject:
+    """Project with n stakeholders and n certifications; supply is split evenly"""
+    supply = n * SUPPLY_PER_STAKEHOLDER
+    return DatumProject(
+        params=DatumProjectParams(project_id=b"P" * 32, project_metadata=b"ipfs://project", project_state=state),
+        project_token=TokenProject(policy_id=GREY_POLICY, token_name=GREY_TOKEN, total_supply=supply),
+        stakeholders=[
+            StakeHolderParticipation(
+                stakeholder=b"investor", pkh=_pkh(10 + i), participation=SUPPLY_PER_STAKEHOLDER, claimed=FalseData()
+            )
+            for i in range(n)
+        ],
+        certifications=[
+            Certification(
+                certification_date=1_700_000_000 + i,
+                quantity=SUPPLY_PER_STAKEHOLDER,
+                real_certification_date=1_700_000_000 + i if real_quantity else 0,
+                real_quantity=real_quantity,
+            )
+            for i in range(n)
+        ],
+    )
+
+
+def _project_update(old: DatumProject, new: DatumProject, extra_inputs: int) -> list:
+    """UpdateProject spending the project UTxO; the user input holds the USER NFT"""
+    nft = {NFT_POLICY: {b"REF_project": 1}}
+    project_ref = TxOutRef(_tx_id(2), 0)
+    inputs = [
+        TxInInfo(project_ref, _out(SCRIPT_ADDRESS, nft, old)),
+        TxInInfo(TxOutRef(_tx_id(3), 0), _out(_wallet(1), {NFT_POLICY: {b"USER_project": 1}})),
+        *_wallet_inputs(extra_inputs),
+    ]
+    outputs = [_out(SCRIPT_ADDRESS, nft, new), _out(_wallet(1), {NFT_POLICY: {b"USER_project": 1}})]
+    redeemer = UpdateProject(project_input_index=0, user_input_index=1, project_output_index=0)
+    return [old, redeemer, ScriptContext(_tx_info(inputs, outputs), Spending(project_ref))]
+
+
+def project_update_open(n: int) -> list:
+    """State 0 -> 1: validate_datum_update checks every stakeholder and certification"""
+    return _project_update(_project_datum(n, state=0), _project_datum(n, state=1), extra_inputs=1)
+
+
+def project_update_locked(n: int) -> list:
+    """State 2: every stakeholder and certification is compared with the previous datum"""
+    return _project_update(_project_datum(n, state=2), _project_datum(n, state=2, real_quantity=900), extra_inputs=1)
+
+
+def project_update_inputs(n: int) -> list:
+    """Fixed datum, n wallet inputs (the single-input check scans them all)"""
+    return _project_update(_project_datum(2, state=0), _project_datum(2, state=1), extra_inputs=n)
+
+
+def protocol_update_inputs(n: int) -> list:
+    """UpdateProtocol with n wallet inputs"""
+    nft = {NFT_POLICY: {b"REF_protocol": 1}}
+    datum = DatumProtocol(project_admins=[_pkh(1)], protocol_fee=1_000_000, oracle_id=b"O" * 28, projects=[])
+    new_datum = DatumProtocol(project_admins=[_pkh(1)], protocol_fee=2_000_000, oracle_id=b"O" * 28, projects=[])
+    protocol_ref = TxOutRef(_tx_id(2), 0)
+    inputs = [
+        TxInInfo(protocol_ref, _out(SCRIPT_ADDRESS, nft, datum)),
+        TxInInfo(TxOutRef(_tx_id(3), 0), _out(_wallet(1), {NFT_POLICY: {b"USER_protocol": 1}})),
+        *_wallet_inputs(n),
+    ]
+    outputs = [_out(SCRIPT_ADDRESS, nft, new_datum), _out(_wallet(1), {NFT_POLICY: {b"USER_protocol": 1}})]
+    redeemer = UpdateProtocol(protocol_input_index=0, user_input_index=1, protocol_output_index=0)
+    return [datum, redeemer, ScriptContext(_tx_info(inputs, outputs), Spending(protocol_ref))]
+
+
+def investor_buy_outputs(n: int) -> list:
+    """BuyGrey paying the seller across n outputs (payments and transfers are summed over all outputs)"""
+    seller, buyer = _pkh(1), _pkh(2)
+    price = PriceWithPrecision(price=1_250_000, precision=6)
+    datum = DatumInvestor(seller_pkh=seller, grey_token_amount=10_000, price_per_token=price, min_purchase_amount=1)
+    new_datum = DatumInvestor(seller_pkh=seller, grey_token_amount=9_000, price_per_token=price, min_purchase_amount=1)
+    investor_ref = TxOutRef(_tx_id(2), 0)
+    inputs = [
+        TxInInfo(investor_ref, _out(SCRIPT_ADDRESS, {GREY_POLICY: {GREY_TOKEN: 10_000}}, datum)),
+        *_wallet_inputs(1),
+    ]
+    payment = -(-1_250 // n)  # 1000 tokens at 1.25 USDA, split over n outputs (rounded up)
+    outputs = [
+        _out(SCRIPT_ADDRESS, {GREY_POLICY: {GREY_TOKEN: 9_000}}, new_datum),
+        _out(_wallet(2), {GREY_POLICY: {GREY_TOKEN: 1_000}}),
+        *[_out(_wallet(1), {USDA_POLICY_ID: {b"USDATEST": payment}}) for _ in range(n)],
+    ]
+    redeemer = BuyGrey(
+        buyer_pkh=buyer, amount=1_000, investor_input_index=0, protocol_ref_index=0, investor_output_index=0
+    )
+    return [datum, redeemer, ScriptContext(_tx_info(inputs, outputs, signatories=[buyer]), Spending(investor_ref))]
+
+
+def grey_mint_claim(n: int) -> list:
+    """Stakeholder claim in state 1: the signer is matched against n stakeholders (last one signs)"""
+    datum = _project_datum(n, state=1)
+    nft = {NFT_POLICY: {b"REF_project": 1}}
+    inputs = [TxInInfo(TxOutRef(_tx_id(2), 0), _out(SCRIPT_ADDRESS, nft, datum)), *_wallet_inputs(1)]
+    outputs = [_out(SCRIPT_ADDRESS, nft, datum), _out(_wallet(10 + n - 1), {GREY_POLICY: {GREY_TOKEN: 1_000}})]
+    mint = {GREY_POLICY: {GREY_TOKEN: SUPPLY_PER_STAKEHOLDER}}
+    tx_info = _tx_info(inputs, outputs, mint=mint, signatories=[_pkh(10 + n - 1)])
+    return [MintGrey(project_input_index=0, project_output_index=0), ScriptContext(tx_info, Minting(GREY_POLICY))]
+
+
+SCENARIOS: dict[str, Scenario] = {
+    "project_update_open": Scenario("validators/project.py", (NFT_POLICY,), project_update_open),
+    "project_update_locked": Scenario("validators/project.py", (NFT_POLICY,), project_update_locked),
+    "project_update_inputs": Scenario("validators/project.py", (NFT_POLICY,), project_update_inputs),
+    "protocol_update_inputs": Scenario("validators/protocol.py", (NFT_POLICY,), protocol_update_inputs),
+    "investor_buy_outputs": Scenario(
+        "validators/investor.py", (PROTOCOL_POLICY, GREY_POLICY, GREY_TOKEN), investor_buy_outputs
+    ),
+    "grey_mint_claim": Scenario("minting_policies/grey.py", (NFT_POLICY,), grey_mint_claim),
+}
+
+
+################################################
+# Helper comparisons (util.py vs fast_util.py)
+################################################
+
+PROBE_TEMPLATE = """
+from opshin.prelude import *
+
+from terrasacha_contracts.fast_util import *
+
+
+def validator(context: ScriptContext) -> None:
+    tx_info = context.tx_info
+    purpose = get_spending_purpose(context)
+    own = tx_info.inputs[0].resolved
+{body}
+"""
+
+# name -> (util.py call, fast_util.py call), each run on project_update_inputs contexts
+HELPER_PROBES: dict[str, tuple[str, str]] = {
+    "resolve_input": (
+        # resolve_linear_input plus the own-address rescan the validators did after it
+        """    own = resolve_linear_input(tx_info, 0, purpose)
+    for txi in tx_info.inputs:
+        if txi.out_ref == purpose.tx_out_ref:
+            own_address = txi.resolved.address
+    assert only_one_input_from_address(own_address, tx_info.inputs) == 1, "more than one input"
+""",
+        "    own = resolve_own_input(tx_info, 0, purpose)\n",
+    ),
+    "resolve_output": ("    resolve_linear_output(own, tx_info, 0)\n", "    resolve_own_output(own, tx_info, 0)\n"),
+    "token_present": (
+        f"    assert check_token_present({NFT_POLICY!r}, tx_info.inputs[1].resolved)\n",
+        f"    assert holds_policy({NFT_POLICY!r}, tx_info.inputs[1].resolved)\n",
+    ),
+    "extract_token": (
+        "    assert extract_token_from_input(own).policy_id != b''\n",
+        "    assert first_token(own).policy_id != b''\n",
+    ),
+}
+
+
+@cache
+def compile_probe(body: str) -> bytes:
+    with tempfile.TemporaryDirectory() as tmp:
+        source = Path(tmp) / "probe.py"
+        source.write_text(PROBE_TEMPLATE.format(body=body))
+        return compile_contract(str(source), ())
+
+
+def compare_helper(name: str, n: int) -> tuple[ContractBudget, ContractBudget]:
+    """(util.py, fast_util.py) cost of a helper call on a context with n extra inputs"""
+    context = project_update_inputs(n)[-1]
+    return tuple(evaluate(compile_probe(body), [context], f"{name} probe at n={n}") for body in HELPER_PROBES[name])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure contract execution budgets")
+    parser.add_argument("--update", action="store_true", help=f"overwrite {BASELINE_FILE.name}")
+    args = parser.parse_args()
+
+    budgets = measure_all()
+    baseline = load_baseline()
+    print(f"{'scenario':<30} {'cpu':>14} {'mem':>10} {'size':>7} {'fee':>9}  vs baseline")
+    for key, budget in budgets.items():
+        previous = baseline.get(key)
+        change = "new" if previous is None else f"{budget.cpu / previous.cpu - 1:+.1%} cpu"
+        if budget.exceeds_tx_limit:
+            change += " (over the transaction limit)"
+        print(f"{key:<30} {budget.cpu:>14,} {budget.mem:>10,} {budget.script_size:>7,} {budget.fee:>9,}  {change}")
+
+    print(f"\n{'helper':<30} {'util cpu':>14} {'fast cpu':>14} {'util mem':>10} {'fast mem':>10}")
+    for name in HELPER_PROBES:
+        for n in SIZES:
+            old, new = compare_helper(name, n)
+            print(f"{name + '/' + str(n):<30} {old.cpu:>14,} {new.cpu:>14,} {old.mem:>10,} {new.mem:>10,}")
+
+    if args.update:
+        write_baseline(budgets)
+        print(f"Baseline written to {BASELINE_FILE}")
+
+
+if __name__ == "__main__":
+    main()
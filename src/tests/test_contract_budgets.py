@@ -0,0 +1,56 @@
+"""
+Execution budget regression tests
+
+Every validator and minting policy is evaluated on synthetic contexts of
+growing size and compared with the stored baseline (tests/contract_budgets.json);
+the fast_util helpers must stay cheaper than the util helpers they replace.
+After an intended change regenerate it with: cd src && python -m tests.budgets --update
+"""
+
+import pytest
+
+from tests.budgets import HELPER_PROBES, SCENARIOS, SIZES, ContractBudget, compare_helper, load_baseline, measure
+
+
+BASELINE = load_baseline()
+
+
+@pytest.mark.slow
+@pytest.mark.performance
+@pytest.mark.contracts
+class TestContractBudgets:
+    """Execution units, script size and fee against the baseline"""
+
+    @pytest.mark.parametrize("name,n", [(name, n) for name in SCENARIOS for n in SIZES])
+    def test_budget_within_baseline(self, name, n):
+        key = f"{name}/{n}"
+        assert key in BASELINE, f"No baseline for {key}; run: cd src && python -m tests.budgets --update"
+
+        budget = measure(SCENARIOS[name], n)
+
+        regressions = budget.regressions(BASELINE[key])
+        assert not regressions, f"{key} regressed: {', '.join(regressions)}"
+
+    @pytest.mark.parametrize("name", list(HELPER_PROBES))
+    def test_fast_helpers_cost_less_than_util_helpers(self, name):
+        for n in SIZES:
+            util_budget, fast_budget = compare_helper(name, n)
+            assert fast_budget.cpu < util_budget.cpu, f"{name}/{n}: {fast_budget.cpu} >= {util_budget.cpu} cpu"
+            assert fast_budget.mem < util_budget.mem, f"{name}/{n}: {fast_budget.mem} >= {util_budget.mem} mem"
+
+    def test_regressions_flag_growth_past_tolerance(self):
+        baseline = ContractBudget(cpu=1_000_000, mem=10_000, script_size=5_000, fee=300_000)
+
+        assert ContractBudget(cpu=1_010_000, mem=9_000, script_size=5_000, fee=300_000).regressions(baseline) == []
+        assert ContractBudget(cpu=1_000_000, mem=10_500, script_size=5_000, fee=301_000).regressions(baseline) == [
+            "mem 10000 -> 10500"
+        ]
+
+    def test_evaluation_time(self, request):
+        if not request.config.pluginmanager.hasplugin("benchmark"):
+            pytest.skip("pytest-benchmark not installed")
+        benchmark = request.getfixturevalue("benchmark")
+
+        budget = benchmark(measure, SCENARIOS["project_update_locked"], 10)
+
+        assert not budget.exceeds_tx_limit
@@ -0,0 +1,114 @@
+"""
+Tests for the in-memory ledger emulator
+
+Transactions built with pycardano's TransactionBuilder are validated and
+applied offline, including a locally evaluated OpShin minting policy.
+"""
+
+import pathlib
+
+import pycardano as pc
+import pytest
+from opshin.builder import build
+
+from cardano_offchain.chain_provider import ChainProviderError
+from cardano_offchain.emulator import EmulatedChainContext, EmulatorChainProvider, EmulatorError
+
+
+POLICY_SOURCE = """
+from opshin.prelude import *
+
+
+def validator(owner: bytes, redeemer: int, context: ScriptContext) -> None:
+    purpose = context.purpose
+    assert isinstance(purpose, Minting), "not minting"
+    assert owner in context.tx_info.signatories, "owner must sign"
+    assert context.tx_info.mint[purpose.policy_id][b"T"] == redeemer, "wrong amount"
+"""
+
+
+def _key():
+    signing_key = pc.PaymentSigningKey.generate()
+    address = pc.Address(signing_key.to_verification_key().hash(), network=pc.Network.TESTNET)
+    return signing_key, address
+
+
+@pytest.fixture(scope="module")
+def owner_policy(tmp_path_factory):
+    """OpShin policy: the owner signs and the redeemer states the minted amount"""
+    signing_key, address = _key()
+    source = tmp_path_factory.mktemp("emulator") / "policy.py"
+    pathlib.Path(source).write_text(POLICY_SOURCE)
+    return signing_key, address, build(source, address.payment_part.payload)
+
+
+@pytest.mark.unit
+class TestEmulatedChainContext:
+    """Tests for EmulatedChainContext and EmulatorChainProvider"""
+
+    async def test_payments_apply_and_confirm_on_advance(self):
+        chain = EmulatedChainContext()
+        provider = EmulatorChainProvider(chain)
+        signing_key, sender = _key()
+        _, receiver = _key()
+        funded = chain.fund(sender, 100_000_000)
+
+        builder = pc.TransactionBuilder(chain)
+        builder.add_input_address(sender)
+        builder.add_output(pc.TransactionOutput(receiver, 10_000_000))
+        tx = builder.build_and_sign([signing_key], change_address=sender)
+        tx_hash = await provider.submit_tx(tx.to_cbor())
+
+        # Spent and created at once; confirmed when the block closes
+        assert chain.get_utxo(funded.input) is None
+        assert [u.output.amount.coin for u in chain.utxos(receiver)] == [10_000_000]
+        with pytest.raises(ChainProviderError) as not_yet:
+            await provider.transaction(tx_hash)
+        assert not_yet.value.not_found
+        assert await provider.address_transactions(str(receiver), from_block="0") == []
+        chain.advance_slots(20)
+        assert len(await provider.address_transactions(str(receiver), from_block="1", to_block="1")) == 1
+        details = await provider.transaction(tx_hash)
+        assert details["block_height"] == (await provider.block_latest())["height"] == 1
+        assert int(details["fees"]) == tx.transaction_body.fee
+
+        # Resubmissions, double spends and unsigned spends are rejected
+        with pytest.raises(EmulatorError, match="already submitted"):
+            chain.submit(tx)
+        builder = pc.TransactionBuilder(chain)
+        builder.add_input(funded)
+        builder.add_output(pc.TransactionOutput(receiver, 5_000_000))
+        with pytest.raises(EmulatorError, match="not in the UTxO set"):
+            chain.submit(builder.build_and_sign([signing_key], change_address=sender))
+        builder = pc.TransactionBuilder(chain)
+        builder.add_input_address(sender)
+        builder.add_output(pc.TransactionOutput(receiver, 5_000_000))
+        unsigned = pc.Transaction(builder.build(change_address=sender), pc.TransactionWitnessSet())
+        with pytest.raises(EmulatorError, match="Missing signatures"):
+            chain.submit(unsigned)
+
+    def test_plutus_minting_policy_evaluated_locally(self, owner_policy):
+        owner_key, owner, script = owner_policy
+        chain = EmulatedChainContext()
+        chain.fund(owner, 50_000_000)
+        policy_id = pc.plutus_script_hash(script)
+        tokens = pc.MultiAsset({policy_id: pc.Asset({pc.AssetName(b"T"): 7})})
+
+        def mint(redeemer_amount: int) -> pc.Transaction:
+            builder = pc.TransactionBuilder(chain)
+            builder.add_input_address(owner)
+            builder.mint = tokens
+            builder.add_minting_script(script, pc.Redeemer(redeemer_amount))
+            builder.required_signers = [owner.payment_part]
+            builder.add_output(pc.TransactionOutput(owner, pc.Value(2_000_000, tokens)))
+            return builder.build_and_sign([owner_key], change_address=owner)
+
+        # The builder's execution-unit estimate comes from the emulator's evaluator
+        with pytest.raises(Exception, match="wrong amount"):
+            mint(6)
+        tx = mint(7)
+        chain.submit(tx)
+
+        [ex_units] = chain.get_transaction(tx.id.payload.hex()).ex_units.values()
+        assert 0 < ex_units.mem < chain.protocol_param.max_tx_ex_mem
+        assert chain.asset_quantity(policy_id.payload.hex() + b"T".hex()) == 7
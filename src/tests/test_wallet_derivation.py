@@ -0,0 +1,69 @@
+"""
+Tests for CardanoWallet key derivation
+
+Cached account/chain keys must derive exactly what the full CIP-1852 path
+does, and the address table must answer lookups without re-deriving.
+"""
+
+import pycardano as pc
+import pytest
+
+from cardano_offchain.wallet import CardanoWallet
+
+
+MNEMONIC = pc.HDWallet.generate_mnemonic()
+
+
+@pytest.mark.unit
+class TestWalletDerivation:
+    """Tests for cached derivation and the address lookup table"""
+
+    def test_cached_chain_keys_match_full_path(self):
+        wallet = CardanoWallet(MNEMONIC)
+        root = pc.HDWallet.from_mnemonic(MNEMONIC)
+
+        assert wallet.payment_key.public_key == root.derive_from_path("m/1852'/1815'/0'/0/0").public_key
+        assert wallet.staking_key.public_key == root.derive_from_path("m/1852'/1815'/0'/2/0").public_key
+
+        wallet.generate_addresses(8)
+        expected = pc.ExtendedSigningKey.from_hdwallet(root.derive_from_path("m/1852'/1815'/0'/0/7"))
+        assert wallet.addresses[7]["signing_key"].to_verification_key() == expected.to_verification_key()
+        assert wallet.addresses[7]["derivation_path"] == "m/1852'/1815'/0'/0/7"
+
+    def test_bulk_lookup(self):
+        wallet = CardanoWallet(MNEMONIC)
+        wallet.generate_addresses(50)
+        targets = [
+            wallet.staking_address,
+            wallet.addresses[12]["enterprise_address"],
+            str(wallet.addresses[40]["staking_address"]),
+            CardanoWallet(pc.HDWallet.generate_mnemonic()).enterprise_address,
+        ]
+
+        assert wallet.find_wallet_indices_by_addresses(targets, max_search=49) == [0, 12, 40, None]
+        # Outside the search window even though already derived
+        assert wallet.find_wallet_index_by_address(wallet.addresses[40]["enterprise_address"]) is None
+
+    def test_lookup_derives_each_index_once(self, monkeypatch):
+        wallet = CardanoWallet(MNEMONIC)
+        target = CardanoWallet(MNEMONIC).generate_addresses(11)[10]["enterprise_address"]
+        derivations = []
+        derive = wallet._derive_payment_address
+        monkeypatch.setattr(wallet, "_derive_payment_address", lambda i: derivations.append(i) or derive(i))
+
+        assert wallet.find_wallet_index_by_address(target) == 10
+        for _ in range(3):
+            wallet.find_wallet_index_by_address(wallet.enterprise_address, max_search=20)
+        assert derivations == list(range(1, 21))
+
+    def test_lookup_does_not_generate_addresses(self):
+        wallet = CardanoWallet(MNEMONIC)
+        wallet.generate_addresses(3)
+        target = CardanoWallet(MNEMONIC).generate_addresses(16)[15]["staking_address"]
+
+        assert wallet.find_wallet_index_by_address(target, max_search=30) == 15
+        assert len(wallet.addresses) == 3
+        assert len(wallet.signing_keys) == 3
+        # Addresses generated later still match their lookups
+        wallet.generate_addresses(20)
+        assert wallet.find_wallet_index_by_address(wallet.addresses[15]["staking_address"], max_search=30) == 15